@@ -0,0 +1,51 @@
+"""add event outbox notify trigger
+
+Notifies the outbox processor when events are inserted so it can publish
+them immediately instead of waiting for the next poll.
+
+Revision ID: add_outbox_notify_trigger
+Revises: 6b6d02c48e18
+Create Date: 2025-12-16 09:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_outbox_notify_trigger"
+down_revision: str | None = "6b6d02c48e18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Statement-level trigger: one notification per inserting statement, and
+    # PostgreSQL folds duplicates within a transaction, delivered on commit
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_event_outbox() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('event_outbox', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION notify_event_outbox();
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("DROP TRIGGER IF EXISTS event_outbox_notify ON event_outbox;")
+    op.execute("DROP FUNCTION IF EXISTS notify_event_outbox();")
@@ -0,0 +1,55 @@
+"""add file blobs for content-addressed storage
+
+Adds the reference-counted file_blobs table and drops the uniqueness of
+files.storage_key, since deduplicated files share one object.
+
+Revision ID: add_file_blobs
+Revises: add_outbox_notify_trigger
+Create Date: 2025-12-17 09:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_file_blobs"
+down_revision: str | None = "add_outbox_notify_trigger"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "file_blobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="Auto-incrementing integer primary key"),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("bucket", sa.String(length=63), nullable=False),
+        sa.Column("storage_key", sa.String(length=500), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("released_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, comment="Timestamp of record creation"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, comment="Timestamp of last update"),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_file_blobs")),
+        sa.UniqueConstraint("bucket", "sha256", name="uq_file_blobs_bucket_sha256"),
+    )
+    op.create_index(op.f("ix_file_blobs_storage_key"), "file_blobs", ["storage_key"], unique=False)
+    op.create_index(op.f("ix_file_blobs_released_at"), "file_blobs", ["released_at"], unique=False)
+
+    op.drop_index(op.f("ix_files_storage_key"), table_name="files")
+    op.create_index(op.f("ix_files_storage_key"), "files", ["storage_key"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index(op.f("ix_files_storage_key"), table_name="files")
+    op.create_index(op.f("ix_files_storage_key"), "files", ["storage_key"], unique=True)
+
+    op.drop_index(op.f("ix_file_blobs_released_at"), table_name="file_blobs")
+    op.drop_index(op.f("ix_file_blobs_storage_key"), table_name="file_blobs")
+    op.drop_table("file_blobs")
@@ -34,6 +34,7 @@ from example_service.core.settings import (
     get_auth_settings,
     get_consul_settings,
     get_db_settings,
+    get_featureflag_settings,
     get_health_settings,
     get_logging_settings,
     get_otel_settings,
@@ -296,6 +297,29 @@ async def _startup_cache() -> None:
         _mark_rate_limiter_disabled()
 
 
+async def _startup_featureflags() -> None:
+    """Load the in-memory feature flag snapshot."""
+    db = get_db_settings()
+    settings = get_featureflag_settings()
+
+    if not (db.is_configured and settings.snapshot_enabled):
+        return
+
+    try:
+        from example_service.features.featureflags.engine import start_flag_engine
+
+        engine = await start_flag_engine()
+        logger.info(
+            "Feature flag snapshot loaded",
+            extra={"flags": len(engine.snapshot)},
+        )
+    except Exception as e:
+        logger.warning(
+            "Feature flag snapshot unavailable, evaluating from the database",
+            extra={"error": str(e)},
+        )
+
+
 async def _startup_storage() -> None:
     """Initialize storage service (S3/MinIO)."""
     settings = get_storage_settings()
@@ -718,6 +742,33 @@ async def _shutdown_websocket() -> None:
     logger.info("WebSocket connection manager stopped")
 
 
+async def _shutdown_webhooks() -> None:
+    """Stop the webhook delivery queue and close its connection pool."""
+    try:
+        from example_service.features.webhooks.dispatcher import stop_webhook_delivery
+
+        await stop_webhook_delivery()
+        logger.info("Webhook delivery stopped")
+    except Exception as e:
+        logger.warning(
+            "Error stopping webhook delivery",
+            extra={"error": str(e)},
+        )
+
+
+async def _shutdown_email() -> None:
+    """Close pooled email provider connections."""
+    try:
+        from example_service.infra.email.providers import close_provider_factory
+
+        await close_provider_factory()
+    except Exception as e:
+        logger.warning(
+            "Error closing email providers",
+            extra={"error": str(e)},
+        )
+
+
 async def _shutdown_tasks() -> None:
     """Stop Taskiq broker and APScheduler."""
     global _taskiq_module, _scheduler_module
@@ -797,6 +848,19 @@ async def _shutdown_storage() -> None:
         )
 
 
+async def _shutdown_featureflags() -> None:
+    """Stop refreshing the feature flag snapshot."""
+    try:
+        from example_service.features.featureflags.engine import stop_flag_engine
+
+        await stop_flag_engine()
+    except Exception as e:
+        logger.warning(
+            "Error stopping feature flag engine",
+            extra={"error": str(e)},
+        )
+
+
 async def _shutdown_cache() -> None:
     """Close Redis cache."""
     from example_service.infra.cache.redis import stop_cache
@@ -883,6 +947,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # 4. Cache (Redis)
     await _startup_cache()
 
+    # 4a. Feature flag snapshot (requires database, notified through cache)
+    await _startup_featureflags()
+
     # 5. Storage (S3/MinIO)
     await _startup_storage()
 
@@ -999,6 +1066,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     logger.info("Application shutting down", extra={"service": app_settings.service_name})
 
+    # Webhook delivery and email providers (started on demand)
+    await _shutdown_webhooks()
+    await _shutdown_email()
+
     # 12. AI pipeline
     await _shutdown_ai()
 
@@ -1023,6 +1094,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # 5. Storage
     await _shutdown_storage()
 
+    # 4a. Feature flag snapshot
+    await _shutdown_featureflags()
+
     # 4. Cache
     await _shutdown_cache()
 
@@ -10,6 +10,7 @@ from starlette.responses import JSONResponse
 
 from example_service.app.middleware.constants import EXEMPT_PATHS
 from example_service.core.exceptions import RateLimitException
+from example_service.infra.ratelimit.hybrid import HybridRateLimiter
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -52,12 +53,19 @@ class RateLimitMiddleware:
             default_limit=100,
             default_window=60
         )
+
+        # High-volume endpoints: reject over-limit clients locally and
+        # reconcile with Redis in batches
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=HybridRateLimiter(limiter, sync_interval=1.0, error_budget=0.1),
+        )
     """
 
     def __init__(
         self,
         app: ASGIApp,
-        limiter: RateLimiter | None = None,
+        limiter: RateLimiter | HybridRateLimiter | None = None,
         default_limit: int = 100,
         default_window: int = 60,
         enabled: bool = True,
@@ -68,7 +76,8 @@ class RateLimitMiddleware:
 
         Args:
             app: The ASGI application.
-            limiter: RateLimiter instance (required if enabled=True).
+            limiter: RateLimiter or HybridRateLimiter instance (required if
+                enabled=True).
             default_limit: Default rate limit (requests per window).
             default_window: Default time window in seconds.
             enabled: Whether rate limiting is enabled.
@@ -221,14 +230,16 @@ class RateLimitMiddleware:
             # Store metadata for response headers
             rate_limit_metadata = metadata
 
-            # Track successful Redis operation for protection status
+            # Track successful Redis operation for protection status.
+            # HybridRateLimiter reports its own Redis health: most of its
+            # decisions are local and say nothing about Redis.
             try:
                 from example_service.infra.ratelimit.tracker import (
                     get_rate_limit_tracker,
                 )
 
                 tracker = get_rate_limit_tracker()
-                if tracker:
+                if tracker and not isinstance(self.limiter, HybridRateLimiter):
                     tracker.record_success()
             except (ImportError, AttributeError, RuntimeError) as e:
                 logger.debug("Failed to record rate limit success", exc_info=e)
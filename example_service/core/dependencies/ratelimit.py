@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends, Request
 
+from example_service.core.settings import get_app_settings
 from example_service.infra.cache import get_cache
 from example_service.infra.ratelimit.limiter import RateLimiter, check_rate_limit
 
@@ -35,7 +36,7 @@ async def get_rate_limiter() -> RateLimiter:
     """
     async with get_cache() as cache:
         redis_client: Redis = cache.get_client()
-        return RateLimiter(redis_client)
+        return RateLimiter(redis_client, algorithm=get_app_settings().rate_limit_algorithm)
 
 
 def rate_limit(
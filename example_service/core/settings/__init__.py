@@ -38,6 +38,7 @@ from .loader import (
     get_datatransfer_settings,
     get_db_settings,
     get_email_settings,
+    get_featureflag_settings,
     get_graphql_settings,
     get_health_settings,
     get_i18n_settings,
@@ -68,6 +69,7 @@ __all__ = [
     "get_datatransfer_settings",
     "get_db_settings",
     "get_email_settings",
+    "get_featureflag_settings",
     "get_graphql_settings",
     "get_health_settings",
     "get_i18n_settings",
@@ -175,6 +175,9 @@ class AppSettings(BaseSettings):
     rate_limit_window_seconds: int = Field(
         default=60, ge=1, le=3600, description="Rate limit window in seconds",
     )
+    rate_limit_algorithm: Literal["gcra", "token_bucket"] = Field(
+        default="gcra", description="Rate limiting algorithm (gcra or token_bucket)",
+    )
 
     # Debug middleware configuration (distributed tracing)
     enable_debug_middleware: bool = Field(
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Literal
 
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -47,14 +48,26 @@ class DataTransferSettings(BaseSettings):
 
     enable_compression: bool = Field(
         default=False,
-        description="Enable gzip compression for exports",
+        description="Enable compression for exports",
+    )
+
+    compression_format: Literal["gzip", "zstd"] = Field(
+        default="gzip",
+        description="Streaming compression format for exports (zstd requires zstandard before Python 3.14)",
     )
 
     compression_level: int = Field(
         default=6,
         ge=1,
         le=9,
-        description="Gzip compression level (1=fastest, 9=best compression)",
+        description="Compression level (1=fastest, 9=best compression)",
+    )
+
+    export_batch_size: int = Field(
+        default=5000,
+        ge=100,
+        le=100000,
+        description="Rows read per keyset page when streaming exports",
     )
 
     # ──────────────────────────────────────────────────────────────
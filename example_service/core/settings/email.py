@@ -139,6 +139,32 @@ class EmailSettings(BaseSettings):
         le=500,
         description="Maximum recipients per batch send",
     )
+    batch_concurrency: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum messages in flight at once during a batch send",
+    )
+
+    # SMTP Connection Pool
+    smtp_pool_size: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Maximum open SMTP connections per provider configuration",
+    )
+    smtp_pool_max_messages: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Messages sent over one SMTP connection before it is replaced",
+    )
+    smtp_pool_idle_timeout: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Seconds an idle SMTP connection is kept open for reuse",
+    )
 
     @model_validator(mode="after")
     def validate_tls_ssl_exclusive(self) -> EmailSettings:
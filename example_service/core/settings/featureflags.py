@@ -0,0 +1,52 @@
+"""Feature flag evaluation settings.
+
+Environment variables use FEATUREFLAGS_ prefix.
+Example: FEATUREFLAGS_SNAPSHOT_ENABLED=true
+         FEATUREFLAGS_REFRESH_INTERVAL_SECONDS=30
+"""
+
+from __future__ import annotations
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class FeatureFlagSettings(BaseSettings):
+    """Feature flag snapshot engine settings.
+
+    Environment variables use FEATUREFLAGS_ prefix.
+    Example: FEATUREFLAGS_REFRESH_INTERVAL_SECONDS=10
+
+    The snapshot engine keeps every flag and override in memory so flag
+    checks do not query the database. Changes reach other replicas through
+    Redis pub/sub, with versioned polling as the fallback.
+    """
+
+    snapshot_enabled: bool = Field(
+        default=True,
+        description="Evaluate flags from an in-memory snapshot instead of querying the database per check",
+    )
+    refresh_interval_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=3600.0,
+        description="Seconds between version checks that reload the snapshot when flags changed",
+    )
+    invalidation_channel: str = Field(
+        default="featureflags:changed",
+        min_length=1,
+        description="Redis pub/sub channel (prefixed with the Redis key_prefix) announcing flag changes",
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="FEATUREFLAGS_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore",
+        env_ignore_empty=True,
+    )
+
+
+__all__ = ["FeatureFlagSettings"]
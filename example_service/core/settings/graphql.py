@@ -94,6 +94,36 @@ class GraphQLSettings(BaseSettings):
         description="Enable GraphQL schema introspection (disable in production for security)",
     )
 
+    # Automatic persisted queries and parsed-document caching
+    persisted_queries_enabled: bool = Field(
+        default=True,
+        description="Accept Automatic Persisted Queries (sha256 hash instead of the document)",
+    )
+    persisted_query_ttl: int = Field(
+        default=604800,
+        ge=60,
+        le=2592000,
+        description="TTL in seconds for persisted query documents stored in Redis",
+    )
+    persisted_query_local_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Persisted query documents kept in the in-process LRU",
+    )
+    document_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        le=100000,
+        description="Parsed and validated documents cached in process (0 disables)",
+    )
+
+    # Cross-request DataLoader cache
+    dataloader_cache_enabled: bool = Field(
+        default=False,
+        description="Serve tags, feature flags and audit logs from Redis across requests",
+    )
+
     # Feature Toggles
     # Enable/disable specific GraphQL features without code changes
     feature_reminders: bool = Field(
@@ -33,6 +33,7 @@ from .backup import BackupSettings
 from .consul import ConsulSettings
 from .datatransfer import DataTransferSettings
 from .email import EmailSettings
+from .featureflags import FeatureFlagSettings
 from .graphql import GraphQLSettings
 from .health import HealthCheckSettings
 from .i18n import I18nSettings
@@ -280,6 +281,16 @@ def get_webhook_settings() -> WebhookSettings:
     return WebhookSettings()
 
 
+@lru_cache(maxsize=1)
+def get_featureflag_settings() -> FeatureFlagSettings:
+    """Get cached feature flag settings.
+
+    Returns:
+        Validated and frozen FeatureFlagSettings instance.
+    """
+    return FeatureFlagSettings()
+
+
 def clear_all_caches() -> None:
     """Clear all settings caches.
 
@@ -309,6 +320,7 @@ def clear_all_caches() -> None:
     get_job_settings.cache_clear()
     get_search_settings.cache_clear()
     get_webhook_settings.cache_clear()
+    get_featureflag_settings.cache_clear()
 
 
 def clear_settings_cache() -> None:
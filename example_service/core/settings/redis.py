@@ -131,6 +131,60 @@ class RedisSettings(BaseSettings):
         description="Auth token cache TTL in seconds (5 minutes)",
     )
 
+    # ──────────────────────────────────────────────────────────────
+    # Value encoding settings
+    # ──────────────────────────────────────────────────────────────
+
+    value_serializer: Literal["json", "msgpack"] = Field(
+        default="json",
+        description="Serializer for cached values (msgpack requires the msgpack package)",
+    )
+
+    value_compression: Literal["none", "zlib", "zstd", "lz4"] = Field(
+        default="none",
+        description="Compression for cached values above the threshold (zstd/lz4 require optional packages)",
+    )
+
+    value_compression_threshold: int = Field(
+        default=1024,
+        ge=0,
+        description="Minimum serialized value size in bytes before compression is applied",
+    )
+
+    # ──────────────────────────────────────────────────────────────
+    # Local (L1) in-process cache settings
+    # ──────────────────────────────────────────────────────────────
+
+    local_cache_enabled: bool = Field(
+        default=False,
+        description="Enable a bounded in-process L1 cache in front of Redis for RedisCache reads",
+    )
+
+    local_cache_max_size: int = Field(
+        default=10_000,
+        ge=1,
+        le=1_000_000,
+        description="Maximum number of entries held in the in-process L1 cache",
+    )
+
+    local_cache_ttl: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=3600.0,
+        description="Maximum L1 entry lifetime in seconds (bounds staleness if an invalidation is missed)",
+    )
+
+    local_cache_eviction: Literal["lru", "lfu"] = Field(
+        default="lru",
+        description="L1 eviction policy: least recently used or least frequently used",
+    )
+
+    local_cache_invalidation_channel: str = Field(
+        default="cache:invalidate",
+        min_length=1,
+        description="Redis pub/sub channel (prefixed with key_prefix) used to invalidate L1 entries across replicas",
+    )
+
     # ──────────────────────────────────────────────────────────────
     # Retry and resilience settings
     # ──────────────────────────────────────────────────────────────
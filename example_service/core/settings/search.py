@@ -6,6 +6,7 @@ environment variables with SEARCH_ prefix.
 Features controlled:
 - Feature flags (synonyms, click boosting, semantic search, etc.)
 - Performance tuning (cache TTL, max query length, result limits)
+- Parallel multi-entity search (concurrency cap, deadline)
 - Fuzzy search settings
 - Click boosting configuration
 - Slow query logging
@@ -14,6 +15,8 @@ Features controlled:
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,9 +37,32 @@ class SearchSettings(BaseSettings):
     # Performance tuning
     cache_ttl_seconds: int = Field(default=300, ge=0, description="Cache TTL in seconds")
     suggestion_cache_ttl: int = Field(default=600, ge=0, description="Suggestion cache TTL")
+    facet_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Facet count cache TTL in seconds (0 disables facet caching)",
+    )
     max_query_length: int = Field(default=500, ge=1, description="Maximum query length")
     max_results_per_entity: int = Field(default=100, ge=1, description="Max results per entity")
     min_rank_threshold: float = Field(default=0.0, ge=0.0, le=1.0, description="Min rank threshold")
+    count_strategy: Literal["exact", "capped", "estimate"] = Field(
+        default="exact",
+        description="Total hit counting: exact, capped at count_threshold, or planner estimate above it",
+    )
+    count_threshold: int = Field(
+        default=1000, ge=1, description="Matches counted exactly before capping or estimating",
+    )
+
+    # Parallel multi-entity search
+    enable_parallel_search: bool = Field(
+        default=False, description="Search entity types concurrently on separate sessions",
+    )
+    parallel_search_max_concurrency: int = Field(
+        default=4, ge=1, le=32, description="Max concurrent entity searches per request",
+    )
+    parallel_search_timeout_ms: int = Field(
+        default=2000, ge=1, description="Deadline for all entity searches in milliseconds",
+    )
 
     # Fuzzy search settings
     fuzzy_threshold: float = Field(default=0.3, ge=0.0, le=1.0, description="Fuzzy match threshold")
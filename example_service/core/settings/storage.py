@@ -236,6 +236,27 @@ class StorageSettings(BaseSettings):
         description="S3 key prefix for generated thumbnails",
     )
 
+    # ──────────────────────────────────────────────────────────────
+    # Content-Addressed Storage
+    # ──────────────────────────────────────────────────────────────
+
+    dedup_enabled: bool = Field(
+        default=False,
+        description="Store direct uploads under their sha256 so identical files share one object",
+    )
+
+    dedup_prefix: str = Field(
+        default="blobs/",
+        description="S3 key prefix for content-addressed objects",
+    )
+
+    dedup_gc_grace_seconds: int = Field(
+        default=3600,
+        ge=0,
+        le=30 * 24 * 3600,
+        description="How long an unreferenced content-addressed object is kept before garbage collection",
+    )
+
     # ──────────────────────────────────────────────────────────────
     # Health Check Configuration
     # ──────────────────────────────────────────────────────────────
@@ -275,6 +296,27 @@ class StorageSettings(BaseSettings):
         description="Number of chunks to buffer during streaming operations",
     )
 
+    multipart_threshold: int = Field(
+        default=64 * 1024 * 1024,  # 64MB
+        ge=5 * 1024 * 1024,  # S3 minimum part size
+        le=5 * 1024 * 1024 * 1024,  # 5GB single PUT maximum
+        description="Objects at least this large are uploaded as streaming multipart uploads",
+    )
+
+    multipart_part_size: int = Field(
+        default=8 * 1024 * 1024,  # 8MB
+        ge=5 * 1024 * 1024,  # S3 minimum part size
+        le=5 * 1024 * 1024 * 1024,  # S3 maximum part size
+        description="Part size in bytes for multipart uploads",
+    )
+
+    multipart_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Parts uploaded in parallel (bounds memory to about concurrency x part size)",
+    )
+
     # ──────────────────────────────────────────────────────────────
     # Service Lifecycle Configuration
     # ──────────────────────────────────────────────────────────────
@@ -31,6 +31,36 @@ class WebhookSettings(BaseSettings):
         description="Connection timeout for webhook HTTP requests (seconds)",
     )
 
+    # Connection pooling
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with webhook endpoints (requires the h2 package)",
+    )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum open connections in the shared webhook HTTP pool",
+    )
+    max_keepalive_connections: int = Field(
+        default=50,
+        ge=0,
+        le=1000,
+        description="Maximum idle connections kept alive for reuse",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds an idle pooled connection is kept before closing",
+    )
+    max_concurrency_per_host: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum concurrent deliveries to a single host",
+    )
+
     # Retry configuration
     max_retries: int = Field(
         default=3,
@@ -54,6 +84,10 @@ class WebhookSettings(BaseSettings):
         ge=1.0,
         description="Maximum delay between retries (1 hour default)",
     )
+    scheduler_enabled: bool = Field(
+        default=True,
+        description="Deliver new events and retries from an in-process scheduled queue instead of waiting for the pending-delivery sweep",
+    )
 
     # Delivery guarantees
     enable_signature: bool = Field(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -63,6 +65,36 @@ class WebSocketSettings(BaseSettings):
         description="Timeout for graceful WebSocket close handshake",
     )
 
+    # ──────────────────────────────────────────────────────────────
+    # Outbound delivery
+    # ──────────────────────────────────────────────────────────────
+
+    send_queue_size: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Maximum messages buffered per connection before it counts as slow",
+    )
+
+    slow_consumer_policy: Literal["drop", "disconnect"] = Field(
+        default="disconnect",
+        description="What to do when a connection's send queue is full: drop the message or disconnect",
+    )
+
+    broadcast_batch_window_ms: float = Field(
+        default=0,
+        ge=0,
+        le=1000,
+        description="Buffer broadcasts per channel and send them as one batch frame (0 disables)",
+    )
+
+    broadcast_batch_max_messages: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Pending broadcasts that trigger an early batch flush",
+    )
+
     # ──────────────────────────────────────────────────────────────
     # Channel configuration
     # ──────────────────────────────────────────────────────────────
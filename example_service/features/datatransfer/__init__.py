@@ -3,7 +3,7 @@
 Provides comprehensive data import/export capabilities:
 - CSV, JSON, and Excel format support
 - Validation with detailed error reporting
-- Streaming exports for large datasets
+- Streaming exports for large datasets (keyset pagination, gzip/zstd)
 - Progress tracking for long operations
 - Storage integration for exports
 
@@ -64,6 +64,7 @@ from .jobs import (
     run_export_job,
     run_import_job,
 )
+from .loader import BulkLoader
 from .router import router
 from .schemas import (
     ExportFormat,
@@ -81,6 +82,14 @@ from .schemas import (
     SupportedEntity,
 )
 from .service import DataTransferService, get_data_transfer_service
+from .streaming import (
+    CSVRowWriter,
+    JSONDocumentWriter,
+    JSONLinesWriter,
+    encode_stream,
+    get_compressor,
+    iter_rows,
+)
 from .validators import (
     EntityValidator,
     ValidationError,
@@ -104,8 +113,12 @@ __all__ = [
     "BaseExporter",
     # Importers
     "BaseImporter",
+    # Loader
+    "BulkLoader",
     "CSVExporter",
     "CSVImporter",
+    # Streaming
+    "CSVRowWriter",
     # Errors
     "DataImportError",
     # Audit
@@ -130,8 +143,10 @@ __all__ = [
     "ImportResult",
     "ImportStatus",
     "ImportValidationError",
+    "JSONDocumentWriter",
     "JSONExporter",
     "JSONImporter",
+    "JSONLinesWriter",
     # Jobs
     "JobProgress",
     "JobStatus",
@@ -147,7 +162,9 @@ __all__ = [
     "cleanup_old_exports",
     "cleanup_old_exports_async",
     "create_validator",
+    "encode_stream",
     "get_audit_logger",
+    "get_compressor",
     "get_data_transfer_service",
     "get_export_stats",
     "get_exporter",
@@ -155,6 +172,7 @@ __all__ = [
     "get_job_tracker",
     "get_supported_events",
     "get_validator_registry",
+    "iter_rows",
     "log_export_operation",
     "log_import_operation",
     "notify_export_complete",
@@ -1,6 +1,8 @@
 """Data importers for various formats.
 
 Provides importers for CSV, JSON, and Excel formats with validation.
+``iter_bytes`` yields records one at a time so large imports can be
+validated and written in chunks without building the full record list.
 """
 
 from __future__ import annotations
@@ -15,7 +17,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -108,6 +110,20 @@ class BaseImporter[T](ABC):
         """
         ...
 
+    def iter_bytes(self, data: bytes) -> Iterator[ParsedRecord]:
+        """Parse records from bytes one at a time.
+
+        Importers that can parse incrementally override this; the default
+        parses everything up front.
+
+        Args:
+            data: Input data as bytes.
+
+        Yields:
+            Parsed records with validation results, in file order.
+        """
+        yield from self.parse_bytes(data)
+
     @property
     @abstractmethod
     def supported_extensions(self) -> list[str]:
@@ -278,18 +294,23 @@ class CSVImporter(BaseImporter[T]):
         text = data.decode(self.encoding)
         return self._parse_csv(io.StringIO(text))
 
+    def iter_bytes(self, data: bytes) -> Iterator[ParsedRecord]:
+        """Parse CSV bytes row by row, decoding incrementally."""
+        text = io.TextIOWrapper(io.BytesIO(data), encoding=self.encoding, newline="")
+        yield from self._iter_csv(text)
+
     def _parse_csv(self, file_obj: io.StringIO | Any) -> list[ParsedRecord]:
         """Parse CSV from file-like object."""
+        return list(self._iter_csv(file_obj))
+
+    def _iter_csv(self, file_obj: io.TextIOBase | Any) -> Iterator[ParsedRecord]:
+        """Parse CSV rows from a file-like object one at a time."""
         reader = csv.DictReader(file_obj, delimiter=self.delimiter)
-        records = []
 
         for row_num, row in enumerate(reader, start=2):  # Row 1 is header
             # Clean up None values from empty strings
             cleaned = {k: (v if v != "" else None) for k, v in row.items() if k}
-            parsed = self.validate_record(cleaned, row_number=row_num)
-            records.append(parsed)
-
-        return records
+            yield self.validate_record(cleaned, row_number=row_num)
 
 
 class JSONImporter(BaseImporter[T]):
@@ -329,8 +350,20 @@ class JSONImporter(BaseImporter[T]):
         parsed = json.loads(data.decode("utf-8"))
         return self._parse_json(parsed)
 
+    def iter_bytes(self, data: bytes) -> Iterator[ParsedRecord]:
+        """Parse JSON bytes, validating records one at a time."""
+        return self._iter_json(json.loads(data.decode("utf-8")))
+
     def _parse_json(self, data: dict | list) -> list[ParsedRecord]:
         """Parse JSON data structure."""
+        return list(self._iter_json(data))
+
+    def _iter_json(self, data: dict | list) -> Iterator[ParsedRecord]:
+        """Validate the JSON structure and return an iterator over its records.
+
+        Raises:
+            DataImportError: If the structure holds no records array.
+        """
         # Support both array and object with records key
         if isinstance(data, list):
             records_list = data
@@ -343,22 +376,20 @@ class JSONImporter(BaseImporter[T]):
             msg = "JSON must be an array or object with records"
             raise DataImportError(msg)
 
-        records = []
+        return self._iter_records(records_list)
+
+    def _iter_records(self, records_list: list[Any]) -> Iterator[ParsedRecord]:
+        """Validate JSON records one at a time."""
         for row_num, row in enumerate(records_list, start=1):
             if not isinstance(row, dict):
-                records.append(
-                    ParsedRecord(
-                        row_number=row_num,
-                        data={},
-                        errors=[("_record", f"Row {row_num} is not an object")],
-                    ),
+                yield ParsedRecord(
+                    row_number=row_num,
+                    data={},
+                    errors=[("_record", f"Row {row_num} is not an object")],
                 )
                 continue
 
-            parsed = self.validate_record(row, row_number=row_num)
-            records.append(parsed)
-
-        return records
+            yield self.validate_record(row, row_number=row_num)
 
 
 class ExcelImporter(BaseImporter[T]):
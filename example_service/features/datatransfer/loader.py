@@ -0,0 +1,277 @@
+"""Set-based writer for data imports.
+
+Imports write each chunk of rows with a handful of statements instead of an
+ORM round trip per row:
+
+- Existing ids are resolved with one ``IN`` query per chunk.
+- New rows are streamed with ``COPY ... FROM STDIN`` on psycopg, or a
+  batched multi-row ``INSERT`` on other drivers.
+- Updates are copied into a temporary staging table and applied with a
+  single ``UPDATE ... FROM``; other drivers use a bulk UPDATE by primary key.
+
+COPY bypasses SQLAlchemy, so Python-side column defaults (generated ids,
+timestamps), ``onupdate`` values and bind processing (enums, JSON) are applied
+to each row before it is sent.
+
+Example:
+    loader = BulkLoader(session, Reminder)
+    existing = await loader.existing_ids([row["id"] for row in rows])
+    await loader.insert([row for row in rows if row["id"] not in existing])
+"""
+
+from __future__ import annotations
+
+from itertools import count
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert, select, text, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.sql.schema import CallableColumnDefault, ScalarElementColumnDefault
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import Column
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.schema import DefaultGenerator
+
+logger = logging.getLogger(__name__)
+
+# Drivers whose connections support COPY FROM STDIN
+_COPY_DRIVERS = frozenset({"psycopg", "psycopg_async"})
+
+_staging_ids = count(1)
+
+
+class BulkLoader:
+    """Write import rows for one model with set-based statements.
+
+    Rows are dictionaries keyed by model attribute names, like the keyword
+    arguments the model constructor takes.
+    """
+
+    def __init__(self, session: AsyncSession, model_class: type[Any]) -> None:
+        """Initialize loader.
+
+        Args:
+            session: Async database session; writes join its transaction.
+            model_class: Mapped model to write.
+        """
+        self.session = session
+        self.model_class = model_class
+
+        mapper = sa_inspect(model_class)
+        self.table = mapper.local_table
+        self.columns: dict[str, Column[Any]] = {
+            attr.key: attr.columns[0] for attr in mapper.column_attrs
+        }
+        self.key_column = self.columns.get("id")
+
+    def unknown_fields(self, data: dict[str, Any]) -> list[str]:
+        """Get the fields of a row that are not model columns."""
+        return [field for field in data if field not in self.columns]
+
+    def coerce_id(self, value: Any) -> Any:
+        """Convert an imported id to the key column's Python type.
+
+        Raises:
+            ValueError: If the value is not a valid id.
+        """
+        if self.key_column is None:
+            msg = f"{self.model_class.__name__} has no id column"
+            raise ValueError(msg)
+        python_type = self.key_column.type.python_type
+        if isinstance(value, python_type):
+            return value
+        try:
+            return python_type(value)
+        except (TypeError, ValueError) as e:
+            msg = f"Invalid id {value!r}: {e}"
+            raise ValueError(msg) from e
+
+    async def existing_ids(self, ids: Iterable[Any]) -> set[Any]:
+        """Get the ids that already exist, with one query.
+
+        Args:
+            ids: Ids already converted with ``coerce_id``.
+
+        Returns:
+            The subset of ``ids`` present in the table.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids or self.key_column is None:
+            return set()
+        result = await self.session.execute(
+            select(self.key_column).where(self.key_column.in_(unique_ids)),
+        )
+        return set(result.scalars())
+
+    async def insert(self, rows: list[dict[str, Any]]) -> None:
+        """Insert new rows.
+
+        Args:
+            rows: Rows without unknown fields; ids are generated by defaults.
+        """
+        if not rows:
+            return
+        if self._use_copy():
+            for fields, group in _group_by_fields(rows).items():
+                await self._copy_insert(fields, group)
+        else:
+            await self.session.execute(insert(self.model_class), rows)
+
+    async def update(self, rows: list[dict[str, Any]]) -> None:
+        """Update existing rows by id.
+
+        Args:
+            rows: Rows including ``id``; only the given fields are updated.
+        """
+        if not rows:
+            return
+        if self._use_copy():
+            for fields, group in _group_by_fields(rows).items():
+                await self._copy_update(fields, group)
+        else:
+            await self.session.execute(update(self.model_class), rows)
+
+    def _use_copy(self) -> bool:
+        return self.session.get_bind().dialect.driver in _COPY_DRIVERS
+
+    async def _copy_insert(self, fields: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        """COPY rows into the table, filling Python-side defaults first."""
+        columns = [self.columns[field] for field in fields]
+        defaulted = [
+            column
+            for key, column in self.columns.items()
+            if key not in fields
+            and column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        ]
+        processors = self._processors(columns + defaulted)
+
+        def values(row: dict[str, Any]) -> tuple[Any, ...]:
+            raw = [row[field] for field in fields]
+            raw.extend(_default_value(column.default) for column in defaulted)
+            return tuple(
+                value if process is None or value is None else process(value)
+                for value, process in zip(raw, processors, strict=True)
+            )
+
+        target = self._preparer().format_table(self.table)
+        await self._copy(target, columns + defaulted, (values(row) for row in rows))
+
+        logger.debug(
+            "Copied %d rows into %s", len(rows), self.table.name,
+        )
+
+    async def _copy_update(self, fields: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        """Apply updates through a temporary staging table."""
+        preparer = self._preparer()
+        key = self.key_column
+        if key is None:
+            msg = f"{self.model_class.__name__} has no id column"
+            raise ValueError(msg)
+
+        columns = [self.columns[field] for field in fields]
+        # The raw UPDATE skips onupdate hooks, so stage their values as well
+        refreshed = [
+            column
+            for key, column in self.columns.items()
+            if key not in fields
+            and column.onupdate is not None
+            and (column.onupdate.is_scalar or column.onupdate.is_callable)
+        ]
+        staged = columns + refreshed
+        processors = self._processors(staged)
+        set_columns = [column for column in staged if column is not key]
+        target = preparer.format_table(self.table)
+        staging = preparer.quote(f"_import_{self.table.name}_{next(_staging_ids)}")
+        column_list = ", ".join(preparer.quote(column.name) for column in staged)
+
+        def values(row: dict[str, Any]) -> tuple[Any, ...]:
+            raw = [row[field] for field in fields]
+            raw.extend(_default_value(column.onupdate) for column in refreshed)
+            return tuple(
+                value if process is None or value is None else process(value)
+                for value, process in zip(raw, processors, strict=True)
+            )
+
+        await self.session.execute(
+            text(
+                f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {target} WITH NO DATA",
+            ),
+        )
+        await self._copy(staging, staged, (values(row) for row in rows))
+        if set_columns:
+            assignments = ", ".join(
+                f"{preparer.quote(column.name)} = s.{preparer.quote(column.name)}"
+                for column in set_columns
+            )
+            key_name = preparer.quote(key.name)
+            await self.session.execute(
+                text(
+                    f"UPDATE {target} AS t SET {assignments} FROM {staging} AS s "
+                    f"WHERE t.{key_name} = s.{key_name}",
+                ),
+            )
+        await self.session.execute(text(f"DROP TABLE {staging}"))
+
+        logger.debug(
+            "Updated %d rows in %s from staging", len(rows), self.table.name,
+        )
+
+    async def _copy(
+        self,
+        target: str,
+        columns: list[Column[Any]],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> None:
+        """Stream rows into ``target`` with COPY on the session's connection."""
+        preparer = self._preparer()
+        column_list = ", ".join(preparer.quote(column.name) for column in columns)
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if driver_connection is None:
+            msg = "COPY needs an open driver connection"
+            raise RuntimeError(msg)
+
+        statement = f"COPY {target} ({column_list}) FROM STDIN"
+        async with (
+            driver_connection.cursor() as cursor,
+            cursor.copy(statement) as copy,
+        ):
+            for row in rows:
+                await copy.write_row(row)
+
+    def _processors(self, columns: list[Column[Any]]) -> list[Any]:
+        dialect = self.session.get_bind().dialect
+        return [column.type.bind_processor(dialect) for column in columns]
+
+    def _preparer(self) -> Any:
+        return self.session.get_bind().dialect.identifier_preparer
+
+
+def _group_by_fields(rows: list[dict[str, Any]]) -> dict[tuple[str, ...], list[dict[str, Any]]]:
+    """Group rows by their field set so each group shares one column list."""
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    return groups
+
+
+def _default_value(default: DefaultGenerator | None) -> Any:
+    """Evaluate a scalar or Python callable column default or onupdate."""
+    if isinstance(default, ScalarElementColumnDefault):
+        return default.arg
+    if isinstance(default, CallableColumnDefault):
+        # SQLAlchemy wraps zero-argument callables to accept an execution
+        # context, which they ignore
+        return default.arg(None)  # type: ignore[arg-type]
+    msg = f"Unsupported column default {default!r}"
+    raise TypeError(msg)
+
+
+__all__ = ["BulkLoader"]
@@ -34,6 +34,7 @@ from .schemas import (
     SupportedEntitiesResponse,
 )
 from .service import DataTransferService
+from .streaming import GzipCompressor, ZstdCompressor
 from .webhooks import notify_export_complete, notify_import_complete
 
 if TYPE_CHECKING:
@@ -412,12 +413,16 @@ async def stream_export(
     user: AuthUserDep,
     _rate_limit: StreamingRateLimit,
     entity_type: Annotated[str, Query(description="Entity type to export")],
+    *,
     format: Annotated[
         ExportFormat, Query(description="Export format"),
     ] = ExportFormat.CSV,
     chunk_size: Annotated[
         int, Query(description="Records per chunk (100-10000)", ge=100, le=10000),
     ] = 1000,
+    compress: Annotated[
+        bool, Query(description="Compress the stream (gzip or zstd, from settings)"),
+    ] = False,
     tenant: TenantContextDep = None,
 ) -> StreamingResponse:
     """Stream export data for large datasets.
@@ -432,6 +437,7 @@ async def stream_export(
         entity_type: Type of entity to export.
         format: Output format (csv or json - xlsx not supported for streaming).
         chunk_size: Number of records per chunk.
+        compress: Compress the stream with the configured compression format.
         tenant: Optional tenant context for multi-tenant filtering.
 
     Returns:
@@ -456,7 +462,7 @@ async def stream_export(
         )
 
     # Excel format doesn't support streaming well
-    if format == ExportFormat.XLSX:
+    if format == ExportFormat.EXCEL:
         raise BadRequestException(
             detail="Excel format does not support streaming. Use CSV or JSON.",
             type="unsupported-format",
@@ -483,9 +489,18 @@ async def stream_export(
         content_type = "application/x-ndjson"  # JSON Lines format
         filename = f"{entity_type}_{timestamp}.jsonl"
 
+    compression = get_datatransfer_settings().compression_format if compress else None
+    if compression is not None:
+        compressor = GzipCompressor if compression == "gzip" else ZstdCompressor
+        content_type = compressor.content_type
+        filename = f"{filename}.{compressor.file_extension}"
+
     async def generate() -> AsyncIterator[bytes]:
         async for chunk in service.stream_export(
-            request, tenant_id=tenant_id, chunk_size=chunk_size,
+            request,
+            tenant_id=tenant_id,
+            chunk_size=chunk_size,
+            compression=compression,
         ):
             yield chunk
 
@@ -8,18 +8,22 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 import gzip
+from itertools import batched
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 import uuid
 
 from sqlalchemy import func, select
+from sqlalchemy import inspect as sa_inspect
 
 from example_service.core.settings import get_datatransfer_settings
 
 from .exporters import get_exporter
 from .importers import ParsedRecord, get_importer
+from .loader import BulkLoader
 from .schemas import (
+    ExportFormat,
     ExportRequest,
     ExportResult,
     ExportStatus,
@@ -31,12 +35,23 @@ from .schemas import (
     ImportValidationError,
     SupportedEntity,
 )
+from .streaming import (
+    CSVRowWriter,
+    JSONDocumentWriter,
+    JSONLinesWriter,
+    RowWriter,
+    encode_stream,
+    get_compressor,
+    iter_rows,
+)
 from .validators import get_validator_registry, validate_entity
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
 
 
 logger = logging.getLogger(__name__)
@@ -339,8 +354,44 @@ class DataTransferService:
         model_class = self._import_model(config["model_path"])
 
         # Build query
-        stmt = select(model_class)
+        stmt = self._apply_export_filters(
+            select(model_class),
+            model_class,
+            entity_type,
+            filters=filters,
+            filter_conditions=filter_conditions,
+            tenant_id=tenant_id,
+        )
+
+        # Execute query
+        result = await self.session.execute(stmt)
+        records = result.scalars().all()
+
+        return list(records), config
+
+    def _apply_export_filters(
+        self,
+        stmt: Any,
+        model_class: type[Any],
+        entity_type: str,
+        *,
+        filters: dict[str, Any] | None,
+        filter_conditions: list[FilterCondition] | None,
+        tenant_id: str | None,
+    ) -> Any:
+        """Apply tenant, legacy and advanced filters to an export query.
+
+        Args:
+            stmt: SQLAlchemy select statement.
+            model_class: Model class being exported.
+            entity_type: Type of entity being exported.
+            filters: Optional simple equality filters (legacy, deprecated).
+            filter_conditions: Optional advanced filter conditions.
+            tenant_id: Optional tenant ID for multi-tenant filtering.
 
+        Returns:
+            Filtered statement.
+        """
         # Apply tenant filter if tenant isolation is enabled and tenant_id is provided
         settings = get_datatransfer_settings()
         if (
@@ -370,11 +421,179 @@ class DataTransferService:
             for condition in filter_conditions:
                 stmt = self._apply_filter_condition(stmt, model_class, condition)
 
-        # Execute query
-        result = await self.session.execute(stmt)
-        records = result.scalars().all()
+        return stmt
 
-        return list(records), config
+    def _build_export_query(
+        self,
+        request: ExportRequest,
+        tenant_id: str | None = None,
+    ) -> tuple[Select[Any], InstrumentedAttribute[Any] | None, list[str]]:
+        """Build a column select for a streaming export.
+
+        Only the exported columns (plus the ``id`` key) are selected, so rows
+        are read without building ORM objects. Requested fields that are not
+        columns of the model are skipped.
+
+        Args:
+            request: Export request.
+            tenant_id: Optional tenant ID for multi-tenant filtering.
+
+        Returns:
+            Tuple of (statement, keyset pagination column or None, fields).
+
+        Raises:
+            ValueError: If entity type is not exportable.
+        """
+        config = self._get_entity_config(request.entity_type)
+        if not config.get("exportable", True):
+            msg = f"Entity '{request.entity_type}' is not exportable"
+            raise ValueError(msg)
+
+        model_class = self._import_model(config["model_path"])
+        columns = {
+            attr.key: getattr(model_class, attr.key)
+            for attr in sa_inspect(model_class).column_attrs
+        }
+
+        requested = request.fields or config.get("fields") or list(columns)
+        fields = [field for field in requested if field in columns]
+        skipped = [field for field in requested if field not in columns]
+        if skipped:
+            logger.debug(
+                "Skipping export fields that are not columns",
+                extra={"entity_type": request.entity_type, "fields": skipped},
+            )
+
+        key_column = columns.get("id")
+        selected = [columns[field] for field in fields]
+        if key_column is not None and "id" not in fields:
+            selected.append(key_column)
+
+        stmt = self._apply_export_filters(
+            select(*selected),
+            model_class,
+            request.entity_type,
+            filters=request.filters,
+            filter_conditions=request.filter_conditions,
+            tenant_id=tenant_id,
+        )
+        return stmt, key_column, fields
+
+    async def iter_export_rows(
+        self,
+        request: ExportRequest,
+        tenant_id: str | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Read export rows page by page with keyset pagination.
+
+        Args:
+            request: Export request.
+            tenant_id: Optional tenant ID for multi-tenant filtering.
+            batch_size: Rows per page (default from settings).
+
+        Yields:
+            Pages of row dictionaries keyed by field name.
+        """
+        stmt, key_column, _ = self._build_export_query(request, tenant_id)
+        batch_size = batch_size or get_datatransfer_settings().export_batch_size
+        async for rows in iter_rows(
+            self.session, stmt, key_column, batch_size=batch_size,
+        ):
+            yield rows
+
+    def _get_row_writer(
+        self,
+        request: ExportRequest,
+        fields: list[str],
+        *,
+        json_lines: bool = False,
+    ) -> RowWriter:
+        """Get the streaming writer for an export format.
+
+        Args:
+            request: Export request.
+            fields: Exported fields, in order.
+            json_lines: Write JSON as JSON Lines instead of a JSON document.
+
+        Returns:
+            Row writer.
+
+        Raises:
+            ValueError: If the format cannot be streamed.
+        """
+        if request.format == ExportFormat.CSV:
+            return CSVRowWriter(fields, include_headers=request.include_headers)
+        if request.format == ExportFormat.JSON:
+            return JSONLinesWriter(fields) if json_lines else JSONDocumentWriter(fields)
+        msg = f"Export format '{request.format.value}' does not support streaming"
+        raise ValueError(msg)
+
+    async def _export_records_file(
+        self,
+        request: ExportRequest,
+        tenant_id: str | None,
+        export_dir: Path,
+    ) -> tuple[Path, int]:
+        """Export with an in-memory exporter (formats that cannot stream).
+
+        Args:
+            request: Export request.
+            tenant_id: Optional tenant ID for multi-tenant filtering.
+            export_dir: Directory to write the export to.
+
+        Returns:
+            Tuple of (file path, record count).
+        """
+        records, config = await self._fetch_export_records(
+            request.entity_type,
+            request.filters,
+            request.filter_conditions,
+            tenant_id,
+        )
+        exporter = get_exporter(
+            format=request.format.value,
+            fields=request.fields or config.get("fields"),
+            include_headers=request.include_headers,
+        )
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        file_path = (
+            export_dir / f"{request.entity_type}_{timestamp}.{exporter.file_extension}"
+        )
+        return file_path, exporter.export(records, file_path)
+
+    async def _stream_export_file(
+        self,
+        request: ExportRequest,
+        tenant_id: str | None,
+        export_dir: Path,
+    ) -> tuple[Path, int]:
+        """Stream an export into a file page by page.
+
+        Args:
+            request: Export request.
+            tenant_id: Optional tenant ID for multi-tenant filtering.
+            export_dir: Directory to write the export to.
+
+        Returns:
+            Tuple of (file path, record count).
+        """
+        stmt, key_column, fields = self._build_export_query(request, tenant_id)
+        writer = self._get_row_writer(request, fields)
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        file_path = export_dir / f"{request.entity_type}_{timestamp}.{writer.file_extension}"
+
+        pages = iter_rows(
+            self.session,
+            stmt,
+            key_column,
+            batch_size=get_datatransfer_settings().export_batch_size,
+        )
+        with file_path.open("wb") as f:
+            async for chunk in encode_stream(pages, writer):
+                f.write(chunk)
+
+        return file_path, writer.record_count
 
     async def export(
         self,
@@ -394,30 +613,19 @@ class DataTransferService:
         started_at = datetime.now(UTC)
 
         try:
-            # Fetch records using shared helper
-            records, config = await self._fetch_export_records(
-                request.entity_type,
-                request.filters,
-                request.filter_conditions,
-                tenant_id,
-            )
-
-            # Get exporter
-            exporter = get_exporter(
-                format=request.format.value,
-                fields=request.fields or config.get("fields"),
-                include_headers=request.include_headers,
-            )
-
-            # Generate filename using settings
             settings = get_datatransfer_settings()
             export_dir = settings.ensure_export_dir()
-            timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-            filename = f"{request.entity_type}_{timestamp}.{exporter.file_extension}"
-            file_path = export_dir / filename
 
-            # Export to file
-            record_count = exporter.export(list(records), file_path)
+            # CSV and JSON stream to the file; Excel needs all rows at once
+            if request.format == ExportFormat.EXCEL:
+                file_path, record_count = await self._export_records_file(
+                    request, tenant_id, export_dir,
+                )
+            else:
+                file_path, record_count = await self._stream_export_file(
+                    request, tenant_id, export_dir,
+                )
+            filename = file_path.name
             file_size = file_path.stat().st_size
 
             # Upload to storage if requested
@@ -471,43 +679,55 @@ class DataTransferService:
             Tuple of (data bytes, content_type, filename).
         """
         settings = get_datatransfer_settings()
+        should_compress = compress if compress is not None else settings.enable_compression
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
 
-        # Fetch records using shared helper
-        records, config = await self._fetch_export_records(
-            request.entity_type,
-            request.filters,
-            request.filter_conditions,
-            tenant_id,
+        if request.format == ExportFormat.EXCEL:
+            # Excel needs all rows at once
+            records, config = await self._fetch_export_records(
+                request.entity_type,
+                request.filters,
+                request.filter_conditions,
+                tenant_id,
+            )
+            exporter = get_exporter(
+                format=request.format.value,
+                fields=request.fields or config.get("fields"),
+                include_headers=request.include_headers,
+            )
+            data = exporter.export_to_bytes(records)
+            filename = f"{request.entity_type}_{timestamp}.{exporter.file_extension}"
+            if should_compress:
+                return self._compress_data(data), "application/gzip", f"{filename}.gz"
+            return data, exporter.content_type, filename
+
+        # Rows are encoded (and compressed) page by page; only the output
+        # is held in memory
+        stmt, key_column, fields = self._build_export_query(request, tenant_id)
+        writer = self._get_row_writer(request, fields)
+        compressor = (
+            get_compressor(settings.compression_format, settings.compression_level)
+            if should_compress
+            else None
         )
-
-        # Get exporter and export
-        exporter = get_exporter(
-            format=request.format.value,
-            fields=request.fields or config.get("fields"),
-            include_headers=request.include_headers,
+        pages = iter_rows(
+            self.session, stmt, key_column, batch_size=settings.export_batch_size,
         )
+        data = b"".join([chunk async for chunk in encode_stream(pages, writer, compressor)])
 
-        data = exporter.export_to_bytes(records)
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        filename = f"{request.entity_type}_{timestamp}.{exporter.file_extension}"
-
-        # Apply compression if enabled
-        should_compress = compress if compress is not None else settings.enable_compression
-        if should_compress:
-            data = self._compress_data(data)
-            filename = f"{filename}.gz"
-            content_type = "application/gzip"
+        filename = f"{request.entity_type}_{timestamp}.{writer.file_extension}"
+        if compressor is not None:
             logger.debug(
                 "Compressed export data",
                 extra={
                     "entity_type": request.entity_type,
-                    "original_size": len(data),
+                    "compression": settings.compression_format,
                     "compressed_size": len(data),
                 },
             )
-            return data, content_type, filename
+            return data, compressor.content_type, f"{filename}.{compressor.file_extension}"
 
-        return data, exporter.content_type, filename
+        return data, writer.content_type, filename
 
     async def get_export_count(
         self,
@@ -559,119 +779,42 @@ class DataTransferService:
         request: ExportRequest,
         tenant_id: str | None = None,
         chunk_size: int = 1000,
+        compression: str | None = None,
     ) -> AsyncIterator[bytes]:
         """Stream export data in chunks for large datasets.
 
-        Uses server-side cursors and pagination to efficiently handle
-        large datasets without loading everything into memory.
+        Rows are read with keyset pagination on ``id`` and encoded page by
+        page, so memory use is constant and each page costs the same no
+        matter how far into the table it is. JSON is streamed as JSON Lines.
 
         Args:
             request: Export request.
             tenant_id: Optional tenant ID.
             chunk_size: Number of records per chunk.
+            compression: Optional streaming compression (``gzip`` or ``zstd``).
 
         Yields:
             Bytes chunks of exported data.
-        """
-        config = self._get_entity_config(entity_type=request.entity_type)
-        if not config.get("exportable", True):
-            msg = f"Entity '{request.entity_type}' is not exportable"
-            raise ValueError(msg)
-
-        model_class = self._import_model(config["model_path"])
-
-        # Build base query
-        stmt = select(model_class)
-
-        # Apply tenant filter
-        settings = get_datatransfer_settings()
-        if (
-            settings.enable_tenant_isolation
-            and tenant_id
-            and hasattr(model_class, "tenant_id")
-        ):
-            stmt = stmt.where(model_class.tenant_id == tenant_id)
-
-        # Apply filters
-        if request.filters:
-            for field, value in request.filters.items():
-                if hasattr(model_class, field):
-                    stmt = stmt.where(getattr(model_class, field) == value)
-
-        if request.filter_conditions:
-            for condition in request.filter_conditions:
-                stmt = self._apply_filter_condition(stmt, model_class, condition)
-
-        # Order by primary key for consistent pagination
-        if hasattr(model_class, "id"):
-            stmt = stmt.order_by(model_class.id)
 
-        # Get exporter
-        exporter = get_exporter(
-            format=request.format.value,
-            fields=request.fields or config.get("fields"),
-            include_headers=request.include_headers,
+        Raises:
+            ValueError: If the entity or format cannot be streamed.
+        """
+        stmt, key_column, fields = self._build_export_query(request, tenant_id)
+        writer = self._get_row_writer(request, fields, json_lines=True)
+        compressor = get_compressor(
+            compression, get_datatransfer_settings().compression_level,
         )
 
-        # Stream in chunks with offset-based pagination
-        offset = 0
-        first_chunk = True
-
-        while True:
-            # Execute paginated query
-            paginated_stmt = stmt.offset(offset).limit(chunk_size)
-            result = await self.session.execute(paginated_stmt)
-            records = list(result.scalars().all())
-
-            if not records:
-                break
-
-            # For CSV/JSON, we need to handle headers specially
-            if request.format.value == "csv":
-                if first_chunk:
-                    # Include headers in first chunk
-                    chunk_data = exporter.export_to_bytes(records)
-                else:
-                    # Skip headers for subsequent chunks
-                    temp_exporter = get_exporter(
-                        format=request.format.value,
-                        fields=request.fields or config.get("fields"),
-                        include_headers=False,
-                    )
-                    chunk_data = temp_exporter.export_to_bytes(records)
-            elif request.format.value == "json":
-                # For JSON, yield each record as a JSON line (JSONL format for streaming)
-                import json
-                lines = []
-                for record in records:
-                    record_dict = {
-                        field: getattr(record, field, None)
-                        for field in (request.fields or config.get("fields", []))
-                    }
-                    # Handle datetime serialization
-                    for key, value in record_dict.items():
-                        if isinstance(value, datetime):
-                            record_dict[key] = value.isoformat()
-                    lines.append(json.dumps(record_dict))
-                chunk_data = ("\n".join(lines) + "\n").encode("utf-8")
-            else:
-                # For Excel and other formats, export the chunk directly
-                chunk_data = exporter.export_to_bytes(records)
-
-            yield chunk_data
-            first_chunk = False
-            offset += chunk_size
-
-            # Check if we got fewer records than requested (last chunk)
-            if len(records) < chunk_size:
-                break
+        pages = iter_rows(self.session, stmt, key_column, batch_size=chunk_size)
+        async for chunk in encode_stream(pages, writer, compressor):
+            yield chunk
 
         logger.info(
             "Streaming export completed",
             extra={
                 "entity_type": request.entity_type,
-                "total_chunks": (offset // chunk_size) + 1,
-                "total_records": offset + len(records) if records else offset,
+                "total_records": writer.record_count,
+                "compression": compression,
             },
         )
 
@@ -687,6 +830,13 @@ class DataTransferService:
     ) -> ImportResult:
         """Import data from bytes.
 
+        Records are parsed, validated and written one chunk of
+        ``batch_size`` rows at a time. Each chunk is written set-based: one
+        query finds the ids that already exist, new rows are bulk inserted
+        and updates applied in bulk (see ``BulkLoader``), inside a savepoint.
+        If a chunk fails, its rows are retried one by one so the failing rows
+        can be reported.
+
         Args:
             data: Raw file data.
             entity_type: Type of entity to import.
@@ -716,13 +866,8 @@ class DataTransferService:
                 field_types=config.get("field_types", {}),
             )
 
-            # Parse and validate records
-            parsed_records = importer.parse_bytes(data)
-            total_rows = len(parsed_records)
-
             # Collect validation errors
             validation_errors: list[ImportValidationError] = []
-            valid_records: list[ParsedRecord] = []
             settings = get_datatransfer_settings()
             max_errors = settings.max_validation_errors
 
@@ -730,44 +875,82 @@ class DataTransferService:
             validator_registry = get_validator_registry()
             has_entity_validator = validator_registry.has_validator(entity_type)
 
-            for record in parsed_records:
-                if not record.is_valid:
-                    # Basic type validation failed
-                    for field, error in record.errors:
-                        if len(validation_errors) < max_errors:
-                            validation_errors.append(
-                                ImportValidationError(
-                                    row=record.row_number,
-                                    field=field if field != "_record" else None,
-                                    error=error,
-                                    value=record.data.get(field)
-                                    if field != "_record"
-                                    else None,
-                                ),
-                            )
+            loader = None
+            if not validate_only:
+                loader = BulkLoader(self.session, self._import_model(config["model_path"]))
+
+            total_rows = 0
+            invalid = 0
+            successful = 0
+            skipped = 0
+            failed = 0
+
+            # Ensure batch_size is within valid range
+            batch_size = max(1, min(batch_size, 1000))
+
+            for chunk in batched(importer.iter_bytes(data), batch_size, strict=False):
+                valid_records: list[ParsedRecord] = [
+                    record
+                    for record in chunk
+                    if self._validate_import_record(
+                        entity_type,
+                        record,
+                        has_entity_validator,
+                        validation_errors,
+                        max_errors,
+                    )
+                ]
+                total_rows += len(chunk)
+                invalid += len(chunk) - len(valid_records)
+
+                # Once validation has failed without skip_errors nothing is
+                # written, but the rest of the file is still validated
+                if loader is None or (invalid and not skip_errors) or not valid_records:
                     continue
 
-                # Run entity-specific validation if available
-                if has_entity_validator:
-                    entity_result = validate_entity(entity_type, record.data)
-                    if not entity_result.is_valid:
-                        for err in entity_result.errors:
-                            if len(validation_errors) < max_errors:
-                                validation_errors.append(
-                                    ImportValidationError(
-                                        row=record.row_number,
-                                        field=err.field,
-                                        error=err.message,
-                                        value=err.value,
-                                    ),
-                                )
-                        continue
-
-                    # Use transformed data if available
-                    if entity_result.transformed_data:
-                        record.data = entity_result.transformed_data
-
-                valid_records.append(record)
+                written, chunk_skipped, failures = await self._write_import_chunk(
+                    loader,
+                    valid_records,
+                    update_existing=update_existing,
+                    skip_errors=skip_errors,
+                )
+                successful += written
+                skipped += chunk_skipped
+                failed += len(failures)
+                for record, error in failures:
+                    if len(validation_errors) < 100:
+                        validation_errors.append(
+                            ImportValidationError(
+                                row=record.row_number,
+                                field=None,
+                                error=f"Database error: {error}",
+                            ),
+                        )
+
+                if failures and not skip_errors:
+                    await self.session.rollback()
+                    return ImportResult(
+                        status=ImportStatus.FAILED,
+                        import_id=import_id,
+                        entity_type=entity_type,
+                        format=format,
+                        total_rows=total_rows,
+                        processed_rows=successful + failed + skipped,
+                        successful_rows=successful,
+                        failed_rows=failed + invalid,
+                        skipped_rows=skipped,
+                        validation_errors=validation_errors,
+                        started_at=started_at,
+                        completed_at=datetime.now(UTC),
+                        error_message=str(failures[0][1]),
+                    )
+
+                logger.debug(
+                    "Processed batch ending at row %d (%d written, %d skipped)",
+                    total_rows,
+                    written,
+                    chunk_skipped,
+                )
 
             # If validation only, return here
             if validate_only:
@@ -780,15 +963,18 @@ class DataTransferService:
                     format=format,
                     total_rows=total_rows,
                     processed_rows=total_rows,
-                    successful_rows=len(valid_records),
-                    failed_rows=len(parsed_records) - len(valid_records),
+                    successful_rows=total_rows - invalid,
+                    failed_rows=invalid,
                     validation_errors=validation_errors,
                     started_at=started_at,
                     completed_at=datetime.now(UTC),
                 )
 
             # If we have errors and not skipping, fail
-            if validation_errors and not skip_errors:
+            if invalid and not skip_errors:
+                # Discard chunks written before the first invalid record
+                if successful:
+                    await self.session.rollback()
                 return ImportResult(
                     status=ImportStatus.FAILED,
                     import_id=import_id,
@@ -796,105 +982,18 @@ class DataTransferService:
                     format=format,
                     total_rows=total_rows,
                     processed_rows=0,
-                    failed_rows=len(parsed_records) - len(valid_records),
+                    failed_rows=invalid,
                     validation_errors=validation_errors,
                     started_at=started_at,
                     completed_at=datetime.now(UTC),
                     error_message="Validation failed. Fix errors or use skip_errors=true.",
                 )
 
-            # Import valid records in batches
-            model_class = self._import_model(config["model_path"])
-            successful = 0
-            skipped = 0
-            failed = 0
-
-            # Ensure batch_size is within valid range
-            batch_size = max(1, min(batch_size, 1000))
-
-            # Process records in batches
-            for batch_start in range(0, len(valid_records), batch_size):
-                batch_end = min(batch_start + batch_size, len(valid_records))
-                batch = valid_records[batch_start:batch_end]
-
-                for record in batch:
-                    try:
-                        # Check for existing record if update_existing is enabled
-                        existing = None
-                        if update_existing and "id" in record.data:
-                            existing = await self.session.get(
-                                model_class, record.data["id"],
-                            )
-
-                        if existing:
-                            # Update existing
-                            for key, value in record.data.items():
-                                if key != "id" and hasattr(existing, key):
-                                    setattr(existing, key, value)
-                            successful += 1
-                        elif "id" in record.data:
-                            # Skip if exists and not updating
-                            existing = await self.session.get(
-                                model_class, record.data["id"],
-                            )
-                            if existing:
-                                skipped += 1
-                                continue
-
-                        if not existing:
-                            # Create new record
-                            # Remove id if present to let DB generate it
-                            create_data = {
-                                k: v for k, v in record.data.items() if k != "id"
-                            }
-                            new_record = model_class(**create_data)
-                            self.session.add(new_record)
-                            successful += 1
-
-                    except Exception as e:
-                        failed += 1
-                        if len(validation_errors) < 100:
-                            validation_errors.append(
-                                ImportValidationError(
-                                    row=record.row_number,
-                                    field=None,
-                                    error=f"Database error: {e}",
-                                ),
-                            )
-                        if not skip_errors:
-                            await self.session.rollback()
-                            return ImportResult(
-                                status=ImportStatus.FAILED,
-                                import_id=import_id,
-                                entity_type=entity_type,
-                                format=format,
-                                total_rows=total_rows,
-                                processed_rows=successful + failed + skipped,
-                                successful_rows=successful,
-                                failed_rows=failed
-                                + len(parsed_records)
-                                - len(valid_records),
-                                skipped_rows=skipped,
-                                validation_errors=validation_errors,
-                                started_at=started_at,
-                                completed_at=datetime.now(UTC),
-                                error_message=str(e),
-                            )
-
-                # Flush the batch to the database
-                await self.session.flush()
-                logger.debug(
-                    "Processed batch %d-%d of %d records",
-                    batch_start + 1,
-                    batch_end,
-                    len(valid_records),
-                )
-
             # Commit all changes after all batches
             await self.session.commit()
 
             # Determine final status
-            total_failed = failed + len(parsed_records) - len(valid_records)
+            total_failed = failed + invalid
             if total_failed > 0 and successful > 0:
                 status = ImportStatus.PARTIALLY_COMPLETED
             elif total_failed > 0:
@@ -929,6 +1028,143 @@ class DataTransferService:
                 error_message=str(e),
             )
 
+    def _validate_import_record(
+        self,
+        entity_type: str,
+        record: ParsedRecord,
+        has_entity_validator: bool,
+        validation_errors: list[ImportValidationError],
+        max_errors: int,
+    ) -> bool:
+        """Validate a parsed record, collecting errors up to ``max_errors``.
+
+        Returns:
+            True if the record is valid; its data may have been transformed.
+        """
+        if not record.is_valid:
+            # Basic type validation failed
+            for field, error in record.errors:
+                if len(validation_errors) < max_errors:
+                    validation_errors.append(
+                        ImportValidationError(
+                            row=record.row_number,
+                            field=field if field != "_record" else None,
+                            error=error,
+                            value=record.data.get(field) if field != "_record" else None,
+                        ),
+                    )
+            return False
+
+        # Run entity-specific validation if available
+        if has_entity_validator:
+            entity_result = validate_entity(entity_type, record.data)
+            if not entity_result.is_valid:
+                for err in entity_result.errors:
+                    if len(validation_errors) < max_errors:
+                        validation_errors.append(
+                            ImportValidationError(
+                                row=record.row_number,
+                                field=err.field,
+                                error=err.message,
+                                value=err.value,
+                            ),
+                        )
+                return False
+
+            # Use transformed data if available
+            if entity_result.transformed_data:
+                record.data = entity_result.transformed_data
+
+        return True
+
+    async def _write_import_chunk(
+        self,
+        loader: BulkLoader,
+        records: list[ParsedRecord],
+        *,
+        update_existing: bool,
+        skip_errors: bool,
+    ) -> tuple[int, int, list[tuple[ParsedRecord, Any]]]:
+        """Write one chunk of valid records with set-based statements.
+
+        Records whose id already exists are updated (``update_existing``) or
+        skipped; all others are inserted with a generated id.
+
+        Returns:
+            Tuple of (written, skipped, [(record, error)]).
+        """
+        failures: list[tuple[ParsedRecord, Any]] = []
+        ids: dict[int, Any] = {}
+        invalid_ids: set[int] = set()
+        for index, record in enumerate(records):
+            if record.data.get("id") is None:
+                continue
+            try:
+                ids[index] = loader.coerce_id(record.data["id"])
+            except ValueError as e:
+                failures.append((record, e))
+                invalid_ids.add(index)
+        existing = await loader.existing_ids(ids.values())
+
+        inserts: list[tuple[ParsedRecord, dict[str, Any]]] = []
+        updates: list[tuple[ParsedRecord, dict[str, Any]]] = []
+        skipped = 0
+        for index, record in enumerate(records):
+            if index in invalid_ids:
+                continue
+            if index in ids and ids[index] in existing:
+                if not update_existing:
+                    skipped += 1
+                    continue
+                # Fields the model does not have are ignored on update
+                row = {
+                    key: value
+                    for key, value in record.data.items()
+                    if key in loader.columns and key != "id"
+                }
+                updates.append((record, {"id": ids[index], **row}))
+                continue
+
+            # Remove id if present to let the database generate it
+            row = {key: value for key, value in record.data.items() if key != "id"}
+            if unknown := loader.unknown_fields(row):
+                failures.append(
+                    (record, f"'{unknown[0]}' is an invalid keyword argument for {loader.model_class.__name__}"),
+                )
+                continue
+            inserts.append((record, row))
+
+        if failures and not skip_errors:
+            return 0, skipped, failures
+
+        try:
+            async with self.session.begin_nested():
+                await loader.insert([row for _, row in inserts])
+                await loader.update([row for _, row in updates])
+            return len(inserts) + len(updates), skipped, failures
+        except Exception:
+            logger.debug(
+                "Bulk write of %d records failed, retrying row by row",
+                len(inserts) + len(updates),
+                exc_info=True,
+            )
+
+        # Retry row by row to find the records that fail
+        written = 0
+        for record, row, write in [
+            *((record, row, loader.insert) for record, row in inserts),
+            *((record, row, loader.update) for record, row in updates),
+        ]:
+            try:
+                async with self.session.begin_nested():
+                    await write([row])
+                written += 1
+            except Exception as e:
+                failures.append((record, e))
+                if not skip_errors:
+                    break
+        return written, skipped, failures
+
     def generate_import_template(
         self,
         entity_type: str,
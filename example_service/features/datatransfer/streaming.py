@@ -0,0 +1,364 @@
+"""Streaming export engine.
+
+Exports are read page by page with keyset pagination
+(``WHERE id > :last ORDER BY id LIMIT n``), so every page is an index range
+scan no matter how deep into the table it is, and total cost grows linearly
+with the row count. Only the exported columns are selected and rows are
+encoded straight into CSV, JSON Lines or JSON bytes, optionally through a
+streaming gzip/zstd compressor. Memory stays at roughly one page regardless
+of table size.
+
+Models without an ``id`` column fall back to a server-side cursor
+(``yield_per``), which is equally constant-memory but keeps a transaction
+open for the duration of the export.
+
+Example:
+    rows = iter_rows(session, stmt, Reminder.id, batch_size=5000)
+    async for chunk in encode_stream(rows, CSVRowWriter(fields), GzipCompressor()):
+        await response.write(chunk)
+"""
+
+from __future__ import annotations
+
+import csv
+from datetime import UTC, datetime
+import io
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Protocol
+import zlib
+
+from .exporters import serialize_value
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_rows(
+    session: AsyncSession,
+    stmt: Select[Any],
+    key_column: InstrumentedAttribute[Any] | None,
+    *,
+    batch_size: int = 1000,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield pages of rows as dictionaries.
+
+    Args:
+        session: Async database session.
+        stmt: Select of the exported columns (without ordering or limits).
+            Must include ``key_column`` when one is given.
+        key_column: Unique, sortable column for keyset pagination; None to
+            read through a server-side cursor instead.
+        batch_size: Rows per page.
+
+    Yields:
+        Lists of up to ``batch_size`` row dictionaries.
+    """
+    if key_column is None:
+        stream = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in stream.mappings().partitions():
+            yield [dict(row) for row in partition]
+        return
+
+    key = key_column.key
+    page = stmt.order_by(key_column).limit(batch_size)
+    last: Any = None
+    while True:
+        page_stmt = page if last is None else page.where(key_column > last)
+        result = await session.execute(page_stmt)
+        rows = [dict(row) for row in result.mappings()]
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        last = rows[-1][key]
+
+
+class RowWriter(Protocol):
+    """Encodes pages of row dictionaries into an output format."""
+
+    content_type: str
+    file_extension: str
+    record_count: int
+
+    def begin(self) -> bytes:
+        """Bytes written before the first row."""
+        ...
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        """Encode a page of rows."""
+        ...
+
+    def end(self) -> bytes:
+        """Bytes written after the last row."""
+        ...
+
+
+class CSVRowWriter:
+    """Encode rows as CSV with a fixed column order."""
+
+    content_type = "text/csv"
+    file_extension = "csv"
+
+    def __init__(self, fields: list[str], include_headers: bool = True) -> None:
+        """Initialize writer.
+
+        Args:
+            fields: Column order; missing values are written as empty cells.
+            include_headers: Whether to write a header row.
+        """
+        self.fields = fields
+        self.include_headers = include_headers
+        self.record_count = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def begin(self) -> bytes:
+        """Return the header row."""
+        if not self.include_headers:
+            return b""
+        return self._encode([self.fields])
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        """Encode a page of rows."""
+        self.record_count += len(rows)
+        return self._encode(
+            [serialize_value(row.get(field)) for field in self.fields] for row in rows
+        )
+
+    def end(self) -> bytes:
+        """Return nothing; CSV has no footer."""
+        return b""
+
+    def _encode(self, rows: Any) -> bytes:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerows(rows)
+        return self._buffer.getvalue().encode("utf-8")
+
+
+class JSONLinesWriter:
+    """Encode rows as JSON Lines, one object per line."""
+
+    content_type = "application/x-ndjson"
+    file_extension = "jsonl"
+
+    def __init__(self, fields: list[str]) -> None:
+        """Initialize writer.
+
+        Args:
+            fields: Keys written for every row, in order.
+        """
+        self.fields = fields
+        self.record_count = 0
+
+    def begin(self) -> bytes:
+        """Return nothing; JSON Lines has no header."""
+        return b""
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        """Encode a page of rows."""
+        self.record_count += len(rows)
+        return "".join(f"{_dump_row(row, self.fields)}\n" for row in rows).encode("utf-8")
+
+    def end(self) -> bytes:
+        """Return nothing; JSON Lines has no footer."""
+        return b""
+
+
+class JSONDocumentWriter:
+    """Encode rows as the ``JSONExporter`` document, written incrementally.
+
+    ``record_count`` follows the records array since it is only known once
+    every row has been written.
+    """
+
+    content_type = "application/json"
+    file_extension = "json"
+
+    def __init__(self, fields: list[str]) -> None:
+        """Initialize writer.
+
+        Args:
+            fields: Keys written for every row, in order.
+        """
+        self.fields = fields
+        self.record_count = 0
+
+    def begin(self) -> bytes:
+        """Open the document and records array."""
+        exported_at = json.dumps(datetime.now(UTC).isoformat())
+        return f'{{"exported_at": {exported_at}, "records": ['.encode()
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        """Encode a page of rows as array items."""
+        if not rows:
+            return b""
+        separator = ",\n" if self.record_count else "\n"
+        self.record_count += len(rows)
+        items = ",\n".join(_dump_row(row, self.fields) for row in rows)
+        return f"{separator}{items}".encode()
+
+    def end(self) -> bytes:
+        """Close the records array and document."""
+        return f'\n], "record_count": {self.record_count}}}\n'.encode()
+
+
+def _dump_row(row: dict[str, Any], fields: list[str]) -> str:
+    return json.dumps(
+        {field: serialize_value(row.get(field)) for field in fields},
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+class StreamCompressor(Protocol):
+    """Incremental compressor producing a single compressed stream."""
+
+    content_type: str
+    file_extension: str
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk; may return nothing while buffering."""
+        ...
+
+    def flush(self) -> bytes:
+        """Finish the stream and return the remaining bytes."""
+        ...
+
+
+class GzipCompressor:
+    """Streaming gzip compressor."""
+
+    content_type = "application/gzip"
+    file_extension = "gz"
+
+    def __init__(self, level: int = 6) -> None:
+        """Initialize compressor.
+
+        Args:
+            level: Compression level (1=fastest, 9=best compression).
+        """
+        # wbits 16 + MAX_WBITS writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Finish the gzip stream."""
+        return self._compressor.flush()
+
+
+class ZstdCompressor:
+    """Streaming zstd compressor.
+
+    Uses ``compression.zstd`` on Python 3.14+, otherwise requires zstandard.
+    """
+
+    content_type = "application/zstd"
+    file_extension = "zst"
+
+    def __init__(self, level: int = 3) -> None:
+        """Initialize compressor.
+
+        Args:
+            level: Compression level.
+        """
+        try:
+            from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+        except ImportError:
+            try:
+                import zstandard
+            except ImportError as err:
+                msg = "zstandard is required for zstd export compression. Install with: pip install zstandard"
+                raise ImportError(msg) from err
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zstd.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Finish the zstd frame."""
+        return self._compressor.flush()
+
+
+def get_compressor(compression: str | None, level: int = 6) -> StreamCompressor | None:
+    """Get a streaming compressor by name.
+
+    Args:
+        compression: ``gzip``, ``zstd`` or None for no compression.
+        level: Compression level.
+
+    Returns:
+        Compressor instance, or None.
+
+    Raises:
+        ValueError: If the compression format is not supported.
+    """
+    if compression is None:
+        return None
+    name = compression.lower()
+    if name in ("gzip", "gz"):
+        return GzipCompressor(level)
+    if name in ("zstd", "zst"):
+        return ZstdCompressor(level)
+    msg = f"Unsupported export compression: {compression}"
+    raise ValueError(msg)
+
+
+async def encode_stream(
+    pages: AsyncIterator[list[dict[str, Any]]],
+    writer: RowWriter,
+    compressor: StreamCompressor | None = None,
+) -> AsyncIterator[bytes]:
+    """Encode pages of rows into output chunks.
+
+    Args:
+        pages: Pages of row dictionaries, e.g. from ``iter_rows``.
+        writer: Output format writer.
+        compressor: Optional streaming compressor.
+
+    Yields:
+        Non-empty output chunks, at most one per page plus header and footer.
+    """
+
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor is not None else data
+
+    if chunk := encode(writer.begin()):
+        yield chunk
+    async for rows in pages:
+        if chunk := encode(writer.write(rows)):
+            yield chunk
+
+    tail = encode(writer.end())
+    if compressor is not None:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+
+
+__all__ = [
+    "CSVRowWriter",
+    "GzipCompressor",
+    "JSONDocumentWriter",
+    "JSONLinesWriter",
+    "RowWriter",
+    "StreamCompressor",
+    "ZstdCompressor",
+    "encode_stream",
+    "get_compressor",
+    "iter_rows",
+]
@@ -35,6 +35,7 @@ Usage:
 from __future__ import annotations
 
 from .dependencies import FeatureFlags, get_feature_flags, require_feature
+from .engine import FeatureFlagEngine, FlagSnapshot, get_flag_engine
 from .models import FeatureFlag, FlagOverride, FlagStatus
 from .router import router
 from .schemas import (
@@ -56,6 +57,8 @@ __all__ = [
     "FeatureFlag",
     # Schemas
     "FeatureFlagCreate",
+    # Engine
+    "FeatureFlagEngine",
     "FeatureFlagListResponse",
     "FeatureFlagResponse",
     # Service
@@ -69,10 +72,12 @@ __all__ = [
     "FlagOverride",
     "FlagOverrideCreate",
     "FlagOverrideResponse",
+    "FlagSnapshot",
     "FlagStatus",
     "TargetingRule",
     "get_feature_flag_service",
     "get_feature_flags",
+    "get_flag_engine",
     "require_feature",
     # Router
     "router",
@@ -0,0 +1,609 @@
+"""In-process feature flag snapshot engine.
+
+Evaluating flags through ``FeatureFlagService`` costs two queries per
+request. The engine instead keeps every flag and override in memory and
+evaluates them without touching the database:
+
+- Each flag is compiled once per snapshot into a small evaluator; targeting
+  rules become predicate closures with their operator and expected value
+  already resolved.
+- Overrides are indexed by ``(entity_type, entity_id)``, so finding the
+  overrides for a user or tenant is a dict lookup.
+- ``FlagSnapshot`` is immutable. A refresh builds a new snapshot and swaps
+  it in, so evaluation is synchronous and never sees a half-loaded state.
+
+The snapshot is refreshed two ways:
+
+- A background poll reads a cheap version (row counts and latest
+  ``updated_at`` of both tables) every ``refresh_interval`` seconds and only
+  reloads when it changed.
+- Writes through ``FeatureFlagService`` call ``notify_changed``, which
+  reloads locally and publishes on a Redis channel so other replicas reload
+  immediately instead of waiting for their next poll.
+
+Usage:
+    engine = await start_flag_engine()
+
+    if engine.snapshot.is_enabled("new_dashboard", user_id="user-123"):
+        ...
+
+    await stop_flag_engine()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import hashlib
+import json
+import logging
+import operator as op
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from example_service.core.settings import get_featureflag_settings, get_redis_settings
+
+from .models import FeatureFlag, FlagOverride, FlagStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from contextlib import AbstractAsyncContextManager
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    # (user_id, tenant_id, attributes) -> result
+    Predicate = Callable[[str | None, str | None, Mapping[str, Any] | None], bool]
+    Evaluator = Callable[
+        [str | None, str | None, Mapping[str, Any] | None], tuple[bool, str],
+    ]
+
+logger = logging.getLogger(__name__)
+
+_ORDERING = {"gt": op.gt, "gte": op.ge, "lt": op.lt, "lte": op.le}
+
+_OVERRIDE_ON = (True, "override")
+_OVERRIDE_OFF = (False, "override")
+_TIME_CONSTRAINT = (False, "time_constraint")
+_NO_IDENTITY = (False, "no_identity_for_percentage")
+_NO_MATCHING_RULE = (False, "no_matching_rule")
+
+
+def percentage_bucket(flag_key: str, identity: str) -> int:
+    """Get a consistent bucket (0-99) for percentage rollout.
+
+    Args:
+        flag_key: Flag key.
+        identity: User or tenant ID.
+
+    Returns:
+        Bucket number 0-99.
+    """
+    consistent_hash = hashlib.sha256(f"{flag_key}:{identity}".encode()).hexdigest()
+    return int(consistent_hash[:8], 16) % 100
+
+
+def _never(*_: Any) -> bool:
+    return False
+
+
+def compile_comparison(operator: str, expected: Any) -> Callable[[Any], bool]:
+    """Compile a comparison into a one-argument predicate.
+
+    Matches ``FeatureFlagService._compare``: a missing (``None``) value never
+    matches and unknown operators never match.
+
+    Args:
+        operator: Comparison operator.
+        expected: Expected value.
+
+    Returns:
+        Predicate taking the actual value.
+    """
+    if operator == "eq":
+        return lambda actual: actual is not None and actual == expected
+    if operator == "neq":
+        return lambda actual: actual is not None and actual != expected
+    if operator in ("in", "not_in"):
+        values = expected if isinstance(expected, list) else [expected]
+        try:
+            members: frozenset[Any] | list[Any] = frozenset(values)
+        except TypeError:
+            # Unhashable values (e.g. nested lists) fall back to a scan
+            members = values
+
+        def contains(actual: Any) -> bool:
+            try:
+                return actual in members
+            except TypeError:
+                return actual in values
+
+        if operator == "in":
+            return lambda actual: actual is not None and contains(actual)
+        return lambda actual: actual is not None and not contains(actual)
+    if operator == "contains":
+        return lambda actual: actual is not None and expected in str(actual)
+    if operator == "starts_with":
+        prefix = str(expected)
+        return lambda actual: actual is not None and str(actual).startswith(prefix)
+    if operator == "ends_with":
+        suffix = str(expected)
+        return lambda actual: actual is not None and str(actual).endswith(suffix)
+    if operator in _ORDERING:
+        compare = _ORDERING[operator]
+        return lambda actual: actual is not None and compare(actual, expected)
+    return _never
+
+
+def compile_rule(rule: Mapping[str, Any]) -> Predicate:
+    """Compile a targeting rule into a predicate.
+
+    Matches ``FeatureFlagService._matches_rule``.
+
+    Args:
+        rule: Targeting rule configuration.
+
+    Returns:
+        Predicate taking ``(user_id, tenant_id, attributes)``.
+    """
+    rule_type = rule.get("type")
+    compare = compile_comparison(rule.get("operator", "eq"), rule.get("value"))
+
+    if rule_type == "user_id":
+        return lambda user_id, _tenant_id, _attributes: compare(user_id)
+    if rule_type == "tenant_id":
+        return lambda _user_id, tenant_id, _attributes: compare(tenant_id)
+    if rule_type == "attribute":
+        attribute = rule.get("attribute")
+        if attribute:
+            return lambda _user_id, _tenant_id, attributes: bool(
+                attributes and compare(attributes.get(attribute)),
+            )
+    return _never
+
+
+def _compile_evaluator(flag: FeatureFlag) -> Evaluator:
+    """Compile a flag's status-specific logic, with result tuples precomputed."""
+    status = flag.status
+
+    if status == FlagStatus.DISABLED.value:
+        disabled = (False, "disabled")
+        return lambda *_: disabled
+
+    if status == FlagStatus.ENABLED.value:
+        enabled = (bool(flag.enabled), "global")
+        return lambda *_: enabled
+
+    if status == FlagStatus.PERCENTAGE.value:
+        key = flag.key
+        percentage = flag.percentage
+        reason = f"percentage_{percentage}"
+        included, excluded = (True, reason), (False, reason)
+
+        def evaluate_percentage(
+            user_id: str | None,
+            tenant_id: str | None,
+            _attributes: Mapping[str, Any] | None,
+        ) -> tuple[bool, str]:
+            identity = user_id or tenant_id
+            if not identity:
+                return _NO_IDENTITY
+            return included if percentage_bucket(key, identity) < percentage else excluded
+
+        return evaluate_percentage
+
+    if status == FlagStatus.TARGETED.value:
+        # The JSON column holds a list of rules despite its dict annotation
+        targeting_rules = cast("list[Mapping[str, Any]]", flag.targeting_rules or [])
+        rules = tuple(
+            (compile_rule(rule), (True, f"targeting_rule_{rule.get('type')}"))
+            for rule in targeting_rules
+        )
+
+        def evaluate_targeted(
+            user_id: str | None,
+            tenant_id: str | None,
+            attributes: Mapping[str, Any] | None,
+        ) -> tuple[bool, str]:
+            for matches, result in rules:
+                if matches(user_id, tenant_id, attributes):
+                    return result
+            return _NO_MATCHING_RULE
+
+        return evaluate_targeted
+
+    unknown = (False, "unknown_status")
+    return lambda *_: unknown
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFlag:
+    """A flag with its evaluation logic compiled."""
+
+    key: str
+    starts_at: datetime | None
+    ends_at: datetime | None
+    evaluate: Evaluator
+
+    @classmethod
+    def compile(cls, flag: FeatureFlag) -> CompiledFlag:
+        """Compile a feature flag model."""
+        return cls(
+            key=flag.key,
+            starts_at=flag.starts_at,
+            ends_at=flag.ends_at,
+            evaluate=_compile_evaluator(flag),
+        )
+
+    def is_active(self, now: datetime) -> bool:
+        """Check the flag's time window, like ``FeatureFlag.is_active``."""
+        if self.starts_at and now < self.starts_at:
+            return False
+        return not (self.ends_at and now > self.ends_at)
+
+
+class FlagSnapshot:
+    """Immutable in-memory view of all flags and overrides.
+
+    Example:
+        snapshot = FlagSnapshot.build(flags, overrides)
+        snapshot.is_enabled("new_dashboard", user_id="user-123")
+    """
+
+    __slots__ = ("flags", "overrides", "version")
+
+    def __init__(
+        self,
+        flags: dict[str, CompiledFlag],
+        overrides: dict[tuple[str, str], dict[str, bool]],
+        version: Any = None,
+    ) -> None:
+        """Initialize snapshot.
+
+        Args:
+            flags: Compiled flags by key.
+            overrides: Override values by flag key, indexed by
+                ``(entity_type, entity_id)``.
+            version: Version the snapshot was loaded at.
+        """
+        self.flags = flags
+        self.overrides = overrides
+        self.version = version
+
+    @classmethod
+    def build(
+        cls,
+        flags: Iterable[FeatureFlag],
+        overrides: Iterable[FlagOverride],
+        version: Any = None,
+    ) -> FlagSnapshot:
+        """Compile flags and index overrides.
+
+        Args:
+            flags: Feature flag models.
+            overrides: Flag override models.
+            version: Version the rows were loaded at.
+
+        Returns:
+            New snapshot.
+        """
+        indexed: dict[tuple[str, str], dict[str, bool]] = {}
+        for override in overrides:
+            entity = (override.entity_type, override.entity_id)
+            indexed.setdefault(entity, {})[override.flag_key] = override.enabled
+        return cls(
+            {flag.key: CompiledFlag.compile(flag) for flag in flags},
+            indexed,
+            version,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of flags."""
+        return len(self.flags)
+
+    def _override(
+        self,
+        key: str,
+        user_id: str | None,
+        tenant_id: str | None,
+    ) -> tuple[bool, str] | None:
+        """Find an override, preferring the user's over the tenant's."""
+        if user_id:
+            values = self.overrides.get(("user", user_id))
+            if values is not None and key in values:
+                return _OVERRIDE_ON if values[key] else _OVERRIDE_OFF
+        if tenant_id:
+            values = self.overrides.get(("tenant", tenant_id))
+            if values is not None and key in values:
+                return _OVERRIDE_ON if values[key] else _OVERRIDE_OFF
+        return None
+
+    def _evaluate(
+        self,
+        flag: CompiledFlag,
+        user_id: str | None,
+        tenant_id: str | None,
+        attributes: Mapping[str, Any] | None,
+        now: datetime,
+    ) -> tuple[bool, str]:
+        override = self._override(flag.key, user_id, tenant_id)
+        if override is not None:
+            return override
+        if not flag.is_active(now):
+            return _TIME_CONSTRAINT
+        return flag.evaluate(user_id, tenant_id, attributes)
+
+    def is_enabled(
+        self,
+        key: str,
+        user_id: str | None = None,
+        tenant_id: str | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        default: bool = False,
+    ) -> bool:
+        """Check if a flag is enabled.
+
+        Args:
+            key: Flag key.
+            user_id: User ID for context.
+            tenant_id: Tenant ID for context.
+            attributes: Additional attributes.
+            default: Value if the flag does not exist.
+
+        Returns:
+            True if the flag is enabled.
+        """
+        flag = self.flags.get(key)
+        if flag is None:
+            return default
+        return self._evaluate(flag, user_id, tenant_id, attributes, datetime.now(UTC))[0]
+
+    def evaluate(
+        self,
+        user_id: str | None = None,
+        tenant_id: str | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        flag_keys: Iterable[str] | None = None,
+    ) -> dict[str, tuple[bool, str]]:
+        """Evaluate flags for a context.
+
+        Args:
+            user_id: User ID for context.
+            tenant_id: Tenant ID for context.
+            attributes: Additional attributes.
+            flag_keys: Flags to evaluate (all if None); unknown keys are skipped.
+
+        Returns:
+            ``(enabled, reason)`` by flag key.
+        """
+        if flag_keys:
+            flags = [self.flags[key] for key in flag_keys if key in self.flags]
+        else:
+            flags = list(self.flags.values())
+        now = datetime.now(UTC)
+        return {
+            flag.key: self._evaluate(flag, user_id, tenant_id, attributes, now)
+            for flag in flags
+        }
+
+
+async def _read_version(session: AsyncSession) -> tuple[Any, ...]:
+    """Read row counts and latest ``updated_at`` of both tables in one query.
+
+    Inserts and deletes change a count and updates move ``updated_at``, so
+    comparing versions is enough to skip reloading an unchanged snapshot.
+    """
+    stmt = select(
+        select(func.count()).select_from(FeatureFlag).scalar_subquery(),
+        select(func.max(FeatureFlag.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(FlagOverride).scalar_subquery(),
+        select(func.max(FlagOverride.updated_at)).scalar_subquery(),
+    )
+    return tuple((await session.execute(stmt)).one())
+
+
+class FeatureFlagEngine:
+    """Keep a ``FlagSnapshot`` current by polling and push invalidation.
+
+    Example:
+        engine = FeatureFlagEngine(get_async_session, redis=client)
+        await engine.start()
+        engine.snapshot.is_enabled("new_dashboard", user_id="user-123")
+        await engine.stop()
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        *,
+        refresh_interval: float = 30.0,
+        redis: Any | None = None,
+        channel: str = "featureflags:changed",
+    ) -> None:
+        """Initialize engine.
+
+        Args:
+            session_factory: Returns an async context manager yielding a session.
+            refresh_interval: Seconds between version checks.
+            redis: Redis client for change notifications (polling only if None).
+            channel: Pub/sub channel for change notifications.
+        """
+        self._session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self._redis = redis
+        self.channel = channel
+        self._snapshot = FlagSnapshot({}, {})
+        self._lock = asyncio.Lock()
+        self._origin = uuid4().hex
+        self._tasks: list[asyncio.Task[None]] = []
+        self._pubsub: Any | None = None
+
+    @property
+    def snapshot(self) -> FlagSnapshot:
+        """Get the current snapshot."""
+        return self._snapshot
+
+    async def refresh(self, *, force: bool = False) -> bool:
+        """Reload the snapshot if the stored flags changed.
+
+        Args:
+            force: Reload without comparing versions.
+
+        Returns:
+            True if a new snapshot was loaded.
+        """
+        async with self._lock:
+            async with self._session_factory() as session:
+                version = await _read_version(session)
+                if not force and version == self._snapshot.version:
+                    return False
+                flags = (await session.execute(select(FeatureFlag))).scalars().all()
+                overrides = (await session.execute(select(FlagOverride))).scalars().all()
+            self._snapshot = FlagSnapshot.build(flags, overrides, version)
+
+        logger.debug(
+            "Loaded feature flag snapshot: %d flags, %d overrides",
+            len(flags),
+            len(overrides),
+        )
+        return True
+
+    async def notify_changed(self) -> None:
+        """Reload after a local write and tell other processes to reload."""
+        await self.refresh(force=True)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(self.channel, json.dumps({"origin": self._origin}))
+        except Exception as e:
+            logger.warning(
+                "Failed to publish feature flag change",
+                extra={"channel": self.channel, "error": str(e)},
+            )
+
+    async def start(self) -> None:
+        """Load the first snapshot and start refreshing in the background."""
+        await self.refresh(force=True)
+        self._tasks.append(asyncio.create_task(self._poll()))
+
+        if self._redis is None:
+            return
+        try:
+            self._pubsub = self._redis.pubsub()
+            await self._pubsub.subscribe(self.channel)
+        except Exception as e:
+            logger.warning(
+                "Feature flag change notifications unavailable, polling only",
+                extra={"channel": self.channel, "error": str(e)},
+            )
+            self._pubsub = None
+            return
+        self._tasks.append(asyncio.create_task(self._listen()))
+
+    async def stop(self) -> None:
+        """Stop background refreshing."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        if self._pubsub is not None:
+            with contextlib.suppress(Exception):
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(
+                    "Failed to refresh feature flag snapshot",
+                    extra={"error": str(e)},
+                )
+
+    async def _listen(self) -> None:
+        assert self._pubsub is not None
+        async for message in self._pubsub.listen():
+            if message["type"] != "message":
+                continue
+            try:
+                origin = json.loads(message["data"]).get("origin")
+            except (TypeError, ValueError, AttributeError):
+                origin = None
+            if origin == self._origin:
+                continue
+            try:
+                await self.refresh(force=True)
+            except Exception as e:
+                logger.warning(
+                    "Failed to reload feature flags after change notification",
+                    extra={"error": str(e)},
+                )
+
+
+_engine: FeatureFlagEngine | None = None
+
+
+def get_flag_engine() -> FeatureFlagEngine | None:
+    """Get the process-wide engine, or None if it is not running."""
+    return _engine
+
+
+async def start_flag_engine() -> FeatureFlagEngine:
+    """Start the process-wide engine, configured from FeatureFlagSettings.
+
+    Change notifications use the shared Redis cache connection when it is
+    available; otherwise the engine relies on polling.
+    """
+    global _engine
+    if _engine is not None:
+        return _engine
+
+    from example_service.infra.cache.redis import get_cache_instance
+    from example_service.infra.database.session import get_async_session
+
+    settings = get_featureflag_settings()
+    cache = get_cache_instance()
+    redis = None
+    if cache is not None:
+        with contextlib.suppress(RuntimeError):
+            redis = cache.client
+
+    engine = FeatureFlagEngine(
+        get_async_session,
+        refresh_interval=settings.refresh_interval_seconds,
+        redis=redis,
+        channel=get_redis_settings().get_prefixed_key(settings.invalidation_channel),
+    )
+    await engine.start()
+    _engine = engine
+    return engine
+
+
+async def stop_flag_engine() -> None:
+    """Stop the process-wide engine."""
+    global _engine
+    if _engine is not None:
+        await _engine.stop()
+        _engine = None
+
+
+__all__ = [
+    "CompiledFlag",
+    "FeatureFlagEngine",
+    "FlagSnapshot",
+    "compile_comparison",
+    "compile_rule",
+    "get_flag_engine",
+    "percentage_bucket",
+    "start_flag_engine",
+    "stop_flag_engine",
+]
@@ -1,17 +1,19 @@
 """Feature flag service.
 
-Provides flag management and evaluation with caching support.
+Provides flag management and evaluation with caching support. When the
+snapshot engine is running, evaluation reads its in-memory snapshot and
+writes notify it; otherwise flags are evaluated from the database.
 """
 
 from __future__ import annotations
 
 from datetime import UTC, datetime
-import hashlib
 import logging
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import delete, select
 
+from .engine import get_flag_engine, percentage_bucket
 from .models import FeatureFlag, FlagOverride, FlagStatus
 from .schemas import (
     FeatureFlagCreate,
@@ -97,6 +99,7 @@ class FeatureFlagService:
         self.session.add(flag)
         await self.session.commit()
         await self.session.refresh(flag)
+        await self._notify_changed()
 
         logger.info("Created feature flag: %s", flag.key)
         return flag
@@ -204,6 +207,7 @@ class FeatureFlagService:
 
         await self.session.commit()
         await self.session.refresh(flag)
+        await self._notify_changed()
 
         logger.info("Updated feature flag: %s", flag.key)
         return flag
@@ -228,6 +232,7 @@ class FeatureFlagService:
 
         await self.session.delete(flag)
         await self.session.commit()
+        await self._notify_changed()
 
         logger.info("Deleted feature flag: %s", key)
         return True
@@ -256,6 +261,7 @@ class FeatureFlagService:
             existing.reason = data.reason
             await self.session.commit()
             await self.session.refresh(existing)
+            await self._notify_changed()
             return existing
 
         override = FlagOverride(
@@ -269,6 +275,7 @@ class FeatureFlagService:
         self.session.add(override)
         await self.session.commit()
         await self.session.refresh(override)
+        await self._notify_changed()
 
         logger.info(
             "Created flag override: %s for %s:%s",
@@ -302,7 +309,23 @@ class FeatureFlagService:
         result = await self.session.execute(stmt)
         await self.session.commit()
 
-        return (result.rowcount or 0) > 0  # type: ignore[attr-defined]
+        deleted = (result.rowcount or 0) > 0  # type: ignore[attr-defined]
+        if deleted:
+            await self._notify_changed()
+        return deleted
+
+    async def _notify_changed(self) -> None:
+        """Tell the snapshot engine, if running, that flags changed."""
+        engine = get_flag_engine()
+        if engine is None:
+            return
+        try:
+            await engine.notify_changed()
+        except Exception as e:
+            logger.warning(
+                "Failed to refresh feature flag snapshot after change",
+                extra={"error": str(e)},
+            )
 
     async def get_overrides(
         self,
@@ -348,6 +371,24 @@ class FeatureFlagService:
         Returns:
             Evaluated flag values.
         """
+        engine = get_flag_engine()
+        if engine is not None:
+            results = engine.snapshot.evaluate(
+                context.user_id,
+                context.tenant_id,
+                context.attributes,
+                flag_keys,
+            )
+            return FlagEvaluationResponse(
+                flags={key: enabled for key, (enabled, _) in results.items()},
+                details=[
+                    FlagEvaluationResult(key=key, enabled=enabled, reason=reason)
+                    for key, (enabled, reason) in results.items()
+                ]
+                if include_details
+                else None,
+            )
+
         # Get all flags or specific ones
         stmt = select(FeatureFlag)
         if flag_keys:
@@ -420,6 +461,10 @@ class FeatureFlagService:
         Returns:
             True if flag is enabled.
         """
+        engine = get_flag_engine()
+        if engine is not None:
+            return engine.snapshot.is_enabled(key, user_id, tenant_id, attributes, default)
+
         context = FlagEvaluationRequest(
             user_id=user_id,
             tenant_id=tenant_id,
@@ -495,8 +540,7 @@ class FeatureFlagService:
         Returns:
             Bucket number 0-99.
         """
-        consistent_hash = hashlib.sha256(f"{flag_key}:{identity}".encode()).hexdigest()
-        return int(consistent_hash[:8], 16) % 100
+        return percentage_bucket(flag_key, identity)
 
     def _matches_rule(
         self,
@@ -6,7 +6,7 @@ from datetime import datetime
 import enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from example_service.core.database import TenantMixin, TimestampedBase
@@ -31,13 +31,16 @@ class File(TimestampedBase, TenantMixin):
 
     Files are initially uploaded to a universal bucket, then relocated to
     tenant-specific buckets. The bucket field tracks the current location.
+
+    With content-addressed storage enabled, files with identical bytes share
+    one object (see FileBlob), so storage_key is not unique across files.
     """
 
     __tablename__ = "files"
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
-    storage_key: Mapped[str] = mapped_column(String(500), nullable=False, unique=True, index=True)
+    storage_key: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     bucket: Mapped[str] = mapped_column(String(63), nullable=False)
     content_type: Mapped[str] = mapped_column(String(127), nullable=False)
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -82,3 +85,29 @@ class FileThumbnail(TimestampedBase):
 
     # Relationship to parent file
     file: Mapped["File"] = relationship("File", back_populates="thumbnails")
+
+
+class FileBlob(TimestampedBase):
+    """Content-addressed object shared by files with identical bytes.
+
+    The object lives at a key derived from its sha256. ``ref_count`` counts
+    the files pointing at it; once it drops to zero the cleanup worker
+    deletes the object after a grace period.
+    """
+
+    __tablename__ = "file_blobs"
+    __table_args__ = (
+        UniqueConstraint("bucket", "sha256", name="uq_file_blobs_bucket_sha256"),
+    )
+
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    bucket: Mapped[str] = mapped_column(String(63), nullable=False)
+    storage_key: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Set when ref_count drops to zero; garbage collection waits a grace period
+    released_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+    )
@@ -7,17 +7,23 @@ in single-tenant mode with no tenant filtering.
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from example_service.core.database import SearchFilter
-from example_service.core.database.repository import SearchResult, TenantAwareRepository
-from example_service.features.files.models import File, FileStatus
+from example_service.core.database.repository import (
+    BaseRepository,
+    SearchResult,
+    TenantAwareRepository,
+)
+from example_service.features.files.models import File, FileBlob, FileStatus
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -57,6 +63,9 @@ class FileRepository(TenantAwareRepository[File]):
     ) -> File | None:
         """Get file by its storage key.
 
+        Content-addressed objects are shared, so several files can have the
+        same key; the oldest one is returned.
+
         Args:
             session: Database session
             storage_key: S3 storage key
@@ -68,14 +77,49 @@ class FileRepository(TenantAwareRepository[File]):
         """
         stmt = select(File).where(File.storage_key == storage_key)
         stmt = self._apply_tenant_filter(stmt, tenant_id)
-        result = await session.execute(stmt)
-        file = result.scalar_one_or_none()
+        result = await session.execute(stmt.order_by(File.created_at).limit(1))
+        file = result.scalars().first()
 
         self._lazy.debug(
             lambda: f"db.get_by_storage_key({storage_key}, tenant={tenant_id}) -> {'found' if file else 'not found'}",
         )
         return file
 
+    async def get_by_ids(
+        self,
+        session: AsyncSession,
+        file_ids: Sequence[UUID],
+        *,
+        tenant_id: str | None = None,
+        options: Iterable[Any] | None = None,
+    ) -> dict[UUID, File]:
+        """Get multiple files by ID with a single query.
+
+        Args:
+            session: Database session
+            file_ids: File UUIDs to fetch
+            tenant_id: Optional tenant ID for multi-tenant filtering.
+                      If None, no tenant filtering is applied (single-tenant mode).
+            options: SQLAlchemy loader options (e.g., selectinload)
+
+        Returns:
+            Files by ID (missing IDs are absent)
+        """
+        if not file_ids:
+            return {}
+
+        stmt = select(File).where(File.id.in_(set(file_ids)))
+        if options:
+            stmt = stmt.options(*options)
+        stmt = self._apply_tenant_filter(stmt, tenant_id)
+        result = await session.execute(stmt)
+        files = {file.id: file for file in result.scalars().all()}
+
+        self._lazy.debug(
+            lambda: f"db.get_by_ids({len(file_ids)} ids, tenant={tenant_id}) -> {len(files)} found",
+        )
+        return files
+
     async def list_by_owner(
         self,
         session: AsyncSession,
@@ -330,6 +374,180 @@ class FileRepository(TenantAwareRepository[File]):
         return await self.update_status(session, file_id, FileStatus.DELETED, tenant_id=tenant_id)
 
 
+class FileBlobRepository(BaseRepository[FileBlob]):
+    """Repository for reference-counted, content-addressed blobs.
+
+    Reference counts are only changed with single UPDATE/UPSERT statements,
+    so concurrent uploads and deletes of the same content never lose counts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with FileBlob model."""
+        super().__init__(FileBlob)
+
+    async def acquire(
+        self,
+        session: AsyncSession,
+        *,
+        sha256: str,
+        bucket: str,
+        storage_key: str,
+        size_bytes: int,
+    ) -> FileBlob:
+        """Take a reference to a blob, creating its row if needed.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE, so concurrent uploads of the
+        same content serialize on the row and each gets one reference.
+        A blob waiting for garbage collection is revived.
+
+        Args:
+            session: Database session
+            sha256: Content hash
+            bucket: Bucket holding the object
+            storage_key: Content-addressed object key
+            size_bytes: Content size
+
+        Returns:
+            The blob row with its updated reference count
+        """
+        stmt = (
+            pg_insert(FileBlob)
+            .values(
+                sha256=sha256,
+                bucket=bucket,
+                storage_key=storage_key,
+                size_bytes=size_bytes,
+                ref_count=1,
+            )
+            .on_conflict_do_update(
+                constraint="uq_file_blobs_bucket_sha256",
+                set_={
+                    "ref_count": FileBlob.ref_count + 1,
+                    "released_at": None,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(FileBlob)
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(stmt)
+        blob = result.scalar_one()
+
+        self._lazy.debug(lambda: f"db.acquire({bucket}/{sha256}) -> refs={blob.ref_count}")
+        return blob
+
+    async def add_reference(
+        self,
+        session: AsyncSession,
+        bucket: str,
+        storage_key: str,
+    ) -> bool:
+        """Take another reference to an existing blob.
+
+        Args:
+            session: Database session
+            bucket: Bucket holding the object
+            storage_key: Object key
+
+        Returns:
+            True if the key belongs to a blob, False otherwise
+        """
+        stmt = (
+            update(FileBlob)
+            .where(FileBlob.bucket == bucket, FileBlob.storage_key == storage_key)
+            .values(ref_count=FileBlob.ref_count + 1, released_at=None)
+            .returning(FileBlob.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        found = result.first() is not None
+
+        self._lazy.debug(lambda: f"db.add_reference({bucket}/{storage_key}) -> {found}")
+        return found
+
+    async def release(
+        self,
+        session: AsyncSession,
+        objects: Iterable[tuple[str, str]],
+    ) -> set[tuple[str, str]]:
+        """Drop one reference per (bucket, storage_key) occurrence.
+
+        Blobs whose count reaches zero are stamped with ``released_at`` and
+        left for the cleanup worker; their objects must not be deleted by the
+        caller. Keys that are not blobs are ignored.
+
+        Args:
+            session: Database session
+            objects: (bucket, storage_key) pairs, one per released file
+
+        Returns:
+            The pairs that belong to blobs
+        """
+        counts = Counter(objects)
+        if not counts:
+            return set()
+
+        # One UPDATE per distinct decrement, usually just one
+        by_count: dict[int, list[tuple[str, str]]] = defaultdict(list)
+        for pair, count in counts.items():
+            by_count[count].append(pair)
+
+        managed: set[tuple[str, str]] = set()
+        for count, pairs in by_count.items():
+            stmt = (
+                update(FileBlob)
+                .where(tuple_(FileBlob.bucket, FileBlob.storage_key).in_(pairs))
+                .values(
+                    ref_count=func.greatest(FileBlob.ref_count - count, 0),
+                    released_at=case(
+                        (FileBlob.ref_count <= count, func.now()),
+                        else_=FileBlob.released_at,
+                    ),
+                )
+                .returning(FileBlob.bucket, FileBlob.storage_key)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(stmt)
+            managed.update((row.bucket, row.storage_key) for row in result)
+
+        self._lazy.debug(lambda: f"db.release({len(counts)} keys) -> {len(managed)} blobs")
+        return managed
+
+    async def lock_unreferenced(
+        self,
+        session: AsyncSession,
+        *,
+        released_before: datetime,
+        limit: int = 1000,
+    ) -> Sequence[FileBlob]:
+        """Lock blobs with no references released before a cutoff.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED, so a concurrent
+        ``acquire`` of the same content waits for the collecting
+        transaction, and parallel collectors never pick the same rows.
+
+        Args:
+            session: Database session
+            released_before: Only return blobs released before this time
+            limit: Maximum blobs to return
+
+        Returns:
+            Locked blob rows, oldest release first
+        """
+        stmt = (
+            select(FileBlob)
+            .where(FileBlob.ref_count <= 0, FileBlob.released_at < released_before)
+            .order_by(FileBlob.released_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(stmt)
+        blobs = result.scalars().all()
+
+        self._lazy.debug(lambda: f"db.lock_unreferenced(before={released_before}) -> {len(blobs)} blobs")
+        return blobs
+
+
 # Factory function for dependency injection
 _file_repository: FileRepository | None = None
 
@@ -357,4 +575,20 @@ def get_file_repository() -> FileRepository:
     return _file_repository
 
 
-__all__ = ["FileRepository", "get_file_repository"]
+_file_blob_repository: FileBlobRepository | None = None
+
+
+def get_file_blob_repository() -> FileBlobRepository:
+    """Get FileBlobRepository instance."""
+    global _file_blob_repository
+    if _file_blob_repository is None:
+        _file_blob_repository = FileBlobRepository()
+    return _file_blob_repository
+
+
+__all__ = [
+    "FileBlobRepository",
+    "FileRepository",
+    "get_file_blob_repository",
+    "get_file_repository",
+]
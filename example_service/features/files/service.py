@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import contextlib
 from datetime import UTC, datetime
+import hashlib
+from io import BytesIO
 from typing import TYPE_CHECKING, Any, BinaryIO
 import uuid
 
@@ -12,7 +13,9 @@ from sqlalchemy.orm import selectinload
 from example_service.core.services.base import BaseService
 from example_service.features.files.models import File, FileStatus
 from example_service.features.files.repository import (
+    FileBlobRepository,
     FileRepository,
+    get_file_blob_repository,
     get_file_repository,
 )
 from example_service.features.files.schemas import FileCreate
@@ -32,6 +35,7 @@ from example_service.infra.storage.service import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -45,11 +49,13 @@ class FileService(BaseService):
         session: AsyncSession,
         storage_service: StorageService | None = None,
         repository: FileRepository | None = None,
+        blob_repository: FileBlobRepository | None = None,
     ) -> None:
         super().__init__()
         self._session = session
         self._storage = storage_service or get_storage_service()
         self._repository = repository or get_file_repository()
+        self._blobs = blob_repository or get_file_blob_repository()
 
     def _ensure_storage(self) -> StorageService:
         """Ensure storage service is available, raising error if not configured."""
@@ -210,20 +216,24 @@ class FileService(BaseService):
         # Validate file
         self._validate_file(content_type, size_bytes)
 
-        # Generate storage key
-        storage_key = self._generate_storage_key(filename, owner_id)
-
-        # Reset file object
-        file_obj.seek(0)
-
-        # Upload to storage
         storage = self._ensure_storage()
-        upload_result = await storage.upload_file(
-            file_obj=file_obj,
-            key=storage_key,
-            content_type=content_type,
-            metadata={"original_filename": filename},
-        )
+        if storage.settings.dedup_enabled:
+            upload_result = await self._upload_blob(file_data, content_type)
+            storage_key = upload_result["key"]
+        else:
+            # Generate storage key
+            storage_key = self._generate_storage_key(filename, owner_id)
+
+            # Reset file object
+            file_obj.seek(0)
+
+            # Upload to storage
+            upload_result = await storage.upload_file(
+                file_obj=file_obj,
+                key=storage_key,
+                content_type=content_type,
+                metadata={"original_filename": filename},
+            )
 
         # Create database record
         file_create = FileCreate(
@@ -267,6 +277,56 @@ class FileService(BaseService):
 
         return created
 
+    async def _upload_blob(self, file_data: bytes, content_type: str) -> dict[str, Any]:
+        """Store content under its sha256, uploading only if no object holds it.
+
+        The blob reference is taken before the object is checked: the upsert
+        waits on a garbage collector holding the row, so the object is either
+        kept or re-uploaded, never lost. Shared objects carry the content type
+        of their first upload and no per-file metadata.
+        """
+        storage = self._ensure_storage()
+        settings = storage.settings
+        checksum = hashlib.sha256(file_data).hexdigest()
+        bucket = settings.bucket
+        key = f"{settings.dedup_prefix.rstrip('/')}/{checksum[:2]}/{checksum}"
+
+        blob = await self._blobs.acquire(
+            self._session,
+            sha256=checksum,
+            bucket=bucket,
+            storage_key=key,
+            size_bytes=len(file_data),
+        )
+
+        existing = await storage.get_file_info(key, bucket)
+        if existing is None:
+            result = await storage.upload_file(
+                file_obj=BytesIO(file_data),
+                key=key,
+                content_type=content_type,
+                bucket=bucket,
+            )
+            etag = result["etag"]
+        else:
+            etag = existing["etag"]
+
+        self.logger.debug(
+            "Stored content-addressed blob",
+            extra={
+                "storage_key": key,
+                "ref_count": blob.ref_count,
+                "uploaded": existing is None,
+            },
+        )
+        return {
+            "key": key,
+            "bucket": bucket,
+            "size_bytes": len(file_data),
+            "checksum_sha256": checksum,
+            "etag": etag,
+        }
+
     async def create_presigned_upload(
         self,
         filename: str,
@@ -503,39 +563,56 @@ class FileService(BaseService):
         file = await self._repository.get_or_raise(self._session, file_id, options=options)
 
         if hard_delete:
-            # Delete from storage
-            storage = self._ensure_storage()
-            try:
-                await storage.delete_file(file.storage_key)
-            except StorageClientError as e:
-                self.logger.warning(
-                    "Failed to delete file from storage",
-                    extra={"file_id": str(file_id), "error": str(e)},
-                )
+            await self._delete_from_storage([file])
 
-            # Delete thumbnails from storage
-            for thumbnail in file.thumbnails:
-                with contextlib.suppress(StorageClientError):
-                    # Continue even if thumbnail deletion fails
-                    await storage.delete_file(thumbnail.storage_key)
+        await self._remove_file(file, hard_delete=hard_delete)
+        return True
+
+    async def _delete_from_storage(self, files: Iterable[File]) -> None:
+        """Delete the objects and thumbnails of files with bulk deletes.
+
+        Content-addressed objects are released instead of deleted; the
+        cleanup worker removes them once nothing references them. Storage
+        failures are logged; the database records are still removed.
+        """
+        files = list(files)
+        blobs = await self._blobs.release(
+            self._session, [(file.bucket, file.storage_key) for file in files],
+        )
+
+        keys: list[str] = []
+        for file in files:
+            if (file.bucket, file.storage_key) not in blobs:
+                keys.append(file.storage_key)
+            keys.extend(thumbnail.storage_key for thumbnail in file.thumbnails)
+
+        result = await self._ensure_storage().delete_files(keys)
+        if result["failed"]:
+            self.logger.warning(
+                "Failed to delete files from storage",
+                extra={
+                    "failed": len(result["failed"]),
+                    "errors": result["failed"][:10],
+                },
+            )
 
-            # Delete from database
+    async def _remove_file(self, file: File, *, hard_delete: bool) -> None:
+        """Delete or soft delete a file record and dispatch the deleted event."""
+        if hard_delete:
             await self._repository.delete(self._session, file)
 
             self.logger.info(
                 "File hard deleted",
-                extra={"file_id": str(file_id), "operation": "service.delete_file"},
+                extra={"file_id": str(file.id), "operation": "service.delete_file"},
             )
         else:
-            # Soft delete
-            await self._repository.soft_delete(self._session, file_id)
+            await self._repository.soft_delete(self._session, file.id)
 
             self.logger.info(
                 "File soft deleted",
-                extra={"file_id": str(file_id), "operation": "service.delete_file"},
+                extra={"file_id": str(file.id), "operation": "service.delete_file"},
             )
 
-        # Dispatch webhook event
         await dispatch_event(
             session=self._session,
             event_type=FileEvents.DELETED,
@@ -543,8 +620,6 @@ class FileService(BaseService):
             payload=build_file_event_payload(file, FileEvents.DELETED),
         )
 
-        return True
-
     async def get_processing_status(self, file_id: UUID) -> dict:
         """Get file processing status.
 
@@ -636,6 +711,9 @@ class FileService(BaseService):
     async def batch_download_urls(self, file_ids: list[UUID]) -> dict[str, Any]:
         """Generate download URLs for multiple files.
 
+        Files are loaded with a single query and their URLs are presigned in
+        one pass.
+
         Args:
             file_ids: List of file UUIDs
 
@@ -646,66 +724,44 @@ class FileService(BaseService):
         successful = 0
         failed = 0
 
-        for file_id in file_ids:
-            try:
-                file = await self._repository.get(self._session, file_id)
-                if file is None:
-                    items.append(
-                        {
-                            "file_id": file_id,
-                            "download_url": None,
-                            "filename": None,
-                            "content_type": None,
-                            "size_bytes": None,
-                            "success": False,
-                            "error": "File not found",
-                        },
-                    )
-                    failed += 1
-                    continue
-
-                if file.status != FileStatus.READY:
-                    items.append(
-                        {
-                            "file_id": file_id,
-                            "download_url": None,
-                            "filename": file.original_filename,
-                            "content_type": file.content_type,
-                            "size_bytes": file.size_bytes,
-                            "success": False,
-                            "error": f"File not ready (status: {file.status})",
-                        },
-                    )
-                    failed += 1
-                    continue
-
-                storage = self._ensure_storage()
-                download_url = await storage.get_presigned_url(file.storage_key)
-                items.append(
-                    {
-                        "file_id": file_id,
-                        "download_url": download_url,
-                        "filename": file.original_filename,
-                        "content_type": file.content_type,
-                        "size_bytes": file.size_bytes,
-                        "success": True,
-                        "error": None,
-                    },
-                )
-                successful += 1
+        files = await self._repository.get_by_ids(self._session, file_ids)
 
+        ready_keys = [
+            file.storage_key
+            for file in files.values()
+            if file.status == FileStatus.READY
+        ]
+        urls: dict[str, str] = {}
+        url_error: str | None = None
+        if ready_keys:
+            try:
+                urls = await self._ensure_storage().get_presigned_urls(ready_keys)
             except Exception as e:
-                items.append(
-                    {
-                        "file_id": file_id,
-                        "download_url": None,
-                        "filename": None,
-                        "content_type": None,
-                        "size_bytes": None,
-                        "success": False,
-                        "error": str(e),
-                    },
-                )
+                url_error = str(e)
+
+        for file_id in file_ids:
+            file = files.get(file_id)
+            if file is None:
+                error: str | None = "File not found"
+            elif file.status != FileStatus.READY:
+                error = f"File not ready (status: {file.status})"
+            else:
+                error = url_error
+
+            items.append(
+                {
+                    "file_id": file_id,
+                    "download_url": urls[file.storage_key] if file and not error else None,
+                    "filename": file.original_filename if file else None,
+                    "content_type": file.content_type if file else None,
+                    "size_bytes": file.size_bytes if file else None,
+                    "success": error is None,
+                    "error": error,
+                },
+            )
+            if error is None:
+                successful += 1
+            else:
                 failed += 1
 
         self.logger.info(
@@ -746,56 +802,66 @@ class FileService(BaseService):
         successful = 0
         failed = 0
 
+        delete_objects = hard_delete and not dry_run
+        options = [selectinload(File.thumbnails)] if delete_objects else None
+        files = await self._repository.get_by_ids(
+            self._session, file_ids, options=options,
+        )
+
+        # One bulk storage delete for every object and thumbnail in the batch
+        if delete_objects and files:
+            await self._delete_from_storage(files.values())
+
         for file_id in file_ids:
+            file = files.get(file_id)
+            if file is None:
+                items.append(
+                    {
+                        "file_id": file_id,
+                        "filename": None,
+                        "would_delete": None,
+                        "deleted": None,
+                        "success": False,
+                        "error": "File not found",
+                    },
+                )
+                failed += 1
+                continue
+
+            if dry_run:
+                # Dry run - just preview
+                items.append(
+                    {
+                        "file_id": file_id,
+                        "filename": file.original_filename,
+                        "would_delete": True,
+                        "deleted": None,
+                        "success": True,
+                        "error": None,
+                    },
+                )
+                successful += 1
+                continue
+
             try:
-                file = await self._repository.get(self._session, file_id)
-                if file is None:
-                    items.append(
-                        {
-                            "file_id": file_id,
-                            "filename": None,
-                            "would_delete": None,
-                            "deleted": None,
-                            "success": False,
-                            "error": "File not found",
-                        },
-                    )
-                    failed += 1
-                    continue
-
-                if dry_run:
-                    # Dry run - just preview
-                    items.append(
-                        {
-                            "file_id": file_id,
-                            "filename": file.original_filename,
-                            "would_delete": True,
-                            "deleted": None,
-                            "success": True,
-                            "error": None,
-                        },
-                    )
-                    successful += 1
-                else:
-                    # Actual deletion
-                    await self.delete_file(file_id, hard_delete=hard_delete)
-                    items.append(
-                        {
-                            "file_id": file_id,
-                            "filename": file.original_filename,
-                            "would_delete": None,
-                            "deleted": True,
-                            "success": True,
-                            "error": None,
-                        },
-                    )
-                    successful += 1
+                await self._remove_file(file, hard_delete=hard_delete)
+                items.append(
+                    {
+                        "file_id": file_id,
+                        "filename": file.original_filename,
+                        "would_delete": None,
+                        "deleted": True,
+                        "success": True,
+                        "error": None,
+                    },
+                )
+                successful += 1
 
             except Exception as e:
                 items.append(
                     {
                         "file_id": file_id,
-                        "filename": None,
+                        "filename": file.original_filename,
                         "would_delete": None,
                         "deleted": None,
                         "success": False,
@@ -855,18 +921,28 @@ class FileService(BaseService):
         if new_filename is None:
             new_filename = f"Copy of {source_file.original_filename}"
 
-        # Generate new storage key
-        new_storage_key = self._generate_storage_key(new_filename, source_file.owner_id)
-
-        # Copy file in storage
         storage = self._ensure_storage()
-        await storage.copy_file(
-            source_key=source_file.storage_key,
-            dest_key=new_storage_key,
-        )
+        if await self._blobs.add_reference(
+            self._session, source_file.bucket, source_file.storage_key,
+        ):
+            # Content-addressed objects are shared; the copy takes a reference
+            new_storage_key = source_file.storage_key
+            etag = source_file.etag
+        else:
+            # Generate new storage key
+            new_storage_key = self._generate_storage_key(
+                new_filename, source_file.owner_id,
+            )
+
+            # Copy file in storage
+            await storage.copy_file(
+                source_key=source_file.storage_key,
+                dest_key=new_storage_key,
+            )
 
-        # Get file info to get the new etag
-        file_info = await storage.get_file_info(new_storage_key)
+            # Get file info to get the new etag
+            file_info = await storage.get_file_info(new_storage_key)
+            etag = file_info.get("etag") if file_info else None
 
         # Create new database record
         file_create = FileCreate(
@@ -876,7 +952,7 @@ class FileService(BaseService):
             content_type=source_file.content_type,
             size_bytes=source_file.size_bytes,
             checksum_sha256=source_file.checksum_sha256,
-            etag=file_info.get("etag") if file_info else None,
+            etag=etag,
             status=FileStatus.READY,
             owner_id=source_file.owner_id,
             is_public=source_file.is_public,
@@ -35,6 +35,7 @@ from example_service.features.graphql.caching.cdn_headers import (
     set_no_cache_headers,
 )
 from example_service.features.graphql.caching.field_cache import (
+    FieldCacheBatcher,
     cache_key,
     cached_field,
     invalidate_field_cache,
@@ -42,10 +43,12 @@ from example_service.features.graphql.caching.field_cache import (
 from example_service.features.graphql.caching.query_cache import (
     CacheConfig,
     QueryCacheExtension,
+    invalidate_query_cache,
 )
 
 __all__ = [
     "CacheConfig",
+    "FieldCacheBatcher",
     # Query-level caching
     "QueryCacheExtension",
     "cache_key",
@@ -53,6 +56,7 @@ __all__ = [
     "cached_field",
     "get_cache_control_header",
     "invalidate_field_cache",
+    "invalidate_query_cache",
     # CDN caching
     "set_cache_headers",
     "set_no_cache_headers",
@@ -3,6 +3,11 @@
 Provides decorators and utilities for caching individual field resolver results.
 Useful for expensive computed fields that don't change frequently.
 
+Cache reads and writes are batched per event loop tick: when a list of objects
+resolves the same cached field, every lookup made in that tick is served by a
+single ``MGET`` and every miss is written back in a single pipeline, so 100
+reminders asking for ``tagsCount`` cost one Redis round trip, not 100.
+
 Usage:
     from example_service.features.graphql.caching.field_cache import cached_field
 
@@ -17,19 +22,25 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 import functools
 import hashlib
+import inspect
 import logging
 from typing import TYPE_CHECKING, Any
+import weakref
 
 from example_service.infra.cache import get_cache_instance
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from example_service.infra.cache import RedisCache
+
 logger = logging.getLogger(__name__)
 
-__all__ = ["cache_key", "cached_field", "invalidate_field_cache"]
+__all__ = ["FieldCacheBatcher", "cache_key", "cached_field", "invalidate_field_cache"]
 
 
 def cache_key(*args: Any, prefix: str = "field") -> str:
@@ -52,6 +63,134 @@ def cache_key(*args: Any, prefix: str = "field") -> str:
     return f"{prefix}:{key_hash}"
 
 
+class FieldCacheBatcher:
+    """Coalesce field cache reads and writes made in the same event loop tick.
+
+    Works like a DataLoader: ``load`` queues the key and returns a future, and
+    the queue is dispatched as one ``MGET`` once the current tick has finished
+    scheduling resolvers. Writes are queued the same way and flushed as one
+    pipeline per TTL.
+
+    Example:
+        batcher = FieldCacheBatcher(cache)
+        values = await asyncio.gather(*(batcher.load(key) for key in keys))
+    """
+
+    def __init__(self, cache: RedisCache) -> None:
+        """Initialize the batcher.
+
+        Args:
+            cache: Cache used for batched reads and writes
+        """
+        self.cache = cache
+        self._pending_reads: dict[str, list[asyncio.Future[Any]]] = {}
+        self._pending_writes: dict[int, dict[str, Any]] = defaultdict(dict)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: str) -> Any | None:
+        """Queue a cache read and wait for the batched result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or cache error
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        if not self._pending_reads:
+            loop.call_soon(self._spawn, self._dispatch_reads)
+        self._pending_reads.setdefault(key, []).append(future)
+        return await future
+
+    def store(self, key: str, value: Any, ttl: int) -> None:
+        """Queue a cache write for the next batched flush.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        if not self._pending_writes:
+            asyncio.get_running_loop().call_soon(self._spawn, self._flush_writes)
+        self._pending_writes[ttl][key] = value
+
+    async def flush(self) -> None:
+        """Wait for queued reads and writes to reach Redis."""
+        while True:
+            # Yield so dispatches queued with call_soon get spawned and
+            # finished tasks' done-callbacks run
+            await asyncio.sleep(0)
+            running = [task for task in self._tasks if not task.done()]
+            if not running:
+                if not (self._pending_reads or self._pending_writes):
+                    return
+                continue
+            await asyncio.wait(running)
+
+    def _spawn(self, dispatch: Callable[[], Any]) -> None:
+        task = asyncio.get_running_loop().create_task(dispatch())
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch_reads(self) -> None:
+        pending, self._pending_reads = self._pending_reads, {}
+        keys = list(pending)
+
+        try:
+            values = await self.cache.get_many(keys)
+        except Exception as e:
+            # Fall back to the resolvers if the cache is unavailable
+            logger.exception(
+                "Field cache batch read failed",
+                extra={"error": str(e), "keys": len(keys)},
+            )
+            values = [None] * len(keys)
+
+        for key, value in zip(keys, values, strict=True):
+            for future in pending[key]:
+                if not future.done():
+                    future.set_result(value)
+
+        logger.debug(
+            "Field cache batch read",
+            extra={
+                "keys": len(keys),
+                "hits": sum(value is not None for value in values),
+            },
+        )
+
+    async def _flush_writes(self) -> None:
+        pending, self._pending_writes = self._pending_writes, defaultdict(dict)
+
+        for ttl, items in pending.items():
+            try:
+                await self.cache.set_many(items, ttl=ttl)
+            except Exception as e:
+                # Don't fail field resolution if caching has issues
+                logger.exception(
+                    "Field cache batch write failed",
+                    extra={"error": str(e), "keys": len(items), "ttl": ttl},
+                )
+
+
+# One batcher per event loop, rebuilt when the global cache is replaced
+_batchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FieldCacheBatcher] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_batcher(cache: RedisCache) -> FieldCacheBatcher:
+    """Get the field cache batcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None or batcher.cache is not cache:
+        batcher = FieldCacheBatcher(cache)
+        _batchers[loop] = batcher
+    return batcher
+
+
 def cached_field(
     ttl: int = 300,
     key_func: Callable[[Any], str] | None = None,
@@ -59,7 +198,10 @@ def cached_field(
 ) -> Callable:
     """Decorator for caching field resolver results.
 
-    Caches the result of expensive field resolvers in Redis.
+    Caches the result of expensive field resolvers in Redis. Sync and async
+    resolvers are both supported; the decorated resolver is always async.
+    Lookups from sibling objects in the same tick share one ``MGET`` and
+    misses are written back in one pipeline.
 
     Args:
         ttl: Cache TTL in seconds (default: 300 = 5 minutes)
@@ -90,17 +232,23 @@ def cached_field(
     """
 
     def decorator(func: Callable) -> Callable:
+        async def resolve(self: Any, *args: Any, **kwargs: Any) -> Any:
+            result = func(self, *args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
         @functools.wraps(func)
-        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
             # Get cache instance
             cache = get_cache_instance()
             if not cache:
                 # No cache configured, call function directly
-                return func(self, *args, **kwargs)
+                return await resolve(self, *args, **kwargs)
 
             # Check if we should skip caching
             if skip_if and skip_if(self):
-                return func(self, *args, **kwargs)
+                return await resolve(self, *args, **kwargs)
 
             # Generate cache key
             if key_func:
@@ -112,69 +260,43 @@ def cached_field(
                     cache_key_str = f"field:{func.__name__}:{obj_id}"
                 else:
                     # No ID available, can't cache
-                    return func(self, *args, **kwargs)
+                    return await resolve(self, *args, **kwargs)
 
-            try:
-                # Try to get cached result
-                import asyncio
-
-                if asyncio.iscoroutinefunction(cache.get):
-                    # Async cache - need to handle async
-                    # For now, skip caching for async cache in sync resolvers
-                    logger.debug("Async cache not supported in sync field resolvers")
-                    return func(self, *args, **kwargs)
-                # Sync cache
-                cached_result = cache.get(cache_key_str)
-                if cached_result is not None:
-                    logger.debug(
-                        "Field cache hit",
-                        extra={
-                            "cache_key": cache_key_str,
-                            "field": func.__name__,
-                        },
-                    )
-                    # Deserialize result
-                    import json
-
-                    return json.loads(cached_result)
-
-                # Cache miss - call function and cache result
-                result = func(self, *args, **kwargs)
-
-                # Serialize and cache result
-                import json
-
-                cache_value = json.dumps(result)
-                cache.set(cache_key_str, cache_value, ttl=ttl)
+            batcher = _get_batcher(cache)
 
+            cached_result = await batcher.load(cache_key_str)
+            if cached_result is not None:
                 logger.debug(
-                    "Field cached",
+                    "Field cache hit",
                     extra={
                         "cache_key": cache_key_str,
                         "field": func.__name__,
-                        "ttl": ttl,
                     },
                 )
+                return cached_result
 
-                return result
+            # Cache miss - call function and queue the result for write-back
+            result = await resolve(self, *args, **kwargs)
+            if result is not None:
+                batcher.store(cache_key_str, result, ttl)
 
-            except Exception as e:
-                # Don't fail the field resolution if caching has issues
-                logger.exception(
-                    "Field cache error",
+                logger.debug(
+                    "Field cached",
                     extra={
-                        "error": str(e),
+                        "cache_key": cache_key_str,
                         "field": func.__name__,
+                        "ttl": ttl,
                     },
                 )
-                return func(self, *args, **kwargs)
+
+            return result
 
         return wrapper
 
     return decorator
 
 
-def invalidate_field_cache(cache_key: str) -> None:
+async def invalidate_field_cache(cache_key: str) -> None:
     """Invalidate a field cache entry.
 
     Args:
@@ -182,13 +304,13 @@ def invalidate_field_cache(cache_key: str) -> None:
 
     Example:
         # After updating a reminder, invalidate its cached fields
-        invalidate_field_cache(f"reminder:{reminder_id}:tags_count")
-        invalidate_field_cache(f"reminder:{reminder_id}:formatted")
+        await invalidate_field_cache(f"reminder:{reminder_id}:tags_count")
+        await invalidate_field_cache(f"reminder:{reminder_id}:formatted")
     """
     cache = get_cache_instance()
     if cache:
         try:
-            cache.delete(cache_key)
+            await cache.delete(cache_key)
             logger.debug("Field cache invalidated", extra={"cache_key": cache_key})
         except Exception as e:
             logger.exception(
@@ -242,8 +364,8 @@ Example: Cache invalidation after mutation
         # Invalidate cached fields
         from example_service.features.graphql.caching.field_cache import invalidate_field_cache
 
-        invalidate_field_cache(f"reminder:{id}:tags_count")
-        invalidate_field_cache(f"reminder:{id}:formatted")
+        await invalidate_field_cache(f"reminder:{id}:tags_count")
+        await invalidate_field_cache(f"reminder:{id}:formatted")
 
         return ReminderSuccess(reminder=updated_reminder)
 
@@ -1,7 +1,13 @@
 """Query-level caching extension for GraphQL operations.
 
 Caches entire query results in Redis to reduce database load and improve response times.
-Uses operation name, variables, and user context as cache key to ensure correct isolation.
+Cache keys combine a hash of the normalized document, the operation name, the variables
+and the viewer/tenant scope, so formatting differences share an entry while users and
+tenants stay isolated.
+
+Cached results are tagged with the operation's root fields. Mutations invalidate the
+tags of the entities they modify, so ``createReminder`` clears cached ``reminder`` and
+``reminders`` results.
 
 Usage:
     from example_service.features.graphql.caching.query_cache import QueryCacheExtension
@@ -16,15 +22,28 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from typing import Any
+import re
+from typing import TYPE_CHECKING, ClassVar
 
+from graphql import ExecutionResult, FieldNode, OperationDefinitionNode, print_ast
 from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from example_service.features.graphql.extensions.metrics import (
+    record_cache_hit,
+    record_cache_miss,
+)
+from example_service.infra.cache import get_cache_instance, invalidate_tags
 
-from example_service.infra.cache import get_cache_instance
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["CacheConfig", "QueryCacheExtension"]
+__all__ = ["CacheConfig", "QueryCacheExtension", "invalidate_query_cache"]
+
+# Splits a mutation field name into its verb and entity ("createReminder")
+_MUTATION_NAME_RE = re.compile(r"^[a-z]+([A-Z]\w*)$")
 
 
 class CacheConfig:
@@ -35,29 +54,65 @@ class CacheConfig:
     SHORT_TTL = 60  # 1 minute
     LONG_TTL = 3600  # 1 hour
 
-    # Operations to skip caching
-    SKIP_MUTATIONS = True  # Never cache mutations
-    SKIP_SUBSCRIPTIONS = True  # Never cache subscriptions
+    # Invalidate cached queries touched by successful mutations
+    INVALIDATE_ON_MUTATION = True
 
     # Cache key prefix
     KEY_PREFIX = "graphql:query:"
 
+    # Prefix for invalidation tags (stored as tag:{TAG_PREFIX}{field})
+    TAG_PREFIX = "graphql:"
+
+    # TTL hints by operation name; 0 disables caching for the operation
+    OPERATION_TTLS: ClassVar[dict[str, int]] = {}
+
+    # TTL hints by root field name; the shortest hint in a query wins
+    FIELD_TTLS: ClassVar[dict[str, int]] = {}
+
+    # Query root fields invalidated by a mutation field, overriding the
+    # default of deriving them from the mutation name
+    MUTATION_INVALIDATIONS: ClassVar[dict[str, list[str]]] = {}
+
+
+async def invalidate_query_cache(
+    fields: list[str],
+    config: CacheConfig | None = None,
+) -> int:
+    """Invalidate cached query results that select any of the given root fields.
+
+    Use this when data changes outside a GraphQL mutation (REST endpoints,
+    background tasks).
+
+    Args:
+        fields: Query root field names (e.g. ``["reminders", "reminder"]``)
+        config: Cache configuration (for the tag prefix)
+
+    Returns:
+        Number of cached results deleted
+    """
+    config = config or CacheConfig()
+    if not fields or get_cache_instance() is None:
+        return 0
+    return await invalidate_tags([f"{config.TAG_PREFIX}{field}" for field in fields])
+
 
 class QueryCacheExtension(SchemaExtension):
     """Cache query results in Redis for improved performance.
 
     This extension caches the entire result of GraphQL queries in Redis,
     using a cache key derived from:
+    - Normalized document (whitespace and comments do not matter)
     - Operation name
-    - Operation type (query/mutation/subscription)
     - Query variables
-    - User ID (for authenticated requests)
+    - Viewer and tenant (for authenticated requests)
 
     This ensures cache isolation per user and per query variation.
 
     Cache behavior:
-    - Queries: Cached by default
-    - Mutations: Never cached (data modification)
+    - Queries: Served from cache before any resolver runs; stored after
+      execution without errors
+    - Mutations: Never cached; invalidate cached queries for the entities
+      they modify
     - Subscriptions: Never cached (real-time data)
     - Introspection queries: Short TTL (schema doesn't change often)
 
@@ -86,77 +141,46 @@ class QueryCacheExtension(SchemaExtension):
             ttl: Default cache TTL in seconds (default: 300 = 5 minutes)
             config: Custom cache configuration
         """
-        self.ttl = ttl or CacheConfig.DEFAULT_TTL
         self.config = config or CacheConfig()
+        self.ttl = ttl or self.config.DEFAULT_TTL
 
-    def on_execute(self) -> Any:
-        """Check cache before executing operation.
+    async def on_execute(self) -> AsyncIterator[None]:
+        """Serve queries from cache and store or invalidate after execution.
 
-        If cached result exists, return it immediately without execution.
-        Otherwise, execute the operation and cache the result.
+        On a hit the cached result is placed on the execution context, which
+        makes Strawberry skip execution entirely. On a miss the query runs
+        normally and its result is cached afterwards.
         """
         execution_context = self.execution_context
 
-        # Get cache instance
         cache = get_cache_instance()
         if not cache:
             # No cache configured, skip caching
             logger.debug("Query caching skipped: no cache configured")
-            return None
+            yield
+            return
 
-        # Get operation type
         operation_type = execution_context.operation_type
-        if not operation_type:
-            return None
+        operation_name = execution_context.operation_name
 
-        # Skip caching for mutations and subscriptions
-        if self.config.SKIP_MUTATIONS and operation_type == "mutation":
-            return None
+        if operation_type == OperationType.MUTATION:
+            yield
+            await self._invalidate_for_mutation()
+            return
 
-        if self.config.SKIP_SUBSCRIPTIONS and operation_type == "subscription":
-            return None
+        if operation_type != OperationType.QUERY:
+            yield
+            return
 
-        # Generate cache key
-        cache_key = self._generate_cache_key()
+        root_fields = self._root_fields()
+        ttl = self._resolve_ttl(root_fields)
+        cache_key = self._generate_cache_key() if ttl > 0 else None
         if not cache_key:
-            return None
+            yield
+            return
 
         try:
-            # Try to get cached result
-            import asyncio
-
-            if asyncio.iscoroutinefunction(cache.get):
-                # Async cache - this needs proper handling in async context
-                # For now, we'll skip async caching in the extension
-                # (This is a known limitation of Strawberry extensions)
-                logger.debug("Async cache not supported in extensions yet")
-                return None
-            # Sync cache
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                logger.debug(
-                    "Cache hit",
-                    extra={
-                        "cache_key": cache_key,
-                        "operation_name": execution_context.operation_name,
-                    },
-                )
-                # Deserialize and return cached result
-                return json.loads(cached_result)
-
-            # Cache miss - execute query and cache result
-            logger.debug(
-                "Cache miss",
-                extra={
-                    "cache_key": cache_key,
-                    "operation_name": execution_context.operation_name,
-                },
-            )
-
-            # Let the query execute normally
-            # We'll cache the result in on_request_end
-            return None
-
+            cached_result = await cache.get(cache_key)
         except Exception as e:
             # Don't fail the operation if caching has issues
             logger.exception(
@@ -164,70 +188,55 @@ class QueryCacheExtension(SchemaExtension):
                 extra={
                     "error": str(e),
                     "cache_key": cache_key,
-                    "operation_name": execution_context.operation_name,
+                    "operation_name": operation_name,
                 },
             )
-            return None
+            cached_result = None
 
-    def on_request_end(self) -> None:
-        """Cache the result after successful execution."""
-        execution_context = self.execution_context
-
-        # Get cache instance
-        cache = get_cache_instance()
-        if not cache:
-            return
-
-        # Get operation type
-        operation_type = execution_context.operation_type
-        if not operation_type:
+        if isinstance(cached_result, dict):
+            logger.debug(
+                "Cache hit",
+                extra={"cache_key": cache_key, "operation_name": operation_name},
+            )
+            record_cache_hit("query", "query")
+            execution_context.result = ExecutionResult(data=cached_result.get("data"))
+            yield
             return
 
-        # Skip caching for mutations and subscriptions
-        if self.config.SKIP_MUTATIONS and operation_type == "mutation":
-            return
+        logger.debug(
+            "Cache miss",
+            extra={"cache_key": cache_key, "operation_name": operation_name},
+        )
+        record_cache_miss("query", "query")
 
-        if self.config.SKIP_SUBSCRIPTIONS and operation_type == "subscription":
-            return
+        yield
 
-        # Check if execution was successful (no errors)
+        # Don't cache errors or partial results
         result = execution_context.result
-        if not result or result.errors:
-            # Don't cache errors
-            return
-
-        # Generate cache key
-        cache_key = self._generate_cache_key()
-        if not cache_key:
+        if not result or result.errors or result.data is None:
             return
 
         try:
-            # Serialize result
-            cache_value = json.dumps(
-                {
-                    "data": result.data,
-                    "errors": None,
-                },
-            )
+            await cache.set(cache_key, {"data": result.data}, ttl=ttl)
 
-            # Cache the result
-            import asyncio
+            # Tag the entry with its root fields for mutation invalidation
+            pipe = cache.pipeline()
+            for field in root_fields:
+                tag_key = f"tag:{self.config.TAG_PREFIX}{field}"
+                pipe.sadd(tag_key, cache_key)
+                # Keep the tag slightly longer than the data it points to
+                pipe.expire(tag_key, ttl + 60)
+            await pipe.execute()
 
-            if asyncio.iscoroutinefunction(cache.set):
-                # Async cache - skip for now
-                logger.debug("Async cache not supported in extensions yet")
-                return
-            # Sync cache
-            cache.set(cache_key, cache_value, ttl=self.ttl)
             logger.debug(
                 "Cached query result",
                 extra={
                     "cache_key": cache_key,
-                    "operation_name": execution_context.operation_name,
-                    "ttl": self.ttl,
+                    "operation_name": operation_name,
+                    "ttl": ttl,
+                    "tags": root_fields,
                 },
             )
-
         except Exception as e:
             # Don't fail the operation if caching has issues
             logger.exception(
@@ -235,30 +244,140 @@ class QueryCacheExtension(SchemaExtension):
                 extra={
                     "error": str(e),
                     "cache_key": cache_key,
-                    "operation_name": execution_context.operation_name,
+                    "operation_name": operation_name,
+                },
+            )
+
+    async def _invalidate_for_mutation(self) -> None:
+        """Invalidate cached queries for the entities a mutation modified."""
+        if not self.config.INVALIDATE_ON_MUTATION:
+            return
+
+        # Nothing was written if the mutation never produced data
+        result = self.execution_context.result
+        if not result or result.data is None:
+            return
+
+        fields: list[str] = []
+        for mutation_field in self._root_fields():
+            if result.data.get(mutation_field) is None:
+                continue
+            fields.extend(self._invalidated_fields(mutation_field))
+
+        if not fields:
+            return
+
+        try:
+            deleted = await invalidate_query_cache(fields, self.config)
+            logger.debug(
+                "Invalidated cached queries after mutation",
+                extra={
+                    "operation_name": self.execution_context.operation_name,
+                    "fields": fields,
+                    "deleted": deleted,
                 },
             )
+        except Exception as e:
+            # Don't fail the mutation if invalidation has issues
+            logger.exception(
+                "Cache invalidation failed",
+                extra={"error": str(e), "fields": fields},
+            )
+
+    def _invalidated_fields(self, mutation_field: str) -> list[str]:
+        """Get the query root fields affected by a mutation field.
+
+        Uses ``MUTATION_INVALIDATIONS`` when configured; otherwise the entity
+        is taken from the mutation name, so ``updateReminder`` maps to
+        ``reminder`` and ``reminders``.
+        """
+        if mutation_field in self.config.MUTATION_INVALIDATIONS:
+            return list(self.config.MUTATION_INVALIDATIONS[mutation_field])
+
+        match = _MUTATION_NAME_RE.match(mutation_field)
+        if not match:
+            return []
+        entity = match.group(1)
+        entity = entity[0].lower() + entity[1:]
+        return [entity, f"{entity}s"]
+
+    def _resolve_ttl(self, root_fields: list[str]) -> int:
+        """Get the TTL for the current query from the configured hints."""
+        operation_name = self.execution_context.operation_name
+        if operation_name and operation_name in self.config.OPERATION_TTLS:
+            return self.config.OPERATION_TTLS[operation_name]
+
+        hints = [
+            self.config.FIELD_TTLS[field]
+            for field in root_fields
+            if field in self.config.FIELD_TTLS
+        ]
+        if root_fields and all(field.startswith("__") for field in root_fields):
+            hints.append(self.config.SHORT_TTL)
+
+        return min(hints) if hints else self.ttl
+
+    def _operation(self) -> OperationDefinitionNode | None:
+        """Get the operation definition being executed."""
+        document = self.execution_context.graphql_document
+        if document is None:
+            return None
+
+        operation_name = self.execution_context.operation_name
+        operations = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, OperationDefinitionNode)
+        ]
+        if operation_name:
+            for operation in operations:
+                if operation.name and operation.name.value == operation_name:
+                    return operation
+            return None
+        return operations[0] if len(operations) == 1 else None
+
+    def _root_fields(self) -> list[str]:
+        """Get the root field names selected by the operation."""
+        operation = self._operation()
+        if operation is None:
+            return []
+
+        return sorted({
+            selection.name.value
+            for selection in operation.selection_set.selections
+            if isinstance(selection, FieldNode) and selection.name.value != "__typename"
+        })
+
+    def _scope(self) -> str:
+        """Get the viewer/tenant scope for the cache key."""
+        context = getattr(self.execution_context, "context", None)
+        user = getattr(context, "user", None) if context else None
+        if not user:
+            return "anonymous"
+        tenant_id = getattr(user, "tenant_id", None) or "-"
+        return f"tenant:{tenant_id}:user:{user.identifier}"
 
     def _generate_cache_key(self) -> str | None:
         """Generate cache key from operation details.
 
         The cache key includes:
+        - Normalized document hash
         - Operation name
-        - Operation type
         - Variables (serialized)
-        - User ID (for authenticated requests)
+        - Viewer/tenant scope (for authenticated requests)
 
         Returns:
             Cache key string, or None if key cannot be generated
         """
         execution_context = self.execution_context
+        document = execution_context.graphql_document
+        if document is None:
+            return None
 
-        # Get operation details
         operation_name = execution_context.operation_name or "anonymous"
-        operation_type = execution_context.operation_type or "query"
 
         # Get variables (serialize to ensure consistent key)
-        variables = execution_context.variable_values or {}
+        variables = execution_context.variables or {}
         try:
             variables_str = json.dumps(variables, sort_keys=True)
         except (TypeError, ValueError):
@@ -269,19 +388,14 @@ class QueryCacheExtension(SchemaExtension):
             )
             return None
 
-        # Get user ID if authenticated
-        user_id = "anonymous"
-        if hasattr(execution_context, "context") and execution_context.context:
-            context = execution_context.context
-            if hasattr(context, "user") and context.user:
-                user_id = f"user:{context.user.id}"
+        document_hash = hashlib.sha256(print_ast(document).encode()).hexdigest()
 
-        # Generate hash of operation + variables + user
-        key_components = f"{operation_type}:{operation_name}:{variables_str}:{user_id}"
-        key_hash = hashlib.sha256(key_components.encode()).hexdigest()[:16]
+        # Generate hash of document + operation + variables + scope
+        key_components = f"{document_hash}:{operation_name}:{variables_str}:{self._scope()}"
+        key_hash = hashlib.sha256(key_components.encode()).hexdigest()[:32]
 
         # Create cache key
-        return f"{self.config.KEY_PREFIX}{operation_type}:{operation_name}:{key_hash}"
+        return f"{self.config.KEY_PREFIX}{operation_name}:{key_hash}"
 
 
 # ============================================================================
@@ -310,58 +424,30 @@ Example: Different TTLs for different environments
         QueryCacheExtension(ttl=ttl),
     ]
 
-Example: Custom configuration
+Example: Custom configuration and TTL hints
     from example_service.features.graphql.caching.query_cache import (
         CacheConfig,
         QueryCacheExtension,
     )
 
-    config = CacheConfig()
-    config.DEFAULT_TTL = 600  # 10 minutes
-    config.KEY_PREFIX = "myapp:graphql:query:"
+    class DashboardCacheConfig(CacheConfig):
+        KEY_PREFIX = "myapp:graphql:query:"
+        OPERATION_TTLS = {"DashboardSummary": 30, "CurrentUser": 0}  # 0 = never cache
+        FIELD_TTLS = {"featureFlags": 3600}
+        MUTATION_INVALIDATIONS = {"completeReminder": ["reminders", "reminderStats"]}
 
     extensions = [
-        QueryCacheExtension(config=config),
+        QueryCacheExtension(config=DashboardCacheConfig()),
     ]
 
 Example: Cache invalidation
-    # After a mutation that modifies data, you may want to invalidate related caches
-    # This can be done in the mutation resolver:
-
-    from example_service.infra.cache import get_cache_instance
-
-    @strawberry.mutation
-    async def update_reminder(
-        self,
-        info: Info,
-        id: strawberry.ID,
-        input: UpdateReminderInput,
-    ) -> ReminderPayload:
-        # Update the reminder...
-
-        # Invalidate related caches
-        cache = get_cache_instance()
-        if cache:
-            # Clear all reminder-related query caches
-            # Note: This requires a pattern-based delete, which Redis supports
-            cache.delete_pattern("graphql:query:query:reminders:*")
-            cache.delete_pattern(f"graphql:query:query:reminder:*{id}*")
-
-        return ReminderSuccess(reminder=updated_reminder)
-
-Example: Selective caching with directives (future enhancement)
-    # In the future, you could use GraphQL directives to control caching:
+    # Mutations invalidate automatically: updateReminder clears cached results
+    # selecting the reminder and reminders root fields. When data changes
+    # outside GraphQL, invalidate explicitly:
 
-    type Query {
-        # Cache for 1 hour
-        reminder(id: ID!): Reminder @cache(ttl: 3600)
+    from example_service.features.graphql.caching import invalidate_query_cache
 
-        # Never cache
-        currentUser: User @cache(ttl: 0)
-
-        # Cache for 5 minutes (default)
-        reminders(first: Int): ReminderConnection
-    }
+    await invalidate_query_cache(["reminders", "reminder"])
 
 Example: Cache warming
     # Warm the cache during application startup or on a schedule:
@@ -386,10 +472,4 @@ Example: Cache warming
             \"\"\",
             context_value=create_system_context(),
         )
-
-Note: The current implementation has limitations with async caching in Strawberry
-extensions. For production use, consider:
-1. Using a sync cache backend (like Redis with sync client)
-2. Implementing caching at a higher level (middleware)
-3. Using dedicated caching solutions like GraphQL CDN or Apollo Server caching
 """
@@ -4,7 +4,9 @@ DataLoaders batch and cache database lookups within a single request,
 preventing N+1 query problems common in GraphQL resolvers.
 
 Each GraphQL request gets its own DataLoader instance to ensure proper
-batching boundaries and cache isolation.
+batching boundaries and cache isolation. When
+``GRAPHQL_DATALOADER_CACHE_ENABLED`` is set, loaders for rarely changing
+entities are additionally backed by a shared Redis cache (see ``cache``).
 """
 
 from __future__ import annotations
@@ -12,8 +14,36 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from example_service.core.settings import get_graphql_settings
+from example_service.features.audit.models import AuditLog
+from example_service.features.featureflags.models import FeatureFlag
 from example_service.features.graphql.dataloaders.ai import AIJobDataLoader
+from example_service.features.graphql.dataloaders.audit import (
+    AuditLogDataLoader,
+    AuditLogsByEntityDataLoader,
+)
+from example_service.features.graphql.dataloaders.cache import (
+    LOADER_CACHE_TTLS,
+    SharedLoaderCache,
+    bump_entity_versions,
+    model_from_dict,
+    model_to_dict,
+)
+from example_service.features.graphql.dataloaders.featureflags import (
+    FeatureFlagByKeyDataLoader,
+    FeatureFlagDataLoader,
+)
+from example_service.features.graphql.dataloaders.files import FileDataLoader
+from example_service.features.graphql.dataloaders.relationships import (
+    ReminderTagsDataLoader,
+)
 from example_service.features.graphql.dataloaders.reminders import ReminderDataLoader
+from example_service.features.graphql.dataloaders.tags import TagDataLoader
+from example_service.features.graphql.dataloaders.webhooks import (
+    WebhookDataLoader,
+    WebhookDeliveriesByWebhookDataLoader,
+)
+from example_service.features.tags.models import Tag
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -34,21 +64,91 @@ class DataLoaders:
 
     reminders: ReminderDataLoader
     ai_jobs: AIJobDataLoader
+    tags: TagDataLoader
+    reminder_tags: ReminderTagsDataLoader
+    feature_flags: FeatureFlagDataLoader
+    feature_flags_by_key: FeatureFlagByKeyDataLoader
+    audit_logs: AuditLogDataLoader
+    audit_logs_by_entity: AuditLogsByEntityDataLoader
+    files: FileDataLoader
+    webhooks: WebhookDataLoader
+    webhook_deliveries_by_webhook: WebhookDeliveriesByWebhookDataLoader
+
+
+def _model_cache(entity: str, model: type) -> SharedLoaderCache:
+    return SharedLoaderCache(
+        entity=entity,
+        ttl=LOADER_CACHE_TTLS[entity],
+        encode=model_to_dict,
+        decode=lambda data: model_from_dict(model, data),
+    )
 
 
-def create_dataloaders(session: AsyncSession) -> DataLoaders:
+def create_dataloaders(
+    session: AsyncSession,
+    *,
+    shared_cache: bool | None = None,
+) -> DataLoaders:
     """Factory for creating request-scoped DataLoaders.
 
     Args:
         session: Database session for the current request
+        shared_cache: Back tag, feature flag and audit log loaders with the
+            cross-request Redis cache (defaults to
+            ``GRAPHQL_DATALOADER_CACHE_ENABLED``)
 
     Returns:
         DataLoaders container with all loaders initialized
     """
+    if shared_cache is None:
+        shared_cache = get_graphql_settings().dataloader_cache_enabled
+
+    tag_cache = flag_cache = flag_key_cache = audit_cache = None
+    reminder_tags_cache: SharedLoaderCache | None = None
+    if shared_cache:
+        tag_cache = _model_cache("tag", Tag)
+        flag_cache = _model_cache("feature_flag", FeatureFlag)
+        flag_key_cache = _model_cache("feature_flag_key", FeatureFlag)
+        audit_cache = _model_cache("audit_log", AuditLog)
+        reminder_tags_cache = SharedLoaderCache(
+            entity="reminder_tags",
+            ttl=LOADER_CACHE_TTLS["reminder_tags"],
+            encode=lambda tags: [model_to_dict(tag) for tag in tags],
+            decode=lambda data: [model_from_dict(Tag, item) for item in data],
+        )
+
     return DataLoaders(
         reminders=ReminderDataLoader(session),
         ai_jobs=AIJobDataLoader(session),
+        tags=TagDataLoader(session, shared_cache=tag_cache),
+        reminder_tags=ReminderTagsDataLoader(session, shared_cache=reminder_tags_cache),
+        feature_flags=FeatureFlagDataLoader(session, shared_cache=flag_cache),
+        feature_flags_by_key=FeatureFlagByKeyDataLoader(
+            session,
+            shared_cache=flag_key_cache,
+        ),
+        audit_logs=AuditLogDataLoader(session, shared_cache=audit_cache),
+        audit_logs_by_entity=AuditLogsByEntityDataLoader(session),
+        files=FileDataLoader(session),
+        webhooks=WebhookDataLoader(session),
+        webhook_deliveries_by_webhook=WebhookDeliveriesByWebhookDataLoader(session),
     )
 
 
-__all__ = ["AIJobDataLoader", "DataLoaders", "ReminderDataLoader", "create_dataloaders"]
+__all__ = [
+    "AIJobDataLoader",
+    "AuditLogDataLoader",
+    "AuditLogsByEntityDataLoader",
+    "DataLoaders",
+    "FeatureFlagByKeyDataLoader",
+    "FeatureFlagDataLoader",
+    "FileDataLoader",
+    "ReminderDataLoader",
+    "ReminderTagsDataLoader",
+    "SharedLoaderCache",
+    "TagDataLoader",
+    "WebhookDataLoader",
+    "WebhookDeliveriesByWebhookDataLoader",
+    "bump_entity_versions",
+    "create_dataloaders",
+]
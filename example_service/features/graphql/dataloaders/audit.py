@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from example_service.features.graphql.dataloaders.cache import SharedLoaderCache
+
 
 class AuditLogDataLoader:
     """DataLoader for batch-loading audit logs by ID.
@@ -29,16 +31,22 @@ class AuditLogDataLoader:
         audit_log = await loader.load(uuid)
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        shared_cache: SharedLoaderCache | None = None,
+    ) -> None:
         """Initialize with a database session.
 
         Args:
             session: AsyncSession scoped to the current request
+            shared_cache: Optional cross-request cache behind the loader
         """
         self._session = session
-        self._loader: DataLoader[UUID, AuditLog | None] = DataLoader(
-            load_fn=self._batch_load_audit_logs,
-        )
+        load_fn = self._batch_load_audit_logs
+        if shared_cache is not None:
+            load_fn = shared_cache.wrap(load_fn)
+        self._loader: DataLoader[UUID, AuditLog | None] = DataLoader(load_fn=load_fn)
 
     async def _batch_load_audit_logs(
         self,
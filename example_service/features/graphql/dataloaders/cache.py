@@ -0,0 +1,222 @@
+"""Shared second-level cache for DataLoaders.
+
+DataLoaders only cache within a single request. ``SharedLoaderCache`` sits
+behind a loader's batch function and serves entities from Redis across
+requests, so frequently viewed, rarely changing data (tags, feature flags,
+audit logs) is returned without touching Postgres.
+
+Correctness after writes comes from per-entity version counters rather than
+deletes. Every cached value records the version of its entity at load time;
+mutations bump the version with ``bump_entity_versions``, which makes every
+older value unreadable. Versions and values for a whole batch are fetched
+with a single ``MGET``, and misses are written back in a single pipeline.
+
+Keys:
+    {prefix}:{entity}:{key} - Cached value with the version it was loaded at
+    {prefix}:version:{entity}:{key} - Version counter bumped by mutations
+
+Example:
+    tag_cache = SharedLoaderCache("tag", ttl=600, encode=model_to_dict,
+                                  decode=partial(model_from_dict, Tag))
+    loader = DataLoader(load_fn=tag_cache.wrap(batch_load_tags))
+
+    # After a mutation commits:
+    await bump_entity_versions("tag", [tag.id])
+
+Note:
+    Only mapped column attributes are cached; values are restored as
+    transient ORM instances, so relationships on them are not loaded. Only
+    use the cache for loaders whose consumers read column attributes.
+    Writes that do not bump versions (e.g. through the REST API) become
+    visible once the entity's TTL lapses.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import inspect as sa_inspect
+
+from example_service.infra.cache import get_cache_instance
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for shared loader entries
+KEY_PREFIX = "graphql:loader"
+
+# Version counters outlive every cached value, so a lapsed counter can never
+# make an old value readable again
+VERSION_TTL_SECONDS = 7 * 24 * 3600
+
+# Default per-entity TTLs (seconds) used by create_dataloaders
+LOADER_CACHE_TTLS: dict[str, int] = {
+    "tag": 600,
+    "reminder_tags": 300,
+    "feature_flag": 60,
+    "feature_flag_key": 60,
+    "audit_log": 3600,  # Audit logs are immutable
+}
+
+
+def model_to_dict(instance: Any) -> dict[str, Any]:
+    """Serialize the column attributes of an ORM instance."""
+    mapper = sa_inspect(type(instance))
+    return {attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs}
+
+
+def model_from_dict[V](model: type[V], data: dict[str, Any]) -> V:
+    """Restore a transient ORM instance from ``model_to_dict`` output."""
+    return model(**data)
+
+
+def _version_key(entity: str, key: Any) -> str:
+    return f"{KEY_PREFIX}:version:{entity}:{key}"
+
+
+def _value_key(entity: str, key: Any) -> str:
+    return f"{KEY_PREFIX}:{entity}:{key}"
+
+
+@dataclass(slots=True)
+class SharedLoaderCache[K, V]:
+    """Versioned Redis cache behind a DataLoader batch function.
+
+    Attributes:
+        entity: Version namespace (e.g. ``"tag"``); keys are entity keys.
+        ttl: Time to live for cached values in seconds.
+        encode: Converts a loaded value into a cacheable value.
+        decode: Restores a loaded value from its cached form.
+    """
+
+    entity: str
+    ttl: int
+    encode: Callable[[V], Any]
+    decode: Callable[[Any], V]
+
+    def wrap(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[list[V]]],
+    ) -> Callable[[list[K]], Awaitable[list[V]]]:
+        """Wrap a batch load function with the shared cache.
+
+        Keys found at their current version are served from Redis; the rest
+        go to ``batch_load`` in a single call. ``None`` results are never
+        cached. Without a configured cache, or if Redis fails, the batch
+        function is called directly.
+
+        Args:
+            batch_load: DataLoader batch function to wrap
+
+        Returns:
+            Batch function with the same signature
+        """
+
+        async def load(keys: list[K]) -> list[V]:
+            cache = get_cache_instance()
+            if cache is None or not keys:
+                return await batch_load(keys)
+
+            cache_keys: list[str] = []
+            for key in keys:
+                cache_keys.append(_version_key(self.entity, key))
+                cache_keys.append(_value_key(self.entity, key))
+
+            try:
+                raw = await cache.get_many(cache_keys)
+            except Exception as e:
+                logger.warning(
+                    "Shared loader cache read failed",
+                    extra={"entity": self.entity, "error": str(e)},
+                )
+                return await batch_load(keys)
+
+            results: list[Any] = [None] * len(keys)
+            versions: list[int] = []
+            missing: list[int] = []
+            for index in range(len(keys)):
+                version = int(raw[2 * index] or 0)
+                entry = raw[2 * index + 1]
+                versions.append(version)
+                if isinstance(entry, dict) and entry.get("v") == version:
+                    results[index] = self.decode(entry["d"])
+                else:
+                    missing.append(index)
+
+            if missing:
+                loaded = await batch_load([keys[index] for index in missing])
+                to_store: dict[str, Any] = {}
+                for index, value in zip(missing, loaded, strict=True):
+                    results[index] = value
+                    if value is not None:
+                        to_store[_value_key(self.entity, keys[index])] = {
+                            "v": versions[index],
+                            "d": self.encode(value),
+                        }
+
+                if to_store:
+                    try:
+                        await cache.set_many(to_store, ttl=self.ttl)
+                    except Exception as e:
+                        logger.warning(
+                            "Shared loader cache write failed",
+                            extra={"entity": self.entity, "error": str(e)},
+                        )
+
+            logger.debug(
+                "Shared loader cache batch",
+                extra={
+                    "entity": self.entity,
+                    "keys": len(keys),
+                    "hits": len(keys) - len(missing),
+                },
+            )
+            return results
+
+        return load
+
+
+async def bump_entity_versions(entity: str, keys: Iterable[Any]) -> None:
+    """Invalidate shared loader entries by bumping entity versions.
+
+    Call after the write commits. Values cached at older versions are
+    ignored by every replica from then on.
+
+    Args:
+        entity: Version namespace (e.g. ``"tag"``)
+        keys: Entity keys whose cached values are now stale
+    """
+    cache = get_cache_instance()
+    if cache is None:
+        return
+
+    version_keys = [_version_key(entity, key) for key in keys]
+    if not version_keys:
+        return
+
+    try:
+        pipe = cache.client.pipeline(transaction=False)
+        for version_key in version_keys:
+            pipe.incr(version_key)
+            pipe.expire(version_key, VERSION_TTL_SECONDS)
+        await pipe.execute()
+        # Versions may be held in the L1 cache of other replicas
+        await cache.invalidate_local(keys=version_keys)
+    except Exception as e:
+        logger.warning(
+            "Failed to bump shared loader versions",
+            extra={"entity": entity, "keys": len(version_keys), "error": str(e)},
+        )
+
+
+__all__ = [
+    "LOADER_CACHE_TTLS",
+    "SharedLoaderCache",
+    "bump_entity_versions",
+    "model_from_dict",
+    "model_to_dict",
+]
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from example_service.features.graphql.dataloaders.cache import SharedLoaderCache
+
 
 class FeatureFlagDataLoader:
     """DataLoader for batch-loading feature flags by ID.
@@ -28,16 +30,22 @@ class FeatureFlagDataLoader:
         flag = await loader.load(uuid)
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        shared_cache: SharedLoaderCache | None = None,
+    ) -> None:
         """Initialize with a database session.
 
         Args:
             session: AsyncSession scoped to the current request
+            shared_cache: Optional cross-request cache behind the loader
         """
         self._session = session
-        self._loader: DataLoader[UUID, FeatureFlag | None] = DataLoader(
-            load_fn=self._batch_load_flags,
-        )
+        load_fn = self._batch_load_flags
+        if shared_cache is not None:
+            load_fn = shared_cache.wrap(load_fn)
+        self._loader: DataLoader[UUID, FeatureFlag | None] = DataLoader(load_fn=load_fn)
 
     async def _batch_load_flags(
         self,
@@ -94,16 +102,22 @@ class FeatureFlagByKeyDataLoader:
         flag = await loader.load("new_dashboard")
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        shared_cache: SharedLoaderCache | None = None,
+    ) -> None:
         """Initialize with a database session.
 
         Args:
             session: AsyncSession scoped to the current request
+            shared_cache: Optional cross-request cache behind the loader
         """
         self._session = session
-        self._loader: DataLoader[str, FeatureFlag | None] = DataLoader(
-            load_fn=self._batch_load_flags_by_key,
-        )
+        load_fn = self._batch_load_flags_by_key
+        if shared_cache is not None:
+            load_fn = shared_cache.wrap(load_fn)
+        self._loader: DataLoader[str, FeatureFlag | None] = DataLoader(load_fn=load_fn)
 
     async def _batch_load_flags_by_key(
         self,
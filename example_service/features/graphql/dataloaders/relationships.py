@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from example_service.features.graphql.dataloaders.cache import SharedLoaderCache
+
 
 class ReminderTagsDataLoader:
     """DataLoader for batch-loading tags by reminder ID.
@@ -29,16 +31,22 @@ class ReminderTagsDataLoader:
         tags = await loader.load(reminder_uuid)  # Returns list[Tag]
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        shared_cache: SharedLoaderCache | None = None,
+    ) -> None:
         """Initialize with a database session.
 
         Args:
             session: AsyncSession scoped to the current request
+            shared_cache: Optional cross-request cache behind the loader
         """
         self._session = session
-        self._loader: DataLoader[UUID, list[Tag]] = DataLoader(
-            load_fn=self._batch_load_tags_by_reminder,
-        )
+        load_fn = self._batch_load_tags_by_reminder
+        if shared_cache is not None:
+            load_fn = shared_cache.wrap(load_fn)
+        self._loader: DataLoader[UUID, list[Tag]] = DataLoader(load_fn=load_fn)
 
     async def _batch_load_tags_by_reminder(
         self,
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from example_service.features.graphql.dataloaders.cache import SharedLoaderCache
+
 
 class TagDataLoader:
     """DataLoader for batch-loading tags by ID.
@@ -31,14 +33,22 @@ class TagDataLoader:
         tags = await loader.load_many([uuid1, uuid2, uuid3])
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        shared_cache: SharedLoaderCache | None = None,
+    ) -> None:
         """Initialize with a database session.
 
         Args:
             session: AsyncSession scoped to the current request
+            shared_cache: Optional cross-request cache behind the loader
         """
         self._session = session
-        self._loader: DataLoader[UUID, Tag | None] = DataLoader(load_fn=self._batch_load_tags)
+        load_fn = self._batch_load_tags
+        if shared_cache is not None:
+            load_fn = shared_cache.wrap(load_fn)
+        self._loader: DataLoader[UUID, Tag | None] = DataLoader(load_fn=load_fn)
 
     async def _batch_load_tags(
         self,
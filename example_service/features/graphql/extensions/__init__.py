@@ -3,6 +3,7 @@
 This package contains Strawberry extensions that enhance the GraphQL API with:
 - Rate limiting (per-operation throttling)
 - Query complexity limiting (depth and cost scoring)
+- Parsed-document caching (skip parse, validation and complexity analysis)
 - OpenTelemetry tracing (distributed tracing)
 - Prometheus metrics (request rates, latencies, caching, DataLoaders)
 - Caching (query and field-level)
@@ -10,10 +11,15 @@ This package contains Strawberry extensions that enhance the GraphQL API with:
 
 from __future__ import annotations
 
+from example_service.core.settings import get_graphql_settings
 from example_service.features.graphql.extensions.complexity_limiter import (
     ComplexityConfig,
     ComplexityLimiter,
 )
+from example_service.features.graphql.extensions.document_cache import (
+    CachedDocument,
+    DocumentCacheExtension,
+)
 from example_service.features.graphql.extensions.metrics import (
     GRAPHQL_METRICS,
     GraphQLMetricsExtension,
@@ -40,6 +46,8 @@ def get_extensions() -> list:
         List of Strawberry extension instances
     """
     return [
+        # Must run before ComplexityLimiter, which reuses its cached analysis
+        DocumentCacheExtension(max_size=get_graphql_settings().document_cache_size),
         ComplexityLimiter(),
         GraphQLRateLimiter(),
         GraphQLMetricsExtension(),
@@ -49,8 +57,11 @@ def get_extensions() -> list:
 
 __all__ = [
     "GRAPHQL_METRICS",
+    "CachedDocument",
     "ComplexityConfig",
     "ComplexityLimiter",
+    # Performance
+    "DocumentCacheExtension",
     # Metrics
     "GraphQLMetricsExtension",
     # Security
@@ -29,6 +29,10 @@ from graphql.language import (
 from graphql.type import GraphQLList, GraphQLObjectType
 from strawberry.extensions import SchemaExtension
 
+from example_service.features.graphql.extensions.document_cache import (
+    get_cached_document,
+)
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["ComplexityConfig", "ComplexityLimiter"]
@@ -69,7 +73,9 @@ class ComplexityLimiter(SchemaExtension):
     - Custom field costs (expensive operations)
 
     The complexity score is calculated before execution and queries exceeding
-    the limit are rejected with a COMPLEXITY_LIMIT_EXCEEDED error.
+    the limit are rejected with a COMPLEXITY_LIMIT_EXCEEDED error. When
+    ``DocumentCacheExtension`` runs first, scores are cached with the parsed
+    document and computed once per distinct operation.
 
     Example complexity calculation:
         query {
@@ -140,8 +146,15 @@ class ComplexityLimiter(SchemaExtension):
             return
 
         try:
-            # Calculate complexity
-            complexity_score, max_depth = self._calculate_complexity(operation)
+            # Reuse the analysis cached with the parsed document when available
+            cached_document = get_cached_document(execution_context)
+            operation_name = execution_context.operation_name
+            analysis = cached_document.analysis.get(operation_name) if cached_document else None
+            if analysis is None:
+                analysis = self._calculate_complexity(operation)
+                if cached_document is not None:
+                    cached_document.analysis[operation_name] = analysis
+            complexity_score, max_depth = analysis
 
             # Check depth limit
             if max_depth > self.max_depth:
@@ -0,0 +1,136 @@
+"""Parsed-document cache extension for GraphQL operations.
+
+Parsing and validating a GraphQL document costs far more than executing a
+small query against warm caches, yet most traffic repeats a handful of
+operations. This extension keeps parsed documents in an in-process LRU keyed
+by the document's sha256 (the same hash Automatic Persisted Queries use), so
+repeated operations skip parsing, and remembers which documents already
+passed validation so they skip validation too.
+
+Cache entries also carry per-operation analysis results: ``ComplexityLimiter``
+stores the computed complexity and depth on the entry, so hot operations skip
+the AST walk as well.
+
+Usage:
+    from example_service.features.graphql.extensions.document_cache import (
+        DocumentCacheExtension,
+    )
+
+    extensions = [
+        DocumentCacheExtension(max_size=1000),  # Must come before ComplexityLimiter
+        ComplexityLimiter(max_complexity=1000),
+    ]
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING
+
+from strawberry.extensions import SchemaExtension
+
+from example_service.features.graphql.persisted_queries import query_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from graphql import DocumentNode
+    from strawberry.types import ExecutionContext
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CachedDocument", "DocumentCacheExtension", "get_cached_document"]
+
+# Attribute holding the cache entry for the current execution
+ENTRY_ATTRIBUTE = "_document_cache_entry"
+
+
+@dataclass(slots=True)
+class CachedDocument:
+    """Parsed document with cached validation and analysis results.
+
+    Attributes:
+        document: Parsed document AST (shared; treat as read-only).
+        validated: Whether the document passed validation.
+        analysis: ``(complexity, depth)`` by operation name.
+    """
+
+    document: DocumentNode
+    validated: bool = False
+    analysis: dict[str | None, tuple[int, int]] = field(default_factory=dict)
+
+
+def get_cached_document(execution_context: ExecutionContext) -> CachedDocument | None:
+    """Get the document cache entry for an execution, if any."""
+    return getattr(execution_context, ENTRY_ATTRIBUTE, None)
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """Cache parsed and validated documents by hash.
+
+    On a hit the cached AST is placed on the execution context, which makes
+    Strawberry skip parsing, and validation is skipped for documents that
+    already validated. Documents that fail validation are never marked
+    validated, so their errors are reported on every request.
+
+    Example:
+        schema = strawberry.Schema(
+            query=Query,
+            extensions=[DocumentCacheExtension(max_size=1000)],
+        )
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        """Initialize document cache extension.
+
+        Args:
+            max_size: Maximum cached documents (0 disables caching)
+        """
+        self.max_size = max_size
+        self._documents: OrderedDict[str, CachedDocument] = OrderedDict()
+
+    def on_parse(self) -> Iterator[None]:
+        """Serve the parsed document from cache, or cache it after parsing."""
+        execution_context = self.execution_context
+        query = execution_context.query
+        if not query or self.max_size <= 0:
+            yield
+            return
+
+        key = query_hash(query)
+        entry = self._documents.get(key)
+        if entry is not None:
+            self._documents.move_to_end(key)
+            execution_context.graphql_document = entry.document
+
+        yield
+
+        if entry is None:
+            document = execution_context.graphql_document
+            if document is None:
+                # Syntax error; nothing to cache
+                return
+            entry = CachedDocument(document=document)
+            self._documents[key] = entry
+            if len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+        setattr(execution_context, ENTRY_ATTRIBUTE, entry)
+
+    def on_validate(self) -> Iterator[None]:
+        """Skip validation for documents that already validated."""
+        execution_context = self.execution_context
+        entry = get_cached_document(execution_context)
+        if entry is not None and entry.validated:
+            execution_context.pre_execution_errors = []
+
+        yield
+
+        if (
+            entry is not None
+            and not entry.validated
+            and not execution_context.pre_execution_errors
+        ):
+            entry.validated = True
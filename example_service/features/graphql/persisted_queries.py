@@ -0,0 +1,204 @@
+"""Automatic Persisted Queries (APQ) for the GraphQL endpoint.
+
+Clients send the sha256 hash of a document instead of the document itself:
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "<hash>"}}}
+
+If the hash is unknown the server answers with a ``PersistedQueryNotFound``
+error and the client retries once with both the hash and the full document,
+which registers it. Documents live in Redis (shared by all replicas) behind an
+in-process LRU, so hot operations resolve without a network hop and requests
+carry a small hash instead of the full query.
+
+This follows the Apollo APQ protocol, so Apollo Client's persisted query link
+and compatible clients work unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any
+
+from graphql import GraphQLError
+
+from example_service.infra.cache import LocalCache, get_cache_instance
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "PersistedQueryError",
+    "PersistedQueryStore",
+    "get_persisted_query_store",
+    "query_hash",
+    "resolve_persisted_query",
+]
+
+# Redis key prefix for persisted documents
+KEY_PREFIX = "graphql:apq:"
+
+# Local LRU entries expire after an hour so Redis TTLs are eventually honoured
+LOCAL_TTL_SECONDS = 3600.0
+
+
+class PersistedQueryError(GraphQLError):
+    """Raised when a persisted query cannot be resolved."""
+
+
+def query_hash(query: str) -> str:
+    """Get the APQ hash (hex sha256) of a GraphQL document."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryStore:
+    """Two-tier store for persisted query documents.
+
+    Lookups check the in-process LRU first and fall back to Redis; documents
+    found in Redis are promoted into the LRU. Without a configured Redis cache
+    the store is process-local.
+
+    Example:
+        store = PersistedQueryStore(ttl=86400)
+        await store.set(query_hash(query), query)
+        await store.get(query_hash(query))  # query
+    """
+
+    def __init__(self, ttl: int = 604800, local_size: int = 1000) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl: TTL in seconds for documents stored in Redis
+            local_size: Maximum documents kept in process
+        """
+        self.ttl = ttl
+        self._local = LocalCache(
+            max_size=local_size,
+            ttl=LOCAL_TTL_SECONDS,
+            cache_name="graphql_apq",
+        )
+
+    async def get(self, sha256_hash: str) -> str | None:
+        """Get the document registered for a hash.
+
+        Args:
+            sha256_hash: Hex sha256 of the document
+
+        Returns:
+            The document, or None if it is not registered
+        """
+        query = self._local.get(sha256_hash)
+        if isinstance(query, str):
+            return query
+
+        cache = get_cache_instance()
+        if cache is None:
+            return None
+
+        try:
+            query = await cache.get(f"{KEY_PREFIX}{sha256_hash}")
+        except Exception as e:
+            logger.warning(
+                "Persisted query lookup failed",
+                extra={"hash": sha256_hash, "error": str(e)},
+            )
+            return None
+
+        if isinstance(query, str):
+            self._local.set(sha256_hash, query)
+            return query
+        return None
+
+    async def set(self, sha256_hash: str, query: str) -> None:
+        """Register a document under its hash.
+
+        Args:
+            sha256_hash: Hex sha256 of the document
+            query: The GraphQL document
+        """
+        self._local.set(sha256_hash, query)
+
+        cache = get_cache_instance()
+        if cache is None:
+            return
+
+        try:
+            await cache.set(f"{KEY_PREFIX}{sha256_hash}", query, ttl=self.ttl)
+        except Exception as e:
+            # The local copy still serves this replica
+            logger.warning(
+                "Persisted query registration failed",
+                extra={"hash": sha256_hash, "error": str(e)},
+            )
+
+
+_store: PersistedQueryStore | None = None
+
+
+def get_persisted_query_store() -> PersistedQueryStore:
+    """Get the process-wide persisted query store (created from settings)."""
+    global _store
+    if _store is None:
+        from example_service.core.settings import get_graphql_settings
+
+        settings = get_graphql_settings()
+        _store = PersistedQueryStore(
+            ttl=settings.persisted_query_ttl,
+            local_size=settings.persisted_query_local_size,
+        )
+    return _store
+
+
+async def resolve_persisted_query(
+    query: str | None,
+    extensions: dict[str, Any] | None,
+    store: PersistedQueryStore | None = None,
+) -> str | None:
+    """Resolve the document for a request that may use APQ.
+
+    Args:
+        query: Document sent with the request (may be omitted with APQ)
+        extensions: Request ``extensions`` object
+        store: Store to use (defaults to the process-wide store)
+
+    Returns:
+        The document to execute (unchanged for non-APQ requests)
+
+    Raises:
+        PersistedQueryError: ``PERSISTED_QUERY_NOT_FOUND`` when the hash is
+            unknown and no document was sent, or ``PERSISTED_QUERY_HASH_MISMATCH``
+            when the document does not match the hash.
+    """
+    persisted = (extensions or {}).get("persistedQuery")
+    if not isinstance(persisted, dict):
+        return query
+
+    sha256_hash = persisted.get("sha256Hash")
+    if persisted.get("version") != 1 or not isinstance(sha256_hash, str):
+        msg = "Unsupported persisted query version"
+        raise PersistedQueryError(
+            msg,
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+    store = store or get_persisted_query_store()
+
+    if not query:
+        query = await store.get(sha256_hash)
+        if query is None:
+            msg = "PersistedQueryNotFound"
+            raise PersistedQueryError(
+                msg,
+                extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+            )
+        return query
+
+    if query_hash(query) != sha256_hash:
+        msg = "provided sha does not match query"
+        raise PersistedQueryError(
+            msg,
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+    await store.set(sha256_hash, query)
+    logger.debug("Registered persisted query", extra={"hash": sha256_hash})
+    return query
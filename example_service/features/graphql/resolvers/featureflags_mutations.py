@@ -21,6 +21,7 @@ from example_service.features.featureflags.repository import get_feature_flag_re
 from example_service.features.featureflags.schemas import (
     FeatureFlagResponse,
 )
+from example_service.features.graphql.dataloaders.cache import bump_entity_versions
 from example_service.features.graphql.events import (
     publish_feature_flag_event,
     serialize_model_for_event,
@@ -47,6 +48,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def _invalidate_flag_loaders(flag_id: UUID, *flag_keys: str) -> None:
+    """Invalidate shared DataLoader entries for a changed feature flag.
+
+    Pass both the old and the new key when a flag is renamed, so lookups
+    by the old key stop serving the cached flag.
+    """
+    await bump_entity_versions("feature_flag", [flag_id])
+    await bump_entity_versions("feature_flag_key", list(dict.fromkeys(flag_keys)))
+
+
 async def create_feature_flag_mutation(
     info: Info[GraphQLContext, None],
     input: CreateFeatureFlagInput,
@@ -198,6 +209,8 @@ async def update_feature_flag_mutation(
                 message=f"Feature flag with ID {id} not found",
             )
 
+        previous_key = flag.key
+
         # Update fields (only if provided)
         update_dict = update_data.model_dump(exclude_unset=True)
 
@@ -248,6 +261,7 @@ async def update_feature_flag_mutation(
 
         await ctx.session.commit()
         await ctx.session.refresh(flag)
+        await _invalidate_flag_loaders(flag.id, previous_key, flag.key)
 
         logger.info("Updated feature flag: %s (%s)", flag.id, flag.key)
 
@@ -320,6 +334,7 @@ async def toggle_feature_flag_mutation(
 
         await ctx.session.commit()
         await ctx.session.refresh(flag)
+        await _invalidate_flag_loaders(flag.id, flag.key)
 
         logger.info(
             "Toggled feature flag: %s (%s) -> %s", flag.id, flag.key, flag.enabled,
@@ -396,6 +411,7 @@ async def delete_feature_flag_mutation(
         # Delete flag
         await repo.delete(ctx.session, flag)
         await ctx.session.commit()
+        await _invalidate_flag_loaders(flag_uuid, flag_key)
 
         logger.info(
             "Deleted feature flag: %s (%s), removed %s associated overrides",
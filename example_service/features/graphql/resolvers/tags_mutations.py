@@ -18,6 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 import strawberry
 
+from example_service.features.graphql.dataloaders.cache import bump_entity_versions
 from example_service.features.graphql.events import (
     publish_tag_event,
     serialize_model_for_event,
@@ -33,13 +34,14 @@ from example_service.features.graphql.types.tags import (
     UpdateTagInput,
 )
 from example_service.features.reminders.models import Reminder
-from example_service.features.tags.models import Tag
+from example_service.features.tags.models import Tag, reminder_tags
 from example_service.features.tags.schemas import TagResponse
 from example_service.utils.runtime_dependencies import require_runtime_dependency
 
 require_runtime_dependency(strawberry)
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
     from strawberry.types import Info
 
     from example_service.features.graphql.context import GraphQLContext
@@ -47,6 +49,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def _tagged_reminder_ids(session: AsyncSession, tag_id: UUID) -> list[UUID]:
+    """Get IDs of reminders carrying a tag (for shared loader invalidation)."""
+    stmt = select(reminder_tags.c.reminder_id).where(reminder_tags.c.tag_id == tag_id)
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def _invalidate_tag_loaders(tag_id: UUID, reminder_ids: list[UUID]) -> None:
+    """Invalidate shared DataLoader entries for a changed tag."""
+    await bump_entity_versions("tag", [tag_id])
+    await bump_entity_versions("reminder_tags", reminder_ids)
+
+
 async def create_tag_mutation(
     info: Info[GraphQLContext, None],
     input: CreateTagInput,
@@ -205,8 +220,10 @@ async def update_tag_mutation(
                 update_data.description.strip() if update_data.description else None
             )
 
+        reminder_ids = await _tagged_reminder_ids(ctx.session, tag.id)
         await ctx.session.commit()
         await ctx.session.refresh(tag)
+        await _invalidate_tag_loaders(tag.id, reminder_ids)
 
         logger.info("Updated tag: %s (%s)", tag.id, tag.name)
 
@@ -280,8 +297,10 @@ async def delete_tag_mutation(
         tag_id_str = str(tag.id)
 
         # Delete tag (cascade will remove associations)
+        reminder_ids = await _tagged_reminder_ids(ctx.session, tag.id)
         await repo.delete(ctx.session, tag)
         await ctx.session.commit()
+        await _invalidate_tag_loaders(tag_uuid, reminder_ids)
 
         logger.info("Deleted tag: %s (%s)", tag_uuid, tag.name)
 
@@ -360,6 +379,7 @@ async def add_tags_to_reminder_mutation(
                 reminder.tags.append(tag)
 
         await ctx.session.commit()
+        await bump_entity_versions("reminder_tags", [reminder_uuid])
 
         logger.info("Added %s tags to reminder: %s", len(tags), reminder_uuid)
 
@@ -423,6 +443,7 @@ async def remove_tags_from_reminder_mutation(
                 removed_count += 1
 
         await ctx.session.commit()
+        await bump_entity_versions("reminder_tags", [reminder_uuid])
 
         logger.info("Removed %s tags from reminder: %s", removed_count, reminder_uuid)
 
@@ -13,6 +13,7 @@ import logging
 from typing import TYPE_CHECKING, Annotated, Any, Literal, cast
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
+from graphql import ExecutionResult
 
 try:
     from strawberry.fastapi import GraphQLRouter
@@ -28,6 +29,10 @@ from example_service.utils.runtime_dependencies import require_runtime_dependenc
 if GraphQLRouter is not None:
     from example_service.features.graphql.context import GraphQLContext
     from example_service.features.graphql.dataloaders import create_dataloaders
+    from example_service.features.graphql.persisted_queries import (
+        PersistedQueryError,
+        resolve_persisted_query,
+    )
     from example_service.features.graphql.playground import register_playground_routes
     from example_service.features.graphql.schema import schema
 else:
@@ -84,6 +89,34 @@ if GraphQLRouter is not None:
             user=user,
             correlation_id=correlation_id,
         )
+
+    class PersistedQueryGraphQLRouter(GraphQLRouter):
+        """GraphQL router that accepts Automatic Persisted Queries.
+
+        Requests carrying a ``persistedQuery`` extension have their document
+        resolved from the persisted query store before execution. APQ errors
+        are returned as regular GraphQL errors so clients can register the
+        document and retry.
+        """
+
+        async def parse_http_body(self, *args: Any, **kwargs: Any) -> Any:
+            """Parse the request body and resolve persisted query hashes."""
+            request_data = await super().parse_http_body(*args, **kwargs)
+            # Batched requests parse to a list of operations
+            operations = request_data if isinstance(request_data, list) else [request_data]
+            for operation in operations:
+                operation.query = await resolve_persisted_query(
+                    operation.query,
+                    getattr(operation, "extensions", None),
+                )
+            return request_data
+
+        async def execute_operation(self, *args: Any, **kwargs: Any) -> Any:
+            """Execute the operation, reporting APQ failures as GraphQL errors."""
+            try:
+                return await super().execute_operation(*args, **kwargs)
+            except PersistedQueryError as e:
+                return ExecutionResult(data=None, errors=[e])
 else:
     # Dummy function to avoid NameError, but it won't be used
     async def get_graphql_context(*_args: Any, **_kwargs: Any) -> Any:
@@ -116,7 +149,10 @@ def create_graphql_router() -> APIRouter:
             "Literal['graphiql', 'apollo-sandbox', 'pathfinder']", graphql_ide_setting,
         )
 
-    graphql_app = GraphQLRouter(
+    router_class = (
+        PersistedQueryGraphQLRouter if settings.persisted_queries_enabled else GraphQLRouter
+    )
+    graphql_app = router_class(
         schema,
         context_getter=cast("Any", get_graphql_context),
         subscription_protocols=subscription_protocols or (),
@@ -8,6 +8,7 @@ and WebSocket (event types and payloads).
 from __future__ import annotations
 
 from example_service.features.notifications.templates.renderer import (
+    RenderPlan,
     TemplateRenderer,
     TemplateRenderError,
 )
@@ -17,6 +18,7 @@ from example_service.features.notifications.templates.service import (
 
 __all__ = [
     "NotificationTemplateService",
+    "RenderPlan",
     "TemplateRenderError",
     "TemplateRenderer",
 ]
@@ -1,7 +1,26 @@
-"""Jinja2 template rendering for notifications with validation and security."""
+"""Jinja2 template rendering for notifications with validation and security.
+
+Parsing and compiling a Jinja template costs far more than rendering it, and
+a notification blast renders the same template thousands of times. The
+renderer therefore compiles each ``NotificationTemplate`` once into a
+``RenderPlan`` (every string template plus the JSON payload, precompiled
+into a single tree of render functions) and keeps plans in an in-process LRU
+keyed by template id, version and a hash of the template sources, so edited
+or unsaved templates never reuse a stale plan. Compiled templates share one
+sandboxed environment per escaping mode.
+
+Usage:
+    renderer = get_template_renderer()
+    rendered = renderer.render_template(template, context)
+    batch = renderer.render_many(template, [context_a, context_b])
+"""
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
 import json
 from typing import TYPE_CHECKING, Any
 
@@ -11,8 +30,11 @@ from jinja2.sandbox import SandboxedEnvironment
 from example_service.infra.logging import get_logger
 
 if TYPE_CHECKING:
-    from example_service.features.notifications.models import NotificationTemplate
+    from collections.abc import Callable, Iterable, Iterator
+
+    from jinja2 import Environment, Template
 
+    from example_service.features.notifications.models import NotificationTemplate
 
 class TemplateRenderError(Exception):
     """Raised when template rendering fails."""
@@ -30,19 +52,80 @@ class TemplateRenderError(Exception):
         self.missing_vars = missing_vars or []
 
 
+@dataclass(frozen=True, slots=True)
+class RenderPlan:
+    """Compiled form of a NotificationTemplate, reused across renders.
+
+    Attributes:
+        subject: Compiled subject template
+        body: Compiled plain text body template
+        body_html: Compiled HTML body template (autoescaped)
+        webhook_payload: Compiled webhook payload
+        websocket_payload: Compiled websocket payload
+        websocket_event_type: Event type sent with the websocket payload
+    """
+
+    subject: Template | None = None
+    body: Template | None = None
+    body_html: Template | None = None
+    webhook_payload: Callable[[dict[str, Any]], Any] | None = None
+    websocket_payload: Callable[[dict[str, Any]], Any] | None = None
+    websocket_event_type: str | None = None
+
+    def render(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Render every part of the template with one context.
+
+        Args:
+            context: Variables for template rendering
+
+        Returns:
+            Rendered content, as returned by ``TemplateRenderer.render_template``
+        """
+        rendered: dict[str, Any] = {}
+
+        # Render email templates
+        if self.subject is not None:
+            rendered["subject"] = self.subject.render(context)
+
+        if self.body is not None:
+            rendered["body"] = self.body.render(context)
+
+        if self.body_html is not None:
+            rendered["body_html"] = self.body_html.render(context)
+
+        # Render webhook payload
+        if self.webhook_payload is not None:
+            rendered["payload"] = self.webhook_payload(context)
+
+        # Render websocket payload
+        if self.websocket_payload is not None:
+            rendered["payload"] = self.websocket_payload(context)
+            rendered["event_type"] = self.websocket_event_type
+
+        return rendered
+
+
 class TemplateRenderer:
     """Jinja2 template renderer with security sandboxing and validation.
 
     Uses SandboxedEnvironment to prevent arbitrary code execution.
     Validates required context variables before rendering.
     Supports email (subject, text, HTML) and JSON (webhook, websocket) templates.
+    Compiled templates are cached, so repeated renders of a template only pay
+    for rendering.
     """
 
-    def __init__(self) -> None:
-        """Initialize with sandboxed Jinja2 environment."""
-        self._logger = get_logger()
+    def __init__(self, cache_size: int = 512) -> None:
+        """Initialize with sandboxed Jinja2 environments.
 
-        # Create sandboxed environment for security
+        Args:
+            cache_size: Maximum number of compiled templates kept in memory
+        """
+        self._logger = get_logger(__name__)
+        self.cache_size = cache_size
+        self._plans: OrderedDict[tuple[Any, ...], RenderPlan] = OrderedDict()
+
+        # Create sandboxed environment for security (HTML, autoescaped)
         self._env = SandboxedEnvironment(
             autoescape=select_autoescape(
                 enabled_extensions=("html", "xml"),
@@ -55,6 +138,21 @@ class TemplateRenderer:
         # Register custom filters
         self._env.filters["json"] = json.dumps
 
+        # Plain text templates, without autoescape
+        self._text_env = SandboxedEnvironment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
+
+        # String values inside JSON payloads
+        self._payload_env = SandboxedEnvironment(autoescape=False)
+
+    @property
+    def cached_templates(self) -> int:
+        """Get the number of compiled templates in the cache."""
+        return len(self._plans)
+
+    def clear_cache(self) -> None:
+        """Drop all compiled templates."""
+        self._plans.clear()
+
     def render_template(
         self,
         template: NotificationTemplate,
@@ -79,33 +177,100 @@ class TemplateRenderer:
         # Validate required context variables
         self._validate_context(template, context)
 
-        rendered = {}
+        with self._render_errors(template):
+            rendered = self.compile(template).render(context)
 
-        try:
-            # Render email templates
-            if template.subject_template:
-                rendered["subject"] = self._render_string(template.subject_template, context)
+        self._logger.debug(
+            lambda: f"Rendered template {template.name} for channel {template.channel}",
+        )
 
-            if template.body_template:
-                rendered["body"] = self._render_string(template.body_template, context)
+        return rendered
 
-            if template.body_html_template:
-                rendered["body_html"] = self._render_string(template.body_html_template, context, autoescape=True)
+    def render_many(
+        self,
+        template: NotificationTemplate,
+        contexts: Iterable[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Render one template against many contexts.
 
-            # Render webhook payload
-            if template.webhook_payload_template:
-                rendered["payload"] = self._render_json(template.webhook_payload_template, context)
+        The template is compiled (or fetched from the cache) once, and each
+        context is validated and rendered against the same plan.
 
-            # Render websocket payload
-            if template.websocket_payload_template:
-                rendered["payload"] = self._render_json(template.websocket_payload_template, context)
-                rendered["event_type"] = template.websocket_event_type
+        Args:
+            template: NotificationTemplate instance
+            contexts: Variables for each render
 
-            self._logger.debug(
-                lambda: f"Rendered template {template.name} for channel {template.channel}",
-            )
+        Returns:
+            Rendered content for each context, in order (see ``render_template``)
+
+        Raises:
+            TemplateRenderError: If validation fails or rendering errors occur
+        """
+        with self._render_errors(template):
+            plan = self.compile(template)
 
-            return rendered
+        results = []
+        for context in contexts:
+            self._validate_context(template, context)
+            with self._render_errors(template):
+                results.append(plan.render(context))
+
+        self._logger.debug(
+            lambda: f"Rendered template {template.name} for channel {template.channel} {len(results)} times",
+        )
+
+        return results
+
+    def compile(self, template: NotificationTemplate) -> RenderPlan:
+        """Get the compiled render plan for a template.
+
+        Plans are cached by template id, version and a hash of the template
+        sources, and evicted least recently used first.
+
+        Args:
+            template: NotificationTemplate instance
+
+        Returns:
+            RenderPlan for the template
+
+        Raises:
+            TemplateSyntaxError: If a template does not parse
+        """
+        key = (template.id, template.version, _source_digest(template))
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            return plan
+
+        plan = RenderPlan(
+            subject=self._text_env.from_string(template.subject_template)
+            if template.subject_template
+            else None,
+            body=self._text_env.from_string(template.body_template) if template.body_template else None,
+            body_html=self._env.from_string(template.body_html_template)
+            if template.body_html_template
+            else None,
+            webhook_payload=_compile_payload(template.webhook_payload_template, self._payload_env)
+            if template.webhook_payload_template
+            else None,
+            websocket_payload=_compile_payload(template.websocket_payload_template, self._payload_env)
+            if template.websocket_payload_template
+            else None,
+            websocket_event_type=template.websocket_event_type,
+        )
+
+        self._plans[key] = plan
+        if len(self._plans) > self.cache_size:
+            self._plans.popitem(last=False)
+
+        self._logger.debug(lambda: f"Compiled template {template.name} for channel {template.channel}")
+        return plan
+
+    @contextmanager
+    def _render_errors(self, template: NotificationTemplate) -> Iterator[None]:
+        """Convert Jinja2 errors into TemplateRenderError."""
+        try:
+            yield
 
         except UndefinedError as exc:
             msg = f"Missing variable in template {template.name}: {exc}"
@@ -148,78 +313,48 @@ class TemplateRenderer:
                 missing_vars=missing,
             )
 
-    def _render_string(
-        self,
-        template_str: str,
-        context: dict[str, Any],
-        autoescape: bool = False,
-    ) -> str:
-        """Render a string template.
 
-        Args:
-            template_str: Template string
-            context: Context variables
-            autoescape: Enable HTML autoescaping
+def _source_digest(template: NotificationTemplate) -> str:
+    """Hash every source a render plan is compiled from."""
+    sources = [
+        template.subject_template,
+        template.body_template,
+        template.body_html_template,
+        template.webhook_payload_template,
+        template.websocket_payload_template,
+        template.websocket_event_type,
+    ]
+    encoded = json.dumps(sources, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
 
-        Returns:
-            Rendered string
-        """
-        if autoescape:
-            # For HTML, use environment with autoescape
-            template = self._env.from_string(template_str)
-        else:
-            # For plain text, disable autoescape
-            env = SandboxedEnvironment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
-            template = env.from_string(template_str)
 
-        return template.render(**context)
+def _compile_payload(obj: Any, env: Environment) -> Callable[[dict[str, Any]], Any]:
+    """Compile a JSON template (Jinja2 strings in values) into one render function.
 
-    def _render_json(
-        self,
-        template_dict: dict[str, Any],
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Render a JSON template (dict with Jinja2 strings in values).
+    Strings containing Jinja2 syntax are compiled once; dicts and lists are
+    rebuilt on every render, and other values pass through.
 
-        Args:
-            template_dict: Template dictionary with Jinja2 expressions
-            context: Context variables
+    Args:
+        obj: Template value (dict, list, str, or primitive)
+        env: Environment to compile string values with
 
-        Returns:
-            Rendered dictionary with all Jinja2 expressions evaluated
-        """
-        return self._render_dict_recursive(template_dict, context)
+    Returns:
+        Function rendering a context into the payload structure
+    """
+    if isinstance(obj, dict):
+        items = [(key, _compile_payload(value, env)) for key, value in obj.items()]
+        return lambda context: {key: render(context) for key, render in items}
 
-    def _render_dict_recursive(
-        self,
-        obj: Any,
-        context: dict[str, Any],
-    ) -> Any:
-        """Recursively render Jinja2 expressions in nested dicts/lists.
+    if isinstance(obj, list):
+        renders = [_compile_payload(item, env) for item in obj]
+        return lambda context: [render(context) for render in renders]
 
-        Args:
-            obj: Object to render (dict, list, str, or primitive)
-            context: Context variables
+    # Check if string contains Jinja2 syntax
+    if isinstance(obj, str) and ("{{" in obj or "{%" in obj):
+        return env.from_string(obj).render
 
-        Returns:
-            Object with all Jinja2 expressions rendered
-        """
-        if isinstance(obj, dict):
-            return {k: self._render_dict_recursive(v, context) for k, v in obj.items()}
-
-        if isinstance(obj, list):
-            return [self._render_dict_recursive(item, context) for item in obj]
-
-        if isinstance(obj, str):
-            # Check if string contains Jinja2 syntax
-            if "{{" in obj or "{%" in obj:
-                env = SandboxedEnvironment(autoescape=False)
-                template = env.from_string(obj)
-                return template.render(**context)
-            return obj
-
-        # Primitives (int, float, bool, None) pass through
-        return obj
+    # Primitives (int, float, bool, None) and plain strings pass through
+    return lambda _context: obj
 
 
 # Singleton instance
@@ -167,6 +167,44 @@ class NotificationTemplateService(BaseService):
 
         return self._renderer.render_template(template, context)
 
+    async def render_many_by_name(
+        self,
+        session: AsyncSession,
+        name: str,
+        channel: str,
+        contexts: Sequence[dict[str, Any]],
+        tenant_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Render a template by name and channel against many contexts.
+
+        The template is looked up and compiled once for the whole batch.
+
+        Args:
+            session: Database session
+            name: Template name (e.g., 'reminder_due')
+            channel: Delivery channel
+            contexts: Variables for each render
+            tenant_id: Optional tenant ID
+
+        Returns:
+            Rendered content for each context, in order
+
+        Raises:
+            ValueError: If template not found
+            TemplateRenderError: If rendering fails
+        """
+        template = await self._repository.get_by_name_and_channel(session, name, channel, tenant_id)
+
+        if not template:
+            msg = f"Template {name} for channel {channel} not found (tenant={tenant_id})"
+            raise ValueError(msg)
+
+        if not template.is_active:
+            msg = f"Template {name} is not active"
+            raise ValueError(msg)
+
+        return self._renderer.render_many(template, contexts)
+
     async def preview_template(
         self,
         template: NotificationTemplate,
@@ -2,7 +2,8 @@
 
 Message Types:
 - Client → Server: subscribe, unsubscribe, ping, message
-- Server → Client: subscribed, unsubscribed, pong, message, error, broadcast
+- Server → Client: subscribed, unsubscribed, pong, message, error, broadcast,
+  batch
 """
 
 from __future__ import annotations
@@ -33,6 +34,7 @@ class ServerMessageType(str, Enum):
     PONG = "pong"
     MESSAGE = "message"
     BROADCAST = "broadcast"
+    BATCH = "batch"
     ERROR = "error"
     CONNECTED = "connected"
 
@@ -157,6 +159,17 @@ class BroadcastMessage(ServerMessage):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+class BatchMessage(ServerMessage):
+    """Several messages for one channel, delivered together (batching enabled)."""
+
+    type: Literal[ServerMessageType.BATCH] = ServerMessageType.BATCH
+    channel: str = Field(..., description="Source channel")
+    messages: list[dict[str, Any]] = Field(
+        ...,
+        description="Messages in broadcast order",
+    )
+
+
 class ErrorMessage(ServerMessage):
     """Error message from server."""
 
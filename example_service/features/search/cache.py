@@ -6,6 +6,8 @@ database load and improve response times.
 Features:
 - Automatic cache key generation from search parameters
 - Configurable TTL per query type
+- Short-lived facet counts keyed on the normalized tsquery, shared by every
+  page of the same search
 - Cache invalidation helpers
 - Metrics for cache hit/miss rates
 
@@ -47,6 +49,7 @@ class SearchCacheConfig:
     default_ttl: int = 300  # 5 minutes
     suggestion_ttl: int = 600  # 10 minutes
     analytics_ttl: int = 60  # 1 minute (analytics should be fresh)
+    facet_ttl: int = 30  # Facets are reused while paging, keep them short-lived
     max_query_length: int = 200  # Don't cache very long queries
     cache_prefix: str = "search"
     min_results_to_cache: int = 0  # Cache even zero-result queries
@@ -269,6 +272,110 @@ class SearchCache:
             logger.warning("Failed to set suggestion cache: %s", e)
             return False
 
+    @staticmethod
+    def _facet_params(
+        entity_type: str,
+        query: str,
+        syntax: str,
+        ts_config: str,
+    ) -> dict[str, Any]:
+        """Build facet cache parameters from the inputs of the tsquery.
+
+        Facet counts depend only on the match predicate, so paging, ranking
+        and highlighting options are deliberately left out of the key. Case
+        and whitespace are normalized since they do not change the tsquery.
+
+        Args:
+            entity_type: Entity type the facets belong to.
+            query: Query text the tsquery is built from.
+            syntax: Query syntax used to build the tsquery.
+            ts_config: PostgreSQL text search configuration.
+
+        Returns:
+            Dictionary of parameters.
+        """
+        return {
+            "entity_type": entity_type,
+            "query": " ".join(query.lower().split()),
+            "syntax": str(syntax),
+            "ts_config": ts_config,
+        }
+
+    async def get_facets(
+        self,
+        entity_type: str,
+        query: str,
+        syntax: str,
+        ts_config: str,
+    ) -> list[dict[str, Any]] | None:
+        """Get cached facet counts for an entity search.
+
+        Args:
+            entity_type: Entity type the facets belong to.
+            query: Query text the tsquery is built from.
+            syntax: Query syntax used to build the tsquery.
+            ts_config: PostgreSQL text search configuration.
+
+        Returns:
+            Cached facets (possibly empty) or None if not found.
+        """
+        if not self.config.enabled or len(query) > self.config.max_query_length:
+            return None
+
+        params = self._facet_params(entity_type, query, syntax, ts_config)
+        cache_key = self._generate_cache_key("facets", params)
+
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached is not None:
+                logger.debug("Facet cache hit for key: %s", cache_key)
+                return cached  # type: ignore[no-any-return]
+        except Exception as e:
+            logger.warning("Failed to get facet cache: %s", e)
+
+        return None
+
+    async def set_facets(
+        self,
+        entity_type: str,
+        query: str,
+        syntax: str,
+        ts_config: str,
+        facets: list[Any],
+        ttl: int | None = None,
+    ) -> bool:
+        """Cache facet counts for an entity search.
+
+        Args:
+            entity_type: Entity type the facets belong to.
+            query: Query text the tsquery is built from.
+            syntax: Query syntax used to build the tsquery.
+            ts_config: PostgreSQL text search configuration.
+            facets: Facet results to cache.
+            ttl: Time to live in seconds (optional).
+
+        Returns:
+            True if cached successfully.
+        """
+        if not self.config.enabled or len(query) > self.config.max_query_length:
+            return False
+
+        params = self._facet_params(entity_type, query, syntax, ts_config)
+        cache_key = self._generate_cache_key("facets", params)
+        cache_ttl = ttl or self.config.facet_ttl
+
+        try:
+            facets_list = [
+                facet if isinstance(facet, dict) else self._request_to_params(facet)
+                for facet in facets
+            ]
+            await self.redis.set(cache_key, facets_list, ttl=cache_ttl)
+            logger.debug("Cached facets for key: %s", cache_key)
+            return True
+        except Exception as e:
+            logger.warning("Failed to set facet cache: %s", e)
+            return False
+
     async def invalidate_search(
         self,
         query: str | None = None,
@@ -290,6 +397,8 @@ class SearchCache:
 
         try:
             deleted = await self.redis.delete_pattern(pattern)
+            # Facet counts come from the same data as the results
+            deleted += await self.redis.delete_pattern(f"{self.config.cache_prefix}:facets:*")
             logger.info("Invalidated %s search cache entries", deleted)
             return deleted
         except Exception as e:
@@ -105,6 +105,9 @@ class EntitySearchResult(BaseModel):
 
     entity_type: str
     total: int = Field(description="Total matching results")
+    total_exact: bool = Field(
+        default=True, description="False if total is capped or a planner estimate",
+    )
     hits: list[SearchHit] = Field(description="Search results")
     facets: list[FacetResult] | None = Field(
         default=None, description="Facet counts for this entity type",
@@ -139,6 +142,12 @@ class SearchResponse(BaseModel):
         default=None, description="Aggregated facet counts across all entity types",
     )
     took_ms: int = Field(description="Search time in milliseconds")
+    partial: bool = Field(
+        default=False, description="True if some entity types timed out and are missing",
+    )
+    timed_out_entities: list[str] = Field(
+        default_factory=list, description="Entity types that did not finish before the deadline",
+    )
 
 
 class SearchSuggestionRequest(BaseModel):
@@ -14,16 +14,22 @@ with PostgreSQL full-text search, including:
 - Click signal boosting for improved ranking
 - Query intent classification
 - Performance profiling
+- Concurrent multi-entity execution with a deadline
 """
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, literal, or_, select, text
+from sqlalchemy import func, literal, or_, select, text, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from example_service.core.database.search import (
     QueryRewriter,
@@ -66,13 +72,36 @@ from .schemas import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractAsyncContextManager
+
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.compiler import SQLCompiler
+
+    SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 logger = logging.getLogger(__name__)
 
 # Threshold for triggering suggestions and "did you mean" features
 LOW_RESULT_THRESHOLD = 3
 
+# Maximum number of values returned per facet field
+FACET_VALUE_LIMIT = 20
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper used to read planner row estimates."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain_json(element: _ExplainJSON, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 # Registry of searchable entities
 # Maps entity type to configuration
 SEARCHABLE_ENTITIES: dict[str, dict[str, Any]] = {
@@ -128,6 +157,7 @@ class SearchService:
     - Click signal boosting for ranking
     - Query intent classification
     - Performance profiling
+    - Concurrent multi-entity execution with a deadline
 
     Example:
         service = SearchService(session)
@@ -157,6 +187,8 @@ class SearchService:
         enable_click_boosting: bool = True,
         enable_intent_classification: bool = False,
         enable_profiling: bool = True,
+        enable_parallel_search: bool = False,
+        session_factory: SessionFactory | None = None,
         cache: SearchCache | None = None,
     ) -> None:
         """Initialize search service.
@@ -171,6 +203,11 @@ class SearchService:
             enable_click_boosting: Enable click signal boosting for ranking.
             enable_intent_classification: Enable query intent classification.
             enable_profiling: Enable query performance profiling.
+            enable_parallel_search: Search entity types concurrently, each on
+                its own pooled session.
+            session_factory: Factory returning an async context manager that
+                yields a new session, used by parallel search (defaults to
+                the application session pool).
             cache: Optional pre-configured SearchCache instance.
         """
         self.session = session
@@ -186,6 +223,10 @@ class SearchService:
             enable_intent_classification or self._config.settings.enable_intent_classification
         )
         self.enable_profiling = enable_profiling and self._config.settings.enable_query_profiling
+        self.enable_parallel_search = (
+            enable_parallel_search or self._config.settings.enable_parallel_search
+        )
+        self._session_factory = session_factory
 
         # Core components
         self._query_parser = SearchQueryParser()
@@ -416,17 +457,26 @@ class SearchService:
         results: list[EntitySearchResult] = []
         total_hits = 0
         all_facets: list[FacetResult] = []
+        timed_out: list[str] = []
 
         # Collect all entity IDs for batch click boost
         all_entity_ids: dict[str, list[str]] = {}
 
-        for entity_type in entity_types:
-            entity_result = await self._search_entity(
-                entity_type,
+        if self.enable_parallel_search and len(entity_types) > 1:
+            entity_results, timed_out = await self._search_entities_concurrently(
+                entity_types,
                 request,
                 expanded_query,
                 intent,
             )
+        else:
+            entity_results = [
+                await self._search_entity(entity_type, request, expanded_query, intent)
+                for entity_type in entity_types
+            ]
+
+        for entity_result in entity_results:
+            entity_type = entity_result.entity_type
             results.append(entity_result)
             total_hits += entity_result.total
 
@@ -476,10 +526,12 @@ class SearchService:
             did_you_mean=did_you_mean,
             facets=all_facets if request.include_facets else None,
             took_ms=took_ms,
+            partial=bool(timed_out),
+            timed_out_entities=timed_out,
         )
 
-        # Cache the results
-        if cache:
+        # Cache the results (partial results would hide the missing entities)
+        if cache and not timed_out:
             try:
                 await cache.set_search_results(request, response)
                 self._cache_circuit_breaker.record_success()
@@ -489,6 +541,77 @@ class SearchService:
 
         return response
 
+    async def _search_entities_concurrently(
+        self,
+        entity_types: list[str],
+        request: SearchRequest,
+        expanded_query: str,
+        intent: QueryIntent | None,
+    ) -> tuple[list[EntitySearchResult], list[str]]:
+        """Search entity types concurrently, each on its own session.
+
+        At most ``parallel_search_max_concurrency`` entity searches run at
+        once. Searches still running at the ``parallel_search_timeout_ms``
+        deadline are cancelled and reported as timed out.
+
+        Args:
+            entity_types: Entity types to search.
+            request: Search request.
+            expanded_query: Query with synonym expansion.
+            intent: Classified query intent.
+
+        Returns:
+            Tuple of (completed results in entity order, timed-out entity types).
+        """
+        settings = self._config.settings
+        session_factory = self._session_factory
+        if session_factory is None:
+            from example_service.infra.database.session import get_async_session
+
+            session_factory = get_async_session
+
+        semaphore = asyncio.Semaphore(settings.parallel_search_max_concurrency)
+
+        async def run(entity_type: str) -> EntitySearchResult:
+            async with semaphore, session_factory() as session:
+                return await self._search_entity(
+                    entity_type,
+                    request,
+                    expanded_query,
+                    intent,
+                    session=session,
+                )
+
+        tasks = {
+            entity_type: asyncio.create_task(run(entity_type))
+            for entity_type in entity_types
+        }
+        _, pending = await asyncio.wait(
+            tasks.values(),
+            timeout=settings.parallel_search_timeout_ms / 1000,
+        )
+        for task in pending:
+            task.cancel()
+        # Wait for cancelled searches to release their sessions
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: list[EntitySearchResult] = []
+        timed_out: list[str] = []
+        for entity_type, task in tasks.items():
+            if task in pending:
+                timed_out.append(entity_type)
+            else:
+                results.append(task.result())
+
+        if timed_out:
+            logger.warning(
+                "Search timed out for entity types %s after %sms",
+                timed_out,
+                settings.parallel_search_timeout_ms,
+            )
+
+        return results, timed_out
+
     async def _apply_click_boosting(
         self,
         results: list[EntitySearchResult],
@@ -547,6 +670,7 @@ class SearchService:
                 EntitySearchResult(
                     entity_type=entity_type,
                     total=entity_result.total,
+                    total_exact=entity_result.total_exact,
                     hits=boosted_hits,
                     facets=entity_result.facets,
                 ),
@@ -560,6 +684,8 @@ class SearchService:
         request: SearchRequest,
         expanded_query: str,
         intent: QueryIntent | None,
+        *,
+        session: AsyncSession | None = None,
     ) -> EntitySearchResult:
         """Search a specific entity type.
 
@@ -568,10 +694,12 @@ class SearchService:
             request: Search request.
             expanded_query: Query with synonym expansion.
             intent: Classified query intent.
+            session: Session to query with (defaults to the service session).
 
         Returns:
             Search results for this entity type.
         """
+        session = session or self.session
         config = self._config.entity_registry.get(entity_type)
         if not config:
             return EntitySearchResult(entity_type=entity_type, total=0, hits=[])
@@ -617,61 +745,107 @@ class SearchService:
             elif adjustments.get("increase_limit"):
                 limit = min(limit * 2, config.max_results)
 
-        # Main query
-        stmt = (
+        settings = self._config.settings
+        match = search_vector.op("@@")(ts_query)
+
+        # Hits, total count and highlighted snippets in one statement: the
+        # inner query ranks, counts and pages the matches; the outer query
+        # runs ts_headline only for the rows on the page.
+        if settings.count_strategy == "exact":
+            total_expr = func.count().over()
+        else:
+            total_expr = self._capped_count(
+                model_class, match, rank_expr, request, settings.count_threshold,
+            )
+
+        page = (
             select(
                 model_class,
                 rank_expr.label("rank"),
+                total_expr.label("total"),
             )
-            .where(search_vector.op("@@")(ts_query))
+            .where(match)
             .where(rank_expr >= request.min_rank)
             .order_by(rank_expr.desc())
             .offset(request.offset)
             .limit(limit)
+            .subquery("page")
         )
+        entity_alias = aliased(model_class, page)
+
+        columns: list[Any] = [entity_alias, page.c.rank, page.c.total]
+        snippet_field = config.snippet_field if request.highlight else None
+        highlight = snippet_field is not None
+        if snippet_field:
+            columns.append(
+                self._headline_expr(
+                    getattr(entity_alias, snippet_field),
+                    request.query,
+                    ts_config,
+                    request.highlight_tag,
+                ).label("headline"),
+            )
+        stmt = select(*columns).order_by(page.c.rank.desc())
 
-        # Execute search
-        result = await self.session.execute(stmt)
+        result = await session.execute(stmt)
         rows = result.all()
 
-        # If no FTS results and fuzzy is enabled, try fuzzy search
-        if not rows and self.enable_fuzzy_fallback and config.fuzzy_fields:
-            rows = await self._fuzzy_search(model_class, config, request)
+        total_exact = True
+        if rows:
+            total = int(rows[0].total)
+            if settings.count_strategy != "exact" and total > settings.count_threshold:
+                total, total_exact = await self._estimate_total(
+                    session, model_class, match, rank_expr, request,
+                )
+        elif request.offset:
+            # Paged past the end: the window count has no row to ride on
+            count_stmt = (
+                select(func.count())
+                .select_from(model_class)
+                .where(match)
+                .where(rank_expr >= request.min_rank)
+            )
+            total = (await session.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
 
-        # Get total count
-        count_stmt = (
-            select(func.count())
-            .select_from(model_class)
-            .where(search_vector.op("@@")(ts_query))
-            .where(rank_expr >= request.min_rank)
-        )
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar() or 0
+        # (entity, rank, highlighted snippet) triples
+        matches: list[tuple[Any, float, str | None]] = [
+            (row[0], float(row[1]), row[3] if highlight else None) for row in rows
+        ]
 
-        # Build hits with optional highlighting
-        hits = []
-        for row in rows:
-            entity = row[0] if isinstance(row, tuple) else row
-            rank = float(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0.5
+        # If no FTS results and fuzzy is enabled, try fuzzy search
+        if not matches and self.enable_fuzzy_fallback and config.fuzzy_fields:
+            for row in await self._fuzzy_search(model_class, config, request, session):
+                entity = row[0] if isinstance(row, tuple) else row
+                rank = float(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0.5
+                snippet = None
+                if highlight and config.snippet_field:
+                    snippet = await self._get_highlighted_snippet(
+                        entity,
+                        request.query,
+                        config.snippet_field,
+                        ts_config,
+                        request.highlight_tag,
+                        session,
+                    )
+                matches.append((entity, rank, snippet))
 
+        # Build hits
+        hits = []
+        for entity, rank, headline in matches:
             # Get title
             title = None
             if config.title_field:
                 title = getattr(entity, config.title_field, None)
 
-            # Get snippet with highlighting
+            # Get snippet (highlighted by the search query when requested)
             snippet = None
-            if request.highlight and config.snippet_field:
-                snippet = await self._get_highlighted_snippet(
-                    entity,
-                    request.query,
-                    config.snippet_field,
-                    ts_config,
-                    request.highlight_tag,
-                )
-            elif config.snippet_field:
+            if config.snippet_field:
                 snippet_text = getattr(entity, config.snippet_field, None)
-                if snippet_text:
+                if highlight:
+                    snippet = headline or (str(snippet_text)[:200] if snippet_text else None)
+                elif snippet_text:
                     snippet = (
                         snippet_text[:200] + "..."
                         if len(snippet_text) > 200
@@ -715,20 +889,120 @@ class SearchService:
                 config,
                 ts_query,
                 search_vector,
+                session,
+                entity_type=entity_type,
+                query=query_to_use,
+                syntax=request.syntax,
             )
 
         return EntitySearchResult(
             entity_type=entity_type,
             total=total,
+            total_exact=total_exact,
             hits=hits,
             facets=facets,
         )
 
+    @staticmethod
+    def _capped_count(
+        model_class: Any,
+        match: Any,
+        rank_expr: Any,
+        request: SearchRequest,
+        cap: int,
+    ) -> Any:
+        """Build a scalar subquery counting at most ``cap + 1`` matches.
+
+        Args:
+            model_class: SQLAlchemy model class.
+            match: The ``search_vector @@ tsquery`` predicate.
+            rank_expr: Rank expression for the min_rank filter.
+            request: Search request.
+            cap: Count threshold.
+
+        Returns:
+            Scalar subquery; a value above ``cap`` means "more than cap".
+        """
+        capped = (
+            select(literal(1))
+            .select_from(model_class)
+            .where(match)
+            .where(rank_expr >= request.min_rank)
+            .limit(cap + 1)
+            .subquery("capped")
+        )
+        return select(func.count()).select_from(capped).scalar_subquery()
+
+    async def _estimate_total(
+        self,
+        session: AsyncSession,
+        model_class: Any,
+        match: Any,
+        rank_expr: Any,
+        request: SearchRequest,
+    ) -> tuple[int, bool]:
+        """Resolve a total that exceeded the count threshold.
+
+        With the ``capped`` strategy the threshold itself is reported. With
+        ``estimate`` the planner row estimate is used (never below the
+        threshold, since at least that many rows are known to match).
+
+        Returns:
+            Tuple of (total, is_exact), where is_exact is always False.
+        """
+        threshold = self._config.settings.count_threshold
+        if self._config.settings.count_strategy != "estimate":
+            return threshold, False
+
+        stmt = (
+            select(literal(1))
+            .select_from(model_class)
+            .where(match)
+            .where(rank_expr >= request.min_rank)
+        )
+        try:
+            plan: Any = (await session.execute(_ExplainJSON(stmt))).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.debug("Row estimate failed, using count threshold: %s", e)
+            return threshold, False
+        return max(estimate, threshold), False
+
+    @staticmethod
+    def _headline_expr(
+        text_expr: Any,
+        query: str,
+        config: str,
+        highlight_tag: str,
+    ) -> Any:
+        """Build a ``ts_headline`` expression highlighting query terms.
+
+        Args:
+            text_expr: Column or literal to highlight.
+            query: Search query.
+            config: Text search configuration.
+            highlight_tag: HTML tag for highlights.
+
+        Returns:
+            SQL expression producing the highlighted snippet.
+        """
+        close_tag = highlight_tag.replace("<", "</")
+        options = f"StartSel={highlight_tag}, StopSel={close_tag}, MaxWords=35, MinWords=15, ShortWord=3, HighlightAll=FALSE"
+        return func.ts_headline(
+            config,
+            text_expr,
+            func.websearch_to_tsquery(config, query),
+            options,
+        )
+
     async def _fuzzy_search(
         self,
         model_class: Any,
         config: EntitySearchConfig,
         request: SearchRequest,
+        session: AsyncSession | None = None,
     ) -> list[Any]:
         """Perform fuzzy search as fallback.
 
@@ -736,6 +1010,7 @@ class SearchService:
             model_class: SQLAlchemy model class.
             config: Entity configuration.
             request: Search request.
+            session: Session to query with (defaults to the service session).
 
         Returns:
             List of (entity, rank) tuples.
@@ -771,7 +1046,7 @@ class SearchService:
         )
 
         try:
-            result = await self.session.execute(stmt)
+            result = await (session or self.session).execute(stmt)
             return result.all()  # type: ignore
         except Exception as e:
             logger.warning("Fuzzy search failed: %s", e)
@@ -783,56 +1058,107 @@ class SearchService:
         config: EntitySearchConfig,
         ts_query: Any,
         search_vector: Any,
+        session: AsyncSession | None = None,
+        *,
+        entity_type: str | None = None,
+        query: str | None = None,
+        syntax: SearchSyntax | None = None,
     ) -> list[FacetResult]:
         """Get facet counts for search results.
 
+        All facet fields are counted in one statement: the match predicate
+        is evaluated once and ``GROUPING SETS`` produces one group per field,
+        with the top values per field selected by a window over the groups.
+
+        When ``entity_type``, ``query`` and ``syntax`` are given, the counts
+        are cached for ``facet_cache_ttl_seconds`` under the normalized
+        tsquery, so paging through the same search reuses them.
+
         Args:
             model_class: SQLAlchemy model class.
             config: Entity configuration.
             ts_query: The tsquery for filtering.
             search_vector: The search vector column.
+            session: Session to query with (defaults to the service session).
+            entity_type: Entity type, used for the facet cache key.
+            query: Query text the tsquery was built from.
+            syntax: Query syntax the tsquery was built with.
 
         Returns:
             List of facet results.
         """
-        facets = []
-        facet_fields = config.facet_fields
+        session = session or self.session
+        field_names = [name for name in config.facet_fields if hasattr(model_class, name)]
+        if not field_names:
+            return []
 
-        for field_name in facet_fields:
-            if not hasattr(model_class, field_name):
-                continue
+        ttl = self._config.settings.facet_cache_ttl_seconds
+        cache = None
+        cache_params: tuple[str, str, str, str] | None = None
+        if ttl and entity_type and query is not None and syntax is not None:
+            cache = await self._get_cache()
+            cache_params = (entity_type, query, syntax, config.config)
+        if cache and cache_params:
+            cached = await cache.get_facets(*cache_params)
+            if cached is not None:
+                return [FacetResult(**facet) for facet in cached]
+
+        fields = [getattr(model_class, name) for name in field_names]
+        grouping = func.grouping(*fields)
+        count = func.count()
+        counts = (
+            select(
+                *(field.label(f"facet_{i}") for i, field in enumerate(fields)),
+                grouping.label("grouping_id"),
+                count.label("count"),
+                func.row_number()
+                .over(partition_by=grouping, order_by=count.desc())
+                .label("facet_rank"),
+            )
+            .where(search_vector.op("@@")(ts_query))
+            .group_by(func.grouping_sets(*(tuple_(field) for field in fields)))
+            .subquery("facet_counts")
+        )
+        stmt = (
+            select(counts)
+            .where(counts.c.facet_rank <= FACET_VALUE_LIMIT)
+            .order_by(counts.c.grouping_id, counts.c.facet_rank)
+        )
+
+        try:
+            result = await session.execute(stmt)
+            rows = result.all()
+        except Exception as e:
+            logger.warning("Facet query failed for %s: %s", ", ".join(field_names), e)
+            return []
 
-            field = getattr(model_class, field_name)
+        # grouping() sets a bit for every field that is not grouped, with the
+        # first field as the most significant bit
+        all_bits = (1 << len(fields)) - 1
+        field_index = {all_bits ^ (1 << (len(fields) - 1 - i)): i for i in range(len(fields))}
+        values: dict[int, list[FacetValue]] = {}
+        for row in rows:
+            index = field_index[row[len(fields)]]
+            value = row[index]
+            values.setdefault(index, []).append(
+                FacetValue(
+                    value=str(value) if value is not None else "null",
+                    count=row[len(fields) + 1],
+                ),
+            )
 
-            # Get value counts
-            stmt = (
-                select(field, func.count().label("count"))
-                .where(search_vector.op("@@")(ts_query))
-                .group_by(field)
-                .order_by(text("count DESC"))
-                .limit(20)
+        facets = [
+            FacetResult(
+                field=name,
+                display_name=name.replace("_", " ").title(),
+                values=values[i],
             )
+            for i, name in enumerate(field_names)
+            if i in values
+        ]
 
-            try:
-                result = await self.session.execute(stmt)
-                values = [
-                    FacetValue(
-                        value=str(row[0]) if row[0] is not None else "null",
-                        count=row[1],
-                    )
-                    for row in result.all()
-                ]
-
-                if values:
-                    facets.append(
-                        FacetResult(
-                            field=field_name,
-                            display_name=field_name.replace("_", " ").title(),
-                            values=values,
-                        ),
-                    )
-            except Exception as e:
-                logger.warning("Facet query failed for %s: %s", field_name, e)
+        if cache and cache_params:
+            await cache.set_facets(*cache_params, facets, ttl=ttl)
 
         return facets
 
@@ -1010,6 +1336,7 @@ class SearchService:
         snippet_field: str,
         config: str,
         highlight_tag: str,
+        session: AsyncSession | None = None,
     ) -> str | None:
         """Get highlighted snippet using PostgreSQL ts_headline.
 
@@ -1019,6 +1346,7 @@ class SearchService:
             snippet_field: Field to use for snippet.
             config: Text search configuration.
             highlight_tag: HTML tag for highlights.
+            session: Session to query with (defaults to the service session).
 
         Returns:
             Highlighted snippet or None.
@@ -1028,19 +1356,11 @@ class SearchService:
             return None
 
         # Use ts_headline for highlighting
-        close_tag = highlight_tag.replace("<", "</")
-        options = f"StartSel={highlight_tag}, StopSel={close_tag}, MaxWords=35, MinWords=15, ShortWord=3, HighlightAll=FALSE"
-
         try:
             stmt = select(
-                func.ts_headline(
-                    config,
-                    literal(str(text_value)),
-                    func.websearch_to_tsquery(config, query),
-                    options,
-                ),
+                self._headline_expr(literal(str(text_value)), query, config, highlight_tag),
             )
-            result = await self.session.execute(stmt)
+            result = await (session or self.session).execute(stmt)
             snippet = result.scalar()
             return snippet if snippet else text_value[:200]  # type: ignore
         except Exception as e:
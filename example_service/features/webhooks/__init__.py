@@ -1,7 +1,17 @@
 """Webhooks feature package."""
 
 from .client import WebhookClient, WebhookDeliveryResult
-from .dispatcher import dispatch_event, process_pending_deliveries
+from .dispatcher import (
+    dispatch_event,
+    get_delivery_scheduler,
+    process_pending_deliveries,
+    stop_webhook_delivery,
+)
+from .engine import (
+    DeliveryScheduler,
+    WebhookDeliveryEngine,
+    get_webhook_delivery_engine,
+)
 from .events import (
     ALL_EVENT_TYPES,
     FileEvents,
@@ -23,10 +33,12 @@ from .service import WebhookService
 
 __all__ = [
     "ALL_EVENT_TYPES",
+    "DeliveryScheduler",
     # Event types and utilities
     "FileEvents",
     "ReminderEvents",
     "WebhookClient",
+    "WebhookDeliveryEngine",
     "WebhookDeliveryRepository",
     "WebhookDeliveryResult",
     "WebhookRepository",
@@ -35,10 +47,13 @@ __all__ = [
     "build_reminder_event_payload",
     "dispatch_event",
     "generate_event_id",
+    "get_delivery_scheduler",
     "get_event_category",
+    "get_webhook_delivery_engine",
     "get_webhook_delivery_repository",
     "get_webhook_repository",
     "process_pending_deliveries",
     "router",
+    "stop_webhook_delivery",
     "validate_event_type",
 ]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 import httpx
 
+from example_service.core.settings import get_webhook_settings
 from example_service.infra.logging import get_lazy_logger
 
 if TYPE_CHECKING:
@@ -29,6 +30,7 @@ class WebhookDeliveryResult:
     response_body: str | None
     response_time_ms: int | None
     error_message: str | None
+    circuit_open: bool = False
 
 
 class WebhookClient:
@@ -39,15 +41,40 @@ class WebhookClient:
     - Custom headers and authentication
     - Timeout and error handling
     - Response capture
+
+    Requests go through one long-lived pooled ``httpx.AsyncClient``, so
+    repeated deliveries to an endpoint reuse keep-alive (or HTTP/2)
+    connections instead of paying a TCP and TLS handshake each time.
     """
 
-    def __init__(self, timeout_seconds: int = 30) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize webhook client.
 
         Args:
             timeout_seconds: Default timeout for HTTP requests
+            http_client: Optional shared HTTP client (a pooled client is
+                created on first use if not provided)
         """
         self.timeout_seconds = timeout_seconds
+        self._http_client = http_client
+        self._owns_client = http_client is None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = create_pooled_http_client()
+            self._owns_client = True
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this instance created it."""
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
 
     def _generate_signature(
         self,
@@ -124,14 +151,13 @@ class WebhookClient:
                 lambda: f"client.deliver: webhook_id={webhook.id}, event_type={event_type}, url={webhook.url}",
             )
 
-            # Send HTTP POST request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook.url,
-                    content=payload_str,
-                    headers=headers,
-                    timeout=webhook.timeout_seconds,
-                )
+            # Send HTTP POST request over a pooled connection
+            response = await self._get_http_client().post(
+                webhook.url,
+                content=payload_str,
+                headers=headers,
+                timeout=webhook.timeout_seconds,
+            )
 
             # Calculate response time
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -247,4 +273,45 @@ class WebhookClient:
             )
 
 
-__all__ = ["WebhookClient", "WebhookDeliveryResult"]
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_pooled_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client used for webhook delivery.
+
+    Pool size, keep-alive and HTTP/2 come from ``WebhookSettings``. HTTP/2
+    falls back to HTTP/1.1 when the h2 package is not installed.
+
+    Returns:
+        Configured ``httpx.AsyncClient``
+    """
+    settings = get_webhook_settings()
+
+    http2 = settings.http2
+    if http2 and not _http2_available():
+        logger.warning(
+            "WEBHOOK_HTTP2 is enabled but h2 is not installed; using HTTP/1.1. "
+            "Install with: pip install 'httpx[http2]'",
+        )
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.timeout_seconds,
+            connect=settings.connect_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_seconds,
+        ),
+    )
+
+
+__all__ = ["WebhookClient", "WebhookDeliveryResult", "create_pooled_http_client"]
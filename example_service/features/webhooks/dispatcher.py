@@ -1,8 +1,11 @@
 """Event dispatcher for webhooks.
 
 This module provides utilities for dispatching events to subscribed webhooks.
-In a production environment, this would typically queue delivery tasks to a
-background job system (Celery, RQ, etc.) rather than executing synchronously.
+Dispatching records one delivery per subscriber and hands them to the
+in-process scheduled queue, which sends them concurrently through the
+delivery engine (see ``engine.py``) and re-queues retries for when they are
+due. ``process_pending_deliveries`` sweeps the database for due deliveries
+that no queue holds, e.g. after a restart.
 """
 
 from __future__ import annotations
@@ -11,7 +14,12 @@ from datetime import UTC, datetime, timedelta
 import logging
 from typing import TYPE_CHECKING
 
-from example_service.features.webhooks.client import WebhookClient
+from example_service.core.settings import get_webhook_settings
+from example_service.features.webhooks.engine import (
+    DeliveryScheduler,
+    close_webhook_delivery_engine,
+    get_webhook_delivery_engine,
+)
 from example_service.features.webhooks.models import WebhookDelivery
 from example_service.features.webhooks.repository import (
     get_webhook_delivery_repository,
@@ -21,8 +29,14 @@ from example_service.features.webhooks.schemas import DeliveryStatus
 from example_service.infra.logging import get_lazy_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from uuid import UUID
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from example_service.core.settings.webhooks import WebhookSettings
+    from example_service.features.webhooks.models import Webhook
+
 logger = logging.getLogger(__name__)
 lazy_logger = get_lazy_logger(__name__)
 
@@ -35,9 +49,8 @@ async def dispatch_event(
 ) -> int:
     """Dispatch an event to all subscribed webhooks.
 
-    Finds all active webhooks subscribed to the event type and creates
-    delivery records for each. In a production system, this would queue
-    background tasks rather than executing deliveries synchronously.
+    Finds all active webhooks subscribed to the event type, creates
+    delivery records for each and queues them for immediate delivery.
 
     Args:
         session: Database session
@@ -95,8 +108,9 @@ async def dispatch_event(
         },
     )
 
-    # Note: In production, you would queue background tasks here
-    # Hook Celery, Dramatiq, or another worker system here if needed.
+    # Fan out to subscribers in the background
+    if get_webhook_settings().scheduler_enabled:
+        get_delivery_scheduler().schedule([delivery.id for delivery in created])
 
     return len(created)
 
@@ -105,35 +119,46 @@ async def process_pending_deliveries(
     session: AsyncSession,
     *,
     limit: int = 100,
+    delivery_ids: Sequence[UUID] | None = None,
 ) -> int:
     """Process pending webhook deliveries.
 
     This function should be called by a background worker to process
     queued webhook deliveries. It finds deliveries that are due for
-    delivery/retry and attempts to send them.
+    delivery/retry and sends them concurrently through the delivery engine.
+    Due rows are locked with SKIP LOCKED, so concurrent workers and the
+    scheduled queue never send the same delivery twice.
 
     Args:
         session: Database session
         limit: Maximum number of deliveries to process
+        delivery_ids: Only process these deliveries (used by the scheduled queue)
 
     Returns:
         Number of deliveries processed
     """
     delivery_repo = get_webhook_delivery_repository()
     webhook_repo = get_webhook_repository()
-    client = WebhookClient()
-
-    # Find deliveries due for retry
-    deliveries = await delivery_repo.find_retries_due(session)
+    engine = get_webhook_delivery_engine()
+    settings = get_webhook_settings()
 
-    # Limit to prevent overwhelming the system
-    deliveries = deliveries[:limit]
+    # Find deliveries due for retry, limited to prevent overwhelming the system
+    deliveries = await delivery_repo.find_retries_due(
+        session,
+        delivery_ids=delivery_ids,
+        limit=limit,
+        skip_locked=True,
+    )
+    if not deliveries:
+        lazy_logger.debug(lambda: "dispatcher.process_pending_deliveries: no deliveries to process")
+        return 0
 
-    processed_count = 0
+    # Load webhook configurations with one query
+    webhooks = await webhook_repo.get_many(session, {d.webhook_id for d in deliveries})
 
+    deliverable: list[tuple[Webhook, WebhookDelivery]] = []
     for delivery in deliveries:
-        # Load webhook configuration
-        webhook = await webhook_repo.get(session, delivery.webhook_id)
+        webhook = webhooks.get(delivery.webhook_id)
         if webhook is None or not webhook.is_active:
             # Webhook was deleted or deactivated
             await delivery_repo.update_status(
@@ -142,19 +167,22 @@ async def process_pending_deliveries(
                 DeliveryStatus.FAILED.value,
                 error_message="Webhook not found or inactive",
             )
-            await session.commit()
             continue
+        deliverable.append((webhook, delivery))
 
-        # Attempt delivery
-        result = await client.deliver(
-            webhook=webhook,
-            event_type=delivery.event_type,
-            event_id=delivery.event_id,
-            payload=delivery.payload,
-        )
+    # Attempt deliveries concurrently
+    results = await engine.deliver_many(deliverable)
 
-        # Update delivery status based on result
-        if result.success:
+    now = datetime.now(UTC)
+    retries: dict[datetime, list[UUID]] = {}
+    circuit_open: list[UUID] = []
+
+    # Update delivery status based on result
+    for (_, delivery), result in zip(deliverable, results, strict=True):
+        if result.circuit_open:
+            # Not attempted; try again once the circuit may have recovered
+            circuit_open.append(delivery.id)
+        elif result.success:
             await delivery_repo.update_status(
                 session,
                 delivery.id,
@@ -165,10 +193,7 @@ async def process_pending_deliveries(
             )
         # Check if we should retry
         elif delivery.attempt_count + 1 < delivery.max_attempts:
-            # Calculate exponential backoff
-            retry_delay_seconds = min(2**delivery.attempt_count * 60, 3600)  # Max 1 hour
-            next_retry_at = datetime.now(UTC) + timedelta(seconds=retry_delay_seconds)
-
+            next_retry_at = now + timedelta(seconds=_retry_delay(settings, delivery.attempt_count))
             await delivery_repo.update_status(
                 session,
                 delivery.id,
@@ -179,6 +204,7 @@ async def process_pending_deliveries(
                 error_message=result.error_message,
                 next_retry_at=next_retry_at,
             )
+            retries.setdefault(next_retry_at, []).append(delivery.id)
         else:
             # Max retries reached
             await delivery_repo.update_status(
@@ -191,21 +217,74 @@ async def process_pending_deliveries(
                 error_message=result.error_message,
             )
 
-        await session.commit()
-        processed_count += 1
+    if circuit_open:
+        reopen_at = now + timedelta(seconds=settings.circuit_breaker_timeout_seconds)
+        await delivery_repo.reschedule(session, circuit_open, reopen_at)
+        retries.setdefault(reopen_at, []).extend(circuit_open)
+
+    await session.commit()
+
+    # Queue retries for when they are due instead of waiting for the next sweep
+    if settings.scheduler_enabled:
+        scheduler = get_delivery_scheduler()
+        for due_at, ids in retries.items():
+            scheduler.schedule(ids, due_at)
 
+    processed_count = len(deliverable) - len(circuit_open)
     if processed_count > 0:
         logger.info(
             "Processed pending webhook deliveries",
             extra={
                 "processed_count": processed_count,
+                "circuit_open_count": len(circuit_open),
                 "operation": "dispatcher.process_pending_deliveries",
             },
         )
-    else:
-        lazy_logger.debug(lambda: "dispatcher.process_pending_deliveries: no deliveries to process")
 
     return processed_count
 
 
-__all__ = ["dispatch_event", "process_pending_deliveries"]
+def _retry_delay(settings: WebhookSettings, attempt_count: int) -> float:
+    """Exponential backoff before the next attempt (1 min doubling to 1 hour by default)."""
+    delay = settings.retry_delay_seconds * settings.retry_backoff_multiplier**attempt_count
+    return min(delay, settings.retry_max_delay_seconds)
+
+
+async def _deliver_scheduled(delivery_ids: list[UUID]) -> None:
+    """Deliver a batch from the scheduled queue in its own session."""
+    from example_service.infra.database.session import get_async_session
+
+    async with get_async_session() as session:
+        await process_pending_deliveries(
+            session,
+            limit=len(delivery_ids),
+            delivery_ids=delivery_ids,
+        )
+
+
+_scheduler: DeliveryScheduler | None = None
+
+
+def get_delivery_scheduler() -> DeliveryScheduler:
+    """Get the process-wide scheduled delivery queue."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = DeliveryScheduler(_deliver_scheduled)
+    return _scheduler
+
+
+async def stop_webhook_delivery() -> None:
+    """Stop the scheduled queue and close the delivery connection pool."""
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
+    await close_webhook_delivery_engine()
+
+
+__all__ = [
+    "dispatch_event",
+    "get_delivery_scheduler",
+    "process_pending_deliveries",
+    "stop_webhook_delivery",
+]
@@ -0,0 +1,328 @@
+"""Concurrent webhook delivery engine.
+
+All deliveries share one long-lived pooled HTTP client (see
+``create_pooled_http_client``), so webhooks to a known endpoint reuse warm
+keep-alive or HTTP/2 connections. Deliveries fan out concurrently with:
+
+- a concurrency limit per host, which queues a slow endpoint's deliveries
+  behind each other instead of letting them take over the connection pool;
+- a circuit breaker per webhook, so an endpoint that keeps failing is
+  skipped (and its deliveries rescheduled) instead of tying up the engine
+  until every request times out;
+- ``DeliveryScheduler``, an in-process queue that wakes up when the next
+  delivery or retry is due instead of polling the database.
+
+The database stays the source of truth. ``process_pending_deliveries`` still
+sweeps due deliveries, so work scheduled in a process that exits is picked up
+again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+import heapq
+from itertools import count
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from example_service.core.settings import get_webhook_settings
+from example_service.features.webhooks.client import (
+    WebhookClient,
+    WebhookDeliveryResult,
+)
+from example_service.infra.logging import get_lazy_logger
+from example_service.infra.resilience import CircuitBreaker, CircuitOpenError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterable, Sequence
+    from uuid import UUID
+
+    from example_service.features.webhooks.models import Webhook, WebhookDelivery
+
+logger = logging.getLogger(__name__)
+lazy_logger = get_lazy_logger(__name__)
+
+
+class _EndpointFailureError(Exception):
+    """Marks a delivery result as an endpoint failure for the circuit breaker."""
+
+    def __init__(self, result: WebhookDeliveryResult) -> None:
+        super().__init__(result.error_message)
+        self.result = result
+
+
+def _is_endpoint_failure(result: WebhookDeliveryResult) -> bool:
+    """Check whether a failed delivery points at an unhealthy endpoint.
+
+    Transport errors, timeouts, 5xx and 429 count against the endpoint;
+    other 4xx responses are the endpoint rejecting this particular request.
+    """
+    if result.success:
+        return False
+    status = result.status_code
+    return status is None or status >= 500 or status == 429
+
+
+class WebhookDeliveryEngine:
+    """Deliver webhooks concurrently over a shared connection pool.
+
+    Example:
+        engine = WebhookDeliveryEngine()
+        results = await engine.deliver_many(
+            [(webhook, delivery) for webhook, delivery in due],
+        )
+    """
+
+    def __init__(
+        self,
+        client: WebhookClient | None = None,
+        *,
+        max_concurrency_per_host: int = 10,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 300.0,
+    ) -> None:
+        """Initialize delivery engine.
+
+        Args:
+            client: Webhook client (a pooled client is created if not provided)
+            max_concurrency_per_host: Maximum concurrent deliveries per host
+            failure_threshold: Consecutive endpoint failures before a
+                webhook's circuit opens
+            recovery_timeout: Seconds an open circuit waits before letting a
+                trial delivery through
+        """
+        self.client = client or WebhookClient()
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_host)
+            self._host_limits[host] = semaphore
+        return semaphore
+
+    def _breaker(self, webhook: Webhook) -> CircuitBreaker:
+        key = str(webhook.id)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=f"webhook:{key}",
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                expected_exception=_EndpointFailureError,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    async def deliver(
+        self,
+        webhook: Webhook,
+        event_type: str,
+        event_id: str,
+        payload: dict,
+    ) -> WebhookDeliveryResult:
+        """Deliver one event through the webhook's circuit breaker.
+
+        Args:
+            webhook: Webhook configuration
+            event_type: Type of event
+            event_id: Unique event identifier
+            payload: Event payload data
+
+        Returns:
+            Delivery result; ``circuit_open`` is set when the delivery was
+            not attempted because the endpoint's circuit is open
+        """
+        try:
+            async with self._breaker(webhook):
+                async with self._host_limit(webhook.url):
+                    result = await self.client.deliver(
+                        webhook=webhook,
+                        event_type=event_type,
+                        event_id=event_id,
+                        payload=payload,
+                    )
+                if _is_endpoint_failure(result):
+                    raise _EndpointFailureError(result)
+        except _EndpointFailureError as e:
+            return e.result
+        except CircuitOpenError:
+            lazy_logger.debug(
+                lambda: f"engine.deliver: webhook_id={webhook.id} circuit open, event_id={event_id}",
+            )
+            return WebhookDeliveryResult(
+                success=False,
+                status_code=None,
+                response_body=None,
+                response_time_ms=None,
+                error_message="Circuit breaker open for webhook endpoint",
+                circuit_open=True,
+            )
+        return result
+
+    async def deliver_many(
+        self,
+        deliveries: Sequence[tuple[Webhook, WebhookDelivery]],
+    ) -> list[WebhookDeliveryResult]:
+        """Deliver many events concurrently.
+
+        Args:
+            deliveries: (webhook, delivery) pairs
+
+        Returns:
+            Results in the same order as ``deliveries``
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.deliver(
+                        webhook,
+                        delivery.event_type,
+                        delivery.event_id,
+                        delivery.payload,
+                    )
+                    for webhook, delivery in deliveries
+                ),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
+
+
+class DeliveryScheduler:
+    """In-process queue that hands delivery IDs to a handler when they are due.
+
+    A single background task sleeps until the earliest due time (or until an
+    earlier item is scheduled) and then passes every due ID, in batches, to
+    the handler in its own task.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[UUID]], Coroutine[Any, Any, Any]],
+        *,
+        batch_size: int = 100,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            handler: Coroutine function called with a batch of due IDs
+            batch_size: Maximum IDs passed to one handler call
+        """
+        self._handler = handler
+        self.batch_size = batch_size
+        self._heap: list[tuple[float, int, UUID]] = []
+        self._sequence = count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[Any]] = set()
+
+    def __len__(self) -> int:
+        """Return the number of scheduled IDs."""
+        return len(self._heap)
+
+    def schedule(self, delivery_ids: Iterable[UUID], due_at: datetime | None = None) -> None:
+        """Schedule deliveries.
+
+        Args:
+            delivery_ids: Delivery UUIDs
+            due_at: When to deliver (defaults to now)
+        """
+        delay = 0.0
+        if due_at is not None:
+            delay = max(0.0, (due_at - datetime.now(UTC)).total_seconds())
+        due = time.monotonic() + delay
+
+        for delivery_id in delivery_ids:
+            heapq.heappush(self._heap, (due, next(self._sequence), delivery_id))
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                batch: list[UUID] = []
+                while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+                    batch.append(heapq.heappop(self._heap)[2])
+                self._start(batch)
+
+    def _start(self, batch: list[UUID]) -> None:
+        task = asyncio.create_task(self._handler(batch))
+        self._running.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task[Any]) -> None:
+        self._running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Scheduled webhook deliveries failed",
+                exc_info=task.exception(),
+                extra={"operation": "engine.scheduler"},
+            )
+
+    async def stop(self) -> None:
+        """Stop scheduling and wait for running handlers to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+
+_engine: WebhookDeliveryEngine | None = None
+
+
+def get_webhook_delivery_engine() -> WebhookDeliveryEngine:
+    """Get the process-wide delivery engine, configured from WebhookSettings."""
+    global _engine
+    if _engine is None:
+        settings = get_webhook_settings()
+        _engine = WebhookDeliveryEngine(
+            WebhookClient(timeout_seconds=settings.timeout_seconds),
+            max_concurrency_per_host=settings.max_concurrency_per_host,
+            failure_threshold=settings.circuit_breaker_threshold,
+            recovery_timeout=float(settings.circuit_breaker_timeout_seconds),
+        )
+    return _engine
+
+
+async def close_webhook_delivery_engine() -> None:
+    """Close the process-wide delivery engine and its connection pool."""
+    global _engine
+    if _engine is not None:
+        await _engine.aclose()
+        _engine = None
+
+
+__all__ = [
+    "DeliveryScheduler",
+    "WebhookDeliveryEngine",
+    "close_webhook_delivery_engine",
+    "get_webhook_delivery_engine",
+]
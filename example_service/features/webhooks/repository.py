@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from example_service.core.database.repository import (
     BaseRepository,
@@ -20,7 +20,7 @@ from example_service.core.database.repository import (
 from example_service.features.webhooks.models import Webhook, WebhookDelivery
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -125,6 +125,32 @@ class WebhookRepository(TenantAwareRepository[Webhook]):
         )
         return items
 
+    async def get_many(
+        self,
+        session: AsyncSession,
+        webhook_ids: Iterable[UUID],
+    ) -> dict[UUID, Webhook]:
+        """Load several webhooks with one query.
+
+        Args:
+            session: Database session
+            webhook_ids: Webhook UUIDs
+
+        Returns:
+            Mapping of webhook ID to webhook (missing IDs are omitted)
+        """
+        ids = list(set(webhook_ids))
+        if not ids:
+            return {}
+
+        result = await session.execute(select(Webhook).where(Webhook.id.in_(ids)))
+        items = {webhook.id: webhook for webhook in result.scalars().all()}
+
+        self._lazy.debug(
+            lambda: f"db.get_many: Webhook({len(ids)} ids) -> {len(items)} found",
+        )
+        return items
+
     async def search_webhooks(
         self,
         session: AsyncSession,
@@ -256,12 +282,20 @@ class WebhookDeliveryRepository(BaseRepository[WebhookDelivery]):
         session: AsyncSession,
         *,
         as_of: datetime | None = None,
+        delivery_ids: Iterable[UUID] | None = None,
+        limit: int | None = None,
+        skip_locked: bool = False,
     ) -> Sequence[WebhookDelivery]:
         """Find deliveries that are due for retry.
 
         Args:
             session: Database session
             as_of: Reference time (defaults to now)
+            delivery_ids: Only consider these deliveries
+            limit: Maximum deliveries to return
+            skip_locked: Lock the returned rows, skipping rows another
+                worker has locked, so concurrent workers never send the
+                same delivery twice
 
         Returns:
             Sequence of deliveries needing retry
@@ -277,6 +311,12 @@ class WebhookDeliveryRepository(BaseRepository[WebhookDelivery]):
             )
             .order_by(WebhookDelivery.next_retry_at.asc())
         )
+        if delivery_ids is not None:
+            stmt = stmt.where(WebhookDelivery.id.in_(list(delivery_ids)))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if skip_locked:
+            stmt = stmt.with_for_update(skip_locked=True)
         result = await session.execute(stmt)
         items = result.scalars().all()
 
@@ -348,6 +388,41 @@ class WebhookDeliveryRepository(BaseRepository[WebhookDelivery]):
         )
         return delivery
 
+    async def reschedule(
+        self,
+        session: AsyncSession,
+        delivery_ids: Sequence[UUID],
+        next_retry_at: datetime,
+    ) -> int:
+        """Push deliveries back without counting an attempt.
+
+        Used when a delivery was not sent, e.g. because the endpoint's
+        circuit breaker is open.
+
+        Args:
+            session: Database session
+            delivery_ids: Delivery UUIDs
+            next_retry_at: When to try again
+
+        Returns:
+            Number of deliveries rescheduled
+        """
+        if not delivery_ids:
+            return 0
+
+        result = await session.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(delivery_ids))
+            .values(next_retry_at=next_retry_at)
+            .execution_options(synchronize_session="fetch"),
+        )
+        count = result.rowcount or 0  # type: ignore[attr-defined]
+
+        self._lazy.debug(
+            lambda: f"db.reschedule: {len(delivery_ids)} deliveries -> {count} rescheduled to {next_retry_at}",
+        )
+        return count
+
 
 # Factory functions for dependency injection
 _webhook_repository: WebhookRepository | None = None
@@ -11,7 +11,7 @@ from fastapi import APIRouter, Depends, status
 from example_service.core.database import NotFoundError
 from example_service.core.dependencies.database import get_db_session
 from example_service.core.exceptions import BadRequestException
-from example_service.features.webhooks.client import WebhookClient
+from example_service.features.webhooks.engine import get_webhook_delivery_engine
 from example_service.features.webhooks.models import WebhookDelivery
 from example_service.features.webhooks.schemas import (
     SecretRegenerateResponse,
@@ -290,9 +290,9 @@ async def test_webhook(
     created_delivery = await delivery_repo.create(session, delivery)
     await session.commit()
 
-    # Attempt delivery
-    client = WebhookClient(timeout_seconds=webhook.timeout_seconds)
-    result = await client.deliver(
+    # Attempt delivery over the shared connection pool, bypassing the
+    # circuit breaker so a test always reaches the endpoint
+    result = await get_webhook_delivery_engine().client.deliver(
         webhook=webhook,
         event_type=test_request.event_type,
         event_id=created_delivery.event_id,
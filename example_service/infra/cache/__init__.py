@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from example_service.infra.cache.codecs import CacheCodec
 from example_service.infra.cache.decorators import (
     cache_key,
     invalidate_cache,
     invalidate_pattern,
     invalidate_tags,
 )
+from example_service.infra.cache.local import LocalCache
 from example_service.infra.cache.redis import RedisCache, get_cache, get_cache_instance
+from example_service.infra.cache.stampede import SingleFlight, StampedeGuard
 from example_service.infra.cache.strategies import (
     CacheConfig,
     CacheManager,
@@ -17,10 +20,14 @@ from example_service.infra.cache.strategies import (
 )
 
 __all__ = [
+    "CacheCodec",
     "CacheConfig",
     "CacheManager",
     "CacheStrategy",
+    "LocalCache",
     "RedisCache",
+    "SingleFlight",
+    "StampedeGuard",
     "cache_key",
     "cached",
     "get_cache",
@@ -0,0 +1,353 @@
+"""Pluggable value codecs for the Redis cache.
+
+A codec turns cached Python values into bytes and back. It combines:
+- a serializer: ``json`` (stdlib) or ``msgpack`` (compact binary, faster for
+  large payloads; requires the ``msgpack`` package)
+- type-preserving encoding for ``datetime``, ``date``, ``time``, ``UUID``,
+  ``Decimal``, ``bytes``, ``set`` and ``frozenset`` values
+- optional compression (``zlib``, ``zstd`` or ``lz4``) for payloads at or above
+  a size threshold
+
+Encoded values start with a header byte identifying the serializer and
+compressor, so readers decode every entry correctly regardless of their own
+configuration. Plain uncompressed JSON is written without a header, exactly as
+before, so existing entries and external readers keep working.
+
+Example:
+    codec = CacheCodec(serializer="msgpack", compression="zstd")
+    data = codec.encode({"at": datetime.now(UTC), "ids": {1, 2}})
+    value = codec.decode(data)  # datetime and set are restored
+"""
+
+from __future__ import annotations
+
+import base64
+from datetime import date, datetime, time
+from decimal import Decimal
+import json
+from typing import Any, Literal
+from uuid import UUID
+import zlib
+
+SerializerName = Literal["json", "msgpack"]
+CompressionName = Literal["none", "zlib", "zstd", "lz4"]
+
+_SERIALIZERS: tuple[SerializerName, ...] = ("json", "msgpack")
+_COMPRESSORS: tuple[CompressionName, ...] = ("none", "zlib", "zstd", "lz4")
+
+# Header bytes live in 0x01-0x08: control characters that can never start a
+# JSON document, so legacy plain-JSON entries are unambiguous.
+_HEADERS: dict[tuple[SerializerName, CompressionName], int] = {
+    (serializer, compressor): 1 + s_index * len(_COMPRESSORS) + c_index
+    for s_index, serializer in enumerate(_SERIALIZERS)
+    for c_index, compressor in enumerate(_COMPRESSORS)
+}
+_HEADER_LOOKUP = {header: pair for pair, header in _HEADERS.items()}
+
+# JSON type tag for values JSON cannot represent natively
+_TYPE_TAG = "__cache_type__"
+
+# msgpack extension type codes
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_TIME = 3
+_EXT_UUID = 4
+_EXT_DECIMAL = 5
+_EXT_SET = 6
+_EXT_FROZENSET = 7
+
+
+# ──────────────────────────────────────────────────────────────
+# JSON with type preservation
+# ──────────────────────────────────────────────────────────────
+
+
+def _json_default(value: Any) -> Any:
+    """Encode non-JSON types as tagged objects."""
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {_TYPE_TAG: "time", "value": value.isoformat()}
+    if isinstance(value, UUID):
+        return {_TYPE_TAG: "uuid", "value": str(value)}
+    if isinstance(value, Decimal):
+        return {_TYPE_TAG: "decimal", "value": str(value)}
+    if isinstance(value, bytes):
+        return {_TYPE_TAG: "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, frozenset):
+        return {_TYPE_TAG: "frozenset", "value": list(value)}
+    if isinstance(value, set):
+        return {_TYPE_TAG: "set", "value": list(value)}
+    msg = f"Object of type {type(value).__name__} is not cache serializable"
+    raise TypeError(msg)
+
+
+_JSON_DECODERS: dict[str, Any] = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "uuid": UUID,
+    "decimal": Decimal,
+    "bytes": base64.b64decode,
+    "set": set,
+    "frozenset": frozenset,
+}
+
+
+def _json_object_hook(obj: dict[str, Any]) -> Any:
+    """Restore tagged objects produced by ``_json_default``."""
+    if len(obj) == 2 and _TYPE_TAG in obj and "value" in obj:
+        decoder = _JSON_DECODERS.get(obj[_TYPE_TAG])
+        if decoder is not None:
+            return decoder(obj["value"])
+    return obj
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes | str) -> Any:
+    return json.loads(data, object_hook=_json_object_hook)
+
+
+# ──────────────────────────────────────────────────────────────
+# msgpack with type preservation
+# ──────────────────────────────────────────────────────────────
+
+
+def _import_msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as err:
+        msg = "msgpack is required for the msgpack cache codec. Install with: pip install msgpack"
+        raise ImportError(msg) from err
+    return msgpack
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    msgpack = _import_msgpack()
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode())
+        if isinstance(obj, date):
+            return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+        if isinstance(obj, time):
+            return msgpack.ExtType(_EXT_TIME, obj.isoformat().encode())
+        if isinstance(obj, UUID):
+            return msgpack.ExtType(_EXT_UUID, obj.bytes)
+        if isinstance(obj, Decimal):
+            return msgpack.ExtType(_EXT_DECIMAL, str(obj).encode())
+        if isinstance(obj, frozenset):
+            return msgpack.ExtType(_EXT_FROZENSET, _msgpack_dumps(list(obj)))
+        if isinstance(obj, set):
+            return msgpack.ExtType(_EXT_SET, _msgpack_dumps(list(obj)))
+        msg = f"Object of type {type(obj).__name__} is not cache serializable"
+        raise TypeError(msg)
+
+    return msgpack.packb(value, default=default, use_bin_type=True)  # type: ignore[no-any-return]
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    msgpack = _import_msgpack()
+
+    def ext_hook(code: int, payload: bytes) -> Any:
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(payload.decode())
+        if code == _EXT_DATE:
+            return date.fromisoformat(payload.decode())
+        if code == _EXT_TIME:
+            return time.fromisoformat(payload.decode())
+        if code == _EXT_UUID:
+            return UUID(bytes=payload)
+        if code == _EXT_DECIMAL:
+            return Decimal(payload.decode())
+        if code == _EXT_SET:
+            return set(_msgpack_loads(payload))
+        if code == _EXT_FROZENSET:
+            return frozenset(_msgpack_loads(payload))
+        return msgpack.ExtType(code, payload)
+
+    return msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False)
+
+
+# ──────────────────────────────────────────────────────────────
+# Compression
+# ──────────────────────────────────────────────────────────────
+
+
+def _import_zstd() -> Any:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError as err:
+            msg = "zstandard is required for zstd cache compression. Install with: pip install zstandard"
+            raise ImportError(msg) from err
+        return zstandard
+    return zstd
+
+
+def _import_lz4() -> Any:
+    try:
+        import lz4.frame
+    except ImportError as err:
+        msg = "lz4 is required for lz4 cache compression. Install with: pip install lz4"
+        raise ImportError(msg) from err
+    return lz4.frame
+
+
+def _compress(compression: CompressionName, data: bytes, level: int | None) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data, 6 if level is None else level)
+    if compression == "zstd":
+        # One-shot compress() writes a complete frame with both the stdlib
+        # module and zstandard; the stdlib ZstdCompressor defaults to
+        # streaming mode and would return an unfinished frame.
+        return _import_zstd().compress(data, 3 if level is None else level)  # type: ignore[no-any-return]
+    if compression == "lz4":
+        return _import_lz4().compress(  # type: ignore[no-any-return]
+            data, compression_level=0 if level is None else level,
+        )
+    return data
+
+
+def _decompress(compression: CompressionName, data: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "zstd":
+        return _import_zstd().decompress(data)  # type: ignore[no-any-return]
+    if compression == "lz4":
+        return _import_lz4().decompress(data)  # type: ignore[no-any-return]
+    return data
+
+
+class CacheCodec:
+    """Serialize, compress and tag cache values.
+
+    Attributes:
+        serializer: Serializer used for new values.
+        compression: Compressor applied to payloads above the threshold.
+        compression_threshold: Minimum payload size in bytes to compress.
+        compression_level: Compressor-specific level (None = library default).
+    """
+
+    def __init__(
+        self,
+        serializer: SerializerName = "json",
+        compression: CompressionName = "none",
+        compression_threshold: int = 1024,
+        compression_level: int | None = None,
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            serializer: ``"json"`` or ``"msgpack"``.
+            compression: ``"none"``, ``"zlib"``, ``"zstd"`` or ``"lz4"``.
+            compression_threshold: Minimum serialized size in bytes before
+                compression is applied.
+            compression_level: Optional compression level.
+
+        Raises:
+            ValueError: If the serializer or compressor is unknown.
+            ImportError: If the optional library for the selection is missing.
+        """
+        if serializer not in _SERIALIZERS:
+            msg = f"Unknown cache serializer: {serializer}"
+            raise ValueError(msg)
+        if compression not in _COMPRESSORS:
+            msg = f"Unknown cache compression: {compression}"
+            raise ValueError(msg)
+
+        # Fail fast on missing optional dependencies
+        if serializer == "msgpack":
+            _import_msgpack()
+        if compression == "zstd":
+            _import_zstd()
+        elif compression == "lz4":
+            _import_lz4()
+
+        self.serializer: SerializerName = serializer
+        self.compression: CompressionName = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the codec."""
+        return (
+            f"CacheCodec(serializer={self.serializer!r}, "
+            f"compression={self.compression!r}, "
+            f"compression_threshold={self.compression_threshold})"
+        )
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value for storage.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            Encoded bytes (headerless for plain uncompressed JSON).
+
+        Raises:
+            TypeError: If the value contains unsupported types.
+        """
+        payload = _msgpack_dumps(value) if self.serializer == "msgpack" else _json_dumps(value)
+
+        compression: CompressionName = "none"
+        if self.compression != "none" and len(payload) >= self.compression_threshold:
+            payload = _compress(self.compression, payload, self.compression_level)
+            compression = self.compression
+
+        if self.serializer == "json" and compression == "none":
+            return payload
+        return bytes((_HEADERS[self.serializer, compression],)) + payload
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a stored value written by any codec configuration.
+
+        Values without a header are treated as legacy entries: JSON is decoded
+        when possible, otherwise the raw string is returned.
+
+        Args:
+            data: Raw value read from Redis.
+
+        Returns:
+            Decoded value.
+        """
+        if isinstance(data, bytes) and data:
+            pair = _HEADER_LOOKUP.get(data[0])
+            if pair is not None:
+                serializer, compression = pair
+                payload = _decompress(compression, data[1:])
+                if serializer == "msgpack":
+                    return _msgpack_loads(payload)
+                return _json_loads(payload)
+
+        try:
+            return _json_loads(data)
+        except (ValueError, TypeError):
+            pass
+
+        if isinstance(data, bytes):
+            try:
+                return data.decode()
+            except UnicodeDecodeError:
+                return data
+        return data
+
+
+# Plain JSON codec matching the historical RedisCache behaviour
+DEFAULT_CODEC = CacheCodec()
+
+
+__all__ = [
+    "DEFAULT_CODEC",
+    "CacheCodec",
+    "CompressionName",
+    "SerializerName",
+]
@@ -29,18 +29,28 @@ Example:
 
     # Invalidate by tag
     await invalidate_tags([f"user:{user_id}"])
+
+When the in-process L1 cache is enabled (``REDIS_LOCAL_CACHE_ENABLED``), cache
+hits are served from process memory and every invalidation helper below also
+publishes an invalidation message so other replicas evict their local copies.
+
+Concurrent misses for the same key are coalesced into a single computation
+(optionally across replicas with a Redis lock), and hot keys are refreshed in
+the background shortly before they expire (XFetch). See ``stampede.py``.
 """
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import partial, wraps
 import hashlib
 import inspect
 import json
 import logging
+import time
 from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
 
 from example_service.infra.cache.redis import get_cache
+from example_service.infra.cache.stampede import StampedeGuard, unwrap_entry, wrap_entry
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -108,6 +118,9 @@ def cached[R, **P](
     tags: Callable[..., list[str]] | None = None,
     condition: Callable[[R], bool] | None = None,
     skip_cache: Callable[P, bool] | None = None,
+    single_flight: bool = True,
+    lock_timeout: float | None = None,
+    early_refresh_beta: float | None = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
     """Cache async function results in Redis.
 
@@ -118,6 +131,11 @@ def cached[R, **P](
         tags: Function to extract tags from args for invalidation
         condition: Function to determine if result should be cached
         skip_cache: Function to determine if cache should be skipped for this call
+        single_flight: Coalesce concurrent misses for the same key in-process
+        lock_timeout: Seconds to hold a Redis lock while recomputing so only one
+            replica recomputes a missing key (None = no cross-replica lock)
+        early_refresh_beta: XFetch aggressiveness for refreshing hot keys before
+            they expire (None or 0 = disabled; 1.0 is a typical value)
 
     Returns:
         Decorated function
@@ -156,7 +174,17 @@ def cached[R, **P](
         )
         async def get_data(user_id: int, force: bool = False) -> Data:
             return await fetch_data(user_id)
+
+        # Expensive query: one replica recomputes, the others wait for it
+        @cached(key_prefix="stats", ttl=600, lock_timeout=30)
+        async def get_stats() -> Stats:
+            return await aggregate_stats()
     """
+    guard = StampedeGuard(
+        single_flight=single_flight,
+        lock_timeout=lock_timeout,
+        beta=early_refresh_beta,
+    )
 
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         # Get function name for default key_prefix
@@ -166,6 +194,53 @@ def cached[R, **P](
         # Get function signature for default key building
         inspect.signature(func)
 
+        async def _compute_and_store(
+            cache: Any,
+            full_key: str,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> R:
+            """Execute the function and store its result (with tags) in cache."""
+            start_time = time.perf_counter()
+            result = await func(*args, **kwargs)
+            delta = time.perf_counter() - start_time
+
+            # Check if we should cache this result
+            if condition and not condition(result):
+                logger.debug(
+                    f"Result not cached (condition=False) for {func_name}",
+                    extra={"function": func_name, "key": full_key},
+                )
+                return result
+
+            # Store in cache (with XFetch metadata when early refresh is enabled)
+            value = wrap_entry(result, delta, ttl) if guard.early_refresh_enabled else result
+            await cache.set(full_key, value, ttl=ttl if ttl > 0 else None)
+
+            # Store tags if provided
+            tag_list = tags(*args, **kwargs) if tags else None
+            if tag_list:
+                for tag in tag_list:
+                    tag_key = f"tag:{tag}"
+                    # Add this cache key to the tag set
+                    if cache._client:
+                        await cache._client.sadd(tag_key, full_key)
+                        # Set expiration on tag slightly longer than data
+                        if ttl > 0:
+                            await cache._client.expire(tag_key, ttl + 60)
+
+            logger.debug(
+                f"Cached result for {func_name}",
+                extra={
+                    "function": func_name,
+                    "key": full_key,
+                    "ttl": ttl,
+                    "tags": tag_list,
+                },
+            )
+
+            return result
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             # Check if we should skip cache for this call
@@ -183,6 +258,7 @@ def cached[R, **P](
 
             # Try to get from cache
             async with get_cache() as cache:
+                compute_and_store = partial(_compute_and_store, cache, full_key, args, kwargs)
                 cached_value = await cache.get(full_key)
 
                 if cached_value is not None:
@@ -190,51 +266,23 @@ def cached[R, **P](
                         f"Cache hit for {func_name}",
                         extra={"function": func_name, "key": full_key},
                     )
-                    return cast("R", cached_value)
+                    entry = unwrap_entry(cached_value)
+                    if guard.should_refresh(entry):
+                        guard.refresh_in_background(full_key, compute_and_store)
+                    return cast("R", entry.value)
 
                 logger.debug(
                     f"Cache miss for {func_name}",
                     extra={"function": func_name, "key": full_key},
                 )
 
-                # Execute function
-                result = await func(*args, **kwargs)
-
-                # Check if we should cache this result
-                if condition and not condition(result):
-                    logger.debug(
-                        f"Result not cached (condition=False) for {func_name}",
-                        extra={"function": func_name, "key": full_key},
-                    )
-                    return result
-
-                # Store in cache
-                await cache.set(full_key, result, ttl=ttl if ttl > 0 else None)
-
-                # Store tags if provided
-                if tags:
-                    tag_list = tags(*args, **kwargs)
-                    for tag in tag_list:
-                        tag_key = f"tag:{tag}"
-                        # Add this cache key to the tag set
-                        if cache._client:
-                            await cache._client.sadd(tag_key, full_key)
-                            # Set expiration on tag slightly longer than data
-                            if ttl > 0:
-                                await cache._client.expire(tag_key, ttl + 60)
-
-                logger.debug(
-                    f"Cached result for {func_name}",
-                    extra={
-                        "function": func_name,
-                        "key": full_key,
-                        "ttl": ttl,
-                        "tags": tag_list if tags else None,
-                    },
+                return await guard.fetch(
+                    full_key,
+                    compute_and_store,
+                    client=cache._client,
+                    reader=lambda: cache.get(full_key),
                 )
 
-                return result
-
         return wrapper
 
     return decorator
@@ -299,6 +347,9 @@ async def invalidate_pattern(pattern: str) -> int:
             logger.warning("Cache client not available for pattern invalidation")
             return 0
 
+        # Evict L1 copies on every replica, even if Redis has no matches
+        await cache.invalidate_local(pattern=pattern)
+
         # Collect matching keys
         keys_to_delete: list[str] = []
         async for key in cache._client.scan_iter(match=pattern, count=100):
@@ -356,6 +407,9 @@ async def invalidate_tags(tag_list: list[str]) -> int:
                 # Delete all associated cache entries
                 deleted = await cache._client.delete(*cache_keys)
                 total_deleted += deleted
+                await cache.invalidate_local(
+                    keys=[k.decode() if isinstance(k, bytes) else k for k in cache_keys],
+                )
 
                 # Delete the tag set itself
                 await cache._client.delete(tag_key)
@@ -0,0 +1,277 @@
+"""Bounded in-process cache used as an L1 layer in front of Redis.
+
+The local cache keeps hot, already-deserialized values in process memory so
+repeated reads skip the Redis round trip and JSON decode entirely. It is
+bounded both by entry count and by a per-entry TTL, and evicts with either an
+LRU or LFU policy once full.
+
+Coherence across replicas is handled by ``RedisCache``, which publishes
+invalidation messages on a Redis pub/sub channel whenever keys are written or
+deleted and evicts matching entries from every replica's local cache. Keep the
+local TTL short: it bounds staleness if an invalidation message is lost.
+
+Example:
+    cache = LocalCache(max_size=5_000, ttl=15.0, eviction="lfu")
+    cache.set("user:42", {"id": 42})
+    cache.get("user:42")  # {"id": 42}
+    cache.delete_pattern("user:*")
+
+Note:
+    Values are returned by reference. Treat cached objects as read-only;
+    mutating them mutates the copy every other reader sees.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import logging
+import time
+from typing import Any, Literal
+
+from example_service.infra.metrics.prometheus import (
+    cache_evictions_total,
+    cache_hits_total,
+    cache_misses_total,
+)
+
+logger = logging.getLogger(__name__)
+
+EvictionPolicy = Literal["lru", "lfu"]
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    """Single local cache entry."""
+
+    value: Any
+    expires_at: float
+    frequency: int = 1
+
+
+class LocalCache:
+    """Size- and TTL-bounded in-process cache with LRU or LFU eviction.
+
+    All operations are synchronous and O(1) (pattern deletes are O(n)), so the
+    cache is safe to use from a single event loop without locking.
+
+    Attributes:
+        max_size: Maximum number of entries held in memory.
+        ttl: Default time to live for entries in seconds.
+        eviction: Eviction policy applied when the cache is full.
+        cache_name: Label value used for the ``cache_name`` metric label.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        eviction: EvictionPolicy = "lru",
+        cache_name: str = "local",
+    ) -> None:
+        """Initialize the local cache.
+
+        Args:
+            max_size: Maximum number of entries (must be positive).
+            ttl: Default entry time to live in seconds (must be positive).
+            eviction: ``"lru"`` (least recently used) or ``"lfu"``
+                (least frequently used).
+            cache_name: Metric label identifying this cache layer.
+
+        Raises:
+            ValueError: If max_size/ttl are not positive or the eviction
+                policy is unknown.
+        """
+        if max_size <= 0:
+            msg = "max_size must be positive"
+            raise ValueError(msg)
+        if ttl <= 0:
+            msg = "ttl must be positive"
+            raise ValueError(msg)
+        if eviction not in ("lru", "lfu"):
+            msg = f"Unknown eviction policy: {eviction}"
+            raise ValueError(msg)
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.eviction: EvictionPolicy = eviction
+        self.cache_name = cache_name
+
+        # LRU order (oldest first). Used directly by the LRU policy and as the
+        # storage for the LFU policy, which keeps its own frequency buckets.
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        # LFU bookkeeping: frequency -> keys in insertion order (oldest first)
+        self._frequencies: dict[int, OrderedDict[str, None]] = {}
+        self._min_frequency = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries currently held (including expired)."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a non-expired entry exists for key."""
+        entry = self._entries.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the local cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record_miss()
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._record_miss()
+            return None
+
+        self._touch(key, entry)
+        self.hits += 1
+        cache_hits_total.labels(cache_name=self.cache_name).inc()
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value in the local cache.
+
+        ``None`` values are not stored since ``None`` signals a miss.
+
+        Args:
+            key: Cache key.
+            value: Value to store (kept by reference).
+            ttl: Time to live in seconds, capped at the cache default.
+        """
+        if value is None:
+            return
+
+        effective_ttl = self.ttl if ttl is None or ttl <= 0 else min(ttl, self.ttl)
+        expires_at = time.monotonic() + effective_ttl
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.expires_at = expires_at
+            self._touch(key, entry)
+            return
+
+        while len(self._entries) >= self.max_size:
+            self._evict_one()
+
+        self._entries[key] = _LocalEntry(value=value, expires_at=expires_at)
+        if self.eviction == "lfu":
+            self._frequencies.setdefault(1, OrderedDict())[key] = None
+            self._min_frequency = 1
+
+    def delete(self, *keys: str) -> int:
+        """Remove entries from the local cache.
+
+        Args:
+            *keys: Keys to remove.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+                removed += 1
+        return removed
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove all entries whose key matches a Redis-style glob pattern.
+
+        Args:
+            pattern: Glob pattern (``*``, ``?`` and ``[...]`` supported).
+
+        Returns:
+            Number of entries removed.
+        """
+        matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matched:
+            self._remove(key)
+        return len(matched)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._frequencies.clear()
+        self._min_frequency = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return local cache statistics.
+
+        Returns:
+            Dictionary with size, capacity, hit/miss/eviction counters and
+            hit ratio.
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "eviction": self.eviction,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _record_miss(self) -> None:
+        self.misses += 1
+        cache_misses_total.labels(cache_name=self.cache_name).inc()
+
+    def _touch(self, key: str, entry: _LocalEntry) -> None:
+        """Record an access for the configured eviction policy."""
+        if self.eviction == "lru":
+            self._entries.move_to_end(key)
+            return
+
+        bucket = self._frequencies[entry.frequency]
+        del bucket[key]
+        if not bucket:
+            del self._frequencies[entry.frequency]
+            if self._min_frequency == entry.frequency:
+                self._min_frequency = entry.frequency + 1
+        entry.frequency += 1
+        self._frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+
+    def _evict_one(self) -> None:
+        """Evict a single entry according to the eviction policy."""
+        if self.eviction == "lru":
+            key = next(iter(self._entries))
+        else:
+            bucket = self._frequencies.get(self._min_frequency)
+            if not bucket:
+                self._min_frequency = min(self._frequencies)
+                bucket = self._frequencies[self._min_frequency]
+            key = next(iter(bucket))
+
+        self._remove(key)
+        self.evictions += 1
+        cache_evictions_total.labels(cache_name=self.cache_name).inc()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        if self.eviction == "lfu":
+            bucket = self._frequencies[entry.frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequencies[entry.frequency]
+
+
+__all__ = ["EvictionPolicy", "LocalCache"]
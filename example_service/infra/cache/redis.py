@@ -4,25 +4,32 @@ This module provides a high-level Redis cache client that includes:
 - Connection pooling
 - Automatic retry with exponential backoff
 - Type-safe get/set operations
-- Serialization/deserialization helpers
+- Pluggable value codecs (JSON/msgpack, optional compression)
 - Health checks
 - Prometheus metrics with trace correlation
+- Optional in-process L1 cache kept coherent across replicas via pub/sub
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
 
 from opentelemetry import trace
 from redis.asyncio import ConnectionPool, Redis
+from redis.client import NEVER_DECODE
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from example_service.core.settings import get_redis_settings
+from example_service.infra.cache.codecs import CacheCodec
+from example_service.infra.cache.local import LocalCache
 from example_service.infra.metrics.prometheus import (
     cache_commands_total,
     cache_connections_active,
@@ -41,6 +48,8 @@ from example_service.utils.retry import retry
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable
+
+    from redis.asyncio.client import PubSub
 else:  # pragma: no cover - typing fallback
     AsyncIterator = Any
 
@@ -68,12 +77,50 @@ class RedisCache:
         await cache.delete("key")
 
         await cache.disconnect()
+
+    When ``REDIS_LOCAL_CACHE_ENABLED`` is set (or a ``LocalCache`` is passed
+    in), reads are served from a bounded in-process L1 cache first. Writes and
+    deletes evict the local entry and publish an invalidation message so every
+    replica drops its stale copy.
+
+    Non-string values are encoded with a ``CacheCodec`` (``REDIS_VALUE_*``
+    settings). Encoded values carry a header byte, so entries written with
+    any codec, including legacy plain JSON, always decode.
     """
 
-    def __init__(self) -> None:
-        """Initialize Redis cache client."""
+    def __init__(
+        self,
+        local_cache: LocalCache | None = None,
+        codec: CacheCodec | None = None,
+    ) -> None:
+        """Initialize Redis cache client.
+
+        Args:
+            local_cache: Optional in-process L1 cache. When omitted, one is
+                created from settings if ``local_cache_enabled`` is True.
+            codec: Value codec. When omitted, one is created from settings.
+        """
         self._pool: ConnectionPool | None = None
         self._client: Redis | None = None
+        self._codec = codec or CacheCodec(
+            serializer=redis_settings.value_serializer,
+            compression=redis_settings.value_compression,
+            compression_threshold=redis_settings.value_compression_threshold,
+        )
+
+        if local_cache is None and redis_settings.local_cache_enabled:
+            local_cache = LocalCache(
+                max_size=redis_settings.local_cache_max_size,
+                ttl=redis_settings.local_cache_ttl,
+                eviction=redis_settings.local_cache_eviction,
+            )
+        self._local = local_cache
+        self._instance_id = uuid4().hex
+        self._invalidation_channel = redis_settings.get_prefixed_key(
+            redis_settings.local_cache_invalidation_channel,
+        )
+        self._invalidation_pubsub: PubSub | None = None
+        self._invalidation_task: asyncio.Task[None] | None = None
 
     async def connect(self) -> None:
         """Establish connection to Redis with connection pooling.
@@ -106,6 +153,9 @@ class RedisCache:
             # Test connection
             await cast("Awaitable[bool]", self._client.ping())
 
+            if self._local is not None:
+                await self._start_invalidation_listener()
+
             logger.info("Redis connection established successfully")
         except Exception as e:
             logger.exception("Failed to connect to Redis", extra={"error": str(e)})
@@ -115,6 +165,8 @@ class RedisCache:
         """Close Redis connection and cleanup resources."""
         logger.info("Disconnecting from Redis")
 
+        await self._stop_invalidation_listener()
+
         if self._client:
             await cast("Any", self._client).aclose()
             self._client = None
@@ -144,6 +196,16 @@ class RedisCache:
         """Public accessor for the underlying Redis client."""
         return self.client
 
+    @property
+    def local_cache(self) -> LocalCache | None:
+        """Get the in-process L1 cache, if enabled."""
+        return self._local
+
+    @property
+    def codec(self) -> CacheCodec:
+        """Get the default value codec."""
+        return self._codec
+
     @retry(
         max_attempts=redis_settings.max_retries,
         initial_delay=redis_settings.retry_delay,
@@ -151,23 +213,38 @@ class RedisCache:
         exceptions=(RedisConnectionError, RedisTimeoutError),
         stop_after_delay=redis_settings.retry_timeout,
     )
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: str, *, codec: CacheCodec | None = None) -> Any | None:
         """Get a value from cache with automatic retry and metrics.
 
         Args:
             key: Cache key.
+            codec: Codec override (defaults to the cache codec).
 
         Returns:
-            Cached value (deserialized from JSON) or None if not found.
+            Cached value (decoded by the codec) or None if not found.
 
         Raises:
             RedisConnectionError: If unable to connect after retries.
         """
+        if self._local is not None:
+            local_value = self._local.get(key)
+            if local_value is not None:
+                return local_value
+
         start_time = time.perf_counter()
         cache_name = "redis"
 
         try:
-            value = await self.client.get(key)
+            # Read raw bytes: encoded values may be binary
+            pttl = -1
+            if self._local is None:
+                value = await self.client.execute_command("GET", key, **{NEVER_DECODE: True})
+            else:
+                # Fetch the remaining TTL too, so the L1 copy never outlives Redis
+                pipe = self.client.pipeline(transaction=False)
+                pipe.execute_command("GET", key, **{NEVER_DECODE: True})
+                pipe.pttl(key)
+                value, pttl = await pipe.execute()
             duration = time.perf_counter() - start_time
 
             # Get trace context for exemplar
@@ -204,11 +281,11 @@ class RedisCache:
             if value is None:
                 return None
 
-            # Try to deserialize as JSON, fallback to raw value
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
+            decoded = (codec or self._codec).decode(value)
+
+            if self._local is not None:
+                self._set_local(key, decoded, pttl)
+            return decoded
         except Exception as e:
             logger.exception(
                 "Failed to get value from cache",
@@ -228,13 +305,16 @@ class RedisCache:
         key: str,
         value: Any,
         ttl: int | None = None,
+        *,
+        codec: CacheCodec | None = None,
     ) -> bool:
         """Set a value in cache with automatic retry and metrics.
 
         Args:
             key: Cache key.
-            value: Value to cache (will be JSON serialized if not a string).
+            value: Value to cache (encoded by the codec if not a string).
             ttl: Time to live in seconds (optional).
+            codec: Codec override (defaults to the cache codec).
 
         Returns:
             True if successful, False otherwise.
@@ -246,13 +326,16 @@ class RedisCache:
         cache_name = "redis"
 
         try:
-            # Serialize to JSON if not a string
+            # Encode with the codec if not a string
             if not isinstance(value, str):
-                value = json.dumps(value)
+                value = (codec or self._codec).encode(value)
 
             result = await self.client.set(key, value, ex=ttl)
             duration = time.perf_counter() - start_time
 
+            if self._local is not None:
+                await self.invalidate_local(keys=[key])
+
             # Get trace context for exemplar
             span = trace.get_current_span()
             trace_id = None
@@ -277,6 +360,89 @@ class RedisCache:
             )
             raise
 
+    async def get_many(
+        self,
+        keys: list[str],
+        *,
+        codec: CacheCodec | None = None,
+    ) -> list[Any | None]:
+        """Get multiple values in a single MGET round trip.
+
+        Args:
+            keys: Cache keys.
+            codec: Codec override (defaults to the cache codec).
+
+        Returns:
+            Decoded values in key order (None for missing keys).
+        """
+        if not keys:
+            return []
+
+        active_codec = codec or self._codec
+        results: list[Any | None] = [None] * len(keys)
+        missing: list[int] = []
+        for index, key in enumerate(keys):
+            local_value = self._local.get(key) if self._local is not None else None
+            if local_value is not None:
+                results[index] = local_value
+            else:
+                missing.append(index)
+
+        if missing:
+            missing_keys = [keys[index] for index in missing]
+            if self._local is None:
+                raw_values = await self.client.execute_command(
+                    "MGET", *missing_keys, **{NEVER_DECODE: True},
+                )
+                pttls = [-1] * len(missing)
+            else:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.execute_command("MGET", *missing_keys, **{NEVER_DECODE: True})
+                for key in missing_keys:
+                    pipe.pttl(key)
+                raw_values, *pttls = await pipe.execute()
+            for index, raw, pttl in zip(missing, raw_values, pttls, strict=True):
+                if raw is None:
+                    continue
+                decoded = active_codec.decode(raw)
+                results[index] = decoded
+                if self._local is not None:
+                    self._set_local(keys[index], decoded, pttl)
+
+        return results
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl: int | None = None,
+        *,
+        codec: CacheCodec | None = None,
+    ) -> bool:
+        """Set multiple values in a single pipelined round trip.
+
+        Args:
+            items: Mapping of cache key to value.
+            ttl: Time to live in seconds (optional).
+            codec: Codec override (defaults to the cache codec).
+
+        Returns:
+            True if every value was stored.
+        """
+        if not items:
+            return True
+
+        active_codec = codec or self._codec
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            encoded = value if isinstance(value, str) else active_codec.encode(value)
+            pipe.set(key, encoded, ex=ttl)
+        results = await pipe.execute()
+
+        if self._local is not None:
+            await self.invalidate_local(keys=list(items))
+
+        return all(results)
+
     async def ttl(self, key: str) -> int:
         """Get the time-to-live for a key in seconds."""
         if self._client is None:
@@ -305,6 +471,9 @@ class RedisCache:
             msg = "Redis client not connected. Call connect() first."
             raise RuntimeError(msg)
 
+        if self._local is not None:
+            await self.invalidate_local(pattern=pattern)
+
         keys = [key async for key in self.scan_iter(match=pattern)]
         if not keys:
             return 0
@@ -338,6 +507,9 @@ class RedisCache:
             result = await self.client.delete(key)
             duration = time.perf_counter() - start_time
 
+            if self._local is not None:
+                await self.invalidate_local(keys=[key])
+
             # Get trace context for exemplar
             span = trace.get_current_span()
             trace_id = None
@@ -412,6 +584,176 @@ class RedisCache:
             )
             raise
 
+    async def invalidate_local(
+        self,
+        *,
+        keys: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """Evict entries from the L1 cache on this and every other replica.
+
+        Evicts locally first, then publishes an invalidation message on the
+        invalidation channel. Publishing failures are logged but never raised:
+        the local TTL bounds staleness on replicas that miss the message.
+
+        Args:
+            keys: Exact cache keys to evict.
+            pattern: Redis glob pattern of keys to evict.
+        """
+        if self._local is None or (not keys and pattern is None):
+            return
+
+        if keys:
+            self._local.delete(*keys)
+        if pattern is not None:
+            self._local.delete_pattern(pattern)
+
+        if self._client is None:
+            return
+
+        message: dict[str, Any] = {"origin": self._instance_id}
+        if keys:
+            message["keys"] = list(keys)
+        if pattern is not None:
+            message["pattern"] = pattern
+
+        try:
+            await self._client.publish(self._invalidation_channel, json.dumps(message))
+        except Exception as e:
+            logger.warning(
+                "Failed to publish cache invalidation",
+                extra={"channel": self._invalidation_channel, "error": str(e)},
+            )
+
+    def _set_local(self, key: str, value: Any, pttl: int) -> None:
+        """Store a value read from Redis in the L1 cache.
+
+        The local TTL is capped at the key's remaining TTL in Redis, so a
+        local copy never outlives the entry it was read from.
+
+        Args:
+            key: Cache key.
+            value: Decoded value.
+            pttl: ``PTTL`` reply for the key (-1 if it has no expiry).
+        """
+        if self._local is None:
+            return
+        if pttl == -1:
+            self._local.set(key, value)
+        elif pttl > 0:
+            self._local.set(key, value, ttl=pttl / 1000)
+
+    async def _start_invalidation_listener(self) -> None:
+        """Subscribe to the invalidation channel and start the listener task."""
+        if self._client is None or self._invalidation_task is not None:
+            return
+
+        await self._subscribe_invalidations()
+        self._invalidation_task = asyncio.create_task(self._invalidation_listener())
+        logger.info(
+            "Local cache enabled with pub/sub invalidation",
+            extra={
+                "channel": self._invalidation_channel,
+                "max_size": self._local.max_size if self._local else None,
+            },
+        )
+
+    async def _stop_invalidation_listener(self) -> None:
+        """Stop the invalidation listener task and close its pub/sub connection."""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._invalidation_task
+            self._invalidation_task = None
+
+        await self._close_invalidation_pubsub()
+
+    async def _subscribe_invalidations(self) -> None:
+        """Open a pub/sub connection subscribed to the invalidation channel."""
+        self._invalidation_pubsub = self.client.pubsub()
+        await self._invalidation_pubsub.subscribe(self._invalidation_channel)
+
+    async def _close_invalidation_pubsub(self) -> None:
+        """Close the invalidation pub/sub connection, ignoring errors."""
+        if self._invalidation_pubsub:
+            with contextlib.suppress(Exception):
+                await cast("Any", self._invalidation_pubsub).aclose()
+            self._invalidation_pubsub = None
+
+    async def _invalidation_listener(self) -> None:
+        """Apply invalidation messages published by other replicas.
+
+        If the pub/sub connection drops, resubscribes with exponential
+        backoff and clears the local cache once resubscribed, since any
+        invalidations published in the meantime were missed.
+        """
+        delay = redis_settings.retry_delay
+        while True:
+            try:
+                if self._invalidation_pubsub is None:
+                    await self._subscribe_invalidations()
+                    if self._local is not None:
+                        self._local.clear()
+                    logger.info(
+                        "Resubscribed to cache invalidations; local cache cleared",
+                        extra={"channel": self._invalidation_channel},
+                    )
+                    delay = redis_settings.retry_delay
+
+                pubsub = cast("PubSub", self._invalidation_pubsub)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    self._apply_invalidation(message["data"])
+                # listen() only returns once the connection is unsubscribed
+                msg = "pub/sub connection closed"
+                raise RedisConnectionError(msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Cache invalidation listener disconnected; retrying",
+                    extra={
+                        "channel": self._invalidation_channel,
+                        "retry_in": delay,
+                        "error": str(e),
+                    },
+                )
+
+            await self._close_invalidation_pubsub()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _apply_invalidation(self, data: str | bytes) -> None:
+        """Evict local entries named by an invalidation message.
+
+        Args:
+            data: JSON payload with ``origin`` and ``keys`` and/or ``pattern``.
+        """
+        if self._local is None:
+            return
+
+        try:
+            payload = json.loads(data)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+
+        # Our own messages were already applied before publishing
+        if payload.get("origin") == self._instance_id:
+            return
+
+        if payload.get("clear"):
+            self._local.clear()
+            return
+
+        keys = payload.get("keys")
+        if keys:
+            self._local.delete(*keys)
+        pattern = payload.get("pattern")
+        if pattern:
+            self._local.delete_pattern(pattern)
+
     async def health_check(self) -> bool:
         """Check if Redis is healthy and responsive.
 
@@ -0,0 +1,406 @@
+"""Cache stampede protection for cache-aside reads.
+
+When a popular key expires, every concurrent caller misses at once and runs
+the same expensive computation. This module provides three complementary
+defences used by ``@cached`` and ``CacheManager.get_or_fetch``:
+
+- Request coalescing (single-flight): at most one in-flight computation per
+  key per process; concurrent callers await the same result.
+- Optional cross-replica lock: a short-lived Redis ``SET NX PX`` lock so only
+  one replica recomputes while the others poll for the fresh value.
+- XFetch probabilistic early refresh: entries carry the measured recompute
+  time and their expiry, and each read refreshes early with a probability
+  that grows as expiry approaches, so hot keys are rebuilt before they expire
+  rather than all missing at the same moment.
+
+Example:
+    guard = StampedeGuard(lock_timeout=10.0)
+
+    raw = await cache.get(key)
+    if raw is not None:
+        entry = unwrap_entry(raw)
+        if guard.should_refresh(entry):
+            guard.refresh_in_background(key, recompute_and_store)
+        return entry.value
+
+    return await guard.fetch(
+        key,
+        recompute_and_store,
+        client=cache.client,
+        reader=lambda: cache.get(key),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+import logging
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import uuid4
+
+from example_service.infra.metrics.prometheus import cache_stampede_events_total
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Marker key identifying values stored with XFetch metadata
+ENTRY_MARKER = "__xfetch__"
+
+# Delete the lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached value with optional XFetch metadata.
+
+    Attributes:
+        value: The cached value.
+        delta: Seconds the last recomputation took (None for plain values).
+        expiry: Wall-clock expiry timestamp (None for plain values).
+    """
+
+    value: Any
+    delta: float | None = None
+    expiry: float | None = None
+
+
+def wrap_entry(value: Any, delta: float, ttl: int | None) -> Any:
+    """Wrap a value with XFetch metadata before storing it.
+
+    Values without an expiry (or ``None`` results, which signal a miss) are
+    returned unchanged since early refresh does not apply to them.
+
+    Args:
+        value: Value to cache.
+        delta: Seconds the computation took.
+        ttl: Time to live in seconds.
+
+    Returns:
+        JSON-serializable envelope, or the value itself.
+    """
+    if value is None or not ttl or ttl <= 0:
+        return value
+    return {
+        ENTRY_MARKER: 1,
+        "value": value,
+        "delta": delta,
+        "expiry": time.time() + ttl,
+    }
+
+
+def unwrap_entry(raw: Any) -> CacheEntry:
+    """Unwrap a stored value, accepting both envelopes and plain values.
+
+    Args:
+        raw: Value as returned by ``RedisCache.get``.
+
+    Returns:
+        CacheEntry with metadata when the value was stored by ``wrap_entry``.
+    """
+    if isinstance(raw, dict) and raw.get(ENTRY_MARKER) == 1 and "value" in raw:
+        return CacheEntry(
+            value=raw["value"],
+            delta=raw.get("delta"),
+            expiry=raw.get("expiry"),
+        )
+    return CacheEntry(value=raw)
+
+
+def should_refresh_early(
+    entry: CacheEntry,
+    beta: float = 1.0,
+    now: float | None = None,
+) -> bool:
+    """Decide whether to recompute an entry before it expires (XFetch).
+
+    Implements ``now - delta * beta * ln(rand()) >= expiry``: the probability
+    of refreshing grows as the entry nears expiry and is higher for values
+    that take longer to recompute.
+
+    Args:
+        entry: Unwrapped cache entry.
+        beta: Aggressiveness (> 1 refreshes earlier, < 1 later).
+        now: Current wall-clock time (defaults to ``time.time()``).
+
+    Returns:
+        True if this caller should trigger a refresh.
+    """
+    if entry.delta is None or entry.expiry is None or beta <= 0:
+        return False
+    current = time.time() if now is None else now
+    # 1.0 - random() is in (0, 1], so the log is always defined
+    return current - entry.delta * beta * math.log(1.0 - random.random()) >= entry.expiry
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight await the same result (or exception). Nothing is cached once the
+    call completes.
+    """
+
+    def __init__(self, cache_name: str = "redis") -> None:
+        """Initialize the single-flight group.
+
+        Args:
+            cache_name: Metric label for coalesced calls.
+        """
+        self.cache_name = cache_name
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+        self._background: dict[str, asyncio.Task[None]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Return True if a computation for key is currently running."""
+        return key in self._calls
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run func once for all concurrent callers of key.
+
+        Args:
+            key: Coalescing key.
+            func: Zero-argument coroutine function to execute.
+
+        Returns:
+            The function result shared by all concurrent callers.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            cache_stampede_events_total.labels(
+                cache_name=self.cache_name, event="coalesced",
+            ).inc()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: take over the computation
+                task = asyncio.current_task()
+                if future.cancelled() and task is not None and not task.cancelling():
+                    return await self.do(key, func)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so a leader-only failure is not logged twice
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def spawn(self, key: str, func: Callable[[], Awaitable[Any]]) -> bool:
+        """Run func in the background unless a call for key is already in flight.
+
+        Args:
+            key: Coalescing key.
+            func: Zero-argument coroutine function to execute.
+
+        Returns:
+            True if a background task was started.
+        """
+        if key in self._calls or key in self._background:
+            return False
+
+        async def _run() -> None:
+            try:
+                await self.do(key, func)
+            except Exception as e:
+                logger.warning(
+                    "Background cache refresh failed",
+                    extra={"key": key, "error": str(e)},
+                )
+            finally:
+                self._background.pop(key, None)
+
+        self._background[key] = asyncio.create_task(_run())
+        return True
+
+
+# Process-wide group shared by @cached and CacheManager
+_default_flights = SingleFlight()
+
+
+class StampedeGuard:
+    """Combine single-flight, a Redis lock and XFetch for one cached call site.
+
+    Attributes:
+        single_flight: Coalesce concurrent computations within the process.
+        lock_timeout: Redis lock lifetime in seconds; None disables the
+            cross-replica lock.
+        wait_timeout: Maximum seconds to wait for another replica's result
+            before computing locally (defaults to ``lock_timeout``).
+        poll_interval: Seconds between polls while waiting on the lock.
+        beta: XFetch aggressiveness; None or 0 disables early refresh.
+    """
+
+    def __init__(
+        self,
+        *,
+        single_flight: bool = True,
+        lock_timeout: float | None = None,
+        wait_timeout: float | None = None,
+        poll_interval: float = 0.05,
+        beta: float | None = 1.0,
+        flights: SingleFlight | None = None,
+    ) -> None:
+        """Initialize the guard.
+
+        Args:
+            single_flight: Coalesce concurrent computations within the process.
+            lock_timeout: Redis lock lifetime in seconds (None disables it).
+            wait_timeout: Maximum seconds to wait on another replica.
+            poll_interval: Seconds between polls while waiting on the lock.
+            beta: XFetch aggressiveness (None or 0 disables early refresh).
+            flights: Single-flight group (defaults to the process-wide group).
+        """
+        self.single_flight = single_flight
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.beta = beta
+        self._flights = flights or _default_flights
+
+    @property
+    def early_refresh_enabled(self) -> bool:
+        """Return True if values should be stored with XFetch metadata."""
+        return bool(self.beta and self.beta > 0)
+
+    def should_refresh(self, entry: CacheEntry) -> bool:
+        """Return True if this read should trigger an early refresh."""
+        if not self.early_refresh_enabled:
+            return False
+        return should_refresh_early(entry, beta=self.beta or 0.0)
+
+    def refresh_in_background(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> bool:
+        """Recompute key in the background, at most once per process.
+
+        Args:
+            key: Cache key.
+            compute: Coroutine function that recomputes and stores the value.
+
+        Returns:
+            True if a refresh was started.
+        """
+        started = self._flights.spawn(key, compute)
+        if started:
+            cache_stampede_events_total.labels(
+                cache_name=self._flights.cache_name, event="early_refresh",
+            ).inc()
+        return started
+
+    async def fetch(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        client: Redis | None = None,
+        reader: Callable[[], Awaitable[Any]] | None = None,
+    ) -> T:
+        """Compute a missing value with stampede protection.
+
+        Args:
+            key: Cache key.
+            compute: Coroutine function that computes, stores and returns the
+                value.
+            client: Redis client used for the cross-replica lock.
+            reader: Coroutine function re-reading the cached value while
+                waiting on another replica.
+
+        Returns:
+            The computed (or concurrently computed) value.
+        """
+        call: Callable[[], Awaitable[T]] = compute
+        if self.lock_timeout and client is not None and reader is not None:
+            call = partial(self._fetch_locked, key, compute, client, reader)
+
+        if self.single_flight:
+            return await self._flights.do(key, call)
+        return await call()
+
+    async def _fetch_locked(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        client: Redis,
+        reader: Callable[[], Awaitable[Any]],
+    ) -> T:
+        """Compute under a Redis lock, or wait for the lock holder's result."""
+        lock_key = f"lock:{key}"
+        token = uuid4().hex
+        lock_timeout = self.lock_timeout or 0.0
+        lock_ms = int(lock_timeout * 1000)
+
+        try:
+            acquired = await client.set(lock_key, token, nx=True, px=lock_ms)
+        except Exception as e:
+            logger.warning(
+                "Cache stampede lock unavailable, computing locally",
+                extra={"key": key, "error": str(e)},
+            )
+            return await compute()
+
+        if acquired:
+            try:
+                return await compute()
+            finally:
+                try:
+                    await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.debug(
+                        "Failed to release cache stampede lock",
+                        extra={"key": key, "error": str(e)},
+                    )
+
+        cache_stampede_events_total.labels(
+            cache_name=self._flights.cache_name, event="lock_wait",
+        ).inc()
+        deadline = time.monotonic() + (self.wait_timeout or lock_timeout)
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            raw = await reader()
+            if raw is not None:
+                return unwrap_entry(raw).value  # type: ignore[no-any-return]
+            if not await client.exists(lock_key):
+                break
+
+        return await compute()
+
+
+__all__ = [
+    "CacheEntry",
+    "SingleFlight",
+    "StampedeGuard",
+    "should_refresh_early",
+    "unwrap_entry",
+    "wrap_entry",
+]
@@ -5,18 +5,27 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
 import hashlib
-import json
+import inspect
 import logging
+import time
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from example_service.infra.cache import get_cache
+from example_service.infra.cache.stampede import (
+    CacheEntry,
+    StampedeGuard,
+    unwrap_entry,
+    wrap_entry,
+)
 from example_service.infra.metrics import tracking
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from example_service.infra.cache.codecs import CacheCodec
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -45,17 +54,30 @@ class CacheConfig:
         ttl: Time to live in seconds
         key_prefix: Prefix for cache keys
         strategy: Caching strategy to use
-        serialize: Function to serialize values
-        deserialize: Function to deserialize values
+        serialize: Optional function to serialize values to strings (bypasses
+            the codec; None lets the codec encode values)
+        deserialize: Optional function to deserialize strings written by
+            ``serialize``
+        codec: Value codec (None uses the RedisCache codec from settings)
         refresh_threshold: Threshold for refresh-ahead (0-1)
+        single_flight: Coalesce concurrent cache-aside misses per key
+        lock_timeout: Redis lock lifetime for cross-replica recomputation
+            (None disables the lock)
+        early_refresh_beta: XFetch aggressiveness for probabilistic early
+            refresh in get_or_fetch (None or 0 disables it; not applied
+            when ``serialize`` is set)
     """
 
     ttl: int = 300  # 5 minutes
     key_prefix: str = "cache"
     strategy: CacheStrategy = CacheStrategy.CACHE_ASIDE
-    serialize: Callable[[Any], str] = lambda x: json.dumps(x)
-    deserialize: Callable[[str], Any] = lambda x: json.loads(x)
+    serialize: Callable[[Any], str] | None = None
+    deserialize: Callable[[str], Any] | None = None
+    codec: CacheCodec | None = None
     refresh_threshold: float = 0.8  # Refresh when 80% of TTL has elapsed
+    single_flight: bool = True
+    lock_timeout: float | None = None
+    early_refresh_beta: float | None = None
 
 
 class CacheManager:
@@ -91,6 +113,11 @@ class CacheManager:
         self.config = config or CacheConfig()
         self._write_queue: asyncio.Queue[tuple[str, Any, Callable]] = asyncio.Queue()
         self._writer_task: asyncio.Task | None = None
+        self._guard = StampedeGuard(
+            single_flight=self.config.single_flight,
+            lock_timeout=self.config.lock_timeout,
+            beta=self.config.early_refresh_beta,
+        )
 
     def _make_key(self, key: str) -> str:
         """Create prefixed cache key.
@@ -103,6 +130,21 @@ class CacheManager:
         """
         return f"{self.config.key_prefix}:{key}"
 
+    def _serialize(self, value: Any) -> Any:
+        """Apply the custom serializer, if configured.
+
+        Without one, values are passed through for the cache codec to encode.
+        """
+        if self.config.serialize is None:
+            return value
+        return self.config.serialize(value)
+
+    def _deserialize(self, value: Any) -> Any:
+        """Apply the custom deserializer to string values, if configured."""
+        if self.config.deserialize is None or not isinstance(value, str):
+            return value
+        return self.config.deserialize(value)
+
     def _hash_key(self, key: str) -> str:
         """Create hashed cache key for long keys.
 
@@ -125,14 +167,26 @@ class CacheManager:
         Returns:
             Cached value or None if not found
         """
+        entry = await self._get_entry(key)
+        return entry.value if entry is not None else None
+
+    async def _get_entry(self, key: str) -> CacheEntry | None:
+        """Get a cached value together with its early-refresh metadata.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cache entry or None if not found
+        """
         async with get_cache() as cache:
             cache_key = self._make_key(self._hash_key(key))
 
             try:
-                cached = await cache.get(cache_key)
+                cached = await cache.get(cache_key, codec=self.config.codec)
                 if cached:
                     tracking.track_token_cache(True)  # Reusing cache hit metric
-                    return self.config.deserialize(cached)
+                    return unwrap_entry(self._deserialize(cached))
                 tracking.track_token_cache(False)
                 return None
             except Exception as e:
@@ -155,8 +209,9 @@ class CacheManager:
             ttl = ttl or self.config.ttl
 
             try:
-                serialized = self.config.serialize(value)
-                await cache.set(cache_key, serialized, ttl=ttl)
+                await cache.set(
+                    cache_key, self._serialize(value), ttl=ttl, codec=self.config.codec,
+                )
                 return True
             except Exception as e:
                 logger.error("Cache set failed for key %s: %s", key, e, exc_info=True)
@@ -196,7 +251,9 @@ class CacheManager:
         """Get value from cache or fetch from source (cache-aside pattern).
 
         This is the most common caching pattern. On cache miss, fetches from
-        source and populates cache.
+        source and populates cache. Concurrent misses for the same key share
+        one fetch (and one replica fetches when ``lock_timeout`` is set), and
+        hot keys are refreshed in the background shortly before expiry.
 
         Args:
             key: Cache key
@@ -213,22 +270,59 @@ class CacheManager:
                 ttl=300
             )
         """
+        cache_key = self._make_key(self._hash_key(key))
+        fetch_and_store = partial(self._fetch_and_store, key, fetch_func, ttl)
+
         # Try to get from cache
-        cached = await self.get(key)
-        if cached is not None:
-            return cached
+        entry = await self._get_entry(key)
+        if entry is not None and entry.value is not None:
+            if self._guard.should_refresh(entry):
+                self._guard.refresh_in_background(cache_key, fetch_and_store)
+            return entry.value
+
+        # Cache miss - fetch from source (coalesced per key)
+        client = None
+        if self.config.lock_timeout:
+            async with get_cache() as cache:
+                client = cache._client
+
+        return await self._guard.fetch(
+            cache_key,
+            fetch_and_store,
+            client=client,
+            reader=lambda: self.get(key),
+        )
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        ttl: int | None,
+    ) -> Any:
+        """Fetch a value from source and populate the cache.
+
+        Args:
+            key: Cache key
+            fetch_func: Sync or async function to fetch the value
+            ttl: Time to live in seconds
 
-        # Cache miss - fetch from source
+        Returns:
+            Fetched value
+        """
         try:
-            value = (
-                await fetch_func()
-                if asyncio.iscoroutinefunction(fetch_func)
-                else fetch_func()
-            )
+            start_time = time.perf_counter()
+            value = fetch_func()
+            if inspect.isawaitable(value):
+                value = await value
+            delta = time.perf_counter() - start_time
 
             # Populate cache
+            # Custom serializers get the raw value, so they skip the envelope
             if value is not None:
-                await self.set(key, value, ttl)
+                if self._guard.early_refresh_enabled and self.config.serialize is None:
+                    await self.set(key, wrap_entry(value, delta, ttl or self.config.ttl), ttl)
+                else:
+                    await self.set(key, value, ttl)
 
             return value
         except Exception as e:
@@ -399,7 +493,7 @@ class CacheManager:
             try:
                 # Get value and TTL
                 remaining_ttl = -1
-                cached = await cache.get(cache_key)
+                cached = await cache.get(cache_key, codec=self.config.codec)
 
                 if cached:
                     # Check remaining TTL
@@ -415,7 +509,7 @@ class CacheManager:
                         # Task errors are handled within _refresh_cache
                         _ = refresh_task
 
-                        return self.config.deserialize(cached)
+                        return unwrap_entry(self._deserialize(cached)).value
 
                 # Cache miss or no refresh needed - fetch and store
                 return await self.get_or_fetch(key, fetch_func, ttl)
@@ -473,18 +567,14 @@ class CacheManager:
             cache_keys = [self._make_key(self._hash_key(k)) for k in keys]
 
             try:
-                # Use pipeline for efficiency
-                pipe = cache.pipeline()
-                for cache_key in cache_keys:
-                    pipe.get(cache_key)
-
-                results = await pipe.execute()
+                # Single MGET round trip
+                results = await cache.get_many(cache_keys, codec=self.config.codec)
 
                 # Build result dictionary
                 output = {}
                 for key, result in zip(keys, results, strict=False):
                     if result:
-                        output[key] = self.config.deserialize(result)
+                        output[key] = unwrap_entry(self._deserialize(result)).value
 
                 return output
             except Exception as e:
@@ -513,14 +603,14 @@ class CacheManager:
 
             try:
                 # Use pipeline for efficiency
-                pipe = cache.pipeline()
-                for key, value in items.items():
-                    cache_key = self._make_key(self._hash_key(key))
-                    serialized = self.config.serialize(value)
-                    pipe.set(cache_key, serialized, ex=ttl)
-
-                await pipe.execute()
-                return True
+                return await cache.set_many(
+                    {
+                        self._make_key(self._hash_key(key)): self._serialize(value)
+                        for key, value in items.items()
+                    },
+                    ttl=ttl,
+                    codec=self.config.codec,
+                )
             except Exception as e:
                 logger.error("Batch set failed: %s", e, exc_info=True)
                 return False
@@ -56,6 +56,7 @@ from .providers import (
     EmailProvider,
     EmailProviderFactory,
     ProviderCapabilities,
+    close_provider_factory,
     get_provider_factory,
     initialize_provider_factory,
 )
@@ -104,6 +105,7 @@ __all__ = [
     "ProviderCapabilities",
     "ResolvedEmailConfig",
     "TemplateNotFoundError",
+    "close_provider_factory",
     "get_email_client",
     "get_email_config_resolver",
     "get_email_service",
@@ -31,6 +31,7 @@ from .base import (
 from .console import ConsoleProvider
 from .factory import (
     EmailProviderFactory,
+    close_provider_factory,
     get_provider_factory,
     initialize_provider_factory,
 )
@@ -38,6 +39,7 @@ from .file import FileProvider
 from .mailgun import MailgunProvider
 from .sendgrid import SendGridProvider
 from .smtp import SMTPProvider
+from .smtp_pool import SMTPConnectionPool
 
 # Optional providers (may not be installed)
 try:
@@ -60,9 +62,11 @@ __all__ = [
     "MailgunProvider",
     "ProviderCapabilities",
     "SESProvider",
+    "SMTPConnectionPool",
     # Providers
     "SMTPProvider",
     "SendGridProvider",
+    "close_provider_factory",
     "get_provider_factory",
     "initialize_provider_factory",
 ]
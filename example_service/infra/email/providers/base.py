@@ -385,6 +385,14 @@ class BaseEmailProvider(ABC):
             )
             return False
 
+    async def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release resources held by the provider (e.g. pooled connections).
+
+        Called when the provider is evicted from the factory cache or on
+        shutdown. The default implementation does nothing; providers that
+        hold connections override it.
+        """
+
     def get_capabilities(self) -> ProviderCapabilities:
         """Get provider capabilities.
 
@@ -2,7 +2,7 @@
 
 Provides centralized provider management with:
 - Lazy provider registration (optional dependencies)
-- Provider caching per configuration
+- Provider caching per configuration (evicted providers are closed)
 - Runtime provider discovery
 - Graceful degradation for unavailable providers
 
@@ -19,6 +19,7 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -57,6 +58,7 @@ class EmailProviderFactory:
         self._registry: dict[str, type[BaseEmailProvider]] = {}
         self._provider_cache: dict[str, EmailProvider] = {}
         self._unavailable: dict[str, str] = {}  # provider -> reason
+        self._closing: set[asyncio.Task[None]] = set()
 
         # Register builtin providers
         self._register_builtin_providers()
@@ -258,10 +260,28 @@ class EmailProviderFactory:
         keys_to_remove = [
             key for key in self._provider_cache if key.startswith(f"{provider_type}:")
         ]
-        for key in keys_to_remove:
-            del self._provider_cache[key]
+        self._evict(keys_to_remove)
         return len(keys_to_remove)
 
+    def _evict(self, keys: list[str]) -> None:
+        """Remove providers from the cache and close them in the background.
+
+        Args:
+            keys: Cache keys to evict
+        """
+        for key in keys:
+            provider = self._provider_cache.pop(key)
+            close = getattr(provider, "close", None)
+            if close is None:
+                continue
+            try:
+                task = asyncio.get_running_loop().create_task(close())
+            except RuntimeError:
+                # No running loop; open connections are dropped with the provider
+                continue
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
     def invalidate_cache(self, tenant_id: str | None = None) -> int:
         """Invalidate cached providers.
 
@@ -274,7 +294,7 @@ class EmailProviderFactory:
         """
         if tenant_id is None:
             count = len(self._provider_cache)
-            self._provider_cache.clear()
+            self._evict(list(self._provider_cache))
             logger.info("Cleared all provider cache (%s entries)", count)
             return count
 
@@ -282,8 +302,7 @@ class EmailProviderFactory:
         keys_to_remove = [
             key for key in self._provider_cache if f":{tenant_id}:" in key
         ]
-        for key in keys_to_remove:
-            del self._provider_cache[key]
+        self._evict(keys_to_remove)
 
         if keys_to_remove:
             logger.info(
@@ -291,6 +310,15 @@ class EmailProviderFactory:
             )
         return len(keys_to_remove)
 
+    async def close(self) -> None:
+        """Close all cached providers and their connections.
+
+        Call this during application shutdown.
+        """
+        self._evict(list(self._provider_cache))
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
     def list_providers(self) -> list[str]:
         """List all registered providers.
 
@@ -381,8 +409,18 @@ def initialize_provider_factory() -> EmailProviderFactory:
     return _factory
 
 
+async def close_provider_factory() -> None:
+    """Close the singleton provider factory's cached providers.
+
+    Call this during application shutdown.
+    """
+    if _factory is not None:
+        await _factory.close()
+
+
 __all__ = [
     "EmailProviderFactory",
+    "close_provider_factory",
     "get_provider_factory",
     "initialize_provider_factory",
 ]
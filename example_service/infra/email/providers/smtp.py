@@ -2,6 +2,7 @@
 
 Production-ready SMTP provider with:
 - Native async support (aiosmtplib)
+- Pooled, reused connections (one pool per provider configuration)
 - TLS/SSL support
 - Authentication support
 - Automatic retry with exponential backoff
@@ -26,11 +27,15 @@ import ssl
 from typing import TYPE_CHECKING
 import uuid
 
+from example_service.core.settings import get_email_settings
 from example_service.utils.retry import retry
 
 from .base import BaseEmailProvider, EmailDeliveryResult, ProviderCapabilities
+from .smtp_pool import SMTPConnectionPool
 
 if TYPE_CHECKING:
+    import aiosmtplib
+
     from example_service.infra.email.resolver import ResolvedEmailConfig
     from example_service.infra.email.schemas import EmailMessage
 
@@ -48,6 +53,12 @@ class SMTPProvider(BaseEmailProvider):
     - Full MIME attachments
     - Priority headers
 
+    Messages are sent over a pool of logged-in connections, so consecutive
+    and concurrent sends skip the TLS handshake and AUTH. Pool limits come
+    from EmailSettings and can be overridden per tenant through
+    ``config_json`` (``smtp_pool_size``, ``smtp_pool_max_messages``,
+    ``smtp_pool_idle_timeout``).
+
     Example:
         config = ResolvedEmailConfig(
             provider_type=EmailProviderType.SMTP,
@@ -81,6 +92,19 @@ class SMTPProvider(BaseEmailProvider):
         self._use_tls = config.smtp_use_tls if config.smtp_use_tls is not None else True
         self._use_ssl = config.smtp_use_ssl if config.smtp_use_ssl is not None else False
 
+        settings = get_email_settings()
+        overrides = config.config_json or {}
+        self._pool = SMTPConnectionPool(
+            self._connect,
+            max_size=int(overrides.get("smtp_pool_size", settings.smtp_pool_size)),
+            max_messages=int(
+                overrides.get("smtp_pool_max_messages", settings.smtp_pool_max_messages),
+            ),
+            idle_timeout=float(
+                overrides.get("smtp_pool_idle_timeout", settings.smtp_pool_idle_timeout),
+            ),
+        )
+
         logger.info(
             "SMTP provider initialized",
             extra={
@@ -88,6 +112,7 @@ class SMTPProvider(BaseEmailProvider):
                 "port": self._port,
                 "use_tls": self._use_tls,
                 "use_ssl": self._use_ssl,
+                "pool_size": self._pool.max_size,
                 "tenant_id": config.tenant_id,
             },
         )
@@ -127,6 +152,49 @@ class SMTPProvider(BaseEmailProvider):
 
         return context
 
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open a connected, authenticated SMTP session for the pool."""
+        import aiosmtplib
+
+        smtp = aiosmtplib.SMTP(
+            hostname=self._host,
+            port=self._port,
+            use_tls=self._use_ssl,  # Implicit TLS
+            start_tls=self._use_tls,  # STARTTLS
+            tls_context=self._create_ssl_context(),
+            timeout=30.0,
+        )
+        await smtp.connect()
+        try:
+            # Authenticate if credentials provided
+            if self._username and self._password:
+                await smtp.login(self._username, self._password)
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    async def _send_pooled(self, mime_message: MIMEMultipart) -> tuple[dict, str]:
+        """Send over a pooled connection.
+
+        A reused connection the server has already dropped is retried once
+        on another connection.
+        """
+        import aiosmtplib
+
+        try:
+            async with self._pool.connection() as smtp:
+                return await smtp.send_message(mime_message)  # type: ignore[no-any-return]
+        except aiosmtplib.SMTPServerDisconnected:
+            logger.debug("Pooled SMTP connection was dropped, retrying on a new one")
+
+        async with self._pool.connection() as smtp:
+            return await smtp.send_message(mime_message)  # type: ignore[no-any-return]
+
+    async def close(self) -> None:
+        """Close pooled SMTP connections."""
+        await self._pool.close()
+
     @retry(
         max_attempts=3,
         initial_delay=1.0,
@@ -151,23 +219,8 @@ class SMTPProvider(BaseEmailProvider):
             mime_message = self._build_mime_message(message)
             message_id = mime_message["Message-ID"]
 
-            # Create SMTP client
-            smtp = aiosmtplib.SMTP(
-                hostname=self._host,
-                port=self._port,
-                use_tls=self._use_ssl,  # Implicit TLS
-                start_tls=self._use_tls,  # STARTTLS
-                tls_context=self._create_ssl_context(),
-                timeout=30.0,
-            )
-
-            async with smtp:
-                # Authenticate if credentials provided
-                if self._username and self._password:
-                    await smtp.login(self._username, self._password)
-
-                # Send the message
-                errors, _response = await smtp.send_message(mime_message)
+            # Send over a pooled, already authenticated connection
+            errors, _response = await self._send_pooled(mime_message)
 
             # Process response
             recipients_accepted = [r for r in message.all_recipients if r not in errors]
@@ -0,0 +1,210 @@
+"""Connection pool for SMTP providers.
+
+Opening an SMTP session costs a TCP connect, a TLS handshake and AUTH before
+the first byte of mail is sent. The pool keeps a few logged-in sessions open
+and hands them out one message at a time:
+
+- At most ``max_size`` connections are open; callers beyond that wait.
+- A connection is replaced after ``max_messages`` messages, since many
+  servers cap messages per session.
+- Idle connections are closed by a timer after ``idle_timeout`` seconds,
+  before the server drops them on its own.
+- A connection idle for more than ``health_check_after`` seconds is checked
+  with NOOP before it is handed out.
+- A connection that raised during use is closed instead of being reused.
+
+Usage:
+    pool = SMTPConnectionPool(connect, max_size=5)
+
+    async with pool.connection() as smtp:
+        await smtp.send_message(mime_message)
+
+    await pool.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledConnection:
+    """An open SMTP client and its usage counters."""
+
+    client: Any
+    messages_sent: int = 0
+    last_used: float = 0.0
+
+
+class SMTPConnectionPool:
+    """Pool of logged-in SMTP connections for one provider configuration.
+
+    The pool does not know how to connect; ``connect`` returns a connected,
+    authenticated client with ``noop()``, ``quit()`` and ``close()`` methods
+    (an ``aiosmtplib.SMTP`` instance).
+
+    Example:
+        async def connect() -> aiosmtplib.SMTP:
+            smtp = aiosmtplib.SMTP(hostname="smtp.example.com", port=587)
+            await smtp.connect()
+            await smtp.login(username, password)
+            return smtp
+
+        pool = SMTPConnectionPool(connect, max_size=5, max_messages=100)
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        *,
+        max_size: int = 5,
+        max_messages: int = 100,
+        idle_timeout: float = 30.0,
+        health_check_after: float = 5.0,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            connect: Coroutine function returning a connected, logged-in client
+            max_size: Maximum open connections
+            max_messages: Messages sent over a connection before it is replaced
+            idle_timeout: Seconds an idle connection is kept open
+            health_check_after: Seconds of idleness after which a connection
+                is checked with NOOP before reuse
+        """
+        self._connect = connect
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: list[_PooledConnection] = []
+        self._in_use = 0
+        self._closed = False
+        self._reap_handle: asyncio.TimerHandle | None = None
+        self._reap_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def size(self) -> int:
+        """Get the number of open connections (idle and in use)."""
+        return len(self._idle) + self._in_use
+
+    @property
+    def idle(self) -> int:
+        """Get the number of idle connections."""
+        return len(self._idle)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Check out a connection for one message.
+
+        Yields:
+            Connected, logged-in SMTP client
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            msg = "SMTP connection pool is closed"
+            raise RuntimeError(msg)
+
+        async with self._slots:
+            conn = await self._checkout()
+            self._in_use += 1
+            try:
+                yield conn.client
+            except BaseException:
+                self._in_use -= 1
+                await _close_quietly(conn.client)
+                raise
+            self._in_use -= 1
+            conn.messages_sent += 1
+            conn.last_used = time.monotonic()
+            if self._closed or conn.messages_sent >= self.max_messages:
+                await _close_quietly(conn.client)
+            else:
+                # Most recently used last, so checkout takes the warmest one
+                self._idle.append(conn)
+                self._schedule_reap()
+
+    async def _checkout(self) -> _PooledConnection:
+        """Take a usable idle connection, or open a new one."""
+        await self._close_expired()
+        while self._idle:
+            conn = self._idle.pop()
+            if time.monotonic() - conn.last_used >= self.health_check_after:
+                try:
+                    await conn.client.noop()
+                except Exception as e:
+                    logger.debug("Discarding stale SMTP connection: %s", e)
+                    await _close_quietly(conn.client)
+                    continue
+            return conn
+
+        client = await self._connect()
+        return _PooledConnection(client=client, last_used=time.monotonic())
+
+    async def _close_expired(self) -> None:
+        """Close connections that have been idle longer than ``idle_timeout``."""
+        now = time.monotonic()
+        expired = [conn for conn in self._idle if now - conn.last_used >= self.idle_timeout]
+        if not expired:
+            return
+        self._idle = [conn for conn in self._idle if now - conn.last_used < self.idle_timeout]
+        for conn in expired:
+            await _close_quietly(conn.client)
+
+    def _schedule_reap(self) -> None:
+        """Arm a timer for when the oldest idle connection expires."""
+        if self._reap_handle is not None or self._closed or not self._idle:
+            return
+        delay = self._idle[0].last_used + self.idle_timeout - time.monotonic()
+        self._reap_handle = asyncio.get_running_loop().call_later(
+            max(delay, 0.0), self._reap,
+        )
+
+    def _reap(self) -> None:
+        """Close expired idle connections in the background."""
+        self._reap_handle = None
+        task = asyncio.create_task(self._reap_expired())
+        self._reap_tasks.add(task)
+        task.add_done_callback(self._reap_tasks.discard)
+
+    async def _reap_expired(self) -> None:
+        """Close expired idle connections and re-arm the timer."""
+        await self._close_expired()
+        self._schedule_reap()
+
+    async def close(self) -> None:
+        """Close idle connections; connections in use close when released."""
+        self._closed = True
+        if self._reap_handle is not None:
+            self._reap_handle.cancel()
+            self._reap_handle = None
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await _close_quietly(conn.client)
+
+
+async def _close_quietly(client: Any) -> None:
+    """End an SMTP session, dropping the socket if QUIT fails."""
+    try:
+        await client.quit()
+    except Exception:
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Error closing SMTP connection", exc_info=True)
+
+
+__all__ = ["SMTPConnectionPool"]
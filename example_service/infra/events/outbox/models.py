@@ -20,6 +20,9 @@ from example_service.utils.runtime_dependencies import require_runtime_dependenc
 
 require_runtime_dependency(datetime)
 
+# Channel notified by the event_outbox insert trigger (see migrations)
+OUTBOX_NOTIFY_CHANNEL = "event_outbox"
+
 
 class EventOutbox(UUIDv7TimestampedBase):
     """Outbox table for reliable event publishing.
@@ -155,4 +158,4 @@ class EventOutbox(UUIDv7TimestampedBase):
         return f"EventOutbox(id={self.id}, event_type={self.event_type!r}, status={status})"
 
 
-__all__ = ["EventOutbox"]
+__all__ = ["OUTBOX_NOTIFY_CHANNEL", "EventOutbox"]
@@ -1,15 +1,22 @@
 """Background outbox processor for reliable event publishing.
 
 The processor runs as a background task that:
-1. Polls the outbox table for pending events
-2. Publishes events to RabbitMQ
-3. Marks events as processed or schedules retries on failure
+1. Claims a batch of pending events from the outbox table
+2. Publishes the batch to RabbitMQ with bounded concurrency, waiting for
+   publisher confirms
+3. Marks the batch as processed, and schedules retries for failures, with
+   one UPDATE each
 
 The processor uses:
 - Batch processing for efficiency
 - FOR UPDATE SKIP LOCKED for concurrent processing
+- Optional hash partitions so several workers claim disjoint event sets
+- LISTEN/NOTIFY wakeups on inserts, with polling as the fallback
 - Exponential backoff for failed events
 - Graceful shutdown handling
+
+Events of the same aggregate are published in order within a batch; events
+of different aggregates are published concurrently.
 """
 
 from __future__ import annotations
@@ -20,9 +27,12 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any
 
-from example_service.core.settings import get_rabbit_settings
+from example_service.core.settings import get_db_settings, get_rabbit_settings
+from example_service.infra.events.outbox.models import OUTBOX_NOTIFY_CHANNEL
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from faststream.rabbit import RabbitBroker
 
 logger = logging.getLogger(__name__)
@@ -34,13 +44,19 @@ _processor: OutboxProcessor | None = None
 class OutboxProcessor:
     """Background processor for publishing outbox events.
 
-    Polls the outbox table and publishes events to RabbitMQ.
+    Claims batches from the outbox table and publishes them to RabbitMQ.
     Handles failures with exponential backoff retries.
 
+    When idle, the processor sleeps until a NOTIFY on the outbox channel
+    (sent by a trigger on inserts) or until ``poll_interval`` elapses.
+
     Attributes:
         batch_size: Number of events to process per batch
         poll_interval: Seconds between polling cycles
         max_retries: Maximum retry attempts before giving up
+        publish_concurrency: Maximum publishes awaiting a broker confirm
+        partition: Partition claimed by this worker (None for all events)
+        partition_count: Total number of partitions across workers
     """
 
     def __init__(
@@ -50,6 +66,10 @@ class OutboxProcessor:
         poll_interval: float = 5.0,
         max_retries: int = 5,
         queue_name: str = "domain-events",
+        publish_concurrency: int = 20,
+        listen: bool = True,
+        partition: int | None = None,
+        partition_count: int = 1,
     ) -> None:
         """Initialize the outbox processor.
 
@@ -58,14 +78,38 @@ class OutboxProcessor:
             poll_interval: Seconds between polls when idle
             max_retries: Max retries before marking as dead letter
             queue_name: RabbitMQ queue for publishing events
+            publish_concurrency: Publishes in flight at once within a batch
+            listen: Wake up on PostgreSQL NOTIFY instead of only polling
+            partition: Partition to claim (0 to partition_count - 1), or
+                None to claim events from every partition
+            partition_count: Number of partitions shared by all workers
+
+        Raises:
+            ValueError: If the concurrency or partition settings are invalid
         """
+        if publish_concurrency < 1:
+            msg = "publish_concurrency must be at least 1"
+            raise ValueError(msg)
+        if partition_count < 1:
+            msg = "partition_count must be at least 1"
+            raise ValueError(msg)
+        if partition is not None and not 0 <= partition < partition_count:
+            msg = f"partition must be between 0 and {partition_count - 1}"
+            raise ValueError(msg)
+
         self.batch_size = batch_size
         self.poll_interval = poll_interval
         self.max_retries = max_retries
         self.queue_name = queue_name
+        self.publish_concurrency = publish_concurrency
+        self.listen = listen
+        self.partition = partition
+        self.partition_count = partition_count
 
         self._running = False
         self._task: asyncio.Task[None] | None = None
+        self._listen_task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
         self._broker: RabbitBroker | None = None
 
     async def start(self) -> None:
@@ -88,12 +132,18 @@ class OutboxProcessor:
 
         self._running = True
         self._task = asyncio.create_task(self._run_loop())
+        if self.listen and get_db_settings().is_configured:
+            self._listen_task = asyncio.create_task(self._listen_loop())
         logger.info(
             "Outbox processor started",
             extra={
                 "batch_size": self.batch_size,
                 "poll_interval": self.poll_interval,
                 "max_retries": self.max_retries,
+                "publish_concurrency": self.publish_concurrency,
+                "partition": self.partition,
+                "partition_count": self.partition_count,
+                "listen": self._listen_task is not None,
             },
         )
 
@@ -106,6 +156,14 @@ class OutboxProcessor:
             return
 
         self._running = False
+        # Interrupt an idle wait so the loop exits promptly
+        self._wakeup.set()
+
+        if self._listen_task:
+            self._listen_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listen_task
+            self._listen_task = None
 
         if self._task:
             # Wait for task to complete current batch
@@ -124,11 +182,13 @@ class OutboxProcessor:
         """Main processing loop."""
         while self._running:
             try:
+                # Cleared before claiming so a NOTIFY during the batch is kept
+                self._wakeup.clear()
                 processed = await self._process_batch()
 
                 if processed == 0:
-                    # No events, wait before polling again
-                    await asyncio.sleep(self.poll_interval)
+                    # No events, wait for a NOTIFY or the next poll
+                    await self._wait_for_events()
                 else:
                     # More events might be available, continue immediately
                     # but yield to other tasks
@@ -142,6 +202,38 @@ class OutboxProcessor:
                 # Back off on errors to avoid tight error loop
                 await asyncio.sleep(self.poll_interval * 2)
 
+    async def _wait_for_events(self) -> None:
+        """Sleep until new events are announced or the poll interval ends."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+
+    async def _listen_loop(self) -> None:
+        """Wake the processing loop whenever outbox rows are inserted.
+
+        Holds a dedicated autocommit connection with ``LISTEN`` on the
+        outbox channel, reconnecting after errors. Polling keeps events
+        flowing while the connection is down.
+        """
+        import psycopg
+
+        url = get_db_settings().psycopg_url
+        while self._running:
+            try:
+                async with await psycopg.AsyncConnection.connect(url, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {OUTBOX_NOTIFY_CHANNEL}")
+                    # Catch up on inserts made while not listening
+                    self._wakeup.set()
+                    async for _ in conn.notifies():
+                        self._wakeup.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Outbox LISTEN connection failed, falling back to polling",
+                    extra={"error": str(e)},
+                )
+                await asyncio.sleep(self.poll_interval)
+
     async def _process_batch(self) -> int:
         """Process a batch of pending events.
 
@@ -152,14 +244,15 @@ class OutboxProcessor:
         from example_service.infra.events.outbox.repository import OutboxRepository
 
         repo = OutboxRepository()
-        processed_count = 0
 
         async with get_async_session() as session:
-            # Fetch pending events with row locking
+            # Claim pending events with row locking until commit
             events = await repo.fetch_pending(
                 session,
                 batch_size=self.batch_size,
                 max_retries=self.max_retries,
+                partition=self.partition,
+                partition_count=self.partition_count,
             )
 
             if not events:
@@ -170,30 +263,20 @@ class OutboxProcessor:
                 extra={"batch_size": len(events)},
             )
 
-            for event in events:
-                try:
-                    await self._publish_event(event)
-                    await repo.mark_processed(session, str(event.id))
-                    processed_count += 1
+            published, errors = await self._publish_batch(events)
 
-                    logger.debug(
-                        "Event published successfully",
-                        extra={
-                            "event_id": str(event.id),
-                            "event_type": event.event_type,
-                        },
-                    )
-
-                except Exception as e:
-                    error_msg = str(e)
-                    await repo.mark_failed(session, str(event.id), error_msg)
+            failures = {event_id: str(error) for event_id, error in errors.items()}
+            await repo.mark_processed_many(session, published)
+            await repo.mark_failed_many(session, failures)
 
+            for event in events:
+                if event.id in failures:
                     logger.warning(
                         "Failed to publish event, scheduled for retry",
                         extra={
                             "event_id": str(event.id),
                             "event_type": event.event_type,
-                            "error": error_msg,
+                            "error": failures[event.id],
                             "retry_count": event.retry_count + 1,
                         },
                     )
@@ -201,22 +284,78 @@ class OutboxProcessor:
             # Commit all changes
             await session.commit()
 
-        if processed_count > 0:
+        if published:
             logger.info(
                 "Outbox batch processed",
-                extra={"processed": processed_count, "total": len(events)},
+                extra={"processed": len(published), "total": len(events)},
             )
 
-        return processed_count
+        return len(published)
+
+    async def _publish_batch(
+        self, events: Sequence[Any],
+    ) -> tuple[list[Any], dict[Any, Exception]]:
+        """Publish a batch of events with bounded concurrency.
+
+        Events sharing an aggregate are published one after another in
+        outbox order; everything else is published concurrently, with at
+        most ``publish_concurrency`` publishes awaiting a confirm. When one
+        of an aggregate's events fails, its later events are not published
+        and stay pending for the next pass.
+
+        Args:
+            events: EventOutbox instances in outbox order
+
+        Returns:
+            IDs of the published events in outbox order, and the publish
+            error by event ID for the events that failed
+        """
+        chains: dict[Any, list[Any]] = {}
+        for event in events:
+            key = (
+                (event.aggregate_type, event.aggregate_id)
+                if event.aggregate_id is not None
+                else event.id
+            )
+            chains.setdefault(key, []).append(event)
+
+        semaphore = asyncio.Semaphore(self.publish_concurrency)
+        published: set[Any] = set()
+        errors: dict[Any, Exception] = {}
+
+        async def publish_chain(chain: list[Any]) -> None:
+            for event in chain:
+                try:
+                    async with semaphore:
+                        await self._publish_event(event)
+                except Exception as e:
+                    errors[event.id] = e
+                    # Later events of this aggregate must not overtake it
+                    return
+                else:
+                    published.add(event.id)
+                    logger.debug(
+                        "Event published successfully",
+                        extra={
+                            "event_id": str(event.id),
+                            "event_type": event.event_type,
+                        },
+                    )
+
+        await asyncio.gather(*(publish_chain(chain) for chain in chains.values()))
+        return [event.id for event in events if event.id in published], errors
 
     async def _publish_event(self, event: Any) -> None:
         """Publish a single event to RabbitMQ.
 
+        Waits for the broker's publisher confirm when the channel has
+        confirms enabled.
+
         Args:
             event: EventOutbox instance to publish
 
         Raises:
-            Exception: If publishing fails
+            Exception: If publishing fails or the broker rejects the message
         """
         if self._broker is None:
             msg = "Broker not initialized"
@@ -236,12 +375,19 @@ class OutboxProcessor:
         }
 
         # Publish to RabbitMQ
-        await self._broker.publish(
+        confirm = await self._broker.publish(
             message=message,
             queue=self.queue_name,
             correlation_id=event.correlation_id,
         )
 
+        if confirm is not None:
+            from pamqp.commands import Basic
+
+            if not isinstance(confirm, Basic.Ack):
+                msg = f"Broker did not acknowledge event: {type(confirm).__name__}"
+                raise RuntimeError(msg)
+
     async def process_one(self) -> bool:
         """Process a single pending event (for testing).
 
@@ -278,6 +424,9 @@ async def start_outbox_processor(
     batch_size: int = 100,
     poll_interval: float = 5.0,
     max_retries: int = 5,
+    publish_concurrency: int = 20,
+    partition: int | None = None,
+    partition_count: int = 1,
 ) -> None:
     """Start the global outbox processor.
 
@@ -285,6 +434,9 @@ async def start_outbox_processor(
         batch_size: Events to process per batch
         poll_interval: Seconds between polling cycles
         max_retries: Maximum retry attempts
+        publish_concurrency: Publishes in flight at once within a batch
+        partition: Partition claimed by this worker (None for all events)
+        partition_count: Number of partitions shared by all workers
     """
     global _processor
 
@@ -297,6 +449,9 @@ async def start_outbox_processor(
         batch_size=batch_size,
         poll_interval=poll_interval,
         max_retries=max_retries,
+        publish_concurrency=publish_concurrency,
+        partition=partition,
+        partition_count=partition_count,
     )
     await _processor.start()
 
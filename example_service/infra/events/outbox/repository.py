@@ -1,8 +1,9 @@
 """Repository for EventOutbox CRUD operations.
 
 Provides methods for:
-- Fetching pending events for processing
-- Marking events as processed or failed
+- Fetching pending events for processing, optionally from one partition
+- Marking events as processed or failed, one at a time or in a single
+  set-based statement per batch
 - Cleaning up old processed events
 """
 
@@ -11,13 +12,29 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import (
+    Interval,
+    String,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from example_service.core.database.repository import BaseRepository
 from example_service.infra.events.outbox.models import EventOutbox
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+    from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,6 +56,8 @@ class OutboxRepository(BaseRepository[EventOutbox]):
         *,
         batch_size: int = 100,
         max_retries: int = 5,
+        partition: int | None = None,
+        partition_count: int = 1,
     ) -> Sequence[EventOutbox]:
         """Fetch pending events ready for processing.
 
@@ -46,13 +65,23 @@ class OutboxRepository(BaseRepository[EventOutbox]):
         - Have not been processed (processed_at is NULL)
         - Are not scheduled for future retry (next_retry_at <= now or NULL)
         - Have not exceeded max retry attempts
+        - Belong to the given partition, when partitioning is used
 
         Events are returned in FIFO order (oldest first) based on UUID v7.
+        The rows stay locked until the session's transaction ends, so
+        concurrent processors claim disjoint batches.
+
+        Partitions are assigned by hashing the aggregate ID (or the event ID
+        for events without an aggregate), so all events of one aggregate are
+        handled by the same worker.
 
         Args:
             session: Database session
             batch_size: Maximum number of events to fetch
             max_retries: Skip events with more retries than this
+            partition: Partition to fetch (0 to partition_count - 1), or
+                None for all events
+            partition_count: Total number of partitions
 
         Returns:
             Sequence of pending EventOutbox records
@@ -71,6 +100,16 @@ class OutboxRepository(BaseRepository[EventOutbox]):
             # Use FOR UPDATE SKIP LOCKED for concurrent processors
             .with_for_update(skip_locked=True)
         )
+        if partition is not None and partition_count > 1:
+            partition_key = func.coalesce(
+                EventOutbox.aggregate_id,
+                cast(EventOutbox.id, String),
+            )
+            # Mask the sign bit: abs() overflows when hashtext returns INT_MIN
+            stmt = stmt.where(
+                func.hashtext(partition_key).op("&")(0x7FFFFFFF) % partition_count
+                == partition,
+            )
 
         result = await session.execute(stmt)
         return result.scalars().all()
@@ -96,6 +135,33 @@ class OutboxRepository(BaseRepository[EventOutbox]):
         )
         await session.execute(stmt)
 
+    async def mark_processed_many(
+        self,
+        session: AsyncSession,
+        event_ids: Sequence[UUID],
+    ) -> None:
+        """Mark a batch of events as processed with a single UPDATE.
+
+        Args:
+            session: Database session
+            event_ids: IDs of the published events
+        """
+        if not event_ids:
+            return
+
+        stmt = (
+            update(EventOutbox)
+            .where(
+                EventOutbox.id
+                == any_(bindparam("event_ids", list(event_ids), type_=ARRAY(EventOutbox.id.type))),
+            )
+            .values(
+                processed_at=datetime.now(UTC),
+                error_message=None,
+            )
+        )
+        await session.execute(stmt)
+
     async def mark_failed(
         self,
         session: AsyncSession,
@@ -118,23 +184,52 @@ class OutboxRepository(BaseRepository[EventOutbox]):
             error_message: Description of the failure
             retry_delay_seconds: Base delay for exponential backoff
         """
-        # Fetch current retry count for backoff calculation
-        event = await self.get(session, event_id)
-        if event is None:
+        await self.mark_failed_many(
+            session,
+            {event_id: error_message},
+            retry_delay_seconds=retry_delay_seconds,
+        )
+
+    async def mark_failed_many(
+        self,
+        session: AsyncSession,
+        failures: Mapping[UUID | str, str],
+        *,
+        retry_delay_seconds: int = 60,
+    ) -> None:
+        """Mark a batch of events as failed with a single UPDATE.
+
+        The retry count and exponential backoff are computed from the stored
+        retry count in SQL, so no rows are read back first.
+
+        Args:
+            session: Database session
+            failures: Error message by event ID
+            retry_delay_seconds: Base delay for exponential backoff
+        """
+        if not failures:
             return
 
-        retry_count = event.retry_count + 1
-        backoff_multiplier = 2 ** (retry_count - 1)  # 1, 2, 4, 8, ...
-        delay = timedelta(seconds=retry_delay_seconds * backoff_multiplier)
-        next_retry = datetime.now(UTC) + delay
+        failed = values(
+            column("id", EventOutbox.id.type),
+            column("error_message", Text),
+            name="failed",
+        ).data(
+            # Truncate long errors
+            [(event_id, error[:1000]) for event_id, error in failures.items()],
+        )
+        # Backoff multiplier 1, 2, 4, 8, ... from the retry count before this failure
+        delay = literal(timedelta(seconds=retry_delay_seconds), Interval) * func.power(
+            2, EventOutbox.retry_count,
+        )
 
         stmt = (
             update(EventOutbox)
-            .where(EventOutbox.id == event_id)
+            .where(EventOutbox.id == failed.c.id)
             .values(
-                retry_count=retry_count,
-                error_message=error_message[:1000],  # Truncate long errors
-                next_retry_at=next_retry,
+                retry_count=EventOutbox.retry_count + 1,
+                error_message=failed.c.error_message,
+                next_retry_at=literal(datetime.now(UTC)) + delay,
             )
         )
         await session.execute(stmt)
@@ -183,8 +278,6 @@ class OutboxRepository(BaseRepository[EventOutbox]):
         Returns:
             Number of unprocessed events
         """
-        from sqlalchemy import func
-
         stmt = (
             select(func.count()).select_from(EventOutbox).where(EventOutbox.processed_at.is_(None))
         )
@@ -208,8 +301,6 @@ class OutboxRepository(BaseRepository[EventOutbox]):
         Returns:
             Number of events exceeding max retries
         """
-        from sqlalchemy import func
-
         stmt = (
             select(func.count())
             .select_from(EventOutbox)
@@ -215,6 +215,16 @@ cache_misses_total = Counter(
     registry=REGISTRY,
 )
 
+cache_stampede_events_total = Counter(
+    "cache_stampede_events_total",
+    "Cache stampede protection events. "
+    "event=coalesced (caller joined an in-flight computation), "
+    "lock_wait (caller waited on another replica's recomputation), "
+    "early_refresh (probabilistic refresh before expiry).",
+    ["cache_name", "event"],
+    registry=REGISTRY,
+)
+
 cache_operation_duration_seconds = Histogram(
     "cache_operation_duration_seconds",
     "Cache operation duration in seconds",
@@ -356,6 +366,13 @@ websocket_broadcast_recipients = Histogram(
     registry=REGISTRY,
 )
 
+websocket_slow_consumer_events_total = Counter(
+    "websocket_slow_consumer_events_total",
+    "Outbound messages refused because a WebSocket send queue was full",
+    ["action"],  # dropped, disconnected
+    registry=REGISTRY,
+)
+
 # Taskiq metrics
 taskiq_tasks_total = Counter(
     "taskiq_tasks_total",
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from example_service.infra.ratelimit.limiter import RateLimiter, check_rate_limit
+from example_service.infra.ratelimit.hybrid import HybridRateLimiter
+from example_service.infra.ratelimit.limiter import (
+    RateLimitAlgorithm,
+    RateLimiter,
+    check_rate_limit,
+)
 from example_service.infra.ratelimit.status import (
     RateLimitProtectionState,
     RateLimitProtectionStatus,
@@ -19,6 +24,8 @@ if TYPE_CHECKING:
     from example_service.app.middleware.rate_limit import RateLimitMiddleware
 
 __all__ = [
+    "HybridRateLimiter",
+    "RateLimitAlgorithm",
     "RateLimitMiddleware",
     "RateLimitProtectionState",
     "RateLimitProtectionStatus",
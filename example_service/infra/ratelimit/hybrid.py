@@ -0,0 +1,342 @@
+"""Hybrid local/Redis rate limiting for high-volume endpoints.
+
+``HybridRateLimiter`` wraps a ``RateLimiter`` and keeps an approximate GCRA
+state per key in process memory:
+
+- Clients that are already over their limit are rejected locally, without a
+  Redis round trip.
+- Allowed requests are counted locally and reported to Redis in batches: a
+  background task pipelines every pending counter in one call each
+  ``sync_interval`` seconds, or sooner once a key has admitted more than its
+  error budget (``error_budget * limit`` requests) since the last sync.
+- Each sync replaces the local state with the authoritative Redis state, so
+  usage from other replicas is reflected within one sync interval.
+
+While the global ``RateLimitStateTracker`` reports DEGRADED, requests are
+enforced with local state only instead of failing open; the background sync
+keeps probing Redis and restores the tracker once a sync succeeds.
+
+The worst-case overshoot per key is roughly ``replicas * error_budget *
+limit`` requests per sync interval.
+
+Example:
+    limiter = HybridRateLimiter(
+        RateLimiter(redis_client),
+        sync_interval=1.0,
+        error_budget=0.1,
+    )
+
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import contextlib
+from dataclasses import dataclass
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+from example_service.infra.metrics.tracking import (
+    track_rate_limit_check,
+    track_rate_limit_hit,
+)
+from example_service.infra.ratelimit.tracker import get_rate_limit_tracker
+
+if TYPE_CHECKING:
+    from example_service.infra.ratelimit.limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _LocalState:
+    """Approximate GCRA state for one key.
+
+    Attributes:
+        limit: Requests allowed per window.
+        window: Window in seconds.
+        tat: Theoretical arrival time (wall-clock seconds).
+        pending: Cost admitted locally and not yet reported to Redis.
+    """
+
+    limit: int
+    window: int
+    tat: float
+    pending: int = 0
+
+    @property
+    def emission(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.window / self.limit
+
+
+class HybridRateLimiter:
+    """Rate limiter with local pre-checks and batched Redis reconciliation.
+
+    Exposes the same ``check_limit`` interface as ``RateLimiter`` so it can be
+    passed to ``RateLimitMiddleware`` or ``check_rate_limit`` directly.
+
+    Attributes:
+        limiter: Redis-backed limiter holding the authoritative state.
+        sync_interval: Seconds between background reconciliations.
+        error_budget: Fraction of a key's limit that may be admitted locally
+            before an early sync is requested.
+        max_keys: Maximum number of keys tracked in memory.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        *,
+        sync_interval: float = 1.0,
+        error_budget: float = 0.1,
+        max_keys: int = 10_000,
+    ) -> None:
+        """Initialize the hybrid limiter.
+
+        Args:
+            limiter: Redis-backed limiter used for reconciliation.
+            sync_interval: Seconds between background syncs (must be positive).
+            error_budget: Fraction of the limit (0-1) admitted locally per key
+                between syncs. 0 syncs after every admitted request.
+            max_keys: Maximum number of keys kept in memory (LRU).
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if sync_interval <= 0:
+            msg = "sync_interval must be positive"
+            raise ValueError(msg)
+        if not 0 <= error_budget <= 1:
+            msg = "error_budget must be between 0 and 1"
+            raise ValueError(msg)
+        if max_keys <= 0:
+            msg = "max_keys must be positive"
+            raise ValueError(msg)
+
+        self.limiter = limiter
+        self.sync_interval = sync_interval
+        self.error_budget = error_budget
+        self.max_keys = max_keys
+
+        self._states: OrderedDict[str, _LocalState] = OrderedDict()
+        self._sync_requested = asyncio.Event()
+        self._sync_task: asyncio.Task[None] | None = None
+
+    async def check_limit(
+        self,
+        key: str,
+        limit: int | None = None,
+        window: int | None = None,
+        cost: int = 1,
+        endpoint: str = "unknown",
+    ) -> tuple[bool, dict[str, int]]:
+        """Check a request against the local state, seeding it from Redis.
+
+        The first request for a key (per replica) is checked against Redis
+        synchronously; later requests are decided locally and reconciled in
+        the background.
+
+        Args:
+            key: Unique identifier for rate limiting.
+            limit: Number of requests allowed per window (uses default if None).
+            window: Time window in seconds (uses default if None).
+            cost: Number of tokens to consume (default: 1).
+            endpoint: API endpoint being rate limited (default: "unknown").
+
+        Returns:
+            Tuple of (is_allowed, metadata) with the same keys as
+            ``RateLimiter.check_limit``.
+        """
+        limit = limit or self.limiter.default_limit
+        window = window or self.limiter.default_window
+        now = time.time()
+        self._ensure_sync_task()
+
+        state = self._states.get(key)
+        if state is not None and (state.limit != limit or state.window != window):
+            state = None
+
+        if state is None:
+            tracker = get_rate_limit_tracker()
+            if tracker is None or not tracker.is_degraded:
+                seeded = await self._seed(key, limit, window, cost, now)
+                if seeded is not None:
+                    allowed, metadata = seeded
+                    self._record(endpoint, allowed=allowed)
+                    return allowed, metadata
+            state = self._store(key, _LocalState(limit=limit, window=window, tat=now))
+        else:
+            self._states.move_to_end(key)
+
+        allowed, metadata = self._consume_local(state, cost, now)
+        if allowed:
+            state.pending += cost
+            if state.pending >= max(1, int(self.error_budget * limit)):
+                self._sync_requested.set()
+        self._record(endpoint, allowed=allowed)
+        return allowed, metadata
+
+    async def flush(self) -> int:
+        """Report pending local counters to Redis and refresh local state.
+
+        Returns:
+            Number of keys reconciled (0 if Redis was unavailable).
+        """
+        now = time.time()
+        batch: list[tuple[str, _LocalState, int]] = []
+        for key, state in list(self._states.items()):
+            if state.pending:
+                batch.append((key, state, state.pending))
+                state.pending = 0
+            elif state.tat <= now:
+                # Idle and fully replenished: re-seed from Redis on next use
+                del self._states[key]
+
+        if not batch:
+            return 0
+
+        tracker = get_rate_limit_tracker()
+        try:
+            results = await self.limiter.consume_batch(
+                [(key, state.limit, state.window, sent) for key, state, sent in batch],
+            )
+        except Exception as e:
+            # Keep the counts so the next sync reports them
+            for _, state, sent in batch:
+                state.pending += sent
+            if tracker:
+                tracker.record_failure(str(e))
+            logger.warning(
+                "Rate limit sync failed, enforcing locally",
+                extra={"keys": len(batch), "error": str(e)},
+            )
+            return 0
+
+        if tracker:
+            tracker.record_success()
+
+        now = time.time()
+        for (_, state, _), (_, _, _, reset_after_ms) in zip(batch, results, strict=True):
+            # Authoritative state plus anything admitted locally during the sync
+            state.tat = max(now + reset_after_ms / 1000, now) + state.pending * state.emission
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the background sync task and flush remaining counters."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sync_task
+            self._sync_task = None
+        await self.flush()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _seed(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        cost: int,
+        now: float,
+    ) -> tuple[bool, dict[str, int]] | None:
+        """Check a new key against Redis and store its state.
+
+        Returns:
+            The Redis decision, or None if Redis is unavailable.
+        """
+        tracker = get_rate_limit_tracker()
+        try:
+            [(allowed, remaining, retry_after_ms, reset_after_ms)] = (
+                await self.limiter.consume_batch([(key, limit, window, cost)])
+            )
+        except Exception as e:
+            if tracker:
+                tracker.record_failure(str(e))
+            logger.warning(
+                "Rate limit check failed, enforcing locally",
+                extra={"key": key, "error": str(e)},
+            )
+            return None
+
+        if tracker:
+            tracker.record_success()
+        tat = now + reset_after_ms / 1000
+        self._store(key, _LocalState(limit=limit, window=window, tat=tat))
+        return allowed, {
+            "limit": limit,
+            "remaining": remaining,
+            "reset": math.ceil(tat),
+            "retry_after": 0 if allowed else max(1, math.ceil(retry_after_ms / 1000)),
+        }
+
+    def _consume_local(
+        self,
+        state: _LocalState,
+        cost: int,
+        now: float,
+    ) -> tuple[bool, dict[str, int]]:
+        """Apply GCRA to the local state."""
+        emission = state.emission
+        tat = max(state.tat, now)
+        new_tat = tat + emission * cost
+        allow_at = new_tat - emission * state.limit
+
+        if allow_at > now:
+            remaining = math.floor((now - (tat - emission * state.limit)) / emission + 1e-6)
+            return False, {
+                "limit": state.limit,
+                "remaining": max(remaining, 0),
+                "reset": math.ceil(tat),
+                "retry_after": max(1, math.ceil(allow_at - now)),
+            }
+
+        state.tat = new_tat
+        remaining = math.floor((now - allow_at) / emission + 1e-6)
+        return True, {
+            "limit": state.limit,
+            "remaining": max(remaining, 0),
+            "reset": math.ceil(new_tat),
+            "retry_after": 0,
+        }
+
+    def _store(self, key: str, state: _LocalState) -> _LocalState:
+        """Insert state for key, evicting the least recently used key if full."""
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
+        return state
+
+    def _ensure_sync_task(self) -> None:
+        """Start the background sync task on first use."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        """Reconcile with Redis every interval or when a key exceeds its budget."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._sync_requested.wait(), timeout=self.sync_interval)
+            self._sync_requested.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Unexpected error in rate limit sync loop")
+
+    @staticmethod
+    def _record(endpoint: str, *, allowed: bool) -> None:
+        """Track the decision in rate limit metrics."""
+        track_rate_limit_check(endpoint=endpoint, allowed=allowed)
+        if not allowed:
+            track_rate_limit_hit(endpoint=endpoint, limit_type="key")
+
+
+__all__ = ["HybridRateLimiter"]
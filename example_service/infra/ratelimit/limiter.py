@@ -1,11 +1,25 @@
-"""Redis-backed rate limiting implementation using token bucket algorithm."""
+"""Redis-backed rate limiting using GCRA or a token bucket.
+
+Both algorithms keep O(1) state per key (a single string for GCRA, a small
+hash for the token bucket) instead of one sorted-set member per request, and
+run as Lua scripts that are loaded once and invoked with ``EVALSHA`` (redis-py
+reloads them transparently on ``NOSCRIPT``). Scripts read the Redis server
+clock so replicas with skewed clocks share one consistent limit.
+
+- ``gcra`` (Generic Cell Rate Algorithm): stores the theoretical arrival time
+  of the next request. Allows bursts of up to ``limit`` requests, then one
+  request every ``window / limit`` seconds.
+- ``token_bucket``: stores the token count and last refill time. A bucket of
+  ``limit`` tokens refills continuously at ``limit / window`` tokens per second.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import math
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from example_service.core.exceptions import RateLimitException
 from example_service.infra.metrics.tracking import (
@@ -17,22 +31,101 @@ from example_service.infra.metrics.tracking import (
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from example_service.infra.ratelimit.hybrid import HybridRateLimiter
+
 logger = logging.getLogger(__name__)
 
+RateLimitAlgorithm = Literal["gcra", "token_bucket"]
+
+# GCRA: KEYS[1] = key, ARGV = emission interval (ms), burst, cost.
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms}.
+# A cost of 0 peeks at the state without consuming capacity.
+_GCRA_SCRIPT = """
+local key = KEYS[1]
+local emission = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', key)) or now
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + emission * cost
+local allow_at = new_tat - emission * burst
+
+if allow_at > now then
+    local remaining = math.floor((now - (tat - emission * burst)) / emission + 1e-6)
+    return {0, math.max(remaining, 0), math.ceil(allow_at - now), math.ceil(tat - now)}
+end
+
+if cost > 0 then
+    redis.call('SET', key, tostring(new_tat), 'PX', math.max(math.ceil(new_tat - now), 1))
+end
+
+-- The epsilon absorbs float error in emission * burst
+local remaining = math.floor((now - allow_at) / emission + 1e-6)
+return {1, math.max(remaining, 0), 0, math.ceil(new_tat - now)}
+"""
+
+# Token bucket: KEYS[1] = key, ARGV = capacity, refill rate (tokens/ms), cost.
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms}.
+# A cost of 0 peeks at the state without consuming capacity.
+_TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+
+if tokens < cost then
+    return {0, math.floor(tokens), math.ceil((cost - tokens) / rate), math.ceil((capacity - tokens) / rate)}
+end
+
+tokens = tokens - cost
+local reset_after = math.ceil((capacity - tokens) / rate)
+if cost > 0 then
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+    redis.call('PEXPIRE', key, math.max(reset_after, 1))
+end
+
+return {1, math.floor(tokens), 0, reset_after}
+"""
+
+_SCRIPTS: dict[str, str] = {
+    "gcra": _GCRA_SCRIPT,
+    "token_bucket": _TOKEN_BUCKET_SCRIPT,
+}
+
 
 class RateLimiter:
-    """Redis-backed rate limiter using token bucket algorithm.
+    """Redis-backed rate limiter using GCRA or a token bucket.
 
-    The token bucket algorithm allows for burst traffic while maintaining
-    an average rate limit. Tokens are added to the bucket at a fixed rate,
-    and each request consumes one token. If no tokens are available, the
-    request is rate limited.
+    Both algorithms allow a burst of up to ``limit`` requests and then
+    sustain an average of ``limit`` requests per ``window`` seconds. State
+    is a single small value per key, so memory does not grow with the
+    request rate.
 
     Attributes:
         redis: Redis client instance.
         key_prefix: Prefix for Redis keys.
         default_limit: Default number of requests allowed per window.
         default_window: Default time window in seconds.
+        algorithm: Rate limiting algorithm (``"gcra"`` or ``"token_bucket"``).
 
     Example:
             limiter = RateLimiter(redis_client)
@@ -51,6 +144,7 @@ class RateLimiter:
         key_prefix: str = "ratelimit",
         default_limit: int = 100,
         default_window: int = 60,
+        algorithm: RateLimitAlgorithm = "gcra",
     ) -> None:
         """Initialize rate limiter.
 
@@ -59,15 +153,28 @@ class RateLimiter:
             key_prefix: Prefix for Redis keys (default: "ratelimit").
             default_limit: Default number of requests per window (default: 100).
             default_window: Default time window in seconds (default: 60).
+            algorithm: ``"gcra"`` (default) or ``"token_bucket"``.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
         """
+        if algorithm not in _SCRIPTS:
+            msg = f"Unknown rate limit algorithm: {algorithm}"
+            raise ValueError(msg)
+
         self.redis = redis
         self.key_prefix = key_prefix
         self.default_limit = default_limit
         self.default_window = default_window
+        self.algorithm: RateLimitAlgorithm = algorithm
+        self._script: Any | None = None
 
     def _make_key(self, identifier: str) -> str:
         """Create Redis key for rate limit tracking.
 
+        The algorithm is part of the key so switching algorithms never reads
+        state written in another format.
+
         Args:
             identifier: Unique identifier for the rate limit (e.g., user ID, IP).
 
@@ -77,7 +184,71 @@ class RateLimiter:
         # Hash long identifiers to keep key size reasonable
         if len(identifier) > 50:
             identifier = hashlib.sha256(identifier.encode()).hexdigest()[:16]
-        return f"{self.key_prefix}:{identifier}"
+        return f"{self.key_prefix}:{self.algorithm}:{identifier}"
+
+    def _script_args(self, limit: int, window: int, cost: int) -> tuple[float, float, int]:
+        """Build the script arguments for the configured algorithm."""
+        window_ms = window * 1000
+        if self.algorithm == "gcra":
+            # Emission interval (ms per request) and burst capacity
+            return window_ms / limit, float(limit), cost
+        # Capacity and refill rate (tokens per ms)
+        return float(limit), limit / window_ms, cost
+
+    async def _run_script(
+        self,
+        redis_key: str,
+        limit: int,
+        window: int,
+        cost: int,
+    ) -> tuple[bool, int, float, float]:
+        """Run the rate limit script via EVALSHA.
+
+        Returns:
+            Tuple of (allowed, remaining, retry_after_ms, reset_after_ms).
+        """
+        if self._script is None:
+            # register_script issues EVALSHA and reloads the script on NOSCRIPT
+            self._script = self.redis.register_script(_SCRIPTS[self.algorithm])
+        result = await self._script(
+            keys=[redis_key],
+            args=list(self._script_args(limit, window, cost)),
+        )
+        return bool(int(result[0])), int(result[1]), float(result[2]), float(result[3])
+
+    async def consume_batch(
+        self,
+        requests: list[tuple[str, int, int, int]],
+    ) -> list[tuple[bool, int, float, float]]:
+        """Apply many rate limit checks in one pipelined round trip.
+
+        Unlike ``check_limit`` this does not fail open: Redis errors are
+        raised so callers can fall back to local enforcement.
+
+        Args:
+            requests: Tuples of (key, limit, window, cost).
+
+        Returns:
+            Tuples of (allowed, remaining, retry_after_ms, reset_after_ms) in
+            request order.
+        """
+        if not requests:
+            return []
+        if self._script is None:
+            self._script = self.redis.register_script(_SCRIPTS[self.algorithm])
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key, limit, window, cost in requests:
+            await self._script(
+                keys=[self._make_key(key)],
+                args=list(self._script_args(limit, window, cost)),
+                client=pipe,
+            )
+        results = await pipe.execute()
+        return [
+            (bool(int(result[0])), int(result[1]), float(result[2]), float(result[3]))
+            for result in results
+        ]
 
     async def check_limit(
         self,
@@ -87,10 +258,10 @@ class RateLimiter:
         cost: int = 1,
         endpoint: str = "unknown",
     ) -> tuple[bool, dict[str, int]]:
-        """Check if request is within rate limit using token bucket algorithm.
+        """Check if request is within rate limit and consume capacity if so.
 
-        This uses a sliding window implementation with Redis for distributed
-        rate limiting across multiple instances.
+        The check is a single atomic script call, so limits are enforced
+        consistently across multiple instances.
 
         Args:
             key: Unique identifier for rate limiting (user ID, IP, API key, etc.).
@@ -102,12 +273,10 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, metadata) where metadata contains:
                 - limit: The rate limit
-                - remaining: Tokens remaining
-                - reset: Unix timestamp when limit resets
-                - retry_after: Seconds to wait before retrying (if limited)
-
-        Raises:
-            RateLimitException: If rate limit is exceeded.
+                - remaining: Requests that can be made immediately
+                - reset: Unix timestamp when the full limit is available again
+                - retry_after: Seconds until this request would be allowed
+                  (0 if allowed)
 
         Example:
                     allowed, meta = await limiter.check_limit("user:123", limit=100, window=60)
@@ -121,56 +290,15 @@ class RateLimiter:
         now = time.time()
 
         try:
-            # Use Lua script for atomic operations
-            # This implements a sliding window rate limiter
-            lua_script = """
-            local key = KEYS[1]
-            local limit = tonumber(ARGV[1])
-            local window = tonumber(ARGV[2])
-            local now = tonumber(ARGV[3])
-            local cost = tonumber(ARGV[4])
-
-            -- Remove old entries outside the window
-            redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
-
-            -- Count current requests in window
-            local current = redis.call('ZCARD', key)
-
-            if current + cost <= limit then
-                -- Add new request(s) with current timestamp as score
-                for i = 1, cost do
-                    redis.call('ZADD', key, now, now .. ':' .. i)
-                end
-                -- Set expiry on the key
-                redis.call('EXPIRE', key, window)
-                return {1, limit - (current + cost)}
-            else
-                return {0, 0}
-            end
-            """
-
-            # Execute Lua script
-            result = await self.redis.eval(
-                lua_script,
-                1,
-                redis_key,
-                limit,
-                window,
-                now,
-                cost,
+            allowed, remaining, retry_after_ms, reset_after_ms = await self._run_script(
+                redis_key, limit, window, cost,
             )
 
-            allowed = bool(result[0])
-            remaining = int(result[1])
-
-            # Calculate reset time (end of current window)
-            reset = int(now + window)
-
             metadata = {
                 "limit": limit,
                 "remaining": remaining,
-                "reset": reset,
-                "retry_after": window if not allowed else 0,
+                "reset": math.ceil(now + reset_after_ms / 1000),
+                "retry_after": 0 if allowed else max(1, math.ceil(retry_after_ms / 1000)),
             }
 
             # Track rate limit check
@@ -189,6 +317,7 @@ class RateLimiter:
                         "limit": limit,
                         "window": window,
                         "remaining": remaining,
+                        "retry_after": metadata["retry_after"],
                     },
                 )
 
@@ -230,42 +359,47 @@ class RateLimiter:
             logger.error(f"Failed to reset rate limit for key: {key}", exc_info=True)
             return False
 
-    async def get_limit_info(self, key: str, window: int | None = None) -> dict[str, int]:
+    async def get_limit_info(
+        self,
+        key: str,
+        window: int | None = None,
+        limit: int | None = None,
+    ) -> dict[str, int]:
         """Get current rate limit information without consuming tokens.
 
         Args:
             key: The identifier to check.
             window: Time window in seconds (uses default if None).
+            limit: Number of requests allowed per window (uses default if None).
 
         Returns:
             Dictionary containing limit information:
                 - limit: The rate limit
                 - remaining: Tokens remaining
                 - reset: Unix timestamp when limit resets
-                - current: Current number of requests in window
+                - current: Capacity currently consumed
 
         Example:
                     info = await limiter.get_limit_info("user:123")
             print(f"Remaining: {info['remaining']}/{info['limit']}")
         """
-        limit = self.default_limit
+        limit = limit or self.default_limit
         window = window or self.default_window
 
         redis_key = self._make_key(key)
         now = time.time()
 
         try:
-            # Remove old entries
-            await self.redis.zremrangebyscore(redis_key, 0, now - window)
-
-            # Count current requests
-            current = await self.redis.zcard(redis_key)
+            _, remaining, _, reset_after_ms = await self._run_script(
+                redis_key, limit, window, 0,
+            )
+            remaining = min(remaining, limit)
 
             return {
                 "limit": limit,
-                "remaining": max(0, limit - current),
-                "reset": int(now + window),
-                "current": current,
+                "remaining": remaining,
+                "reset": math.ceil(now + reset_after_ms / 1000),
+                "current": limit - remaining,
             }
         except Exception as e:
             logger.error(
@@ -282,7 +416,7 @@ class RateLimiter:
 
 
 async def check_rate_limit(
-    limiter: RateLimiter,
+    limiter: RateLimiter | HybridRateLimiter,
     key: str,
     limit: int | None = None,
     window: int | None = None,
@@ -295,7 +429,7 @@ async def check_rate_limit(
     automatically raises RateLimitException if exceeded.
 
     Args:
-        limiter: RateLimiter instance.
+        limiter: RateLimiter or HybridRateLimiter instance.
         key: Unique identifier for rate limiting.
         limit: Number of requests allowed per window.
         window: Time window in seconds.
@@ -85,6 +85,16 @@ class RateLimitStateTracker:
                 last_error=self._state.last_error,
             )
 
+    @property
+    def is_degraded(self) -> bool:
+        """Return True while Redis-backed protection is degraded.
+
+        ``HybridRateLimiter`` checks this on its hot path and enforces limits
+        from local state instead of calling Redis while it is True.
+        """
+        with self._lock:
+            return self._state.status == RateLimitProtectionStatus.DEGRADED
+
     def record_success(self) -> None:
         """Record a successful Redis operation.
 
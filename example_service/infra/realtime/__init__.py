@@ -25,6 +25,7 @@ Usage:
     await manager.broadcast("channel", {"event": "update", "data": {...}})
 """
 
+from example_service.infra.realtime.batching import BroadcastBatcher
 from example_service.infra.realtime.event_bridge import (
     EventBridge,
     get_event_bridge,
@@ -40,6 +41,8 @@ from example_service.infra.realtime.manager import (
 )
 
 __all__ = [
+    # Broadcast batching
+    "BroadcastBatcher",
     # Connection manager
     "ConnectionManager",
     # Event bridge
@@ -0,0 +1,166 @@
+"""Micro-batching for realtime broadcasts.
+
+Bursty sources (e.g. the RabbitMQ event bridge) can produce thousands of
+tiny broadcasts per second, each costing a Redis PUBLISH, a PubSub message
+per instance, and a frame per client. The batcher buffers broadcasts per
+channel for a short window and hands them over in one flush, so a burst
+becomes one PUBLISH per channel, pipelined across channels, and one frame
+per client.
+
+Messages broadcast with a ``coalesce_key`` replace any pending message with
+the same key on the same channel (latest value wins). Use this for
+progress-style updates where only the newest state matters.
+
+Example:
+    batcher = BroadcastBatcher(publish_batches, window=0.005, max_messages=100)
+    batcher.add("reminders", {"type": "broadcast", ...})
+    batcher.add("jobs", {"progress": 40}, coalesce_key="job-1")
+    batcher.add("jobs", {"progress": 45}, coalesce_key="job-1")  # Replaces 40
+    await batcher.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def encode_batch(channel: str, messages: list[dict[str, Any]]) -> str:
+    """Encode a channel's flushed messages as a single text frame.
+
+    A lone message is sent unchanged; several are wrapped as
+    ``{"type": "batch", "channel": ..., "messages": [...]}`` in broadcast
+    order.
+    """
+    if len(messages) == 1:
+        return json.dumps(messages[0])
+    return json.dumps({"type": "batch", "channel": channel, "messages": messages})
+
+
+class BroadcastBatcher:
+    """Buffer broadcasts per channel and flush them together.
+
+    A flush happens ``window`` seconds after the first buffered message, or
+    as soon as ``max_messages`` are pending. Flushes run one at a time, so
+    batches are handed over in the order they were collected.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[dict[str, list[dict[str, Any]]]], Awaitable[None]],
+        window: float = 0.005,
+        max_messages: int = 100,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            flush: Coroutine receiving ``{channel: [message, ...]}`` per flush
+            window: Seconds to buffer before flushing
+            max_messages: Pending message count that triggers an early flush
+        """
+        self._flush = flush
+        self.window = window
+        self.max_messages = max_messages
+
+        # channel -> {message key -> message}; dicts keep insertion order
+        self._pending: dict[str, dict[Any, dict[str, Any]]] = {}
+        self._pending_count = 0
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_scheduled = False
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered messages."""
+        return self._pending_count
+
+    def add(
+        self,
+        channel: str,
+        message: dict[str, Any],
+        coalesce_key: str | None = None,
+    ) -> None:
+        """Buffer a message for a channel.
+
+        Args:
+            channel: Channel to broadcast to
+            message: Message to send
+            coalesce_key: Replace a pending message with the same key on this
+                channel instead of adding another one
+        """
+        buffer = self._pending.setdefault(channel, {})
+        if coalesce_key is None:
+            buffer[next(self._sequence)] = message
+            self._pending_count += 1
+        else:
+            key = ("coalesce", coalesce_key)
+            # Re-insert so the message takes the position of the latest update
+            if buffer.pop(key, None) is None:
+                self._pending_count += 1
+            buffer[key] = message
+
+        if self._flush_scheduled:
+            return
+        if self._pending_count >= self.max_messages:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.window,
+                self._schedule_flush,
+            )
+
+    async def flush(self) -> None:
+        """Hand all buffered messages to the flush callback now."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._flush_scheduled = False
+
+            if not self._pending:
+                return
+
+            batches = {
+                channel: list(buffer.values())
+                for channel, buffer in self._pending.items()
+            }
+            self._pending = {}
+            self._pending_count = 0
+
+            try:
+                await self._flush(batches)
+            except Exception as e:
+                logger.exception(
+                    "Failed to flush broadcast batch",
+                    extra={"channels": len(batches), "error": str(e)},
+                )
+
+    async def close(self) -> None:
+        """Flush buffered messages and wait for in-flight flushes."""
+        await self.flush()
+        if self._tasks:
+            with contextlib.suppress(Exception):
+                await asyncio.gather(*self._tasks)
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._flush_scheduled = True
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+__all__ = ["BroadcastBatcher", "encode_batch"]
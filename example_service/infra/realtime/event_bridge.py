@@ -150,6 +150,7 @@ class EventBridge:
                     "channel": "reminders",  # optional, derived from event_type
                     "data": {...},
                     "correlation_id": "...",  # optional
+                    "coalesce_key": "...",  # optional, latest value wins
                 }
         """
         try:
@@ -178,7 +179,11 @@ class EventBridge:
             broadcast_msg["correlation_id"] = event["correlation_id"]
 
         # Broadcast to channel
-        recipients = await manager.broadcast(channel, broadcast_msg)
+        recipients = await manager.broadcast(
+            channel,
+            broadcast_msg,
+            coalesce_key=event.get("coalesce_key"),
+        )
 
         logger.debug(
             "Event broadcasted to WebSocket clients",
@@ -255,6 +260,7 @@ async def publish_to_websocket(
     data: dict[str, Any],
     channel: str | None = None,
     correlation_id: str | None = None,
+    coalesce_key: str | None = None,
 ) -> bool:
     """Publish an event for WebSocket broadcast.
 
@@ -266,6 +272,8 @@ async def publish_to_websocket(
         data: Event payload
         channel: Target WebSocket channel (derived from event_type if not provided)
         correlation_id: Optional correlation ID for tracing
+        coalesce_key: Optional key for latest-value-wins delivery when
+            broadcast batching is enabled (e.g. a job ID for progress events)
 
     Returns:
         True if published, False if RabbitMQ unavailable.
@@ -290,6 +298,8 @@ async def publish_to_websocket(
             event["channel"] = channel
         if correlation_id:
             event["correlation_id"] = correlation_id
+        if coalesce_key:
+            event["coalesce_key"] = coalesce_key
 
         # Publish with routing key based on event type
         routing_key = f"ws.broadcast.{event_type}"
@@ -7,6 +7,17 @@ This module provides a connection manager that:
 - Supports heartbeat/ping-pong for connection health
 - Provides metrics for observability
 
+Fan-out is built for large channels: a broadcast is JSON-encoded once and
+the resulting text frame is placed on each subscriber's bounded outbound
+queue without awaiting. A writer task per connection drains its queue, so
+clients are written to concurrently and a slow client only backs up its own
+queue. When a queue is full the configured slow consumer policy either drops
+the message for that client or disconnects it.
+
+With ``WS_BROADCAST_BATCH_WINDOW_MS`` set, broadcasts are buffered per channel
+for that window (see ``batching``) and delivered as one ``batch`` frame, with
+one PUBLISH per channel pipelined across channels.
+
 The manager supports two modes:
 1. Local-only: Messages only reach clients on the same instance
 2. Redis PubSub: Messages broadcast to all instances (horizontally scalable)
@@ -25,6 +36,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from example_service.core.settings import get_redis_settings, get_websocket_settings
+from example_service.infra.realtime.batching import BroadcastBatcher, encode_batch
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
@@ -33,6 +45,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded heartbeat frame
+PING_FRAME = json.dumps({"type": "ping"})
+
 
 @dataclass
 class ConnectionInfo:
@@ -45,6 +60,10 @@ class ConnectionInfo:
     metadata: dict[str, Any] = field(default_factory=dict)
     connected_at: float = field(default_factory=time.time)
     last_ping: float = field(default_factory=time.time)
+    # Outbound text frames, drained by writer_task
+    outbound: asyncio.Queue[str] | None = None
+    writer_task: asyncio.Task | None = None
+    closing: bool = False
 
 
 class ConnectionManager:
@@ -91,6 +110,20 @@ class ConnectionManager:
         self._connections: dict[str, ConnectionInfo] = {}
         # channel -> set of connection_ids
         self._channel_connections: dict[str, set[str]] = defaultdict(set)
+        # user_id -> set of connection_ids
+        self._user_connections: dict[str, set[str]] = defaultdict(set)
+
+        # Disconnects scheduled by the slow consumer policy
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Optional micro-batching of broadcasts
+        self._batcher: BroadcastBatcher | None = None
+        if self._settings.broadcast_batch_window_ms > 0:
+            self._batcher = BroadcastBatcher(
+                self._deliver_batches,
+                window=self._settings.broadcast_batch_window_ms / 1000,
+                max_messages=self._settings.broadcast_batch_max_messages,
+            )
 
         # Redis PubSub
         self._pubsub: PubSub | None = None
@@ -134,6 +167,10 @@ class ConnectionManager:
         """Stop the connection manager and close all connections."""
         self._running = False
 
+        # Deliver buffered broadcasts while PubSub is still up
+        if self._batcher is not None:
+            await self._batcher.close()
+
         # Cancel heartbeat task
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
@@ -156,13 +193,17 @@ class ConnectionManager:
                 await self._pubsub.close()
             self._pubsub = None
 
-        # Close all connections
+        # Give queued messages a chance to go out, then close all connections
+        await self.drain(timeout=self._settings.close_timeout)
         for conn_info in list(self._connections.values()):
+            if conn_info.writer_task is not None:
+                conn_info.writer_task.cancel()
             with contextlib.suppress(Exception):
                 await conn_info.websocket.close(code=1001, reason="Server shutdown")
 
         self._connections.clear()
         self._channel_connections.clear()
+        self._user_connections.clear()
 
         logger.info(
             "Connection manager stopped",
@@ -209,10 +250,14 @@ class ConnectionManager:
             websocket=websocket,
             user_id=user_id,
             metadata=metadata or {},
+            outbound=asyncio.Queue(maxsize=self._settings.send_queue_size),
         )
 
         # Store connection
         self._connections[connection_id] = conn_info
+        if user_id is not None:
+            self._user_connections[user_id].add(connection_id)
+        conn_info.writer_task = asyncio.create_task(self._writer(conn_info))
 
         # Subscribe to channels
         if channels:
@@ -243,6 +288,19 @@ class ConnectionManager:
         conn_info = self._connections.pop(connection_id, None)
         if conn_info is None:
             return
+        conn_info.closing = True
+
+        # Stop the writer, unless it is the caller (after a failed send)
+        writer_task = conn_info.writer_task
+        if writer_task is not None and writer_task is not asyncio.current_task():
+            writer_task.cancel()
+
+        if conn_info.user_id is not None:
+            user_connections = self._user_connections.get(conn_info.user_id)
+            if user_connections is not None:
+                user_connections.discard(connection_id)
+                if not user_connections:
+                    del self._user_connections[conn_info.user_id]
 
         # Remove from all channels
         for channel in conn_info.channels:
@@ -331,6 +389,8 @@ class ConnectionManager:
         channel: str,
         message: dict[str, Any],
         exclude: set[str] | None = None,
+        *,
+        coalesce_key: str | None = None,
     ) -> int:
         """Broadcast a message to all subscribers of a channel.
 
@@ -338,27 +398,40 @@ class ConnectionManager:
         reaching all server instances. Otherwise, only local connections
         receive the message.
 
+        When batching is enabled, messages without exclusions are buffered
+        and delivered with the rest of the channel's batch. Messages with
+        exclusions are sent on their own once buffered batches have been
+        handed over, so they never overtake earlier broadcasts.
+
         Args:
             channel: Channel to broadcast to
             message: Message to send (will be JSON serialized)
             exclude: Connection IDs to exclude from broadcast
+            coalesce_key: With batching, replace a pending message with the
+                same key on this channel (latest value wins)
 
         Returns:
-            Number of connections the message was sent to (local only)
+            Number of connections the message was queued for (local,
+            unbatched only)
         """
         exclude = exclude or set()
 
+        if self._batcher is not None:
+            if not exclude:
+                self._batcher.add(channel, message, coalesce_key)
+                return 0
+            await self._batcher.flush()
+
+        frame = json.dumps(message)
+
         # Publish to Redis for cross-instance broadcasting
         if self._redis is not None:
-            await self._redis.publish(
-                f"{self._channel_prefix}{channel}",
-                json.dumps(message),
-            )
+            await self._redis.publish(f"{self._channel_prefix}{channel}", frame)
             # Local delivery will happen via PubSub listener
             return 0
 
         # Local-only broadcast
-        return await self._send_to_channel(channel, message, exclude)
+        return self._send_to_channel(channel, frame, exclude)
 
     async def send_to_connection(
         self,
@@ -367,28 +440,21 @@ class ConnectionManager:
     ) -> bool:
         """Send a message to a specific connection.
 
+        The message goes through the connection's outbound queue, so it is
+        written in order with broadcasts and the slow consumer policy applies.
+
         Args:
             connection_id: ID of the connection
             message: Message to send
 
         Returns:
-            True if sent, False if connection not found
+            True if queued, False if connection not found or too slow
         """
         conn_info = self._connections.get(connection_id)
         if conn_info is None:
             return False
 
-        try:
-            await conn_info.websocket.send_json(message)
-            return True
-        except Exception as e:
-            logger.warning(
-                "Failed to send message to connection",
-                extra={"connection_id": connection_id, "error": str(e)},
-            )
-            # Connection is likely dead, remove it
-            await self.disconnect(connection_id)
-            return False
+        return self._enqueue(conn_info, json.dumps(message))
 
     async def send_to_user(
         self,
@@ -402,13 +468,11 @@ class ConnectionManager:
             message: Message to send
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was queued for
         """
         count = 0
-        for conn_info in list(self._connections.values()):
-            if conn_info.user_id == user_id and await self.send_to_connection(
-                conn_info.connection_id, message,
-            ):
+        for connection_id in list(self._user_connections.get(user_id, ())):
+            if await self.send_to_connection(connection_id, message):
                 count += 1
         return count
 
@@ -421,6 +485,32 @@ class ConnectionManager:
         connection_ids = self._channel_connections.get(channel, set())
         return [self._connections[cid] for cid in connection_ids if cid in self._connections]
 
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued outbound message has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all queues drained, False on timeout
+        """
+        queues = [
+            conn_info.outbound
+            for conn_info in self._connections.values()
+            if conn_info.outbound is not None
+        ]
+        if not queues:
+            return True
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in queues)),
+                timeout,
+            )
+        except TimeoutError:
+            return False
+        return True
+
     @property
     def connection_count(self) -> int:
         """Total number of active connections."""
@@ -433,24 +523,113 @@ class ConnectionManager:
 
     # Private methods
 
-    async def _send_to_channel(
+    def _send_to_channel(
         self,
         channel: str,
-        message: dict[str, Any],
+        frame: str,
         exclude: set[str],
     ) -> int:
-        """Send message to all local connections in a channel."""
-        connection_ids = self._channel_connections.get(channel, set())
-        count = 0
+        """Queue a pre-encoded frame for all local connections in a channel.
 
-        for connection_id in list(connection_ids):
+        Never awaits, so fan-out cost is one queue append per subscriber.
+        """
+        connection_ids = self._channel_connections.get(channel)
+        if not connection_ids:
+            return 0
+
+        connections = self._connections
+        count = 0
+        for connection_id in connection_ids:
             if connection_id in exclude:
                 continue
-            if await self.send_to_connection(connection_id, message):
+            conn_info = connections.get(connection_id)
+            if conn_info is not None and self._enqueue(conn_info, frame):
                 count += 1
 
         return count
 
+    async def _deliver_batches(self, batches: dict[str, list[dict[str, Any]]]) -> None:
+        """Deliver flushed broadcast batches as one frame per channel."""
+        frames = {
+            channel: encode_batch(channel, messages)
+            for channel, messages in batches.items()
+        }
+
+        if self._redis is None:
+            for channel, frame in frames.items():
+                self._send_to_channel(channel, frame, set())
+            return
+
+        # One round trip for every channel in the flush
+        pipe = self._redis.pipeline(transaction=False)
+        for channel, frame in frames.items():
+            pipe.publish(f"{self._channel_prefix}{channel}", frame)
+        await pipe.execute()
+
+    def _enqueue(self, conn_info: ConnectionInfo, frame: str) -> bool:
+        """Queue a frame for a connection, applying the slow consumer policy.
+
+        Returns:
+            True if queued, False if the connection is closing or too slow
+        """
+        if conn_info.closing or conn_info.outbound is None:
+            return False
+
+        try:
+            conn_info.outbound.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self._settings.slow_consumer_policy == "disconnect":
+            conn_info.closing = True
+            task = asyncio.create_task(self.disconnect(conn_info.connection_id))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            logger.warning(
+                "Disconnecting slow WebSocket consumer",
+                extra={
+                    "connection_id": conn_info.connection_id,
+                    "queue_size": conn_info.outbound.maxsize,
+                },
+            )
+            self._record_slow_consumer("disconnected")
+        else:
+            logger.debug(
+                "Dropped message for slow WebSocket consumer",
+                extra={"connection_id": conn_info.connection_id},
+            )
+            self._record_slow_consumer("dropped")
+        return False
+
+    async def _writer(self, conn_info: ConnectionInfo) -> None:
+        """Write queued frames to a connection until it goes away."""
+        queue = conn_info.outbound
+        if queue is None:
+            return
+
+        try:
+            while True:
+                frame = await queue.get()
+                try:
+                    await conn_info.websocket.send_text(frame)
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(
+                "Failed to send message to connection",
+                extra={"connection_id": conn_info.connection_id, "error": str(e)},
+            )
+            # Connection is likely dead, remove it
+            await self.disconnect(conn_info.connection_id)
+        finally:
+            # Release drain() waiters for frames that will never be written
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
     async def _start_pubsub_listener(self) -> None:
         """Start the Redis PubSub listener task."""
         if self._redis is None:
@@ -480,14 +659,14 @@ class ConnectionManager:
                     # Remove prefix to get logical channel name
                     channel = channel.removeprefix(self._channel_prefix)
 
+                    # Published payloads (single messages or batch
+                    # envelopes) are already client frames; forward as-is
                     data = message["data"]
                     if isinstance(data, bytes):
-                        data = json.loads(data.decode())
-                    elif isinstance(data, str):
-                        data = json.loads(data)
+                        data = data.decode()
 
                     # Broadcast to local connections
-                    await self._send_to_channel(channel, data, set())
+                    self._send_to_channel(channel, data, set())
 
                 except Exception as e:
                     logger.exception(
@@ -523,11 +702,8 @@ class ConnectionManager:
                         await self.disconnect(conn_id)
                         continue
 
-                    # Send ping
-                    try:
-                        await conn_info.websocket.send_json({"type": "ping"})
-                    except Exception:
-                        await self.disconnect(conn_id)
+                    # Queue ping behind pending messages
+                    self._enqueue(conn_info, PING_FRAME)
 
         except asyncio.CancelledError:
             pass
@@ -543,6 +719,17 @@ class ConnectionManager:
         except ImportError:
             pass
 
+    def _record_slow_consumer(self, action: str) -> None:
+        """Count a message refused by a full send queue."""
+        try:
+            from example_service.infra.metrics.prometheus import (
+                websocket_slow_consumer_events_total,
+            )
+
+            websocket_slow_consumer_events_total.labels(action=action).inc()
+        except ImportError:
+            pass
+
 
 # Global manager instance
 _manager: ConnectionManager | None = None
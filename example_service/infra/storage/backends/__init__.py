@@ -8,6 +8,7 @@ from example_service.core.settings.storage import StorageBackendType
 from .factory import create_storage_backend
 from .protocol import (
     BucketInfo,
+    BulkDeleteResult,
     ObjectMetadata,
     StorageBackend,
     TenantContext,
@@ -16,6 +17,7 @@ from .protocol import (
 
 __all__ = [
     "BucketInfo",
+    "BulkDeleteResult",
     "ObjectMetadata",
     "StorageBackend",
     "StorageBackendType",
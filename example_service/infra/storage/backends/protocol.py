@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any, BinaryIO, Protocol
 from frozendict import frozendict
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable
     from datetime import datetime
 
 # ============================================================================
@@ -96,6 +96,19 @@ class UploadResult:
     version_id: str | None = None
 
 
+@dataclass(frozen=True)
+class BulkDeleteResult:
+    """Result of a bulk delete operation.
+
+    Attributes:
+        deleted: Keys that were deleted (or did not exist)
+        errors: Error message by key for keys that could not be deleted
+    """
+
+    deleted: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class BucketInfo:
     """Information about a storage bucket.
@@ -202,6 +215,61 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def upload_object_multipart(
+        self,
+        key: str,
+        data: BinaryIO | AsyncIterator[bytes],
+        bucket: str | None = None,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+        acl: str | None = None,
+        storage_class: str | None = None,
+        *,
+        upload_id: str | None = None,
+        abort_on_error: bool = True,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> UploadResult:
+        """Stream an object to storage in parts without buffering it whole.
+
+        Args:
+            key: Object key/path
+            data: File-like object or async iterator of bytes
+            bucket: Target bucket (uses default if None)
+            content_type: MIME type
+            metadata: Custom metadata
+            acl: Access Control List (e.g., 'private', 'public-read')
+            storage_class: Storage tier (e.g., 'STANDARD', 'GLACIER')
+            upload_id: Resume an interrupted multipart upload
+            abort_on_error: Discard uploaded parts on failure; when False the
+                error metadata carries ``upload_id`` for resuming
+            on_progress: Called with the total bytes uploaded after each part
+
+        Returns:
+            UploadResult with upload information
+
+        Raises:
+            StorageError: If upload fails
+        """
+        ...
+
+    async def abort_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        bucket: str | None = None,
+    ) -> None:
+        """Abort a multipart upload and discard its uploaded parts.
+
+        Args:
+            key: Object key/path
+            upload_id: Multipart upload ID
+            bucket: Target bucket (uses default if None)
+
+        Raises:
+            StorageError: If the abort fails
+        """
+        ...
+
     async def download_object(
         self,
         key: str,
@@ -241,6 +309,24 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def delete_objects(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        max_concurrency: int = 4,
+    ) -> BulkDeleteResult:
+        """Delete many objects with as few requests as possible.
+
+        Args:
+            keys: Object keys/paths
+            bucket: Target bucket (uses default if None)
+            max_concurrency: Maximum concurrent bulk delete requests
+
+        Returns:
+            BulkDeleteResult with deleted keys and per-key errors
+        """
+        ...
+
     async def object_exists(
         self,
         key: str,
@@ -277,6 +363,25 @@ class StorageBackend(Protocol):
     # Advanced Object Operations
     # ========================================================================
 
+    async def get_objects_metadata(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+    ) -> dict[str, ObjectMetadata | None]:
+        """Get metadata for many objects concurrently.
+
+        Args:
+            keys: Object keys/paths
+            bucket: Source bucket (uses default if None)
+
+        Returns:
+            ObjectMetadata by key (None for objects that don't exist)
+
+        Raises:
+            StorageError: If a lookup fails for a reason other than not found
+        """
+        ...
+
     async def copy_object(
         self,
         source_key: str,
@@ -390,6 +495,27 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def generate_presigned_download_urls(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        expires_in: int = 3600,
+    ) -> dict[str, str]:
+        """Generate presigned download URLs for many objects.
+
+        Args:
+            keys: Object keys/paths
+            bucket: Target bucket (uses default if None)
+            expires_in: URL expiry in seconds
+
+        Returns:
+            Presigned URL by key
+
+        Raises:
+            StorageError: If URL generation fails
+        """
+        ...
+
     async def generate_presigned_upload_url(
         self,
         key: str,
@@ -4,5 +4,6 @@ Supports AWS S3, MinIO, LocalStack, and other S3-compatible services.
 """
 
 from .backend import S3Backend
+from .multipart import MultipartUpload
 
-__all__ = ["S3Backend"]
+__all__ = ["MultipartUpload", "S3Backend"]
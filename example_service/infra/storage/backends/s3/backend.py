@@ -8,12 +8,11 @@ S3-compatible services using aioboto3.
 from __future__ import annotations
 
 import hashlib
-from io import BytesIO
 import logging
 from typing import TYPE_CHECKING, Any, BinaryIO, Self, cast
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable
 
 from example_service.infra.storage.exceptions import (
     StorageDownloadError,
@@ -31,9 +30,12 @@ if TYPE_CHECKING:
 
 from example_service.infra.storage.backends.protocol import (
     BucketInfo,
+    BulkDeleteResult,
     ObjectMetadata,
     UploadResult,
 )
+from example_service.infra.storage.backends.s3 import bulk
+from example_service.infra.storage.backends.s3.multipart import MultipartUpload
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,50 @@ except ImportError:
     AIOBOTO3_AVAILABLE = False
 
 
+def _stream_size(data: BinaryIO) -> int | None:
+    """Rewind a file-like object and get its size, or None if unseekable."""
+    try:
+        data.seek(0, 2)
+        size = data.tell()
+        data.seek(0)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return size
+
+
+def _object_metadata(key: str, response: dict[str, Any]) -> ObjectMetadata:
+    """Build ObjectMetadata from a HeadObject response."""
+    return ObjectMetadata(
+        key=key,
+        size_bytes=response.get("ContentLength", 0),
+        content_type=response.get("ContentType"),
+        last_modified=response.get("LastModified"),
+        etag=response.get("ETag", "").strip('"'),
+        storage_class=response.get("StorageClass"),
+        custom_metadata=response.get("Metadata", {}),
+        acl=None,  # ACL requires separate call
+    )
+
+
+def _extra_args(
+    content_type: str | None,
+    metadata: dict[str, str] | None,
+    acl: str | None,
+    storage_class: str | None,
+) -> dict[str, Any]:
+    """Build optional PutObject/CreateMultipartUpload arguments."""
+    extra_args: dict[str, Any] = {}
+    if content_type:
+        extra_args["ContentType"] = content_type
+    if metadata:
+        extra_args["Metadata"] = metadata
+    if acl:
+        extra_args["ACL"] = acl
+    if storage_class:
+        extra_args["StorageClass"] = storage_class
+    return extra_args
+
+
 class S3Backend:
     """S3-compatible storage backend.
 
@@ -254,6 +300,9 @@ class S3Backend:
     ) -> UploadResult:
         """Upload an object to S3.
 
+        Objects of at least ``multipart_threshold`` bytes, and streams whose
+        size cannot be determined, are sent as a streaming multipart upload.
+
         Args:
             key: S3 object key
             data: Binary data to upload
@@ -272,31 +321,29 @@ class S3Backend:
         client = self._ensure_client()
         bucket = bucket or self.settings.bucket
 
-        # Calculate size and checksum
-        data.seek(0)
+        # Large or unsized objects are streamed instead of read into memory
+        size_bytes = _stream_size(data)
+        if size_bytes is None or size_bytes >= self.settings.multipart_threshold:
+            return await self.upload_object_multipart(
+                key,
+                data,
+                bucket=bucket,
+                content_type=content_type,
+                metadata=metadata,
+                acl=acl,
+                storage_class=storage_class,
+            )
+
         file_data = data.read()
         size_bytes = len(file_data)
         checksum_sha256 = hashlib.sha256(file_data).hexdigest()
-
-        # Reset for upload
-        file_obj = BytesIO(file_data)
-
-        # Build extra args
-        extra_args: dict[str, Any] = {}
-        if content_type:
-            extra_args["ContentType"] = content_type
-        if metadata:
-            extra_args["Metadata"] = metadata
-        if acl:
-            extra_args["ACL"] = acl
-        if storage_class:
-            extra_args["StorageClass"] = storage_class
+        extra_args = _extra_args(content_type, metadata, acl, storage_class)
 
         try:
             response = await client.put_object(
                 Bucket=bucket,
                 Key=key,
-                Body=file_obj,
+                Body=file_data,
                 **extra_args,
             )
 
@@ -337,6 +384,141 @@ class S3Backend:
                 metadata={"key": key, "bucket": bucket, "error": str(e)},
             ) from e
 
+    async def upload_object_multipart(
+        self,
+        key: str,
+        data: BinaryIO | AsyncIterator[bytes],
+        bucket: str | None = None,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+        acl: str | None = None,
+        storage_class: str | None = None,
+        *,
+        upload_id: str | None = None,
+        abort_on_error: bool = True,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> UploadResult:
+        """Stream an object to S3 as a concurrent multipart upload.
+
+        Memory use is bounded by ``multipart_max_concurrency`` parts of
+        ``multipart_part_size`` bytes, whatever the object size.
+
+        Args:
+            key: S3 object key
+            data: File-like object or async iterator of bytes
+            bucket: Target bucket (uses default if None)
+            content_type: MIME type
+            metadata: Custom metadata
+            acl: Canned ACL (e.g., 'private', 'public-read')
+            storage_class: Storage class (e.g., 'STANDARD', 'GLACIER')
+            upload_id: Resume this multipart upload, skipping uploaded parts
+            abort_on_error: Abort the upload on failure; when False the
+                error metadata carries ``upload_id`` for resuming
+            on_progress: Called with the total bytes uploaded after each part
+
+        Returns:
+            UploadResult with upload information
+
+        Raises:
+            StorageUploadError: If upload fails
+        """
+        client = self._ensure_client()
+        bucket = bucket or self.settings.bucket
+
+        size_bytes = _stream_size(data) if hasattr(data, "read") else None
+        upload = MultipartUpload(
+            client,
+            bucket,
+            key,
+            part_size=self.settings.multipart_part_size,
+            max_concurrency=self.settings.multipart_max_concurrency,
+            extra_args=_extra_args(content_type, metadata, acl, storage_class),
+            upload_id=upload_id,
+            on_progress=on_progress,
+        )
+
+        try:
+            result = await upload.upload(
+                data,
+                size=size_bytes,
+                abort_on_error=abort_on_error,
+            )
+        except ClientError as e:
+            logger.exception(
+                "Failed multipart upload to S3",
+                extra={"key": key, "upload_id": upload.upload_id, "error": str(e)},
+            )
+            error = map_boto_error(e, operation="upload", key=key)
+            if upload.upload_id is not None:
+                error.extra["upload_id"] = upload.upload_id
+            raise error from e
+        except Exception as e:
+            logger.exception(
+                "Unexpected error during S3 multipart upload",
+                extra={"key": key, "upload_id": upload.upload_id, "error": str(e)},
+            )
+            msg = f"Failed to upload {key}: {e}"
+            raise StorageUploadError(
+                msg,
+                metadata={
+                    "key": key,
+                    "bucket": bucket,
+                    "upload_id": upload.upload_id,
+                    "bytes_uploaded": upload.bytes_uploaded,
+                    "error": str(e),
+                },
+            ) from e
+
+        logger.info(
+            "Object uploaded to S3",
+            extra={
+                "key": key,
+                "bucket": bucket,
+                "size_bytes": result.size_bytes,
+                "content_type": content_type,
+                "acl": acl,
+                "storage_class": storage_class,
+                "multipart": upload.upload_id is not None,
+            },
+        )
+        return result
+
+    async def abort_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        bucket: str | None = None,
+    ) -> None:
+        """Abort a multipart upload and discard its uploaded parts.
+
+        Args:
+            key: S3 object key
+            upload_id: Multipart upload ID
+            bucket: Target bucket (uses default if None)
+
+        Raises:
+            StorageError: If the abort fails
+        """
+        client = self._ensure_client()
+        bucket = bucket or self.settings.bucket
+
+        try:
+            await client.abort_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+            )
+        except ClientError as e:
+            logger.exception(
+                "Failed to abort multipart upload", extra={"error": str(e)},
+            )
+            raise map_boto_error(e, operation="abort_upload", key=key) from e
+
+        logger.info(
+            "Aborted multipart upload",
+            extra={"key": key, "bucket": bucket, "upload_id": upload_id},
+        )
+
     async def download_object(
         self,
         key: str,
@@ -428,6 +610,41 @@ class S3Backend:
                 metadata={"key": key, "bucket": bucket, "error": str(e)},
             ) from e
 
+    async def delete_objects(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        max_concurrency: int = 4,
+    ) -> BulkDeleteResult:
+        """Delete many objects using ``DeleteObjects`` (1,000 keys per request).
+
+        Failures are reported per key rather than raised, so one bad key or
+        request does not stop the rest of the batch.
+
+        Args:
+            keys: S3 object keys
+            bucket: Target bucket (uses default if None)
+            max_concurrency: Maximum concurrent DeleteObjects requests
+
+        Returns:
+            BulkDeleteResult with deleted keys and per-key errors
+        """
+        client = self._ensure_client()
+        bucket = bucket or self.settings.bucket
+
+        deleted, errors = await bulk.delete_objects(
+            client,
+            bucket,
+            keys,
+            max_concurrency=max_concurrency,
+        )
+
+        logger.info(
+            "Objects bulk deleted from S3",
+            extra={"bucket": bucket, "deleted": len(deleted), "failed": len(errors)},
+        )
+        return BulkDeleteResult(deleted=deleted, errors=errors)
+
     async def object_exists(
         self,
         key: str,
@@ -481,17 +698,7 @@ class S3Backend:
 
         try:
             response = await client.head_object(Bucket=bucket, Key=key)
-
-            return ObjectMetadata(
-                key=key,
-                size_bytes=response.get("ContentLength", 0),
-                content_type=response.get("ContentType"),
-                last_modified=response.get("LastModified"),
-                etag=response.get("ETag", "").strip('"'),
-                storage_class=response.get("StorageClass"),
-                custom_metadata=response.get("Metadata", {}),
-                acl=None,  # ACL requires separate call
-            )
+            return _object_metadata(key, response)
 
         except ClientError as e:
             error_code = (
@@ -516,6 +723,53 @@ class S3Backend:
                 metadata={"key": key, "bucket": bucket, "error": str(e)},
             ) from e
 
+    async def get_objects_metadata(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+    ) -> dict[str, ObjectMetadata | None]:
+        """Get metadata for many objects with concurrent HEAD requests.
+
+        Concurrency is capped at the connection pool size.
+
+        Args:
+            keys: S3 object keys
+            bucket: Target bucket (uses default if None)
+
+        Returns:
+            ObjectMetadata by key (None for objects that don't exist)
+        """
+        client = self._ensure_client()
+        bucket = bucket or self.settings.bucket
+
+        try:
+            responses = await bulk.head_objects(
+                client,
+                bucket,
+                keys,
+                max_concurrency=self.settings.max_pool_connections,
+            )
+        except ClientError as e:
+            logger.exception(
+                "Failed to get object metadata from S3", extra={"error": str(e)},
+            )
+            raise map_boto_error(e, operation="get_object_metadata") from e
+        except Exception as e:
+            logger.exception(
+                "Unexpected error getting object metadata", extra={"error": str(e)},
+            )
+            msg = f"Failed to get metadata for {len(keys)} objects: {e}"
+            raise StorageError(
+                msg,
+                code="STORAGE_METADATA_ERROR",
+                metadata={"bucket": bucket, "keys": len(keys), "error": str(e)},
+            ) from e
+
+        return {
+            key: _object_metadata(key, response) if response is not None else None
+            for key, response in responses.items()
+        }
+
     # ========================================================================
     # Advanced Object Operations
     # ========================================================================
@@ -805,6 +1059,49 @@ class S3Backend:
                 metadata={"key": key, "bucket": bucket, "error": str(e)},
             ) from e
 
+    async def generate_presigned_download_urls(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        expires_in: int = 3600,
+    ) -> dict[str, str]:
+        """Generate presigned download URLs for many objects.
+
+        URLs are signed locally in one pass, without a request per key.
+
+        Args:
+            keys: Object keys/paths
+            bucket: Target bucket (uses default if None)
+            expires_in: URL expiry in seconds
+
+        Returns:
+            Presigned URL by key
+
+        Raises:
+            StorageError: If URL generation fails
+        """
+        client = self._ensure_client()
+        bucket = bucket or self.settings.bucket
+
+        try:
+            urls = await bulk.presign_get_urls(client, bucket, keys, expires_in)
+        except Exception as e:
+            logger.exception(
+                "Failed to generate presigned URLs", extra={"error": str(e)},
+            )
+            msg = f"Failed to generate presigned URLs: {e}"
+            raise StorageError(
+                msg,
+                code="STORAGE_PRESIGNED_URL_ERROR",
+                metadata={"bucket": bucket, "keys": len(keys), "error": str(e)},
+            ) from e
+
+        logger.debug(
+            "Generated presigned download URLs",
+            extra={"bucket": bucket, "count": len(urls), "expires_in": expires_in},
+        )
+        return urls
+
     async def generate_presigned_upload_url(
         self,
         key: str,
@@ -0,0 +1,151 @@
+"""Bulk object operations for S3-compatible storage.
+
+S3 has no batch HEAD or presign API, but it does delete up to 1,000 keys per
+``DeleteObjects`` request. These helpers turn per-key loops into as few
+requests as possible:
+
+- ``delete_objects`` chunks keys into ``DeleteObjects`` requests and runs a
+  few of them concurrently, so deleting 100k keys takes 100 requests.
+- ``head_objects`` fans HEAD requests out under a concurrency cap.
+- ``presign_get_urls`` signs URLs locally in a single loop; presigning makes
+  no network calls, so it only needs to skip the per-call logging and error
+  wrapping of the single-key method.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, cast
+
+logger = logging.getLogger(__name__)
+
+# Maximum keys per DeleteObjects request (S3 limit)
+DELETE_BATCH_SIZE = 1000
+
+# Error codes meaning a HEAD target does not exist
+_NOT_FOUND_CODES = frozenset({"NoSuchKey", "404", "NotFound"})
+
+
+async def delete_objects(
+    client: Any,
+    bucket: str,
+    keys: list[str],
+    *,
+    max_concurrency: int = 4,
+) -> tuple[list[str], dict[str, str]]:
+    """Delete keys with as few ``DeleteObjects`` requests as possible.
+
+    Requests use quiet mode, so responses only list failures. A request that
+    fails as a whole (e.g. access denied) marks all of its keys as failed
+    instead of aborting the remaining requests.
+
+    Args:
+        client: aioboto3 S3 client
+        bucket: Bucket to delete from
+        keys: Object keys (duplicates are deleted once)
+        max_concurrency: Maximum concurrent ``DeleteObjects`` requests
+
+    Returns:
+        Tuple of (deleted keys, {failed key: error message})
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    errors: dict[str, str] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def delete_batch(batch: list[str]) -> None:
+        async with semaphore:
+            try:
+                response = await client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                logger.warning(
+                    "DeleteObjects request failed",
+                    extra={"bucket": bucket, "keys": len(batch), "error": str(e)},
+                )
+                errors.update(dict.fromkeys(batch, str(e)))
+                return
+
+            for error in response.get("Errors", []):
+                errors[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+
+    await asyncio.gather(
+        *(
+            delete_batch(unique_keys[start : start + DELETE_BATCH_SIZE])
+            for start in range(0, len(unique_keys), DELETE_BATCH_SIZE)
+        ),
+    )
+
+    deleted = [key for key in unique_keys if key not in errors]
+    return deleted, errors
+
+
+async def head_objects(
+    client: Any,
+    bucket: str,
+    keys: list[str],
+    *,
+    max_concurrency: int = 10,
+) -> dict[str, dict[str, Any] | None]:
+    """HEAD many keys concurrently.
+
+    Args:
+        client: aioboto3 S3 client
+        bucket: Bucket holding the keys
+        keys: Object keys
+        max_concurrency: Maximum concurrent HEAD requests
+
+    Returns:
+        {key: HeadObject response, or None if the object does not exist}
+
+    Raises:
+        ClientError: For failures other than a missing object
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def head(key: str) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return cast("dict[str, Any]", await client.head_object(Bucket=bucket, Key=key))
+            except Exception as e:
+                response = getattr(e, "response", None) or {}
+                if response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                    return None
+                raise
+
+    unique_keys = list(dict.fromkeys(keys))
+    responses = await asyncio.gather(*(head(key) for key in unique_keys))
+    return dict(zip(unique_keys, responses, strict=True))
+
+
+async def presign_get_urls(
+    client: Any,
+    bucket: str,
+    keys: list[str],
+    expires_in: int,
+) -> dict[str, str]:
+    """Generate presigned GET URLs for many keys.
+
+    Args:
+        client: aioboto3 S3 client
+        bucket: Bucket holding the keys
+        keys: Object keys
+        expires_in: URL expiry in seconds
+
+    Returns:
+        {key: presigned URL}
+    """
+    urls: dict[str, str] = {}
+    for key in keys:
+        if key not in urls:
+            urls[key] = await client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=expires_in,
+            )
+    return urls
+
+
+__all__ = ["DELETE_BATCH_SIZE", "delete_objects", "head_objects", "presign_get_urls"]
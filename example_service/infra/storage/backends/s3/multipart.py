@@ -0,0 +1,374 @@
+"""Streaming multipart uploads for S3-compatible storage.
+
+``MultipartUpload`` uploads a file or byte stream without ever holding the
+whole object in memory. The source is read one part at a time, hashed
+incrementally, and up to ``max_concurrency`` parts are in flight at once, so
+memory stays at roughly ``(max_concurrency + 1) * part_size`` regardless of
+object size.
+
+Uploads that fail with ``abort_on_error=False`` keep their ``upload_id`` and
+can be resumed: parts S3 already holds (same size and MD5 ETag) are skipped,
+so only the missing parts are sent again.
+
+Example:
+    upload = MultipartUpload(client, "bucket", "videos/big.mp4", max_concurrency=4)
+    result = await upload.upload(open("big.mp4", "rb"))
+
+    # Resume an interrupted upload
+    upload = MultipartUpload(client, "bucket", "videos/big.mp4", upload_id=upload_id)
+    result = await upload.upload(open("big.mp4", "rb"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from example_service.infra.storage.backends.protocol import UploadResult
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable
+
+logger = logging.getLogger(__name__)
+
+# S3 limits: every part but the last must be at least 5MB, at most 10,000 parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+
+def part_size_for(size: int | None, part_size: int) -> int:
+    """Get the part size to use for an object of a known size.
+
+    Grows ``part_size`` when the object would otherwise need more than
+    ``MAX_PARTS`` parts.
+    """
+    if size is None:
+        return part_size
+    return max(part_size, -(-size // MAX_PARTS))
+
+
+def _read_part(source: BinaryIO, size: int) -> bytes:
+    """Read up to ``size`` bytes, retrying short reads until EOF."""
+    chunk = source.read(size)
+    if not chunk or len(chunk) == size:
+        return chunk
+    buffer = bytearray(chunk)
+    while len(buffer) < size:
+        chunk = source.read(size - len(buffer))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+async def iter_parts(
+    source: BinaryIO | AsyncIterator[bytes],
+    part_size: int,
+) -> AsyncGenerator[bytes]:
+    """Split a file or byte stream into ``part_size`` chunks.
+
+    File reads run in a worker thread so the event loop is never blocked on
+    disk I/O. Every chunk except the last is exactly ``part_size`` bytes.
+    """
+    if hasattr(source, "__aiter__"):
+        buffer = bytearray()
+        async for chunk in source:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                yield bytes(buffer[:part_size])
+                del buffer[:part_size]
+        if buffer:
+            yield bytes(buffer)
+        return
+
+    while chunk := await asyncio.to_thread(_read_part, source, part_size):
+        yield chunk
+
+
+class MultipartUpload:
+    """Upload one object to S3 as a streaming, concurrent multipart upload.
+
+    Objects smaller than one part are sent with a single ``PutObject``; the
+    multipart upload is only created once a second part is needed.
+
+    Attributes:
+        upload_id: S3 multipart upload ID (``None`` until created or after abort)
+        bytes_uploaded: Bytes confirmed by S3 so far
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        *,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        extra_args: dict[str, Any] | None = None,
+        upload_id: str | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """Initialize a multipart upload.
+
+        Args:
+            client: aioboto3 S3 client
+            bucket: Target bucket
+            key: Object key
+            part_size: Part size in bytes (at least ``MIN_PART_SIZE``)
+            max_concurrency: Maximum parts uploaded in parallel
+            extra_args: Extra ``PutObject``/``CreateMultipartUpload`` arguments
+                (ContentType, Metadata, ACL, StorageClass)
+            upload_id: Existing upload to resume
+            on_progress: Called with the total bytes uploaded after each part
+
+        Raises:
+            ValueError: If the part size or concurrency is out of range
+        """
+        if part_size < MIN_PART_SIZE:
+            msg = f"part_size must be at least {MIN_PART_SIZE} bytes"
+            raise ValueError(msg)
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.extra_args = extra_args or {}
+        self.upload_id = upload_id
+        self.on_progress = on_progress
+        self.bytes_uploaded = 0
+
+        self._etags: dict[int, str] = {}
+        self._failure: BaseException | None = None
+
+    async def upload(
+        self,
+        source: BinaryIO | AsyncIterator[bytes],
+        *,
+        size: int | None = None,
+        abort_on_error: bool = True,
+    ) -> UploadResult:
+        """Stream ``source`` to S3.
+
+        Args:
+            source: File-like object or async iterator of bytes
+            size: Total size if known (raises the part size above
+                ``MAX_PARTS`` parts)
+            abort_on_error: Abort the multipart upload on failure; when False
+                ``upload_id`` is kept so the upload can be resumed
+
+        Returns:
+            UploadResult with the object's size and SHA256 checksum
+
+        Raises:
+            ValueError: If the stream needs more than ``MAX_PARTS`` parts
+        """
+        part_size = part_size_for(size, self.part_size)
+        parts = iter_parts(source, part_size)
+        try:
+            first = await anext(parts, b"")
+            if self.upload_id is None and len(first) < part_size:
+                return await self._put_single(first)
+            return await self._upload_parts(first, parts, abort_on_error)
+        finally:
+            await parts.aclose()
+
+    async def abort(self) -> None:
+        """Abort the multipart upload and discard uploaded parts."""
+        if self.upload_id is None:
+            return
+        await self.client.abort_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+        )
+        logger.info(
+            "Aborted multipart upload",
+            extra={"key": self.key, "bucket": self.bucket, "upload_id": self.upload_id},
+        )
+        self.upload_id = None
+
+    async def _put_single(self, body: bytes) -> UploadResult:
+        response = await self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Body=body,
+            **self.extra_args,
+        )
+        self._record_progress(len(body))
+        return UploadResult(
+            key=self.key,
+            bucket=self.bucket,
+            etag=response.get("ETag", "").strip('"'),
+            size_bytes=len(body),
+            checksum_sha256=hashlib.sha256(body).hexdigest(),
+            version_id=response.get("VersionId"),
+        )
+
+    async def _upload_parts(
+        self,
+        chunk: bytes,
+        parts: AsyncIterator[bytes],
+        abort_on_error: bool,
+    ) -> UploadResult:
+        if self.upload_id is None:
+            response = await self.client.create_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                **self.extra_args,
+            )
+            self.upload_id = response["UploadId"]
+            existing: dict[int, dict[str, Any]] = {}
+        else:
+            existing = await self._list_parts()
+
+        checksum = hashlib.sha256()
+        size_bytes = 0
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: set[asyncio.Task[None]] = set()
+
+        def settle(task: asyncio.Task[None]) -> None:
+            # Failed parts stay until gathered so their error is raised
+            # (and retrieved) instead of being dropped with the task
+            if not task.cancelled() and task.exception() is None:
+                in_flight.discard(task)
+
+        try:
+            part_number = 1
+            while chunk:
+                if part_number > MAX_PARTS:
+                    msg = f"Upload of {self.key} needs more than {MAX_PARTS} parts"
+                    raise ValueError(msg)
+
+                checksum.update(chunk)
+                size_bytes += len(chunk)
+
+                if self._already_uploaded(existing.get(part_number), chunk):
+                    self._etags[part_number] = existing[part_number]["ETag"]
+                    self._record_progress(len(chunk))
+                else:
+                    # Acquire before reading on so at most max_concurrency
+                    # parts (plus the one being read) are held in memory
+                    await semaphore.acquire()
+                    if self._failure is not None:
+                        semaphore.release()
+                        raise self._failure
+                    task = asyncio.create_task(
+                        self._upload_part(part_number, chunk, semaphore),
+                    )
+                    in_flight.add(task)
+                    task.add_done_callback(settle)
+
+                chunk = await anext(parts, b"")
+                part_number += 1
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+
+            response = await self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": etag}
+                        for number, etag in sorted(self._etags.items())
+                    ],
+                },
+            )
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if abort_on_error:
+                with contextlib.suppress(Exception):
+                    await self.abort()
+            raise
+
+        logger.debug(
+            "Completed multipart upload",
+            extra={
+                "key": self.key,
+                "bucket": self.bucket,
+                "parts": len(self._etags),
+                "resumed_parts": len(existing),
+                "size_bytes": size_bytes,
+            },
+        )
+        return UploadResult(
+            key=self.key,
+            bucket=self.bucket,
+            etag=response.get("ETag", "").strip('"'),
+            size_bytes=size_bytes,
+            checksum_sha256=checksum.hexdigest(),
+            version_id=response.get("VersionId"),
+        )
+
+    async def _upload_part(
+        self,
+        part_number: int,
+        body: bytes,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            response = await self.client.upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            self._etags[part_number] = response["ETag"]
+            self._record_progress(len(body))
+        except Exception as e:
+            if self._failure is None:
+                self._failure = e
+            raise
+        finally:
+            semaphore.release()
+
+    async def _list_parts(self) -> dict[int, dict[str, Any]]:
+        """Get the parts S3 already holds for a resumed upload."""
+        parts: dict[int, dict[str, Any]] = {}
+        kwargs: dict[str, Any] = {}
+        while True:
+            response = await self.client.list_parts(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                **kwargs,
+            )
+            for part in response.get("Parts", []):
+                parts[part["PartNumber"]] = part
+            if not response.get("IsTruncated"):
+                return parts
+            kwargs["PartNumberMarker"] = response["NextPartNumberMarker"]
+
+    @staticmethod
+    def _already_uploaded(part: dict[str, Any] | None, chunk: bytes) -> bool:
+        if part is None or part.get("Size") != len(chunk):
+            return False
+        md5 = hashlib.md5(chunk, usedforsecurity=False).hexdigest()
+        etag: str = part.get("ETag", "")
+        return etag.strip('"') == md5
+
+    def _record_progress(self, size: int) -> None:
+        self.bytes_uploaded += size
+        if self.on_progress is not None:
+            self.on_progress(self.bytes_uploaded)
+
+
+__all__ = [
+    "MAX_PARTS",
+    "MIN_PART_SIZE",
+    "MultipartUpload",
+    "iter_parts",
+    "part_size_for",
+]
@@ -929,7 +929,7 @@ class StorageClient:
         Args:
             keys: List of S3 object keys to delete.
             dry_run: If True, only preview what would be deleted (default: True).
-            max_concurrency: Maximum number of concurrent deletions (default: 10).
+            max_concurrency: Maximum concurrent bulk delete requests (default: 10).
 
         Returns:
             Dictionary with deletion results:
@@ -963,49 +963,17 @@ class StorageClient:
                 "total": len(keys),
             }
 
-        semaphore = asyncio.Semaphore(max_concurrency)
-        deleted = []
-        failed = []
+        from example_service.infra.storage.backends.s3.bulk import delete_objects
 
-        async def delete_one(key: str) -> tuple[str, bool, str | None]:
-            """Delete a single file with semaphore control."""
-            async with semaphore:
-                try:
-                    await self.delete_file(key=key)
-                    logger.debug("Successfully deleted file in batch: %s", key)
-                    return (key, True, None)
-
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.warning(
-                        "Failed to delete file in batch: %s",
-                        key,
-                        extra={"error": error_msg},
-                    )
-                    return (key, False, error_msg)
-
-        # Execute all deletions concurrently with error handling
-        tasks = [delete_one(key) for key in keys]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                key = keys[i]
-                error_msg = str(result)
-                logger.error("Unexpected error deleting %s: %s", key, error_msg)
-                failed.append({"key": key, "error": error_msg})
-            # Type narrowing: result is tuple[str, bool, str | None] here
-            elif isinstance(result, tuple) and len(result) == 3:
-                key, success, error = result
-                if success:
-                    deleted.append(key)
-                else:
-                    failed.append({"key": key, "error": error or "Unknown error"})
-            else:
-                # Fallback for unexpected result type
-                logger.warning("Unexpected result type: %s", type(result))
-                failed.append({"key": keys[i], "error": "Unexpected result format"})
+        # Keys go out in DeleteObjects requests of up to 1,000 keys each
+        s3 = await self.ensure_client()
+        deleted, errors = await delete_objects(
+            s3,
+            self.settings.bucket,
+            keys,
+            max_concurrency=max_concurrency,
+        )
+        failed = [{"key": key, "error": error} for key, error in errors.items()]
 
         logger.info(
             "Batch deletion completed: %s/%s deleted",
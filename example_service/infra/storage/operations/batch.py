@@ -231,18 +231,22 @@ async def batch_download(
 
 
 async def batch_delete(
-    client: Any,  # StorageClient
+    client: Any,  # StorageService
     keys: list[str],
-    max_concurrency: int = 10,
+    max_concurrency: int = 4,
     dry_run: bool = False,
+    bucket: str | None = None,
 ) -> BatchResult:
     """Delete multiple files with dry-run support.
 
+    Keys are deleted with bulk delete requests of up to 1,000 keys each.
+
     Args:
-        client: Storage client instance
+        client: Storage service instance
         keys: List of S3 object keys to delete
-        max_concurrency: Maximum concurrent deletes
+        max_concurrency: Maximum concurrent bulk delete requests
         dry_run: If True, simulates deletion without actually deleting
+        bucket: Optional bucket override
 
     Returns:
         BatchResult with deletion outcomes
@@ -262,18 +266,19 @@ async def batch_delete(
             duration_seconds=time.perf_counter() - start_time,
         )
 
-    semaphore = asyncio.Semaphore(max_concurrency)
-
-    async def delete_one(key: str) -> dict[str, Any]:
-        async with semaphore:
-            try:
-                success = await client.delete_file(key)
-                return {"key": key, "success": success}
-            except Exception as e:
-                return {"key": key, "success": False, "error": str(e)}
+    outcome = await client.delete_files(
+        keys,
+        bucket=bucket,
+        max_concurrency=max_concurrency,
+    )
 
-    tasks = [delete_one(key) for key in keys]
-    results = await asyncio.gather(*tasks)
+    errors = {item["key"]: item["error"] for item in outcome["failed"]}
+    results = [
+        {"key": key, "success": False, "error": errors[key]}
+        if key in errors
+        else {"key": key, "success": True}
+        for key in keys
+    ]
 
     duration = time.perf_counter() - start_time
     successful = sum(1 for r in results if r.get("success"))
@@ -165,15 +165,17 @@ async def generate_upload_url(
 
 
 async def generate_bulk_download_urls(
-    client: Any,  # StorageClient
+    client: Any,  # StorageService
     keys: list[str],
     expires_in: int | None = None,
     bucket: str | None = None,
 ) -> list[PresignedDownloadUrl]:
     """Generate presigned download URLs for multiple files.
 
+    URLs are signed locally in a single pass.
+
     Args:
-        client: Storage client instance
+        client: Storage service instance
         keys: List of S3 object keys
         expires_in: Expiry in seconds (same for all URLs)
         bucket: Optional bucket override
@@ -181,10 +183,16 @@ async def generate_bulk_download_urls(
     Returns:
         List of PresignedDownloadUrl objects
     """
-    import asyncio
-
-    async def generate_one(key: str) -> PresignedDownloadUrl:
-        return await generate_download_url(client, key, expires_in, bucket)
-
-    tasks = [generate_one(key) for key in keys]
-    return await asyncio.gather(*tasks)
+    expires_in = expires_in or client.settings.presigned_url_expiry_seconds
+    urls = await client.get_presigned_urls(keys, expires_in, bucket)
+    expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+
+    return [
+        PresignedDownloadUrl(
+            url=urls[key],
+            key=key,
+            expires_at=expires_at,
+            expires_in_seconds=expires_in,
+        )
+        for key in keys
+    ]
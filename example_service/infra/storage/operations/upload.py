@@ -4,6 +4,9 @@ Provides memory-efficient upload operations for large files with:
 - Async streaming from any data source
 - Progress tracking callbacks
 - Chunked multipart uploads for large files
+
+Streams and files are sent as multipart uploads, so memory use is bounded by
+the configured part size and concurrency rather than the object size.
 """
 
 from __future__ import annotations
@@ -21,7 +24,7 @@ logger = logging.getLogger(__name__)
 
 
 async def upload_stream(
-    client: Any,  # StorageClient
+    client: Any,  # StorageService
     key: str,
     data_stream: AsyncIterator[bytes],
     content_type: str | None = None,
@@ -31,17 +34,17 @@ async def upload_stream(
 ) -> dict[str, Any]:
     """Upload file from an async byte stream.
 
-    Collects streamed data and uploads to S3. For very large files,
-    consider using multipart upload directly.
+    The stream is uploaded part by part as it is consumed; it is never
+    collected into memory.
 
     Args:
-        client: Storage client instance
+        client: Storage service instance
         key: S3 object key
         data_stream: Async iterator yielding bytes
         content_type: MIME content type
         metadata: Custom metadata
         bucket: Optional bucket override
-        chunk_size: Size of chunks to read from stream
+        chunk_size: Unused; parts are sized by ``STORAGE_MULTIPART_PART_SIZE``
 
     Returns:
         Upload result dict
@@ -55,25 +58,10 @@ async def upload_stream(
             client, "data.bin", generate_data()
         )
     """
-    from io import BytesIO
-
-    # Collect stream into buffer
-    buffer = BytesIO()
-    total_size = 0
-
-    async for chunk in data_stream:
-        buffer.write(chunk)
-        total_size += len(chunk)
+    logger.debug("Uploading streamed data", extra={"key": key})
 
-    buffer.seek(0)
-
-    logger.debug(
-        "Uploading streamed data",
-        extra={"key": key, "size_bytes": total_size},
-    )
-
-    result = await client.upload_file(
-        file_obj=buffer,
+    result = await client.upload_file_multipart(
+        file_obj=data_stream,
         key=key,
         content_type=content_type,
         metadata=metadata,
@@ -83,7 +71,7 @@ async def upload_stream(
 
 
 async def upload_file_chunked(
-    client: Any,  # StorageClient
+    client: Any,  # StorageService
     file_path: Path,
     key: str,
     content_type: str | None = None,
@@ -94,16 +82,17 @@ async def upload_file_chunked(
 ) -> dict[str, Any]:
     """Upload a large file with progress tracking.
 
-    Reads file in chunks and provides progress callbacks.
+    Streams the file as a multipart upload and reports progress as parts
+    are confirmed.
 
     Args:
-        client: Storage client instance
+        client: Storage service instance
         file_path: Path to file to upload
         key: S3 object key
         content_type: MIME content type (auto-detected if not provided)
         metadata: Custom metadata
         bucket: Optional bucket override
-        chunk_size: Size of chunks for reading
+        chunk_size: Unused; parts are sized by ``STORAGE_MULTIPART_PART_SIZE``
         on_progress: Callback(bytes_uploaded, total_bytes)
 
     Returns:
@@ -120,7 +109,6 @@ async def upload_file_chunked(
             on_progress=progress,
         )
     """
-    from io import BytesIO
     import mimetypes
 
     file_size = file_path.stat().st_size
@@ -139,29 +127,19 @@ async def upload_file_chunked(
         },
     )
 
-    # Read file and track progress
-    buffer = BytesIO()
-    bytes_read = 0
+    def report(uploaded: int) -> None:
+        if on_progress:
+            on_progress(uploaded, file_size)
 
     with open(file_path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            buffer.write(chunk)
-            bytes_read += len(chunk)
-            if on_progress:
-                on_progress(bytes_read, file_size)
-
-    buffer.seek(0)
-
-    result = await client.upload_file(
-        file_obj=buffer,
-        key=key,
-        content_type=content_type,
-        metadata=metadata,
-        bucket=bucket,
-    )
+        result = await client.upload_file_multipart(
+            file_obj=f,
+            key=key,
+            content_type=content_type,
+            metadata=metadata,
+            bucket=bucket,
+            on_progress=report,
+        )
     return dict(result)
 
 
@@ -15,6 +15,8 @@ import logging
 from typing import TYPE_CHECKING, Any, BinaryIO
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
     from example_service.core.settings.storage import StorageSettings
 
 from example_service.core.settings import get_storage_settings
@@ -278,6 +280,98 @@ class StorageService:
             ctx["checksum"] = result["checksum_sha256"]
             return result
 
+    async def upload_file_multipart(
+        self,
+        file_obj: BinaryIO | AsyncIterator[bytes],
+        key: str,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+        bucket: str | None = None,
+        acl: str | None = None,
+        storage_class: str | None = None,
+        tenant_context: TenantContext | None = None,
+        *,
+        upload_id: str | None = None,
+        abort_on_error: bool = True,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> dict[str, Any]:
+        """Stream a large file to storage as a multipart upload.
+
+        Unlike ``upload_file`` the object is never held in memory as a
+        whole, and async byte streams are accepted directly.
+
+        Args:
+            file_obj: File-like object or async iterator of bytes
+            key: S3 object key
+            content_type: MIME content type
+            metadata: Custom metadata
+            bucket: Optional bucket override
+            acl: Access Control List (e.g., 'private', 'public-read')
+            storage_class: Storage class (e.g., 'STANDARD', 'GLACIER')
+            tenant_context: Optional tenant context for multi-tenant storage
+            upload_id: Resume an interrupted multipart upload
+            abort_on_error: Discard uploaded parts on failure; when False the
+                error metadata carries ``upload_id`` for resuming
+            on_progress: Called with the total bytes uploaded after each part
+
+        Returns:
+            Upload result dict with key, bucket, etag, size_bytes, checksum, version_id
+        """
+        backend = self._ensure_ready()
+
+        resolved_bucket = self._resolve_bucket(tenant_context, bucket)
+        acl = acl or self._settings.default_acl
+        storage_class = storage_class or self._settings.default_storage_class
+
+        async with track_storage_operation(
+            "upload",
+            key=key,
+            bucket=resolved_bucket,
+            content_type=content_type,
+            metadata={"multipart": True},
+        ) as ctx:
+            upload_result = await backend.upload_object_multipart(
+                key=key,
+                data=file_obj,
+                bucket=resolved_bucket,
+                content_type=content_type,
+                metadata=metadata,
+                acl=acl,
+                storage_class=storage_class,
+                upload_id=upload_id,
+                abort_on_error=abort_on_error,
+                on_progress=on_progress,
+            )
+
+            result = {
+                "key": upload_result.key,
+                "bucket": upload_result.bucket,
+                "etag": upload_result.etag,
+                "size_bytes": upload_result.size_bytes,
+                "checksum_sha256": upload_result.checksum_sha256,
+                "version_id": upload_result.version_id,
+            }
+
+            ctx["result_size"] = result["size_bytes"]
+            ctx["checksum"] = result["checksum_sha256"]
+            return result
+
+    async def abort_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        bucket: str | None = None,
+    ) -> None:
+        """Abort a multipart upload left open by a failed upload.
+
+        Args:
+            key: S3 object key
+            upload_id: Multipart upload ID from the failed upload's error
+            bucket: Optional bucket override
+        """
+        backend = self._ensure_ready()
+        await backend.abort_multipart_upload(key, upload_id, bucket)
+
     async def download_file(
         self,
         key: str,
@@ -326,6 +420,50 @@ class StorageService:
         ):
             return await backend.delete_object(key, bucket)
 
+    async def delete_files(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, Any]:
+        """Delete many files with bulk delete requests.
+
+        Args:
+            keys: S3 object keys
+            bucket: Optional bucket override
+            max_concurrency: Maximum concurrent bulk delete requests
+
+        Returns:
+            Dict with ``deleted`` keys, ``failed`` [{"key", "error"}] and ``total``
+        """
+        backend = self._ensure_ready()
+
+        async with track_storage_operation(
+            "batch_delete",
+            bucket=bucket or self._settings.bucket,
+            metadata={"keys": len(keys)},
+        ) as ctx:
+            result = await backend.delete_objects(keys, bucket, max_concurrency)
+            ctx["deleted"] = len(result.deleted)
+            ctx["failed"] = len(result.errors)
+
+        from .metrics import record_batch_operation
+
+        record_batch_operation(
+            "batch_delete",
+            total_count=len(keys),
+            success_count=len(result.deleted),
+            failure_count=len(result.errors),
+        )
+
+        return {
+            "deleted": result.deleted,
+            "failed": [
+                {"key": key, "error": error} for key, error in result.errors.items()
+            ],
+            "total": len(keys),
+        }
+
     async def file_exists(
         self,
         key: str,
@@ -373,6 +511,38 @@ class StorageService:
             "acl": metadata.acl,
         }
 
+    async def get_files_info(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get metadata for many files concurrently.
+
+        Args:
+            keys: S3 object keys
+            bucket: Optional bucket override
+
+        Returns:
+            File info dict by key (None for files that don't exist)
+        """
+        backend = self._ensure_ready()
+        metadata_by_key = await backend.get_objects_metadata(keys, bucket)
+        return {
+            key: None
+            if metadata is None
+            else {
+                "key": metadata.key,
+                "size_bytes": metadata.size_bytes,
+                "content_type": metadata.content_type,
+                "last_modified": metadata.last_modified,
+                "etag": metadata.etag,
+                "storage_class": metadata.storage_class,
+                "metadata": metadata.custom_metadata,
+                "acl": metadata.acl,
+            }
+            for key, metadata in metadata_by_key.items()
+        }
+
     async def get_presigned_url(
         self,
         key: str,
@@ -399,6 +569,32 @@ class StorageService:
             key, bucket, expires_in or self._settings.presigned_url_expiry_seconds,
         )
 
+    async def get_presigned_urls(
+        self,
+        keys: list[str],
+        expires_in: int | None = None,
+        bucket: str | None = None,
+    ) -> dict[str, str]:
+        """Generate presigned download URLs for many keys.
+
+        Args:
+            keys: S3 object keys
+            expires_in: URL expiry in seconds
+            bucket: Optional bucket override
+
+        Returns:
+            Presigned URL by key
+        """
+        backend = self._ensure_ready()
+
+        from .metrics import storage_presigned_urls_generated
+
+        urls = await backend.generate_presigned_download_urls(
+            keys, bucket, expires_in or self._settings.presigned_url_expiry_seconds,
+        )
+        storage_presigned_urls_generated.labels(type="download").inc(len(urls))
+        return urls
+
     async def generate_presigned_upload(
         self,
         key: str,
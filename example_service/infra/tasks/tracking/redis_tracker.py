@@ -2,6 +2,11 @@
 
 This module provides a Redis implementation of the task tracker interface,
 storing task execution data in Redis with configurable TTL.
+
+Read paths batch their Redis commands: execution records are fetched with one
+pipelined round trip per page, and summary statistics come from counters and
+a rolling duration sample maintained on write, so the tasks dashboard and API
+cost a constant number of round trips regardless of history size.
 """
 
 from __future__ import annotations
@@ -26,6 +31,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of recent successful task durations kept for the average
+DURATION_SAMPLE_SIZE = 100
+
+# Task IDs fetched per pipelined round trip when scanning an index
+HISTORY_SCAN_BATCH_SIZE = 500
+
 
 class RedisTaskTracker(BaseTaskTracker):
     """Task execution tracker using Redis storage.
@@ -42,6 +53,8 @@ class RedisTaskTracker(BaseTaskTracker):
     - {prefix}:index:all - Sorted set of all task IDs by timestamp
     - {prefix}:index:name:{name} - Sorted set of task IDs by task name
     - {prefix}:index:status:{status} - Sorted set of task IDs by status
+    - {prefix}:stats:by_name - Hash of task counts by task name
+    - {prefix}:stats:durations - List of recent successful task durations
 
     Example:
             tracker = RedisTaskTracker(
@@ -101,6 +114,29 @@ class RedisTaskTracker(BaseTaskTracker):
     def _index_status_key(self, status: str) -> str:
         return f"{self.key_prefix}:index:status:{status}"
 
+    def _stats_by_name_key(self) -> str:
+        return f"{self.key_prefix}:stats:by_name"
+
+    def _stats_durations_key(self) -> str:
+        return f"{self.key_prefix}:stats:durations"
+
+    async def _fetch_records(self, task_ids: list[Any]) -> list[dict[str, str]]:
+        """Fetch execution records for several tasks in one round trip.
+
+        Args:
+            task_ids: Task IDs to fetch, as read from an index sorted set.
+
+        Returns:
+            Execution hashes in the same order (empty for expired records).
+        """
+        if not task_ids:
+            return []
+
+        pipe = self.client.pipeline(transaction=False)
+        for task_id in task_ids:
+            pipe.hgetall(self._exec_key(task_id))
+        return cast("list[dict[str, str]]", await pipe.execute())
+
     async def connect(self) -> None:
         """Establish connection to Redis."""
         logger.info("Connecting to Redis for task tracking")
@@ -232,6 +268,9 @@ class RedisTaskTracker(BaseTaskTracker):
             pipe.zadd(self._index_name_key(task_name), {task_id: timestamp})
             pipe.zadd(self._index_status_key("running"), {task_id: timestamp})
 
+            # Per-name counter mirrors the name index size for get_stats
+            pipe.hincrby(self._stats_by_name_key(), task_name, 1)
+
             await pipe.execute()
 
             logger.debug(
@@ -263,17 +302,15 @@ class RedisTaskTracker(BaseTaskTracker):
             exec_key = self._exec_key(task_id)
             running_key = self._running_key(task_id)
 
-            # Get current task data
-            task_data = await self.client.hgetall(exec_key)
-            if not task_data:
+            # Only the name is needed from the current record
+            task_name = await self.client.hget(exec_key, "task_name")
+            if task_name is None:
                 logger.warning(
                     "Task execution record not found",
                     extra={"task_id": task_id},
                 )
                 return
 
-            task_name = task_data.get("task_name", "unknown")
-
             # Serialize return value
             return_value_str = ""
             if return_value is not None:
@@ -317,6 +354,11 @@ class RedisTaskTracker(BaseTaskTracker):
             pipe.zrem(self._index_status_key("running"), task_id)
             pipe.zadd(self._index_status_key(status), {task_id: timestamp})
 
+            # Rolling sample of successful durations for get_stats
+            if status == "success":
+                pipe.lpush(self._stats_durations_key(), duration_ms)
+                pipe.ltrim(self._stats_durations_key(), 0, DURATION_SAMPLE_SIZE - 1)
+
             await pipe.execute()
 
             logger.debug(
@@ -350,10 +392,8 @@ class RedisTaskTracker(BaseTaskTracker):
                 return []
 
             tasks = []
-            for task_id in task_ids:
-                exec_key = self._exec_key(task_id)
-                task_data = await self.client.hgetall(exec_key)
-
+            records = await self._fetch_records(task_ids)
+            for task_id, task_data in zip(task_ids, records, strict=True):
                 if task_data:
                     started_at = task_data.get("started_at", "")
                     running_for_ms = 0
@@ -449,74 +489,89 @@ class RedisTaskTracker(BaseTaskTracker):
             else:
                 index_key = self._index_all_key()
 
-            # Get task IDs from index (newest first)
-            # Fetch extra to account for secondary filters
-            fetch_limit = (
-                (offset + limit) * 3
-                if any([worker_id, error_type, min_duration_ms, max_duration_ms])
+            # Without secondary filters the first offset + limit IDs are the
+            # page; otherwise keep paging through the index until it is full.
+            has_secondary_filters = any([
+                worker_id,
+                error_type,
+                created_after,
+                created_before,
+                min_duration_ms is not None,
+                max_duration_ms is not None,
+                task_name and status,
+            ])
+            batch_size = (
+                max(offset + limit, HISTORY_SCAN_BATCH_SIZE)
+                if has_secondary_filters
                 else offset + limit
             )
-            task_ids = await self.client.zrevrange(index_key, 0, fetch_limit - 1)
-
-            if not task_ids:
-                return []
 
-            # Fetch and filter execution records
-            tasks = []
+            tasks: list[dict[str, Any]] = []
             skipped = 0
+            start = 0
 
-            for task_id in task_ids:
-                exec_key = self._exec_key(task_id)
-                task_data = await self.client.hgetall(exec_key)
-
-                if not task_data:
-                    continue
-
-                matches_filters, duration_ms = self._passes_filters(
-                    task_data,
-                    task_name=task_name,
-                    status=status,
-                    worker_id=worker_id,
-                    error_type=error_type,
-                    created_after=created_after,
-                    created_before=created_before,
-                    min_duration_ms=min_duration_ms,
-                    max_duration_ms=max_duration_ms,
+            while len(tasks) < limit:
+                # Get task IDs from index (newest first)
+                task_ids = await self.client.zrevrange(
+                    index_key, start, start + batch_size - 1,
                 )
+                if not task_ids:
+                    break
+                start += len(task_ids)
+
+                records = await self._fetch_records(task_ids)
+                for task_id, task_data in zip(task_ids, records, strict=True):
+                    if not task_data:
+                        continue
+
+                    matches_filters, duration_ms = self._passes_filters(
+                        task_data,
+                        task_name=task_name,
+                        status=status,
+                        worker_id=worker_id,
+                        error_type=error_type,
+                        created_after=created_after,
+                        created_before=created_before,
+                        min_duration_ms=min_duration_ms,
+                        max_duration_ms=max_duration_ms,
+                    )
+
+                    if not matches_filters:
+                        continue
+
+                    # Skip offset records
+                    if skipped < offset:
+                        skipped += 1
+                        continue
 
-                if not matches_filters:
-                    continue
+                    started_at = task_data.get("started_at", "")
 
-                # Skip offset records
-                if skipped < offset:
-                    skipped += 1
-                    continue
+                    # Parse return_value
+                    return_value = None
+                    return_value_str = task_data.get("return_value", "")
+                    if return_value_str:
+                        try:
+                            return_value = json.loads(return_value_str)
+                        except (json.JSONDecodeError, TypeError):
+                            return_value = return_value_str
 
-                started_at = task_data.get("started_at", "")
-
-                # Parse return_value
-                return_value = None
-                return_value_str = task_data.get("return_value", "")
-                if return_value_str:
-                    try:
-                        return_value = json.loads(return_value_str)
-                    except (json.JSONDecodeError, TypeError):
-                        return_value = return_value_str
-
-                tasks.append({
-                    "task_id": task_data.get("task_id", task_id),
-                    "task_name": task_data.get("task_name", "unknown"),
-                    "status": task_data.get("status", "unknown"),
-                    "started_at": started_at,
-                    "finished_at": task_data.get("finished_at", "") or None,
-                    "duration_ms": duration_ms,
-                    "return_value": return_value,
-                    "error_message": task_data.get("error_message", "") or None,
-                    "error_type": task_data.get("error_type", "") or None,
-                    "worker_id": task_data.get("worker_id", "") or None,
-                })
+                    tasks.append({
+                        "task_id": task_data.get("task_id", task_id),
+                        "task_name": task_data.get("task_name", "unknown"),
+                        "status": task_data.get("status", "unknown"),
+                        "started_at": started_at,
+                        "finished_at": task_data.get("finished_at", "") or None,
+                        "duration_ms": duration_ms,
+                        "return_value": return_value,
+                        "error_message": task_data.get("error_message", "") or None,
+                        "error_type": task_data.get("error_type", "") or None,
+                        "worker_id": task_data.get("worker_id", "") or None,
+                    })
+
+                    if len(tasks) >= limit:
+                        break
 
-                if len(tasks) >= limit:
+                if len(task_ids) < batch_size:
                     break
 
             return tasks
@@ -547,31 +602,56 @@ class RedisTaskTracker(BaseTaskTracker):
             else:
                 index_key = self._index_all_key()
 
-            task_ids = await self.client.zrevrange(index_key, 0, -1)
-            if not task_ids:
-                return 0
-
+            has_secondary_filters = any([
+                worker_id,
+                error_type,
+                created_after,
+                created_before,
+                min_duration_ms is not None,
+                max_duration_ms is not None,
+                task_name and status,
+            ])
             total = 0
-            for task_id in task_ids:
-                exec_key = self._exec_key(task_id)
-                task_data = await self.client.hgetall(exec_key)
-                if not task_data:
-                    continue
-
-                matches_filters, _ = self._passes_filters(
-                    task_data,
-                    task_name=task_name,
-                    status=status,
-                    worker_id=worker_id,
-                    error_type=error_type,
-                    created_after=created_after,
-                    created_before=created_before,
-                    min_duration_ms=min_duration_ms,
-                    max_duration_ms=max_duration_ms,
+            start = 0
+            while True:
+                task_ids: list[Any] = await self.client.zrevrange(
+                    index_key, start, start + HISTORY_SCAN_BATCH_SIZE - 1,
                 )
+                if not task_ids:
+                    break
+                start += len(task_ids)
+
+                if not has_secondary_filters:
+                    # Indices outlive expired records; count only live ones,
+                    # as get_task_history does
+                    total += await self.client.exists(
+                        *(self._exec_key(task_id) for task_id in task_ids),
+                    )
+                    if len(task_ids) < HISTORY_SCAN_BATCH_SIZE:
+                        break
+                    continue
 
-                if matches_filters:
-                    total += 1
+                for task_data in await self._fetch_records(task_ids):
+                    if not task_data:
+                        continue
+
+                    matches_filters, _ = self._passes_filters(
+                        task_data,
+                        task_name=task_name,
+                        status=status,
+                        worker_id=worker_id,
+                        error_type=error_type,
+                        created_after=created_after,
+                        created_before=created_before,
+                        min_duration_ms=min_duration_ms,
+                        max_duration_ms=max_duration_ms,
+                    )
+
+                    if matches_filters:
+                        total += 1
+
+                if len(task_ids) < HISTORY_SCAN_BATCH_SIZE:
+                    break
 
             return total
         except (RedisConnectionError, RedisTimeoutError) as e:
@@ -675,44 +755,44 @@ class RedisTaskTracker(BaseTaskTracker):
             }
 
         try:
-            # Count by status
-            running_count = await self.client.zcard(self._index_status_key("running"))
-            success_count = await self.client.zcard(self._index_status_key("success"))
-            failure_count = await self.client.zcard(self._index_status_key("failure"))
-            cancelled_count = await self.client.zcard(
-                self._index_status_key("cancelled"),
-            )
-            total = await self.client.zcard(self._index_all_key())
+            # Everything in one round trip: index sizes, per-name counters
+            # and the rolling duration sample
+            pipe = self.client.pipeline(transaction=False)
+            pipe.zcard(self._index_status_key("running"))
+            pipe.zcard(self._index_status_key("success"))
+            pipe.zcard(self._index_status_key("failure"))
+            pipe.zcard(self._index_status_key("cancelled"))
+            pipe.zcard(self._index_all_key())
+            pipe.hgetall(self._stats_by_name_key())
+            pipe.lrange(self._stats_durations_key(), 0, DURATION_SAMPLE_SIZE - 1)
+            (
+                running_count,
+                success_count,
+                failure_count,
+                cancelled_count,
+                total,
+                name_counts,
+                duration_values,
+            ) = await pipe.execute()
+
+            if not name_counts and total:
+                # Counters predate this tracker version; rebuild them once
+                name_counts = await self._rebuild_name_counts()
 
-            # Get counts by task name
             by_task_name: dict[str, int] = {}
-            async for key in self.client.scan_iter(
-                match=f"{self.key_prefix}:index:name:*",
-            ):
-                task_name = key.replace(f"{self.key_prefix}:index:name:", "")
-                count = await self.client.zcard(key)
-                if count > 0:
-                    by_task_name[task_name] = count
+            for task_name, count in name_counts.items():
+                with contextlib.suppress(ValueError):
+                    if int(count) > 0:
+                        by_task_name[task_name] = int(count)
 
             # Calculate average duration
             avg_duration_ms: float | None = None
-            recent_task_ids = await self.client.zrevrange(
-                self._index_status_key("success"),
-                0,
-                99,  # Sample last 100 successful tasks
-            )
-
-            if recent_task_ids:
-                durations = []
-                for task_id in recent_task_ids:
-                    exec_key = self._exec_key(task_id)
-                    duration_str = await self.client.hget(exec_key, "duration_ms")
-                    if duration_str:
-                        with contextlib.suppress(ValueError):
-                            durations.append(int(duration_str))
-
-                if durations:
-                    avg_duration_ms = sum(durations) / len(durations)
+            durations = []
+            for value in duration_values:
+                with contextlib.suppress(ValueError):
+                    durations.append(int(value))
+            if durations:
+                avg_duration_ms = sum(durations) / len(durations)
 
             return {
                 "total_count": total,
@@ -735,6 +815,39 @@ class RedisTaskTracker(BaseTaskTracker):
                 "avg_duration_ms": None,
             }
 
+    async def _rebuild_name_counts(self) -> dict[str, int]:
+        """Rebuild the per-name counters from the name indices.
+
+        Only needed for data written before the counters existed.
+
+        Returns:
+            Task counts by task name.
+        """
+        prefix = f"{self.key_prefix}:index:name:"
+        keys = [key async for key in self.client.scan_iter(match=f"{prefix}*")]
+        if not keys:
+            return {}
+
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.zcard(key)
+        counts = await pipe.execute()
+
+        name_counts = {
+            key.removeprefix(prefix): count
+            for key, count in zip(keys, counts, strict=True)
+            if count > 0
+        }
+        if name_counts:
+            await self.client.hset(
+                self._stats_by_name_key(),
+                mapping=cast(
+                    "Mapping[str | bytes, bytes | float | int | str]",
+                    name_counts,
+                ),
+            )
+        return name_counts
+
     async def cancel_task(self, task_id: str) -> bool:
         """Mark a task as cancelled."""
         if not self.is_connected:
@@ -263,6 +263,7 @@ async def find_expired_files(expiry_days: int = 30) -> list[dict[str, Any]]:
         {
             "id": str(file.id),
             "s3_key": file.storage_key,
+            "bucket": file.bucket,
             "created_at": file.created_at,
             "thumbnails": [t.storage_key for t in file.thumbnails],
         }
@@ -270,68 +271,136 @@ async def find_expired_files(expiry_days: int = 30) -> list[dict[str, Any]]:
     ]
 
 
-async def delete_file_from_storage(s3_key: str) -> None:
-    """Delete file from S3 storage.
+async def delete_storage_objects(keys: list[str]) -> int:
+    """Delete many objects from storage with bulk delete requests.
 
     Args:
-        s3_key: S3 object key to delete.
+        keys: S3 object keys to delete.
+
+    Returns:
+        Number of objects deleted.
     """
+    if not keys:
+        return 0
+
     storage = get_storage_service()
     if not storage.is_ready:
         logger.warning(
-            "Storage not available; skipping delete", extra={"s3_key": s3_key},
+            "Storage not available; skipping deletes", extra={"count": len(keys)},
         )
-        return
+        return 0
 
-    try:
-        await storage.delete_file(s3_key)
-        logger.info("File deleted from storage", extra={"s3_key": s3_key})
-    except StorageClientError as e:
+    result = await storage.delete_files(keys)
+    if result["failed"]:
         logger.warning(
-            "Failed to delete file from storage",
-            extra={"s3_key": s3_key, "error": str(e)},
+            "Failed to delete objects from storage",
+            extra={"failed": len(result["failed"]), "errors": result["failed"][:10]},
         )
+    return len(result["deleted"])
 
 
-async def delete_thumbnails(thumbnail_keys: list[str]) -> None:
-    """Delete thumbnail objects from storage."""
-    if not thumbnail_keys:
-        return
-
-    storage = get_storage_service()
-    if not storage.is_ready:
-        logger.warning(
-            "Storage not available; skipping thumbnail deletes",
-            extra={"count": len(thumbnail_keys)},
-        )
-        return
-
-    for key in thumbnail_keys:
-        try:
-            await storage.delete_file(key)
-            logger.debug("Deleted thumbnail", extra={"s3_key": key})
-        except StorageClientError as e:
-            logger.warning(
-                "Failed to delete thumbnail", extra={"s3_key": key, "error": str(e)},
-            )
-
+async def delete_file_records(
+    files: list[dict[str, Any]],
+) -> tuple[int, set[tuple[str, str]]]:
+    """Delete file records and release their content-addressed blobs.
 
-async def delete_file_record(file_id: str) -> None:
-    """Delete file record from database.
+    Both happen in one transaction, so a blob's reference count always
+    matches the records pointing at it.
 
     Args:
-        file_id: File identifier to delete.
+        files: File dictionaries as returned by ``find_expired_files``.
+
+    Returns:
+        Tuple of (records deleted, (bucket, key) pairs owned by blobs).
+        Blob objects must be left to ``collect_unreferenced_blobs``.
     """
     from example_service.features.files.models import File
+    from example_service.features.files.repository import get_file_blob_repository
+
+    if not files:
+        return 0, set()
 
     async with get_async_session() as session:
-        await session.execute(delete(File).where(File.id == file_id))
+        blobs = await get_file_blob_repository().release(
+            session, [(file["bucket"], file["s3_key"]) for file in files],
+        )
+        result = await session.execute(
+            delete(File).where(File.id.in_([file["id"] for file in files])),
+        )
+        deleted_count: int = result.rowcount  # type: ignore[attr-defined]
         await session.commit()
 
     logger.info(
-        "File record deleted",
-        extra={"file_id": file_id},
+        "File records deleted",
+        extra={"count": deleted_count, "released_blobs": len(blobs)},
     )
+    return deleted_count, blobs
+
+
+async def collect_unreferenced_blobs(grace_seconds: int, limit: int = 1000) -> int:
+    """Delete content-addressed objects no file has referenced for a while.
+
+    Blob rows stay locked until their objects are gone and the rows are
+    deleted, so an upload of the same content either revives the blob
+    first or waits and uploads the object again.
+
+    Args:
+        grace_seconds: Minimum time since the last reference was released.
+        limit: Maximum blobs collected per batch.
+
+    Returns:
+        Number of blobs deleted.
+    """
+    from example_service.features.files.repository import get_file_blob_repository
+
+    storage = get_storage_service()
+    if not storage.is_ready:
+        logger.warning("Storage not available; skipping blob collection")
+        return 0
+
+    repository = get_file_blob_repository()
+    released_before = datetime.now(UTC) - timedelta(seconds=grace_seconds)
+    collected = 0
+
+    while True:
+        async with get_async_session() as session:
+            blobs = await repository.lock_unreferenced(
+                session, released_before=released_before, limit=limit,
+            )
+            if not blobs:
+                break
+
+            by_bucket: dict[str, list[Any]] = {}
+            for blob in blobs:
+                by_bucket.setdefault(blob.bucket, []).append(blob)
+
+            # Only drop rows whose objects are gone; failures are retried
+            # on the next run
+            collected_ids: list[Any] = []
+            for bucket, bucket_blobs in by_bucket.items():
+                result = await storage.delete_files(
+                    [blob.storage_key for blob in bucket_blobs], bucket=bucket,
+                )
+                deleted = set(result["deleted"])
+                collected_ids.extend(
+                    blob.id for blob in bucket_blobs if blob.storage_key in deleted
+                )
+                if result["failed"]:
+                    logger.warning(
+                        "Failed to delete blob objects",
+                        extra={"bucket": bucket, "failed": len(result["failed"])},
+                    )
+
+            await repository.delete_many(session, collected_ids)
+            await session.commit()
+
+        collected += len(collected_ids)
+        if len(blobs) < limit or len(collected_ids) < len(blobs):
+            break
+
+    if collected:
+        logger.info("Unreferenced blobs collected", extra={"count": collected})
+    return collected
 
 
 if broker is not None:
@@ -620,6 +689,9 @@ if broker is not None:
                 return {
                     "status": "success",
                     "deleted_count": 0,
+                    "blobs_collected": await collect_unreferenced_blobs(
+                        get_storage_settings().dedup_gc_grace_seconds,
+                    ),
                     "expiry_days": expiry_days,
                 }
 
@@ -631,46 +703,29 @@ if broker is not None:
                 },
             )
 
-            # Step 2: Delete files from storage and database
-            deleted_count = 0
-            failed_count = 0
+            # Step 2: Delete the records with a single statement, then
+            # objects and thumbnails with bulk storage deletes. Objects
+            # shared through content-addressed blobs are only released.
+            deleted_count, blobs = await delete_file_records(expired_files)
+            failed_count = len(expired_files) - deleted_count
 
+            storage_keys: list[str] = []
             for file in expired_files:
-                try:
-                    # Delete from S3
-                    await delete_file_from_storage(file["s3_key"])
-
-                    # Delete thumbnails if they exist
-                    await delete_thumbnails(file.get("thumbnails", []))
-
-                    # Delete database record
-                    await delete_file_record(file["id"])
-
-                    deleted_count += 1
-
-                    logger.debug(
-                        "Expired file deleted",
-                        extra={
-                            "file_id": file["id"],
-                            "s3_key": file["s3_key"],
-                            "created_at": file["created_at"],
-                        },
-                    )
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.warning(
-                        "Failed to delete expired file",
-                        extra={
-                            "file_id": file["id"],
-                            "error": str(e),
-                        },
-                    )
+                if (file["bucket"], file["s3_key"]) not in blobs:
+                    storage_keys.append(file["s3_key"])
+                storage_keys.extend(file.get("thumbnails", []))
+            await delete_storage_objects(storage_keys)
+
+            # Step 3: Delete blobs nothing has referenced for the grace period
+            blobs_collected = await collect_unreferenced_blobs(
+                get_storage_settings().dedup_gc_grace_seconds,
+            )
 
             result = {
                 "status": "success",
                 "deleted_count": deleted_count,
                 "failed_count": failed_count,
+                "blobs_collected": blobs_collected,
                 "total_found": len(expired_files),
                 "expiry_days": expiry_days,
             }
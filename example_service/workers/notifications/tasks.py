@@ -30,7 +30,7 @@ from example_service.features.notifications.repository import (
 from example_service.features.notifications.service import get_notification_service
 from example_service.infra.database.session import get_async_session
 from example_service.infra.email import get_email_service
-from example_service.infra.email.schemas import EmailPriority
+from example_service.infra.email.schemas import EmailMessage, EmailPriority
 from example_service.infra.tasks.broker import broker
 
 logger = logging.getLogger(__name__)
@@ -386,44 +386,38 @@ if broker is not None:
     @broker.task()
     async def send_batch_emails_task(
         emails: list[dict[str, Any]],
+        tenant_id: str | None = None,
     ) -> dict:
         """Send multiple emails in batch.
 
+        With the EnhancedEmailService the messages are sent concurrently over
+        the tenant's pooled provider connections. Without it, the basic email
+        service sends them one after another.
+
         Args:
             emails: List of email dictionaries with keys:
                 - to, subject, body/body_html, etc.
+            tenant_id: Tenant ID for per-tenant config (optional).
 
         Returns:
             Dictionary with batch results.
         """
-        email_service = get_email_service()
-
-        results = []
-        success_count = 0
-        failure_count = 0
+        results: list[dict[str, Any]] = []
+        messages: list[EmailMessage] = []
+        positions: list[int] = []
 
         for email_data in emails:
             try:
-                result = await email_service.send(
-                    to=email_data["to"],
+                to = email_data["to"]
+                message = EmailMessage(
+                    to=[to] if isinstance(to, str) else list(to),
+                    cc=email_data.get("cc") or [],
+                    bcc=email_data.get("bcc") or [],
+                    reply_to=email_data.get("reply_to"),
                     subject=email_data["subject"],
-                    body=email_data.get("body"),
+                    body_text=email_data.get("body"),
                     body_html=email_data.get("body_html"),
-                    cc=email_data.get("cc"),
-                    bcc=email_data.get("bcc"),
-                    reply_to=email_data.get("reply_to"),
                 )
-                results.append(
-                    {
-                        "to": email_data["to"],
-                        "success": result.success,
-                        "message_id": result.message_id,
-                    },
-                )
-                if result.success:
-                    success_count += 1
-                else:
-                    failure_count += 1
             except Exception as e:
                 results.append(
                     {
@@ -432,12 +426,45 @@ if broker is not None:
                         "error": str(e),
                     },
                 )
-                failure_count += 1
+                continue
+            positions.append(len(results))
+            results.append({"to": email_data["to"]})
+            messages.append(message)
+
+        try:
+            from example_service.infra.email.enhanced_service import (
+                get_enhanced_email_service,
+            )
+
+            enhanced_service = get_enhanced_email_service()
+        except RuntimeError:
+            enhanced_service = None
+
+        if enhanced_service is not None:
+            sent = await enhanced_service.send_batch(messages, tenant_id=tenant_id)
+            for position, result in zip(positions, sent, strict=True):
+                results[position].update(
+                    success=result.success,
+                    message_id=result.message_id,
+                )
+        else:
+            # Fall back to basic email service if enhanced service not initialized
+            email_service = get_email_service()
+            for position, message in zip(positions, messages, strict=True):
+                try:
+                    result = await email_service.client.send(message)
+                    results[position].update(
+                        success=result.success,
+                        message_id=result.message_id,
+                    )
+                except Exception as e:
+                    results[position].update(success=False, error=str(e))
 
+        success_count = sum(1 for result in results if result["success"])
         return {
             "total": len(emails),
             "success_count": success_count,
-            "failure_count": failure_count,
+            "failure_count": len(results) - success_count,
             "results": results,
         }
 
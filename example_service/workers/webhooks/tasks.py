@@ -14,7 +14,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from example_service.features.webhooks.client import WebhookClient
+from example_service.features.webhooks.engine import get_webhook_delivery_engine
 from example_service.features.webhooks.repository import (
     get_webhook_delivery_repository,
     get_webhook_repository,
@@ -248,9 +248,9 @@ if broker is not None:
                 },
             )
 
-            # Step 3: Send webhook request using WebhookClient
+            # Step 3: Send webhook request over the shared connection pool
             try:
-                client = WebhookClient(timeout_seconds=delivery["timeout"])
+                client = get_webhook_delivery_engine().client
                 result = await client.deliver(
                     webhook=delivery["webhook"],
                     event_type=delivery["event_type"],
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from io import BytesIO
 import os
@@ -10,11 +12,20 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from example_service.core.settings.storage import StorageSettings
-from example_service.features.files.models import File, FileStatus, FileThumbnail
-from example_service.features.files.repository import FileRepository
+from example_service.features.files.models import (
+    File,
+    FileBlob,
+    FileStatus,
+    FileThumbnail,
+)
+from example_service.features.files.repository import (
+    FileBlobRepository,
+    FileRepository,
+)
 from example_service.features.files.service import FileService
 from example_service.infra.storage.client import InvalidFileError, StorageClientError
 
@@ -52,9 +63,15 @@ class FakeStorageClient:
     def __init__(self, settings: StorageSettings) -> None:
         self.settings = settings
         self.uploads: dict[str, dict] = {}
+        self.upload_count = 0
         self.deleted_keys: list[str] = []
+        self.copied: list[tuple[str, str]] = []
         self.presigned_requests: list[str] = []
 
+    @property
+    def is_ready(self) -> bool:
+        return True
+
     async def upload_file(
         self,
         file_obj,
@@ -64,6 +81,7 @@ class FakeStorageClient:
         bucket: str | None = None,
     ) -> dict:
         payload = file_obj.read()
+        self.upload_count += 1
         checksum = sha256(payload).hexdigest()
         etag = f"etag-{len(self.uploads) + 1}"
         bucket_name = bucket or self.settings.bucket
@@ -88,7 +106,7 @@ class FakeStorageClient:
             "fields": {"key": key, "content-type": content_type},
         }
 
-    async def get_file_info(self, key: str) -> dict | None:
+    async def get_file_info(self, key: str, bucket: str | None = None) -> dict | None:
         stored = self.uploads.get(key)
         if stored is None:
             return None
@@ -107,6 +125,27 @@ class FakeStorageClient:
         self.deleted_keys.append(key)
         self.uploads.pop(key, None)
 
+    async def delete_files(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        max_concurrency: int = 4,
+    ) -> dict:
+        for key in keys:
+            await self.delete_file(key)
+        return {"deleted": list(keys), "failed": []}
+
+    async def copy_file(
+        self,
+        source_key: str,
+        dest_key: str,
+        source_bucket: str | None = None,
+        dest_bucket: str | None = None,
+    ) -> bool:
+        self.copied.append((source_key, dest_key))
+        self.uploads[dest_key] = {**self.uploads[source_key], "etag": f"etag-copy-{dest_key}"}
+        return True
+
 
 @pytest.fixture
 def storage_settings() -> StorageSettings:
@@ -127,6 +166,12 @@ def fake_storage_client(storage_settings: StorageSettings) -> FakeStorageClient:
     return FakeStorageClient(storage_settings)
 
 
+@pytest.fixture
+def dedup_storage_client(storage_settings: StorageSettings) -> FakeStorageClient:
+    """Provide a fake storage client with content-addressed uploads enabled."""
+    return FakeStorageClient(storage_settings.model_copy(update={"dedup_enabled": True}))
+
+
 @pytest.fixture(scope="session")
 def postgres_dsn():
     pytest.importorskip("testcontainers.postgres")
@@ -178,7 +223,7 @@ async def session(postgres_dsn) -> AsyncGenerator[AsyncSession]:
         await conn.run_sync(
             lambda sync_conn: File.metadata.create_all(
                 sync_conn,
-                tables=[File.__table__, FileThumbnail.__table__],
+                tables=[File.__table__, FileThumbnail.__table__, FileBlob.__table__],
             ),
         )
 
@@ -204,8 +249,30 @@ def file_service(
     """Instantiate the service with fake dependencies."""
     return FileService(
         session=session,
-        storage_client=fake_storage_client,
+        storage_service=fake_storage_client,
+        repository=file_repository,
+    )
+
+
+@pytest.fixture
+def blob_repository() -> FileBlobRepository:
+    """Repository bound to the FileBlob model."""
+    return FileBlobRepository()
+
+
+@pytest.fixture
+def dedup_file_service(
+    session: AsyncSession,
+    dedup_storage_client: FakeStorageClient,
+    file_repository: FileRepository,
+    blob_repository: FileBlobRepository,
+) -> FileService:
+    """Instantiate the service with content-addressed uploads enabled."""
+    return FileService(
+        session=session,
+        storage_service=dedup_storage_client,
         repository=file_repository,
+        blob_repository=blob_repository,
     )
 
 
@@ -254,6 +321,15 @@ async def attach_thumbnail(
     return thumbnail
 
 
+async def get_blob(session: AsyncSession, storage_key: str) -> FileBlob | None:
+    """Load a blob row by key, bypassing the identity map."""
+    return await session.scalar(
+        select(FileBlob)
+        .where(FileBlob.storage_key == storage_key)
+        .execution_options(populate_existing=True),
+    )
+
+
 async def test_create_presigned_upload_persists_pending_record(
     session: AsyncSession,
     file_service: FileService,
@@ -390,3 +466,160 @@ async def test_get_download_url_returns_presigned_payload(
     assert result["filename"] == file.original_filename
     assert result["download_url"].endswith(file.storage_key)
     assert result["expires_in"] == fake_storage_client.settings.presigned_url_expiry_seconds
+
+
+async def test_blob_repository_counts_references(
+    session: AsyncSession,
+    blob_repository: FileBlobRepository,
+) -> None:
+    digest = uuid4().hex
+    key = f"blobs/{digest[:2]}/{digest}"
+    acquire = {"sha256": digest, "bucket": "test-bucket", "storage_key": key, "size_bytes": 7}
+
+    first = await blob_repository.acquire(session, **acquire)
+    second = await blob_repository.acquire(session, **acquire)
+    assert second.id == first.id
+    assert second.ref_count == 2
+
+    assert await blob_repository.add_reference(session, "test-bucket", key)
+    assert not await blob_repository.add_reference(session, "test-bucket", "uploads/other")
+
+    released = await blob_repository.release(
+        session,
+        [("test-bucket", key), ("test-bucket", key), ("test-bucket", "uploads/other")],
+    )
+    assert released == {("test-bucket", key)}
+    blob = await get_blob(session, key)
+    assert blob is not None
+    assert blob.ref_count == 1
+    assert blob.released_at is None
+
+    # Over-releasing clamps at zero and stamps the release time
+    await blob_repository.release(session, [("test-bucket", key)] * 2)
+    blob = await get_blob(session, key)
+    assert blob is not None
+    assert blob.ref_count == 0
+    assert blob.released_at is not None
+
+    locked = await blob_repository.lock_unreferenced(
+        session, released_before=datetime.now(UTC) + timedelta(seconds=1),
+    )
+    assert key in {blob.storage_key for blob in locked}
+    locked = await blob_repository.lock_unreferenced(
+        session, released_before=blob.released_at - timedelta(seconds=1),
+    )
+    assert key not in {blob.storage_key for blob in locked}
+
+    # Acquiring a released blob revives it
+    revived = await blob_repository.acquire(session, **acquire)
+    assert revived.ref_count == 1
+    assert revived.released_at is None
+
+
+async def test_upload_same_content_twice_shares_one_blob(
+    session: AsyncSession,
+    dedup_file_service: FileService,
+    dedup_storage_client: FakeStorageClient,
+) -> None:
+    dedup_file_service._dispatch_thumbnail_task = AsyncMock(return_value=True)  # type: ignore[assignment]
+    payload = f"shared-{uuid4()}".encode()
+
+    first = await dedup_file_service.upload_file(
+        file_obj=BytesIO(payload), filename="a.png", content_type="image/png",
+    )
+    second = await dedup_file_service.upload_file(
+        file_obj=BytesIO(payload), filename="b.png", content_type="image/png",
+    )
+
+    digest = sha256(payload).hexdigest()
+    assert first.id != second.id
+    assert first.storage_key == second.storage_key == f"blobs/{digest[:2]}/{digest}"
+    assert dedup_storage_client.upload_count == 1
+    blob = await get_blob(session, first.storage_key)
+    assert blob is not None
+    assert blob.ref_count == 2
+
+
+async def test_copy_of_blob_file_takes_reference_without_copying(
+    session: AsyncSession,
+    dedup_file_service: FileService,
+    dedup_storage_client: FakeStorageClient,
+) -> None:
+    dedup_file_service._dispatch_thumbnail_task = AsyncMock(return_value=True)  # type: ignore[assignment]
+    source = await dedup_file_service.upload_file(
+        file_obj=BytesIO(f"copy-{uuid4()}".encode()),
+        filename="a.png",
+        content_type="image/png",
+    )
+
+    copy = await dedup_file_service.copy_file(source.id)
+
+    assert copy.storage_key == source.storage_key
+    assert copy.etag == source.etag
+    assert dedup_storage_client.copied == []
+    blob = await get_blob(session, source.storage_key)
+    assert blob is not None
+    assert blob.ref_count == 2
+
+
+async def test_copy_of_plain_file_copies_object(
+    session: AsyncSession,
+    file_service: FileService,
+    fake_storage_client: FakeStorageClient,
+) -> None:
+    file = await create_file(session, status=FileStatus.READY)
+    await fake_storage_client.upload_file(BytesIO(b"payload"), key=file.storage_key)
+
+    copy = await file_service.copy_file(file.id, new_filename="copy.png")
+
+    assert copy.storage_key != file.storage_key
+    assert fake_storage_client.copied == [(file.storage_key, copy.storage_key)]
+    assert copy.etag == fake_storage_client.uploads[copy.storage_key]["etag"]
+    assert await get_blob(session, copy.storage_key) is None
+
+
+async def test_deleted_blob_is_collected_after_last_reference(
+    session: AsyncSession,
+    dedup_file_service: FileService,
+    dedup_storage_client: FakeStorageClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from example_service.workers.files import tasks
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr(tasks, "get_async_session", session_scope)
+    monkeypatch.setattr(tasks, "get_storage_service", lambda: dedup_storage_client)
+
+    dedup_file_service._dispatch_thumbnail_task = AsyncMock(return_value=True)  # type: ignore[assignment]
+    payload = f"collect-{uuid4()}".encode()
+    first = await dedup_file_service.upload_file(
+        file_obj=BytesIO(payload), filename="a.png", content_type="image/png",
+    )
+    second = await dedup_file_service.upload_file(
+        file_obj=BytesIO(payload), filename="b.png", content_type="image/png",
+    )
+    key = first.storage_key
+
+    # The object outlives the first delete and is only released by the last
+    await dedup_file_service.delete_file(first.id, hard_delete=True)
+    await tasks.collect_unreferenced_blobs(grace_seconds=0)
+    assert key in dedup_storage_client.uploads
+    assert await get_blob(session, key) is not None
+
+    await dedup_file_service.delete_file(second.id, hard_delete=True)
+    assert key not in dedup_storage_client.deleted_keys
+    blob = await get_blob(session, key)
+    assert blob is not None
+    assert blob.ref_count == 0
+
+    # Still inside the grace period
+    await tasks.collect_unreferenced_blobs(grace_seconds=3600)
+    assert key in dedup_storage_client.uploads
+
+    assert await tasks.collect_unreferenced_blobs(grace_seconds=0) >= 1
+    assert key in dedup_storage_client.deleted_keys
+    assert key not in dedup_storage_client.uploads
+    assert await get_blob(session, key) is None
@@ -0,0 +1,98 @@
+"""Performance tests for cache value codecs.
+
+Compares encode/decode cost and stored size of the cache codecs on payloads
+shaped like the values the service actually caches (search responses and
+stats dictionaries). Optional codecs are skipped when their library is not
+installed.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from example_service.infra.cache.codecs import CacheCodec
+
+CODECS = {
+    "json": {},
+    "json-zlib": {"compression": "zlib"},
+    "json-zstd": {"compression": "zstd"},
+    "json-lz4": {"compression": "lz4"},
+    "msgpack": {"serializer": "msgpack"},
+    "msgpack-zstd": {"serializer": "msgpack", "compression": "zstd"},
+}
+
+_REQUIRES = {"zstd": "zstandard", "lz4": "lz4.frame", "msgpack": "msgpack"}
+
+
+def _make_codec(name: str) -> CacheCodec:
+    """Build a codec, skipping when its optional library is missing."""
+    for marker, module in _REQUIRES.items():
+        if marker in name:
+            pytest.importorskip(module)
+    return CacheCodec(**CODECS[name])
+
+
+@pytest.fixture
+def search_response():
+    """Search response payload (~50 hits with highlights)."""
+    now = datetime.now(UTC).isoformat()
+    return {
+        "query": "invoice overdue",
+        "total": 1234,
+        "took_ms": 12.5,
+        "results": [
+            {
+                "id": str(uuid4()),
+                "entity_type": "reminders",
+                "title": f"Invoice {i} overdue reminder",
+                "snippet": "Your <b>invoice</b> is <b>overdue</b>. " * 4,
+                "rank": 0.5 + i / 100,
+                "created_at": now,
+                "tags": ["billing", "reminder", f"tag-{i % 5}"],
+            }
+            for i in range(50)
+        ],
+        "facets": {"entity_type": {"reminders": 900, "files": 334}},
+    }
+
+
+@pytest.fixture
+def stats_payload():
+    """Small stats dictionary."""
+    return {
+        "total": 1500,
+        "active": 1200,
+        "by_status": {"pending": 100, "running": 50, "success": 1300, "failure": 50},
+        "avg_duration_ms": 245.7,
+    }
+
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+class TestCacheCodecs:
+    """Benchmark cache codec round trips."""
+
+    @pytest.mark.benchmark(group="cache-codec-encode")
+    def test_encode_search_response(self, benchmark, codec_name, search_response):
+        """Benchmark encoding a search response."""
+        codec = _make_codec(codec_name)
+        data = benchmark(codec.encode, search_response)
+        benchmark.extra_info["bytes"] = len(data)
+        assert isinstance(data, bytes)
+
+    @pytest.mark.benchmark(group="cache-codec-decode")
+    def test_decode_search_response(self, benchmark, codec_name, search_response):
+        """Benchmark decoding a search response."""
+        codec = _make_codec(codec_name)
+        data = codec.encode(search_response)
+        result = benchmark(codec.decode, data)
+        assert result == search_response
+
+    @pytest.mark.benchmark(group="cache-codec-small")
+    def test_round_trip_stats(self, benchmark, codec_name, stats_payload):
+        """Benchmark a small payload round trip (below compression threshold)."""
+        codec = _make_codec(codec_name)
+        result = benchmark(lambda: codec.decode(codec.encode(stats_payload)))
+        assert result == stats_payload
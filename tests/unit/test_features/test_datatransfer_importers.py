@@ -201,3 +201,18 @@ class TestImporterParsing:
         records = importer.parse_bytes(payload)
         assert records[0].is_valid
         assert not records[1].is_valid
+
+    def test_csv_importer_iter_bytes_is_lazy(self):
+        importer = importers.CSVImporter(required_fields=["name"])
+        records = importer.iter_bytes(b"name\nAlice\n\nBob\n")
+        first = next(records)
+        assert first.row_number == 2
+        assert first.data["name"] == "Alice"
+        assert [record.data["name"] for record in records] == ["Bob"]
+
+    def test_json_importer_iter_bytes_validates_structure_eagerly(self):
+        importer = importers.JSONImporter()
+        with pytest.raises(importers.DataImportError):
+            importer.iter_bytes(b'{"records": 123}')
+        records = list(importer.iter_bytes(b'{"records": [{"name": "a"}, {"name": "b"}]}'))
+        assert [record.data["name"] for record in records] == ["a", "b"]
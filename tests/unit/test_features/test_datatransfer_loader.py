@@ -0,0 +1,115 @@
+"""Tests for the set-based import writer."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql.psycopg import PGDialectAsync_psycopg
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from example_service.core.database import TimestampMixin
+from example_service.features.datatransfer.loader import BulkLoader
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base, TimestampMixin):
+    __tablename__ = "loader_notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(100))
+
+
+class FakeCopy:
+    def __init__(self, statement: str, copies: list[tuple[str, list[tuple[Any, ...]]]]) -> None:
+        self.rows: list[tuple[Any, ...]] = []
+        copies.append((statement, self.rows))
+
+    async def write_row(self, row: tuple[Any, ...]) -> None:
+        self.rows.append(row)
+
+
+class FakeCursor:
+    def __init__(self, copies: list[tuple[str, list[tuple[Any, ...]]]]) -> None:
+        self.copies = copies
+
+    @asynccontextmanager
+    async def copy(self, statement: str) -> AsyncIterator[FakeCopy]:
+        yield FakeCopy(statement, self.copies)
+
+
+class CopySession:
+    """Session on a psycopg bind that records SQL and COPY payloads."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.copies: list[tuple[str, list[tuple[Any, ...]]]] = []
+        self.bind = SimpleNamespace(dialect=PGDialectAsync_psycopg())
+
+    def get_bind(self) -> Any:
+        return self.bind
+
+    async def execute(self, stmt: Any) -> None:
+        self.statements.append(str(stmt))
+
+    async def connection(self) -> Any:
+        @asynccontextmanager
+        async def cursor() -> AsyncIterator[FakeCursor]:
+            yield FakeCursor(self.copies)
+
+        raw = SimpleNamespace(driver_connection=SimpleNamespace(cursor=cursor))
+
+        async def get_raw_connection() -> Any:
+            return raw
+
+        return SimpleNamespace(get_raw_connection=get_raw_connection)
+
+
+async def test_copy_insert_fills_python_defaults() -> None:
+    session = CopySession()
+
+    await BulkLoader(session, Note).insert([{"id": 1, "title": "first"}])
+
+    (statement, rows), = session.copies
+    assert statement == "COPY loader_notes (id, title, created_at, updated_at) FROM STDIN"
+    (row,) = rows
+    assert row[:2] == (1, "first")
+    assert all(isinstance(value, datetime) for value in row[2:])
+
+
+async def test_copy_update_sets_onupdate_columns() -> None:
+    session = CopySession()
+    before = datetime.now(UTC)
+
+    await BulkLoader(session, Note).update([{"id": 1, "title": "renamed"}])
+
+    (statement, rows), = session.copies
+    assert statement.endswith("(id, title, updated_at) FROM STDIN")
+    (row,) = rows
+    assert row[:2] == (1, "renamed")
+    assert row[2] >= before
+    update = next(sql for sql in session.statements if sql.startswith("UPDATE"))
+    assert "title = s.title, updated_at = s.updated_at" in update
+    assert "created_at" not in update
+
+
+async def test_copy_update_keeps_explicit_onupdate_value() -> None:
+    session = CopySession()
+    stamp = datetime(2024, 1, 1, tzinfo=UTC)
+
+    await BulkLoader(session, Note).update(
+        [{"id": 1, "title": "renamed", "updated_at": stamp}],
+    )
+
+    (statement, rows), = session.copies
+    assert statement.endswith("(id, title, updated_at) FROM STDIN")
+    assert rows == [(1, "renamed", stamp)]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import gzip
+import json
 from types import SimpleNamespace
 
 import pytest
 
 from example_service.features.datatransfer import service as dt_service
-from example_service.features.datatransfer.schemas import ExportFormat, ExportRequest
+from example_service.features.datatransfer.schemas import (
+    ExportFormat,
+    ExportRequest,
+    ImportFormat,
+)
 
 
 class DummyExporter:
@@ -26,6 +32,11 @@ class DummyExporter:
         return b"bytes"
 
 
+async def fake_iter_rows(session, stmt, key_column, *, batch_size=1000):
+    yield [{"id": 1}, {"id": 2}]
+    yield [{"id": 3}]
+
+
 class DummySession:
     def __init__(self, records):
         self._records = records
@@ -35,31 +46,22 @@ class DummySession:
 
 
 @pytest.mark.asyncio
-async def test_export_uses_exporter_and_returns_result(
-    monkeypatch: pytest.MonkeyPatch, tmp_path,
-) -> None:
-    records = [SimpleNamespace(id=1)]
-    session = DummySession(records)
-    svc = dt_service.DataTransferService(session=session)
+async def test_export_streams_rows_to_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    svc = dt_service.DataTransferService(session=DummySession([]))
 
-    monkeypatch.setattr(
-        svc,
-        "_get_entity_config",
-        lambda *_: {"exportable": True, "fields": ["id"], "model_path": "x"},
-    )
-    monkeypatch.setattr(svc, "_import_model", lambda *_: SimpleNamespace(search_vector=None))
-    monkeypatch.setattr(dt_service, "get_exporter", lambda *_, **__: DummyExporter())
-    monkeypatch.setattr(dt_service, "ensure_export_dir", lambda: tmp_path)
-    monkeypatch.setattr(dt_service, "select", lambda *_: None)
+    monkeypatch.setattr(svc, "_build_export_query", lambda *_: (None, None, ["id"]))
+    monkeypatch.setattr(dt_service, "iter_rows", fake_iter_rows)
 
     result = await svc.export(ExportRequest(entity_type="any", format=ExportFormat.CSV))
     assert result.status.name == "COMPLETED"
-    assert result.record_count == len(records)
+    assert result.record_count == 3
     assert result.file_path
+    with open(result.file_path, encoding="utf-8") as f:
+        assert f.read().splitlines() == ["id", "1", "2", "3"]
 
 
 @pytest.mark.asyncio
-async def test_export_to_bytes_success(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_export_excel_uses_exporter(monkeypatch: pytest.MonkeyPatch) -> None:
     records = [SimpleNamespace(id=1)]
     session = DummySession(records)
     svc = dt_service.DataTransferService(session=session)
@@ -73,14 +75,43 @@ async def test_export_to_bytes_success(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(dt_service, "get_exporter", lambda *_, **__: DummyExporter())
     monkeypatch.setattr(dt_service, "select", lambda *_: None)
 
+    result = await svc.export(ExportRequest(entity_type="any", format=ExportFormat.EXCEL))
+    assert result.status.name == "COMPLETED"
+    assert result.record_count == len(records)
+
+
+@pytest.mark.asyncio
+async def test_export_to_bytes_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    svc = dt_service.DataTransferService(session=DummySession([]))
+
+    monkeypatch.setattr(svc, "_build_export_query", lambda *_: (None, None, ["id"]))
+    monkeypatch.setattr(dt_service, "iter_rows", fake_iter_rows)
+
     data, content_type, filename = await svc.export_to_bytes(
-        ExportRequest(entity_type="any", format=ExportFormat.CSV),
+        ExportRequest(entity_type="any", format=ExportFormat.CSV), compress=False,
     )
-    assert data == b"bytes"
+    assert data.decode().splitlines() == ["id", "1", "2", "3"]
     assert content_type == "text/csv"
     assert filename.endswith(".csv")
 
 
+@pytest.mark.asyncio
+async def test_export_to_bytes_compresses_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    svc = dt_service.DataTransferService(session=DummySession([]))
+
+    monkeypatch.setattr(svc, "_build_export_query", lambda *_: (None, None, ["id"]))
+    monkeypatch.setattr(dt_service, "iter_rows", fake_iter_rows)
+
+    data, content_type, filename = await svc.export_to_bytes(
+        ExportRequest(entity_type="any", format=ExportFormat.JSON), compress=True,
+    )
+    payload = json.loads(gzip.decompress(data))
+    assert payload["record_count"] == 3
+    assert payload["records"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert content_type == "application/gzip"
+    assert filename.endswith(".json.gz")
+
+
 @pytest.mark.asyncio
 async def test_export_to_bytes_handles_not_exportable(monkeypatch: pytest.MonkeyPatch) -> None:
     session = DummySession([])
@@ -92,3 +123,131 @@ async def test_export_to_bytes_handles_not_exportable(monkeypatch: pytest.Monkey
     req = ExportRequest(entity_type="any", format=ExportFormat.CSV)
     with pytest.raises(ValueError, match="is not exportable"):
         await svc.export_to_bytes(req)
+
+
+class FakeBulkLoader:
+    """Records set-based writes; rows titled "bad" fail to write."""
+
+    model_class = SimpleNamespace(__name__="Reminder")
+    columns = {"id": None, "title": None}
+
+    def __init__(self, session, model_class):
+        self.existing = {1}
+        self.id_queries = 0
+        self.inserts: list[list[dict]] = []
+        self.updates: list[list[dict]] = []
+        FakeBulkLoader.instance = self
+
+    def unknown_fields(self, data):
+        return [field for field in data if field not in self.columns]
+
+    def coerce_id(self, value):
+        return int(value)
+
+    async def existing_ids(self, ids):
+        self.id_queries += 1
+        return self.existing & set(ids)
+
+    async def insert(self, rows):
+        if not rows:
+            return
+        if any(row.get("title") == "bad" for row in rows):
+            msg = "constraint violated"
+            raise RuntimeError(msg)
+        self.inserts.append(rows)
+
+    async def update(self, rows):
+        if rows:
+            self.updates.append(rows)
+
+
+class ImportSession:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def begin_nested(self):
+        session = self
+
+        class Savepoint:
+            async def __aenter__(self):
+                return session
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Savepoint()
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def patch_import(monkeypatch: pytest.MonkeyPatch, svc) -> None:
+    monkeypatch.setattr(
+        svc,
+        "_get_entity_config",
+        lambda *_: {"importable": True, "model_path": "x", "required_fields": ["title"]},
+    )
+    monkeypatch.setattr(svc, "_import_model", lambda *_: None)
+    monkeypatch.setattr(dt_service, "BulkLoader", FakeBulkLoader)
+
+
+@pytest.mark.asyncio
+async def test_import_writes_each_chunk_set_based(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = ImportSession()
+    svc = dt_service.DataTransferService(session=session)
+    patch_import(monkeypatch, svc)
+    payload = json.dumps(
+        [{"id": 1, "title": "updated"}] + [{"title": f"new {i}"} for i in range(4)],
+    ).encode()
+
+    result = await svc.import_from_bytes(
+        payload,
+        "reminders",
+        ImportFormat.JSON,
+        update_existing=True,
+        batch_size=3,
+    )
+
+    loader = FakeBulkLoader.instance
+    assert result.status.name == "COMPLETED"
+    assert result.successful_rows == 5
+    assert loader.id_queries == 2
+    assert [len(rows) for rows in loader.inserts] == [2, 2]
+    assert loader.updates == [[{"id": 1, "title": "updated"}]]
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_import_skips_existing_and_isolates_failed_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    svc = dt_service.DataTransferService(session=ImportSession())
+    patch_import(monkeypatch, svc)
+    payload = json.dumps(
+        [{"id": 1, "title": "kept"}, {"title": "bad"}, {"title": "good"}],
+    ).encode()
+
+    result = await svc.import_from_bytes(payload, "reminders", ImportFormat.JSON, skip_errors=True)
+
+    assert result.status.name == "PARTIALLY_COMPLETED"
+    assert (result.successful_rows, result.skipped_rows, result.failed_rows) == (1, 1, 1)
+    assert result.validation_errors[0].row == 2
+    assert FakeBulkLoader.instance.inserts == [[{"title": "good"}]]
+
+
+@pytest.mark.asyncio
+async def test_import_validation_failure_writes_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    svc = dt_service.DataTransferService(session=ImportSession())
+    patch_import(monkeypatch, svc)
+    payload = json.dumps([{"title": "a"}, {"title": ""}, {"title": "c"}]).encode()
+
+    result = await svc.import_from_bytes(payload, "reminders", ImportFormat.JSON, batch_size=2)
+
+    assert result.status.name == "FAILED"
+    assert result.total_rows == 3
+    assert result.failed_rows == 1
+    assert result.processed_rows == 0
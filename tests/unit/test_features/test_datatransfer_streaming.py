@@ -0,0 +1,185 @@
+"""Tests for the streaming export engine."""
+
+from __future__ import annotations
+
+import csv
+from datetime import UTC, datetime
+import gzip
+import io
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from example_service.features.datatransfer import streaming
+
+
+class FakeStatement:
+    """Records the clauses applied to a select."""
+
+    def __init__(self, clauses: tuple[Any, ...] = ()) -> None:
+        self.clauses = clauses
+
+    def order_by(self, column: Any) -> FakeStatement:
+        return FakeStatement((*self.clauses, ("order_by", column.key)))
+
+    def limit(self, size: int) -> FakeStatement:
+        return FakeStatement((*self.clauses, ("limit", size)))
+
+    def where(self, clause: Any) -> FakeStatement:
+        return FakeStatement((*self.clauses, ("where", clause)))
+
+
+class FakeKeyColumn:
+    """Key column whose comparison yields an inspectable clause."""
+
+    key = "id"
+
+    def __gt__(self, value: Any) -> tuple[str, Any]:
+        return ("id >", value)
+
+
+class FakeSession:
+    """Serves rows in key order like ``WHERE id > :last ORDER BY id LIMIT n``."""
+
+    def __init__(self, ids: list[int]) -> None:
+        self.ids = ids
+        self.statements: list[FakeStatement] = []
+
+    async def execute(self, stmt: FakeStatement) -> Any:
+        self.statements.append(stmt)
+        clauses = dict(stmt.clauses)
+        last = clauses["where"][1] if "where" in clauses else None
+        rows = [
+            {"id": i, "title": f"row {i}"}
+            for i in self.ids
+            if last is None or i > last
+        ][: clauses["limit"]]
+        return SimpleNamespace(mappings=lambda: rows)
+
+
+async def collect(iterator: Any) -> list[Any]:
+    return [item async for item in iterator]
+
+
+class TestIterRows:
+    """Test keyset pagination."""
+
+    @pytest.mark.asyncio
+    async def test_pages_resume_after_last_key(self):
+        """Each page filters on the last key instead of using an offset."""
+        session = FakeSession(list(range(1, 8)))
+
+        pages = await collect(
+            streaming.iter_rows(session, FakeStatement(), FakeKeyColumn(), batch_size=3),
+        )
+
+        assert [[row["id"] for row in page] for page in pages] == [
+            [1, 2, 3],
+            [4, 5, 6],
+            [7],
+        ]
+        wheres = [dict(stmt.clauses).get("where") for stmt in session.statements]
+        assert wheres == [None, ("id >", 3), ("id >", 6)]
+
+    @pytest.mark.asyncio
+    async def test_full_last_page_ends_with_empty_query(self):
+        """A table that fills the last page ends after one empty page."""
+        session = FakeSession([1, 2, 3, 4])
+
+        pages = await collect(
+            streaming.iter_rows(session, FakeStatement(), FakeKeyColumn(), batch_size=2),
+        )
+
+        assert len(pages) == 2
+        assert len(session.statements) == 3
+
+
+async def pages_of(*pages: list[dict[str, Any]]):
+    for page in pages:
+        yield page
+
+
+class TestWriters:
+    """Test row writers."""
+
+    @pytest.mark.asyncio
+    async def test_csv_writes_header_once_in_field_order(self):
+        """Headers are written once and columns follow the field order."""
+        writer = streaming.CSVRowWriter(["name", "id"])
+        chunks = await collect(
+            streaming.encode_stream(
+                pages_of([{"id": 1, "name": "a"}], [{"id": 2, "name": "b,c"}]),
+                writer,
+            ),
+        )
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows == [["name", "id"], ["a", "1"], ["b,c", "2"]]
+        assert writer.record_count == 2
+
+    @pytest.mark.asyncio
+    async def test_json_lines_serializes_values(self):
+        """JSON Lines rows serialize datetimes and keep only exported fields."""
+        now = datetime.now(UTC)
+        writer = streaming.JSONLinesWriter(["id", "created_at"])
+        chunks = await collect(
+            streaming.encode_stream(
+                pages_of([{"id": 1, "created_at": now, "secret": "x"}]),
+                writer,
+            ),
+        )
+
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": 1, "created_at": now.isoformat()},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_json_document_is_valid_across_pages(self):
+        """The incrementally written document parses as one JSON object."""
+        writer = streaming.JSONDocumentWriter(["id"])
+        chunks = await collect(
+            streaming.encode_stream(pages_of([{"id": 1}, {"id": 2}], [{"id": 3}]), writer),
+        )
+
+        payload = json.loads(b"".join(chunks))
+        assert payload["record_count"] == 3
+        assert payload["records"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    @pytest.mark.asyncio
+    async def test_json_document_without_rows(self):
+        """An empty export is still a valid document."""
+        chunks = await collect(
+            streaming.encode_stream(pages_of(), streaming.JSONDocumentWriter(["id"])),
+        )
+
+        payload = json.loads(b"".join(chunks))
+        assert payload["records"] == []
+        assert payload["record_count"] == 0
+
+
+class TestCompression:
+    """Test streaming compressors."""
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream_round_trips(self):
+        """Compressed chunks concatenate to a single gzip stream."""
+        pages = [[{"id": i} for i in range(start, start + 500)] for start in (0, 500)]
+        chunks = await collect(
+            streaming.encode_stream(
+                pages_of(*pages),
+                streaming.JSONLinesWriter(["id"]),
+                streaming.get_compressor("gzip"),
+            ),
+        )
+
+        lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == list(range(1000))
+
+    def test_unknown_compression_is_rejected(self):
+        """Unsupported compression names raise ValueError."""
+        assert streaming.get_compressor(None) is None
+        with pytest.raises(ValueError, match="Unsupported export compression"):
+            streaming.get_compressor("brotli")
@@ -0,0 +1,269 @@
+"""Unit tests for the in-memory feature flag snapshot engine."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from example_service.features.featureflags.engine import (
+    FeatureFlagEngine,
+    FlagSnapshot,
+    compile_comparison,
+    compile_rule,
+)
+from example_service.features.featureflags.models import FlagStatus
+from example_service.features.featureflags.schemas import FlagEvaluationRequest
+from example_service.features.featureflags.service import FeatureFlagService
+
+
+def make_flag(
+    key: str = "flag",
+    status: str = FlagStatus.ENABLED.value,
+    *,
+    enabled: bool = True,
+    percentage: int = 0,
+    targeting_rules=None,
+    starts_at: datetime | None = None,
+    ends_at: datetime | None = None,
+) -> SimpleNamespace:
+    flag = SimpleNamespace(
+        key=key,
+        status=status,
+        enabled=enabled,
+        percentage=percentage,
+        targeting_rules=targeting_rules,
+        starts_at=starts_at,
+        ends_at=ends_at,
+    )
+    flag.is_active = lambda now: not (
+        (flag.starts_at and now < flag.starts_at) or (flag.ends_at and now > flag.ends_at)
+    )
+    return flag
+
+
+def make_override(flag_key: str, entity_type: str, entity_id: str, enabled: bool):
+    return SimpleNamespace(
+        flag_key=flag_key, entity_type=entity_type, entity_id=entity_id, enabled=enabled,
+    )
+
+
+def test_compiled_comparisons_match_service_compare() -> None:
+    service = FeatureFlagService(session=MagicMock())
+    cases = [
+        ("eq", "a"), ("neq", "a"), ("in", ["a", "b"]), ("in", "a"),
+        ("not_in", ["a"]), ("in", [["a"]]), ("contains", "ell"),
+        ("starts_with", "st"), ("ends_with", "nd"), ("gt", 3), ("gte", 5),
+        ("lt", 1), ("lte", 5), ("bogus", "a"),
+    ]
+    actuals = [None, "a", "b", "hello", "start", "end", 5, 2, ["a"]]
+
+    for operator, expected in cases:
+        compare = compile_comparison(operator, expected)
+        for actual in actuals:
+            try:
+                want = service._compare(actual, operator, expected)
+            except TypeError:
+                with pytest.raises(TypeError):
+                    compare(actual)
+                continue
+            assert compare(actual) == want, (operator, expected, actual)
+
+
+def test_compiled_rules_match_service_rules() -> None:
+    service = FeatureFlagService(session=MagicMock())
+    rules = [
+        {"type": "user_id", "operator": "eq", "value": "u1"},
+        {"type": "tenant_id", "operator": "in", "value": ["t1", "t2"]},
+        {"type": "attribute", "attribute": "plan", "operator": "eq", "value": "pro"},
+        {"type": "attribute", "operator": "eq", "value": "pro"},
+        {"type": "unknown"},
+    ]
+    contexts = [
+        FlagEvaluationRequest(user_id="u1", tenant_id="t1", attributes={"plan": "pro"}),
+        FlagEvaluationRequest(user_id="u2", tenant_id="t3", attributes={}),
+        FlagEvaluationRequest(),
+    ]
+
+    for rule in rules:
+        predicate = compile_rule(rule)
+        for context in contexts:
+            assert predicate(context.user_id, context.tenant_id, context.attributes) == (
+                service._matches_rule(rule, context)
+            )
+
+
+def test_snapshot_matches_database_evaluation() -> None:
+    service = FeatureFlagService(session=MagicMock())
+    now = datetime.now(UTC)
+    flags = [
+        make_flag("on"),
+        make_flag("off", FlagStatus.DISABLED.value),
+        make_flag("rollout", FlagStatus.PERCENTAGE.value, percentage=50),
+        make_flag(
+            "targeted",
+            FlagStatus.TARGETED.value,
+            targeting_rules=[
+                {"type": "attribute", "attribute": "role", "operator": "eq", "value": "admin"},
+                {"type": "user_id", "operator": "starts_with", "value": "user-1"},
+            ],
+        ),
+        make_flag("expired", ends_at=now - timedelta(days=1)),
+        make_flag("upcoming", starts_at=now + timedelta(days=1)),
+        make_flag("weird", "archived"),
+    ]
+    snapshot = FlagSnapshot.build(flags, [])
+    contexts = [
+        FlagEvaluationRequest(user_id=f"user-{i}", attributes={"role": role})
+        for i in range(20)
+        for role in ("admin", "member")
+    ] + [FlagEvaluationRequest(tenant_id="tenant-1"), FlagEvaluationRequest()]
+
+    for context in contexts:
+        expected = {
+            flag.key: service._evaluate_flag(flag, context, {}, now) for flag in flags
+        }
+        assert snapshot.evaluate(context.user_id, context.tenant_id, context.attributes) == (
+            expected
+        )
+
+
+def test_overrides_are_indexed_by_entity_and_prefer_user() -> None:
+    snapshot = FlagSnapshot.build(
+        [make_flag("beta", FlagStatus.DISABLED.value)],
+        [
+            make_override("beta", "tenant", "t1", True),
+            make_override("beta", "user", "u1", False),
+        ],
+    )
+
+    assert snapshot.overrides[("tenant", "t1")] == {"beta": True}
+    assert snapshot.evaluate(tenant_id="t1")["beta"] == (True, "override")
+    assert snapshot.evaluate(user_id="u1", tenant_id="t1")["beta"] == (False, "override")
+    assert snapshot.evaluate(user_id="u2")["beta"] == (False, "disabled")
+
+
+def test_is_enabled_returns_default_for_unknown_flag() -> None:
+    snapshot = FlagSnapshot.build([make_flag("on")], [])
+
+    assert snapshot.is_enabled("on")
+    assert not snapshot.is_enabled("missing")
+    assert snapshot.is_enabled("missing", default=True)
+    assert set(snapshot.evaluate(flag_keys=["on", "missing"])) == {"on"}
+
+
+class FakeResult:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def one(self):
+        return self.value
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.value)
+
+
+class FakeDatabase:
+    """Answers the version query, then the flag and override queries."""
+
+    def __init__(self) -> None:
+        self.version = (1, None, 0, None)
+        self.flags = [make_flag("on")]
+        self.overrides: list = []
+        self.loads = 0
+
+    @asynccontextmanager
+    async def session(self):
+        answers = iter([self.version, self.flags, self.overrides])
+
+        async def execute(_stmt):
+            value = next(answers)
+            if value is self.flags:
+                self.loads += 1
+            return FakeResult(value)
+
+        yield SimpleNamespace(execute=execute)
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_only_when_version_changes() -> None:
+    database = FakeDatabase()
+    engine = FeatureFlagEngine(database.session)
+
+    assert await engine.refresh()
+    assert not await engine.refresh()
+    assert database.loads == 1
+
+    database.flags = [make_flag("on"), make_flag("new")]
+    database.version = (2, None, 0, None)
+    assert await engine.refresh()
+    assert set(engine.snapshot.flags) == {"on", "new"}
+
+
+class FakePubSub:
+    def __init__(self, messages: list[dict]) -> None:
+        self.messages = messages
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    async def unsubscribe(self, channel: str) -> None:
+        pass
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self, messages: list[dict]) -> None:
+        self.published: list[tuple[str, str]] = []
+        self._pubsub = FakePubSub(messages)
+
+    def pubsub(self) -> FakePubSub:
+        return self._pubsub
+
+    async def publish(self, channel: str, data: str) -> None:
+        self.published.append((channel, data))
+
+
+@pytest.mark.asyncio
+async def test_notify_changed_reloads_and_publishes() -> None:
+    database = FakeDatabase()
+    redis = FakeRedis([])
+    engine = FeatureFlagEngine(database.session, redis=redis, channel="flags")
+
+    await engine.start()
+    await engine.notify_changed()
+    await engine.stop()
+
+    assert database.loads == 2
+    assert [channel for channel, _ in redis.published] == ["flags"]
+    assert redis.pubsub().closed
+
+
+@pytest.mark.asyncio
+async def test_listener_reloads_on_changes_from_other_processes() -> None:
+    database = FakeDatabase()
+    redis = FakeRedis([])
+    engine = FeatureFlagEngine(database.session, redis=redis, channel="flags")
+    redis.pubsub().messages.extend([
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": json.dumps({"origin": engine._origin})},
+        {"type": "message", "data": json.dumps({"origin": "other-process"})},
+    ])
+
+    await engine.start()
+    await engine._tasks[-1]
+    await engine.stop()
+
+    # Initial load plus the other process's change only
+    assert database.loads == 2
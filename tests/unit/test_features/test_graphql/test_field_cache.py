@@ -0,0 +1,94 @@
+"""Tests for the batched GraphQL field cache."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+pytest.importorskip("strawberry", reason="GraphQL caching requires strawberry")
+
+from example_service.features.graphql.caching import field_cache
+from example_service.features.graphql.caching.field_cache import (
+    cached_field,
+)
+
+
+class FakeCache:
+    """In-memory cache that counts batched round trips."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.get_many_calls: list[list[str]] = []
+        self.set_many_calls: list[tuple[dict[str, Any], int | None]] = []
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        self.get_many_calls.append(keys)
+        return [self.values.get(key) for key in keys]
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        self.set_many_calls.append((items, ttl))
+        self.values.update(items)
+        return True
+
+
+@dataclass
+class Reminder:
+    id: int
+    tags: list[str]
+
+    @cached_field(ttl=60)
+    def tags_count(self) -> int:
+        return len(self.tags)
+
+    @cached_field(ttl=60, key_func=lambda self: f"reminder:{self.id}:summary")
+    async def summary(self) -> str:
+        await asyncio.sleep(0)
+        return f"{self.id}:{','.join(self.tags)}"
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> FakeCache:
+    fake = FakeCache()
+    monkeypatch.setattr(field_cache, "get_cache_instance", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_sibling_lookups_share_one_round_trip(cache: FakeCache) -> None:
+    reminders = [Reminder(id=i, tags=["a"] * i) for i in range(1, 101)]
+
+    counts = await asyncio.gather(*(r.tags_count() for r in reminders))
+    await field_cache._get_batcher(cache).flush()
+
+    assert counts == list(range(1, 101))
+    assert len(cache.get_many_calls) == 1
+    assert len(cache.get_many_calls[0]) == 100
+    assert len(cache.set_many_calls) == 1
+    assert len(cache.set_many_calls[0][0]) == 100
+    assert cache.set_many_calls[0][1] == 60
+
+
+@pytest.mark.asyncio
+async def test_cached_values_skip_async_resolver(cache: FakeCache) -> None:
+    cache.values["reminder:1:summary"] = "cached"
+    reminders = [Reminder(id=1, tags=["x"]), Reminder(id=2, tags=["y"])]
+
+    summaries = await asyncio.gather(*(r.summary() for r in reminders))
+    await field_cache._get_batcher(cache).flush()
+
+    assert summaries == ["cached", "2:y"]
+    assert cache.set_many_calls == [({"reminder:2:summary": "2:y"}, 60)]
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_back_to_resolver(cache: FakeCache) -> None:
+    async def failing_get_many(keys: list[str]) -> list[Any]:
+        msg = "redis down"
+        raise ConnectionError(msg)
+
+    cache.get_many = failing_get_many  # type: ignore[method-assign]
+
+    assert await Reminder(id=3, tags=["a", "b", "c"]).tags_count() == 3
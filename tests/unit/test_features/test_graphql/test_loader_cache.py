@@ -0,0 +1,126 @@
+"""Tests for the shared cross-request DataLoader cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("strawberry", reason="DataLoaders require strawberry")
+
+from example_service.features.graphql.dataloaders import (
+    cache as loader_cache,
+)
+from example_service.features.graphql.dataloaders.cache import (
+    SharedLoaderCache,
+)
+
+
+class FakeCache:
+    """In-memory cache that records batched round trips."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.get_many_calls: list[list[str]] = []
+        self.set_many_calls: list[dict[str, Any]] = []
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        self.get_many_calls.append(keys)
+        return [self.values.get(key) for key in keys]
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        self.set_many_calls.append(items)
+        self.values.update(items)
+        return True
+
+    def bump(self, entity: str, key: Any) -> None:
+        version_key = loader_cache._version_key(entity, key)
+        self.values[version_key] = int(self.values.get(version_key) or 0) + 1
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> FakeCache:
+    fake = FakeCache()
+    monkeypatch.setattr(loader_cache, "get_cache_instance", lambda: fake)
+    return fake
+
+
+def make_loader() -> tuple[Any, list[list[int]]]:
+    calls: list[list[int]] = []
+
+    async def batch_load(keys: list[int]) -> list[dict[str, int] | None]:
+        calls.append(list(keys))
+        return [None if key < 0 else {"id": key} for key in keys]
+
+    shared = SharedLoaderCache(entity="thing", ttl=60, encode=dict, decode=dict)
+    return shared.wrap(batch_load), calls
+
+
+@pytest.mark.asyncio
+async def test_misses_are_loaded_once_and_shared(cache: FakeCache) -> None:
+    load, calls = make_loader()
+
+    first = await load([1, 2, 3])
+    second = await load([1, 2, 3])
+
+    assert first == second == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert calls == [[1, 2, 3]]
+    # One MGET per batch covering versions and values
+    assert [len(keys) for keys in cache.get_many_calls] == [6, 6]
+    assert len(cache.set_many_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_version_bump_invalidates_only_that_key(cache: FakeCache) -> None:
+    load, calls = make_loader()
+    await load([1, 2])
+
+    cache.bump("thing", 2)
+    result = await load([1, 2])
+
+    assert result == [{"id": 1}, {"id": 2}]
+    assert calls == [[1, 2], [2]]
+    assert cache.set_many_calls[-1] == {
+        loader_cache._value_key("thing", 2): {"v": 1, "d": {"id": 2}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_missing_entities_are_not_cached(cache: FakeCache) -> None:
+    load, calls = make_loader()
+
+    assert await load([-1]) == [None]
+    assert await load([-1]) == [None]
+    assert calls == [[-1], [-1]]
+    assert cache.set_many_calls == []
+
+
+@pytest.mark.asyncio
+async def test_without_cache_calls_batch_function(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(loader_cache, "get_cache_instance", lambda: None)
+    load, calls = make_loader()
+
+    assert await load([1]) == [{"id": 1}]
+    assert calls == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_flag_rename_invalidates_old_and_new_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from example_service.features.graphql.resolvers import featureflags_mutations
+
+    bumped: dict[str, list[Any]] = {}
+
+    async def bump(entity: str, keys: list[Any]) -> None:
+        bumped[entity] = keys
+
+    monkeypatch.setattr(featureflags_mutations, "bump_entity_versions", bump)
+
+    await featureflags_mutations._invalidate_flag_loaders(7, "old_key", "new_key")
+    assert bumped == {"feature_flag": [7], "feature_flag_key": ["old_key", "new_key"]}
+
+    await featureflags_mutations._invalidate_flag_loaders(7, "same", "same")
+    assert bumped["feature_flag_key"] == ["same"]
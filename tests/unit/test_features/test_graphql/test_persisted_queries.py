@@ -0,0 +1,95 @@
+"""Tests for Automatic Persisted Queries and the parsed-document cache."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("graphql", reason="Persisted queries require graphql-core")
+
+from example_service.features.graphql import persisted_queries
+from example_service.features.graphql.persisted_queries import (
+    PersistedQueryError,
+    PersistedQueryStore,
+    query_hash,
+    resolve_persisted_query,
+)
+
+QUERY = "query Dash { reminders { id } }"
+
+
+def apq(sha256_hash: str, version: int = 1) -> dict:
+    return {"persistedQuery": {"version": version, "sha256Hash": sha256_hash}}
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> PersistedQueryStore:
+    # Process-local store: no Redis configured
+    monkeypatch.setattr(persisted_queries, "get_cache_instance", lambda: None)
+    return PersistedQueryStore(ttl=60, local_size=10)
+
+
+@pytest.mark.asyncio
+async def test_plain_requests_pass_through(store: PersistedQueryStore) -> None:
+    assert await resolve_persisted_query(QUERY, None, store) == QUERY
+    assert await resolve_persisted_query(QUERY, {"tracing": True}, store) == QUERY
+
+
+@pytest.mark.asyncio
+async def test_unknown_hash_requests_registration(store: PersistedQueryStore) -> None:
+    with pytest.raises(PersistedQueryError) as exc_info:
+        await resolve_persisted_query(None, apq(query_hash(QUERY)), store)
+
+    assert exc_info.value.message == "PersistedQueryNotFound"
+    assert exc_info.value.extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+
+@pytest.mark.asyncio
+async def test_registered_hash_resolves_document(store: PersistedQueryStore) -> None:
+    sha256_hash = query_hash(QUERY)
+
+    assert await resolve_persisted_query(QUERY, apq(sha256_hash), store) == QUERY
+    assert await resolve_persisted_query(None, apq(sha256_hash), store) == QUERY
+
+
+@pytest.mark.asyncio
+async def test_hash_mismatch_is_rejected(store: PersistedQueryStore) -> None:
+    with pytest.raises(PersistedQueryError) as exc_info:
+        await resolve_persisted_query(QUERY, apq("0" * 64), store)
+
+    assert exc_info.value.extensions == {"code": "PERSISTED_QUERY_HASH_MISMATCH"}
+    assert await store.get("0" * 64) is None
+
+
+@pytest.mark.asyncio
+async def test_unsupported_version_is_rejected(store: PersistedQueryStore) -> None:
+    with pytest.raises(PersistedQueryError):
+        await resolve_persisted_query(QUERY, apq(query_hash(QUERY), version=2), store)
+
+
+@pytest.mark.asyncio
+async def test_document_cache_skips_parse_and_validation() -> None:
+    strawberry = pytest.importorskip("strawberry")
+    from example_service.features.graphql.extensions.document_cache import (
+        DocumentCacheExtension,
+    )
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    extension = DocumentCacheExtension(max_size=10)
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    first = await schema.execute("{ hello }")
+    entry = extension._documents[query_hash("{ hello }")]
+    second = await schema.execute("{ hello }")
+
+    assert first.data == second.data == {"hello": "world"}
+    assert entry.validated
+    assert extension._documents[query_hash("{ hello }")] is entry
+
+    invalid = await schema.execute("{ missing }")
+    assert invalid.errors
+    assert not extension._documents[query_hash("{ missing }")].validated
@@ -0,0 +1,150 @@
+"""Tests for the GraphQL query-result cache extension."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+strawberry = pytest.importorskip("strawberry", reason="Query cache requires strawberry")
+
+from example_service.features.graphql.caching import query_cache  # noqa: E402
+from example_service.features.graphql.caching.query_cache import (  # noqa: E402
+    CacheConfig,
+    QueryCacheExtension,
+)
+
+
+class FakePipeline:
+    def __init__(self, cache: FakeCache) -> None:
+        self.cache = cache
+
+    def sadd(self, key: str, member: str) -> None:
+        self.cache.tags.setdefault(key, set()).add(member)
+
+    def expire(self, key: str, ttl: int) -> None:
+        return None
+
+    async def execute(self) -> list[Any]:
+        return []
+
+
+class FakeCache:
+    """In-memory stand-in for RedisCache."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        self.values[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def pipeline(self) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> FakeCache:
+    fake = FakeCache()
+
+    async def invalidate_tags(tag_list: list[str]) -> int:
+        deleted = 0
+        for tag in tag_list:
+            for key in fake.tags.pop(f"tag:{tag}", set()):
+                deleted += fake.values.pop(key, None) is not None
+        return deleted
+
+    monkeypatch.setattr(query_cache, "get_cache_instance", lambda: fake)
+    monkeypatch.setattr(query_cache, "invalidate_tags", invalidate_tags)
+    return fake
+
+
+def build_schema(calls: list[str], config: CacheConfig | None = None) -> Any:
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def reminders(self, first: int = 10) -> list[str]:
+            calls.append("reminders")
+            return [f"reminder-{i}" for i in range(first)]
+
+        @strawberry.field
+        def status(self) -> str:
+            calls.append("status")
+            return "ok"
+
+    @strawberry.type
+    class Mutation:
+        @strawberry.mutation
+        def create_reminder(self) -> str:
+            calls.append("createReminder")
+            return "created"
+
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+        extensions=[QueryCacheExtension(ttl=120, config=config)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache(cache: FakeCache) -> None:
+    calls: list[str] = []
+    schema = build_schema(calls)
+
+    first = await schema.execute("query Dash { reminders(first: 2) }")
+    # Formatting differences share the normalized document hash
+    second = await schema.execute("query Dash {\n  reminders(first: 2)\n}")
+
+    assert first.data == second.data == {"reminders": ["reminder-0", "reminder-1"]}
+    assert calls == ["reminders"]
+    assert list(cache.ttls.values()) == [120]
+
+
+@pytest.mark.asyncio
+async def test_variables_produce_separate_entries(cache: FakeCache) -> None:
+    calls: list[str] = []
+    schema = build_schema(calls)
+    query = "query Dash($first: Int!) { reminders(first: $first) }"
+
+    await schema.execute(query, variable_values={"first": 1})
+    await schema.execute(query, variable_values={"first": 2})
+
+    assert calls == ["reminders", "reminders"]
+    assert len(cache.values) == 2
+
+
+@pytest.mark.asyncio
+async def test_mutation_invalidates_entity_queries(cache: FakeCache) -> None:
+    calls: list[str] = []
+    schema = build_schema(calls)
+
+    await schema.execute("{ reminders }")
+    await schema.execute("{ status }")
+    await schema.execute("mutation { createReminder }")
+    await schema.execute("{ reminders }")
+    await schema.execute("{ status }")
+
+    assert calls == ["reminders", "status", "createReminder", "reminders"]
+
+
+@pytest.mark.asyncio
+async def test_operation_ttl_hint_zero_disables_caching(cache: FakeCache) -> None:
+    class Config(CacheConfig):
+        OPERATION_TTLS = {"Live": 0}
+        FIELD_TTLS = {"status": 15}
+
+    calls: list[str] = []
+    schema = build_schema(calls, Config())
+
+    await schema.execute("query Live { reminders }")
+    await schema.execute("query Live { reminders }")
+    await schema.execute("query Health { status reminders }")
+
+    assert calls == ["reminders", "reminders", "status", "reminders"]
+    assert list(cache.ttls.values()) == [15]
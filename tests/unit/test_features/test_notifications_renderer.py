@@ -0,0 +1,147 @@
+"""Tests for compiled notification template rendering."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from example_service.features.notifications.templates.renderer import (
+    TemplateRenderer,
+    TemplateRenderError,
+)
+
+
+def make_template(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "version": 1,
+        "name": "reminder_due",
+        "channel": "email",
+        "subject_template": "Reminder: {{ title }}",
+        "body_template": "Hi {{ name }}, {{ title }} is due.",
+        "body_html_template": "<p>{{ title }}</p>",
+        "webhook_payload_template": None,
+        "websocket_payload_template": None,
+        "websocket_event_type": None,
+        "required_context_vars": ["title"],
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestRenderTemplate:
+    """Test rendering output."""
+
+    def test_escapes_html_but_not_text(self):
+        """Only the HTML body is autoescaped."""
+        renderer = TemplateRenderer()
+
+        rendered = renderer.render_template(make_template(), {"title": "<b>Tax</b>", "name": "Ann"})
+
+        assert rendered == {
+            "subject": "Reminder: <b>Tax</b>",
+            "body": "Hi Ann, <b>Tax</b> is due.",
+            "body_html": "<p>&lt;b&gt;Tax&lt;/b&gt;</p>",
+        }
+
+    def test_renders_nested_json_payload(self):
+        """Jinja strings in nested payloads render; other values pass through."""
+        template = make_template(
+            channel="webhook",
+            subject_template=None,
+            body_template=None,
+            body_html_template=None,
+            webhook_payload_template={
+                "event": "reminder.due",
+                "data": {"title": "{{ title }}", "tags": ["{{ tag }}", "static"], "count": 3},
+            },
+        )
+        renderer = TemplateRenderer()
+
+        rendered = renderer.render_template(template, {"title": "Tax", "tag": "finance"})
+
+        assert rendered == {
+            "payload": {
+                "event": "reminder.due",
+                "data": {"title": "Tax", "tags": ["finance", "static"], "count": 3},
+            },
+        }
+
+    def test_missing_required_variable_raises(self):
+        """Required context variables are validated before rendering."""
+        with pytest.raises(TemplateRenderError) as exc_info:
+            TemplateRenderer().render_template(make_template(), {"name": "Ann"})
+
+        assert exc_info.value.missing_vars == ["title"]
+
+    def test_syntax_error_raises_render_error(self):
+        """Templates that fail to compile raise TemplateRenderError."""
+        template = make_template(subject_template="{{ title ")
+
+        with pytest.raises(TemplateRenderError, match="Syntax error"):
+            TemplateRenderer().render_template(template, {"title": "Tax"})
+
+
+class TestCompiledTemplateCache:
+    """Test render plan caching."""
+
+    def test_reuses_plan_for_same_template(self):
+        """Repeated renders compile a template once."""
+        renderer = TemplateRenderer()
+        template = make_template()
+
+        for i in range(5):
+            renderer.render_template(template, {"title": f"Item {i}", "name": "Ann"})
+
+        assert renderer.cached_templates == 1
+        assert renderer.compile(template) is renderer.compile(template)
+
+    def test_edited_template_gets_new_plan(self):
+        """Changing a template's source invalidates its plan even without a version bump."""
+        renderer = TemplateRenderer()
+        template = make_template()
+        renderer.render_template(template, {"title": "Tax", "name": "Ann"})
+
+        template.subject_template = "Due: {{ title }}"
+        rendered = renderer.render_template(template, {"title": "Tax", "name": "Ann"})
+
+        assert rendered["subject"] == "Due: Tax"
+
+    def test_evicts_least_recently_used(self):
+        """The cache stays within ``cache_size``."""
+        renderer = TemplateRenderer(cache_size=2)
+        first, second, third = make_template(), make_template(), make_template()
+
+        first_plan = renderer.compile(first)
+        renderer.compile(second)
+        renderer.compile(first)
+        renderer.compile(third)
+
+        assert renderer.cached_templates == 2
+        assert renderer.compile(first) is first_plan
+
+
+class TestRenderMany:
+    """Test batch rendering."""
+
+    def test_renders_each_context_in_order(self):
+        """One template renders against many contexts with a single compile."""
+        renderer = TemplateRenderer()
+        contexts = [{"title": f"Item {i}", "name": "Ann"} for i in range(3)]
+
+        rendered = renderer.render_many(make_template(), contexts)
+
+        assert [item["subject"] for item in rendered] == [
+            "Reminder: Item 0",
+            "Reminder: Item 1",
+            "Reminder: Item 2",
+        ]
+        assert renderer.cached_templates == 1
+
+    def test_invalid_context_raises(self):
+        """A context missing required variables fails the batch."""
+        with pytest.raises(TemplateRenderError):
+            TemplateRenderer().render_many(make_template(), [{"title": "Tax"}, {"name": "Ann"}])
@@ -114,3 +114,17 @@ async def test_global_cache_init(monkeypatch: pytest.MonkeyPatch):
     redis = DummyRedis()
     cache = await init_search_cache(redis)
     assert cache.redis is redis
+
+
+@pytest.mark.asyncio
+async def test_facet_cache_normalizes_query():
+    redis = DummyRedis()
+    cache = SearchCache(redis, SearchCacheConfig())
+    facets = [{"field": "status", "display_name": "Status", "values": []}]
+
+    assert await cache.set_facets("reminders", "Team  Meeting", "plain", "english", facets)
+
+    assert await cache.get_facets("reminders", "team meeting", "plain", "english") == facets
+    assert await cache.get_facets("reminders", "team meeting", "phrase", "english") is None
+    assert await cache.invalidate_search() == 1
+    assert await cache.get_facets("reminders", "team meeting", "plain", "english") is None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 
 from example_service.features.search import service as search_service
@@ -38,6 +41,21 @@ def _single_entity_config() -> SearchConfiguration:
     return SearchConfiguration(settings=SearchSettings(), entity_registry=registry)
 
 
+def _multi_entity_config(**settings) -> SearchConfiguration:
+    """Build a configuration with three entities and custom settings."""
+    registry = SearchEntityRegistry()
+    for name in ("alpha", "beta", "gamma"):
+        registry.register(
+            name,
+            EntitySearchConfig(
+                display_name=name.title(),
+                model_path="example_service.features.reminders.models.Reminder",
+                search_fields=["title"],
+            ),
+        )
+    return SearchConfiguration(settings=SearchSettings(**settings), entity_registry=registry)
+
+
 @pytest.mark.asyncio
 async def test_search_uses_cache_and_sets_results(monkeypatch: pytest.MonkeyPatch) -> None:
 
@@ -112,3 +130,247 @@ async def test_search_records_analytics_and_handles_low_hits(monkeypatch: pytest
     assert resp.suggestions == ["sugg"]
     assert analytics_calls
     assert analytics_calls[0]["results_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_uses_separate_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    sessions: list[object] = []
+
+    @asynccontextmanager
+    async def session_factory():
+        session = object()
+        sessions.append(session)
+        yield session
+
+    svc = search_service.SearchService(
+        session=None,
+        enable_cache=False,
+        enable_analytics=False,
+        enable_fuzzy_fallback=False,
+        enable_click_boosting=False,
+        enable_parallel_search=True,
+        session_factory=session_factory,
+        config=_multi_entity_config(),
+    )
+    used: list[object] = []
+    in_flight = 0
+    peak = 0
+    all_started = asyncio.Event()
+
+    async def stub_search(entity_type, req, expanded_query, intent, *, session=None):
+        nonlocal in_flight, peak
+        used.append(session)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if in_flight == 3:
+            all_started.set()
+        try:
+            # Only returns once every entity search is in flight at the same time.
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+        finally:
+            in_flight -= 1
+        return EntitySearchResult(entity_type=entity_type, total=1, hits=[])
+
+    monkeypatch.setattr(svc, "_search_entity", stub_search)
+
+    resp = await svc.search(SearchRequest(query="hello"))
+
+    assert [r.entity_type for r in resp.results] == ["alpha", "beta", "gamma"]
+    assert resp.total_hits == 3
+    assert resp.partial is False
+    assert peak == 3
+    assert sorted(map(id, used)) == sorted(map(id, sessions))
+    assert len(set(map(id, used))) == 3
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_returns_partial_results_on_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Cache:
+        def __init__(self):
+            self.set_called = False
+
+        async def get_search_results(self, request):
+            return None
+
+        async def set_search_results(self, request, response):
+            self.set_called = True
+
+    @asynccontextmanager
+    async def session_factory():
+        yield object()
+
+    cache = Cache()
+    svc = search_service.SearchService(
+        session=None,
+        enable_cache=True,
+        cache=cache,
+        enable_analytics=False,
+        enable_fuzzy_fallback=False,
+        enable_click_boosting=False,
+        enable_parallel_search=True,
+        session_factory=session_factory,
+        config=_multi_entity_config(parallel_search_timeout_ms=50, parallel_search_max_concurrency=2),
+    )
+
+    async def stub_search(entity_type, req, expanded_query, intent, *, session=None):
+        if entity_type == "beta":
+            await asyncio.sleep(5)
+        return EntitySearchResult(entity_type=entity_type, total=5, hits=[])
+
+    monkeypatch.setattr(svc, "_search_entity", stub_search)
+
+    resp = await svc.search(SearchRequest(query="hello"))
+
+    assert resp.partial is True
+    assert resp.timed_out_entities == ["beta"]
+    assert [r.entity_type for r in resp.results] == ["alpha", "gamma"]
+    assert resp.total_hits == 10
+    assert cache.set_called is False
+
+
+class _Row(tuple):
+    """Result row supporting both index and attribute access."""
+
+    __slots__ = ()
+
+    @property
+    def total(self):
+        return self[2]
+
+
+class _Result:
+    def __init__(self, rows, scalar=None):
+        self._rows = rows
+        self._scalar = scalar
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class _RecordingSession:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return self.results.pop(0)
+
+
+def _reminder(title: str, description: str):
+    from example_service.features.reminders.models import Reminder
+
+    return Reminder(title=title, description=description)
+
+
+@pytest.mark.asyncio
+async def test_search_entity_uses_single_statement_for_hits_count_and_highlights() -> None:
+    rows = [
+        _Row((_reminder("Team meeting", "weekly meeting notes"), 0.9, 42, "weekly <b>meeting</b> notes")),
+        _Row((_reminder("Meeting prep", "agenda"), 0.5, 42, "<b>agenda</b>")),
+    ]
+    session = _RecordingSession(_Result(rows))
+    svc = search_service.SearchService(
+        session=session,
+        enable_cache=False,
+        enable_analytics=False,
+        enable_fuzzy_fallback=False,
+        config=_single_entity_config(),
+    )
+
+    result = await svc._search_entity(
+        "reminders", SearchRequest(query="meeting", highlight=True), "meeting", None,
+    )
+
+    assert len(session.statements) == 1
+    sql = str(session.statements[0])
+    assert "count(*) OVER ()" in sql
+    assert "ts_headline" in sql
+    assert result.total == 42
+    assert result.total_exact is True
+    assert [hit.snippet for hit in result.hits] == ["weekly <b>meeting</b> notes", "<b>agenda</b>"]
+
+
+@pytest.mark.asyncio
+async def test_search_entity_caps_total_above_threshold() -> None:
+    rows = [_Row((_reminder("Meeting", "notes"), 0.9, 101, "notes"))]
+    config = _single_entity_config()
+    config.settings = SearchSettings(count_strategy="capped", count_threshold=100)
+    session = _RecordingSession(_Result(rows))
+    svc = search_service.SearchService(
+        session=session,
+        enable_cache=False,
+        enable_analytics=False,
+        enable_fuzzy_fallback=False,
+        config=config,
+    )
+
+    result = await svc._search_entity(
+        "reminders", SearchRequest(query="meeting"), "meeting", None,
+    )
+
+    assert len(session.statements) == 1
+    assert "OVER ()" not in str(session.statements[0])
+    assert result.total == 100
+    assert result.total_exact is False
+
+
+class _FacetCache:
+    def __init__(self):
+        self.storage = {}
+
+    async def get_facets(self, entity_type, query, syntax, ts_config):
+        return self.storage.get((entity_type, " ".join(query.lower().split())))
+
+    async def set_facets(self, entity_type, query, syntax, ts_config, facets, ttl=None):
+        self.storage[(entity_type, " ".join(query.lower().split()))] = [f.model_dump() for f in facets]
+        return True
+
+
+@pytest.mark.asyncio
+async def test_get_facets_counts_all_fields_in_one_statement() -> None:
+    from example_service.features.reminders.models import Reminder
+
+    config = EntitySearchConfig(
+        display_name="Reminders",
+        model_path="example_service.features.reminders.models.Reminder",
+        search_fields=["title"],
+        facet_fields=["is_completed", "notification_sent", "missing"],
+    )
+    # Rows: is_completed, notification_sent, grouping_id, count, facet_rank
+    rows = [
+        (False, None, 1, 7, 1),
+        (True, None, 1, 3, 2),
+        (None, True, 2, 10, 1),
+    ]
+    session = _RecordingSession(_Result(rows))
+    cache = _FacetCache()
+    svc = search_service.SearchService(
+        session=session,
+        cache=cache,
+        enable_analytics=False,
+        config=_single_entity_config(),
+    )
+    kwargs = {"entity_type": "reminders", "query": "Team  Meeting", "syntax": "plain"}
+
+    facets = await svc._get_facets(
+        Reminder, config, search_service.func.plainto_tsquery("meeting"),
+        Reminder.search_vector, **kwargs,
+    )
+    again = await svc._get_facets(
+        Reminder, config, search_service.func.plainto_tsquery("meeting"),
+        Reminder.search_vector, **kwargs,
+    )
+
+    assert len(session.statements) == 1
+    assert "GROUPING SETS" in str(session.statements[0])
+    assert [(f.field, [(v.value, v.count) for v in f.values]) for f in facets] == [
+        ("is_completed", [("False", 7), ("True", 3)]),
+        ("notification_sent", [("True", 10)]),
+    ]
+    assert again == facets
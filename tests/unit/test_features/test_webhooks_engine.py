@@ -0,0 +1,158 @@
+"""Tests for the concurrent webhook delivery engine."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from example_service.features.webhooks.client import WebhookDeliveryResult
+from example_service.features.webhooks.engine import (
+    DeliveryScheduler,
+    WebhookDeliveryEngine,
+)
+
+
+class FakeClient:
+    """Answers with a fixed status code and tracks concurrency."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.01) -> None:
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def deliver(self, webhook, event_type, event_id, payload) -> WebhookDeliveryResult:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        success = 200 <= self.status_code < 300
+        return WebhookDeliveryResult(
+            success=success,
+            status_code=self.status_code,
+            response_body=None,
+            response_time_ms=int(self.delay * 1000),
+            error_message=None if success else f"HTTP {self.status_code}",
+        )
+
+    async def aclose(self) -> None:
+        pass
+
+
+def make_webhook(host: str = "hooks.example.com") -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), url=f"https://{host}/events")
+
+
+def make_delivery() -> SimpleNamespace:
+    return SimpleNamespace(event_type="file.uploaded", event_id="evt_1", payload={"id": 1})
+
+
+class TestWebhookDeliveryEngine:
+    """Test fan-out, per-host limits and circuit breaking."""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_to_different_hosts_concurrently(self):
+        """Deliveries to different hosts run at the same time."""
+        client = FakeClient()
+        engine = WebhookDeliveryEngine(client, max_concurrency_per_host=1)
+        deliveries = [(make_webhook(f"host{i}.example.com"), make_delivery()) for i in range(20)]
+
+        results = await engine.deliver_many(deliveries)
+
+        assert all(result.success for result in results)
+        assert client.max_in_flight == 20
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_host(self):
+        """Deliveries to one host queue behind the per-host limit."""
+        client = FakeClient()
+        engine = WebhookDeliveryEngine(client, max_concurrency_per_host=3)
+        webhooks = [make_webhook() for _ in range(10)]
+
+        await engine.deliver_many([(webhook, make_delivery()) for webhook in webhooks])
+
+        assert client.calls == 10
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_opens_its_circuit(self):
+        """After repeated 5xx responses the endpoint is skipped."""
+        client = FakeClient(status_code=503, delay=0)
+        engine = WebhookDeliveryEngine(client, failure_threshold=2)
+        webhook = make_webhook()
+
+        first = await engine.deliver(webhook, "file.uploaded", "evt_1", {})
+        second = await engine.deliver(webhook, "file.uploaded", "evt_2", {})
+        third = await engine.deliver(webhook, "file.uploaded", "evt_3", {})
+
+        assert (first.status_code, second.status_code) == (503, 503)
+        assert not first.circuit_open
+        assert third.circuit_open
+        assert client.calls == 2
+
+        # Other webhooks are unaffected
+        other = await engine.deliver(make_webhook(), "file.uploaded", "evt_4", {})
+        assert other.status_code == 503
+        assert not other.circuit_open
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self):
+        """A 4xx rejects the request, not the endpoint."""
+        client = FakeClient(status_code=422, delay=0)
+        engine = WebhookDeliveryEngine(client, failure_threshold=1)
+        webhook = make_webhook()
+
+        results = [await engine.deliver(webhook, "file.uploaded", f"evt_{i}", {}) for i in range(3)]
+
+        assert not any(result.circuit_open for result in results)
+        assert client.calls == 3
+
+
+class TestDeliveryScheduler:
+    """Test the scheduled delivery queue."""
+
+    @pytest.mark.asyncio
+    async def test_hands_over_ids_when_due(self):
+        """Due IDs are delivered immediately and later IDs when their time comes."""
+        batches: list[list] = []
+        delivered = asyncio.Event()
+
+        async def handler(ids):
+            batches.append(ids)
+            if len(batches) == 2:
+                delivered.set()
+
+        scheduler = DeliveryScheduler(handler)
+        now_ids = [uuid4(), uuid4()]
+        later_id = uuid4()
+
+        scheduler.schedule([later_id], datetime.now(UTC) + timedelta(milliseconds=50))
+        scheduler.schedule(now_ids)
+        await asyncio.wait_for(delivered.wait(), timeout=2)
+        await scheduler.stop()
+
+        assert batches == [now_ids, [later_id]]
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_splits_due_ids_into_batches(self):
+        """A burst is handed over in batches of ``batch_size``."""
+        batches: list[list] = []
+
+        async def handler(ids):
+            batches.append(ids)
+
+        scheduler = DeliveryScheduler(handler, batch_size=4)
+        scheduler.schedule([uuid4() for _ in range(10)])
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
@@ -0,0 +1,129 @@
+"""Tests for pluggable cache value codecs.
+
+Tests cover:
+- Type-preserving round trips for JSON and msgpack
+- Threshold-based compression and header tagging
+- Decoding legacy plain JSON and raw string values
+- RedisCache batched reads and writes through the codec
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from example_service.infra.cache.codecs import CacheCodec
+from example_service.infra.cache.redis import RedisCache
+
+
+@pytest.fixture
+def typed_value() -> dict:
+    """Value containing types JSON cannot represent natively."""
+    return {
+        "id": uuid4(),
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "day": date(2024, 1, 2),
+        "price": Decimal("19.99"),
+        "tags": {"a", "b"},
+        "blob": b"\x00\x01",
+        "nested": [{"n": 1}],
+    }
+
+
+class TestCacheCodec:
+    """Test CacheCodec encode/decode behaviour."""
+
+    @pytest.mark.parametrize("serializer", ["json", "msgpack"])
+    def test_round_trip_preserves_types(self, serializer: str, typed_value: dict) -> None:
+        """Test values decode to the same Python types."""
+        if serializer == "msgpack":
+            pytest.importorskip("msgpack")
+        codec = CacheCodec(serializer=serializer)  # type: ignore[arg-type]
+
+        assert codec.decode(codec.encode(typed_value)) == typed_value
+
+    def test_plain_json_is_headerless(self) -> None:
+        """Test the default codec writes the historical JSON format."""
+        data = CacheCodec().encode({"a": 1})
+
+        assert json.loads(data) == {"a": 1}
+
+    def test_small_payloads_are_not_compressed(self) -> None:
+        """Test values below the threshold skip compression."""
+        codec = CacheCodec(compression="zlib", compression_threshold=1024)
+
+        assert codec.encode({"a": 1}) == b'{"a":1}'
+
+    def test_large_payloads_are_compressed(self) -> None:
+        """Test values above the threshold are compressed and tagged."""
+        codec = CacheCodec(compression="zlib", compression_threshold=64)
+        value = {"items": ["x" * 20] * 100}
+
+        data = codec.encode(value)
+
+        assert data[0] == 2
+        assert len(data) < len(json.dumps(value))
+        assert codec.decode(data) == value
+
+    def test_decodes_entries_written_by_other_configurations(self) -> None:
+        """Test readers decode values regardless of their own settings."""
+        writer = CacheCodec(compression="zlib", compression_threshold=0)
+        reader = CacheCodec()
+
+        assert reader.decode(writer.encode({"a": 1})) == {"a": 1}
+
+    def test_legacy_values(self) -> None:
+        """Test legacy JSON strings and raw strings still decode."""
+        codec = CacheCodec()
+
+        assert codec.decode('{"a": 1}') == {"a": 1}
+        assert codec.decode(b"plain text") == "plain text"
+        assert codec.decode("plain text") == "plain text"
+
+    def test_unknown_options_rejected(self) -> None:
+        """Test unknown serializer/compressor names raise ValueError."""
+        with pytest.raises(ValueError, match="serializer"):
+            CacheCodec(serializer="pickle")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="compression"):
+            CacheCodec(compression="brotli")  # type: ignore[arg-type]
+
+    def test_unsupported_type_raises(self) -> None:
+        """Test unsupported objects raise TypeError on encode."""
+        with pytest.raises(TypeError):
+            CacheCodec().encode({"obj": object()})
+
+
+class TestRedisCacheBatching:
+    """Test RedisCache batched operations."""
+
+    async def test_get_many_uses_single_mget(self) -> None:
+        """Test get_many decodes every key from one MGET."""
+        cache = RedisCache()
+        cache._client = AsyncMock()
+        cache._client.execute_command = AsyncMock(return_value=[b'{"a":1}', None])
+
+        result = await cache.get_many(["k1", "k2"])
+
+        assert result == [{"a": 1}, None]
+        cache._client.execute_command.assert_awaited_once()
+        assert cache._client.execute_command.call_args.args[:3] == ("MGET", "k1", "k2")
+
+    async def test_set_many_pipelines_writes(self) -> None:
+        """Test set_many sends all writes in one pipeline."""
+        cache = RedisCache()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        cache._client = MagicMock()
+        cache._client.pipeline = MagicMock(return_value=pipe)
+
+        assert await cache.set_many({"k1": {"a": 1}, "k2": "raw"}, ttl=60) is True
+
+        assert pipe.set.call_count == 2
+        pipe.set.assert_any_call("k1", b'{"a":1}', ex=60)
+        pipe.set.assert_any_call("k2", "raw", ex=60)
+        pipe.execute.assert_awaited_once()
@@ -19,6 +19,8 @@ Test Strategy:
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
@@ -902,3 +904,101 @@ class TestCacheEdgeCases:
         # Should store 3 tags
         mock_redis = mock_cache._client
         assert mock_redis.sadd.call_count == 3
+
+
+class TestCachedStampedeProtection:
+    """Test @cached request coalescing and early refresh."""
+
+    async def test_concurrent_misses_execute_once(self, mock_cache: AsyncMock) -> None:
+        """Test concurrent misses for one key share a single computation."""
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached(key_prefix="hot", ttl=300)
+        async def get_hot(item_id: int) -> dict[str, int]:
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return {"id": item_id}
+
+        tasks = [asyncio.create_task(get_hot(1)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert call_count == 1
+        assert all(result == {"id": 1} for result in results)
+        mock_cache.set.assert_called_once()
+
+    async def test_single_flight_disabled(self, mock_cache: AsyncMock) -> None:
+        """Test single_flight=False lets every miss compute."""
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached(key_prefix="cold", ttl=300, single_flight=False)
+        async def get_cold(item_id: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return item_id
+
+        tasks = [asyncio.create_task(get_cold(1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert call_count == 3
+
+    async def test_result_stored_with_refresh_metadata(self, mock_cache: AsyncMock) -> None:
+        """Test results are stored in an XFetch envelope and unwrapped on hit."""
+
+        @cached(key_prefix="env", ttl=300, early_refresh_beta=1.0)
+        async def get_value() -> dict[str, str]:
+            return {"a": "b"}
+
+        await get_value()
+
+        stored = mock_cache.set.call_args[0][1]
+        assert stored["value"] == {"a": "b"}
+        assert stored["delta"] >= 0
+
+        mock_cache.get.return_value = stored
+        assert await get_value() == {"a": "b"}
+
+    async def test_expiring_entry_refreshes_in_background(
+        self, mock_cache: AsyncMock,
+    ) -> None:
+        """Test an entry past its expiry returns stale data and refreshes."""
+        call_count = 0
+
+        @cached(key_prefix="stale", ttl=300, early_refresh_beta=1.0)
+        async def get_value() -> int:
+            nonlocal call_count
+            call_count += 1
+            return 2
+
+        mock_cache.get.return_value = {
+            "__xfetch__": 1,
+            "value": 1,
+            "delta": 0.5,
+            "expiry": time.time() - 1,
+        }
+
+        assert await get_value() == 1
+        await asyncio.sleep(0.01)
+
+        assert call_count == 1
+        mock_cache.set.assert_called_once()
+
+    async def test_early_refresh_disabled_stores_plain_value(
+        self, mock_cache: AsyncMock,
+    ) -> None:
+        """Test early refresh is opt-in, so results are stored as-is."""
+
+        @cached(key_prefix="plain", ttl=300)
+        async def get_value() -> dict[str, int]:
+            return {"x": 1}
+
+        await get_value()
+
+        assert mock_cache.set.call_args[0][1] == {"x": 1}
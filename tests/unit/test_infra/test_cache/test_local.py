@@ -0,0 +1,288 @@
+"""Tests for the in-process L1 cache and its RedisCache integration.
+
+Tests cover:
+- LocalCache get/set/delete with TTL expiry
+- LRU and LFU eviction once the cache is full
+- Redis-style glob pattern deletes
+- RedisCache serving hits from L1 and publishing invalidations
+- Capping L1 TTLs at the remaining Redis TTL
+- Applying invalidation messages published by other replicas
+- Resubscribing to invalidations after the pub/sub connection drops
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from example_service.infra.cache.local import LocalCache
+from example_service.infra.cache.redis import RedisCache
+
+
+class TestLocalCache:
+    """Test LocalCache storage, expiry and eviction."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """Test a stored value is returned by reference."""
+        cache = LocalCache(max_size=10, ttl=30.0)
+        value = {"id": 42}
+
+        cache.set("user:42", value)
+
+        assert cache.get("user:42") is value
+        assert cache.stats()["hits"] == 1
+
+    def test_get_missing_key_records_miss(self) -> None:
+        """Test a missing key returns None and counts a miss."""
+        cache = LocalCache(max_size=10, ttl=30.0)
+
+        assert cache.get("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_none_values_are_not_stored(self) -> None:
+        """Test None is never cached since it signals a miss."""
+        cache = LocalCache(max_size=10, ttl=30.0)
+
+        cache.set("key", None)
+
+        assert len(cache) == 0
+
+    def test_expired_entry_is_removed(self) -> None:
+        """Test entries past their TTL are treated as misses."""
+        cache = LocalCache(max_size=10, ttl=30.0)
+
+        with patch("example_service.infra.cache.local.time.monotonic", return_value=100.0):
+            cache.set("key", "value", ttl=5)
+        with patch("example_service.infra.cache.local.time.monotonic", return_value=106.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_ttl_is_capped_at_default(self) -> None:
+        """Test a longer per-entry TTL is capped at the cache TTL."""
+        cache = LocalCache(max_size=10, ttl=10.0)
+
+        with patch("example_service.infra.cache.local.time.monotonic", return_value=0.0):
+            cache.set("key", "value", ttl=3600)
+        with patch("example_service.infra.cache.local.time.monotonic", return_value=11.0):
+            assert cache.get("key") is None
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """Test LRU eviction keeps recently read keys."""
+        cache = LocalCache(max_size=2, ttl=30.0, eviction="lru")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_lfu_evicts_least_frequently_used(self) -> None:
+        """Test LFU eviction keeps frequently read keys."""
+        cache = LocalCache(max_size=2, ttl=30.0, eviction="lfu")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        for _ in range(3):
+            cache.get("b")
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" not in cache
+        assert "b" in cache
+        assert "c" in cache
+
+    def test_lfu_ties_evict_oldest(self) -> None:
+        """Test LFU breaks frequency ties by insertion order."""
+        cache = LocalCache(max_size=2, ttl=30.0, eviction="lfu")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert "a" not in cache
+        assert len(cache) == 2
+
+    def test_delete_pattern(self) -> None:
+        """Test glob pattern deletes match Redis semantics."""
+        cache = LocalCache(max_size=10, ttl=30.0)
+        cache.set("user:1", 1)
+        cache.set("user:2", 2)
+        cache.set("team:1", 3)
+
+        assert cache.delete_pattern("user:*") == 2
+        assert "team:1" in cache
+
+    def test_invalid_configuration(self) -> None:
+        """Test invalid sizes and policies are rejected."""
+        with pytest.raises(ValueError, match="max_size"):
+            LocalCache(max_size=0)
+        with pytest.raises(ValueError, match="ttl"):
+            LocalCache(ttl=0)
+        with pytest.raises(ValueError, match="eviction"):
+            LocalCache(eviction="fifo")  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def two_tier_cache() -> RedisCache:
+    """Create a RedisCache with an L1 layer and a mocked Redis client."""
+    cache = RedisCache(local_cache=LocalCache(max_size=100, ttl=30.0))
+    client = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[json.dumps({"id": 1}).encode(), -1])
+    client.pipeline = MagicMock(return_value=pipe)
+    client.set = AsyncMock(return_value=True)
+    client.delete = AsyncMock(return_value=1)
+    client.publish = AsyncMock(return_value=1)
+    cache._client = client
+    return cache
+
+
+class TestRedisCacheLocalLayer:
+    """Test RedisCache behaviour with the L1 layer enabled."""
+
+    async def test_second_read_served_from_local(self, two_tier_cache: RedisCache) -> None:
+        """Test hot keys skip the Redis round trip after the first read."""
+        first = await two_tier_cache.get("user:1")
+        second = await two_tier_cache.get("user:1")
+
+        assert first == second == {"id": 1}
+        two_tier_cache.client.pipeline().execute.assert_awaited_once()
+
+    async def test_local_ttl_capped_at_redis_ttl(self, two_tier_cache: RedisCache) -> None:
+        """Test L1 copies expire no later than the Redis entry."""
+        pipe = two_tier_cache.client.pipeline()
+        pipe.execute.return_value = [json.dumps({"id": 1}).encode(), 2000]
+
+        await two_tier_cache.get("user:1")
+
+        local = two_tier_cache.local_cache
+        assert local is not None
+        remaining = local._entries["user:1"].expires_at - time.monotonic()
+        assert 0 < remaining <= 2.0
+
+    async def test_get_many_caps_local_ttls(self, two_tier_cache: RedisCache) -> None:
+        """Test batched reads cap each L1 TTL and skip expiring keys."""
+        pipe = two_tier_cache.client.pipeline()
+        pipe.execute.return_value = [[b"1", b"2", None], 1500, -2, -2]
+
+        values = await two_tier_cache.get_many(["a", "b", "c"])
+
+        assert values == [1, 2, None]
+        local = two_tier_cache.local_cache
+        assert local is not None
+        assert local._entries["a"].expires_at - time.monotonic() <= 1.5
+        assert "b" not in local
+
+    async def test_set_evicts_local_and_publishes(self, two_tier_cache: RedisCache) -> None:
+        """Test writes drop the L1 copy and notify other replicas."""
+        await two_tier_cache.get("user:1")
+
+        await two_tier_cache.set("user:1", {"id": 2})
+
+        assert "user:1" not in two_tier_cache.local_cache
+        two_tier_cache.client.publish.assert_awaited_once()
+        _, payload = two_tier_cache.client.publish.call_args[0]
+        assert json.loads(payload)["keys"] == ["user:1"]
+
+    async def test_delete_publishes_invalidation(self, two_tier_cache: RedisCache) -> None:
+        """Test deletes publish an invalidation message."""
+        await two_tier_cache.delete("user:1")
+
+        two_tier_cache.client.publish.assert_awaited_once()
+
+    async def test_publish_failure_is_not_raised(self, two_tier_cache: RedisCache) -> None:
+        """Test invalidation publishing failures never fail the write."""
+        two_tier_cache.client.publish.side_effect = ConnectionError("down")
+
+        assert await two_tier_cache.set("user:1", {"id": 2}) is True
+
+    def test_remote_invalidation_evicts_keys(self, two_tier_cache: RedisCache) -> None:
+        """Test messages from other replicas evict matching entries."""
+        local = two_tier_cache.local_cache
+        assert local is not None
+        local.set("user:1", 1)
+        local.set("user:2", 2)
+        local.set("team:1", 3)
+
+        two_tier_cache._apply_invalidation(
+            json.dumps({"origin": "other", "keys": ["team:1"], "pattern": "user:*"}),
+        )
+
+        assert len(local) == 0
+
+    def test_own_invalidation_is_ignored(self, two_tier_cache: RedisCache) -> None:
+        """Test messages published by this instance are skipped."""
+        local = two_tier_cache.local_cache
+        assert local is not None
+        local.set("user:1", 1)
+
+        two_tier_cache._apply_invalidation(
+            json.dumps({"origin": two_tier_cache._instance_id, "keys": ["user:1"]}),
+        )
+
+        assert "user:1" in local
+
+    def test_malformed_invalidation_is_ignored(self, two_tier_cache: RedisCache) -> None:
+        """Test malformed payloads do not raise."""
+        two_tier_cache._apply_invalidation("not-json")
+
+
+class FakePubSub:
+    """Pub/sub stand-in whose listen() replays messages, then fails."""
+
+    def __init__(self, messages: list[dict], error: Exception | None = None) -> None:
+        self.messages = messages
+        self.error = error
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestInvalidationListener:
+    """Test the invalidation listener survives dropped connections."""
+
+    async def test_resubscribes_and_clears_local_after_disconnect(
+        self, two_tier_cache: RedisCache,
+    ) -> None:
+        """Test a dropped connection is replaced and stale L1 entries cleared."""
+        local = two_tier_cache.local_cache
+        assert local is not None
+        local.set("user:1", 1)
+        local.set("user:2", 2)
+        dropped = FakePubSub(
+            [{"type": "message", "data": json.dumps({"origin": "other", "keys": ["user:1"]})}],
+            error=ConnectionError("connection lost"),
+        )
+        resubscribed = FakePubSub([])
+        two_tier_cache.client.pubsub = MagicMock(side_effect=[dropped, resubscribed])
+
+        yield_to_listener = asyncio.sleep
+        with patch("example_service.infra.cache.redis.asyncio.sleep", AsyncMock()) as backoff:
+            await two_tier_cache._start_invalidation_listener()
+            for _ in range(10):
+                await yield_to_listener(0)
+            await two_tier_cache._stop_invalidation_listener()
+
+        backoff.assert_awaited_once()
+        assert dropped.closed
+        assert resubscribed.channel == two_tier_cache._invalidation_channel
+        assert len(local) == 0
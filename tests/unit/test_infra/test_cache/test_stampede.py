@@ -0,0 +1,301 @@
+"""Tests for cache stampede protection primitives.
+
+Tests cover:
+- XFetch envelopes and the early refresh decision
+- SingleFlight coalescing, error propagation and background refreshes
+- StampedeGuard cross-replica lock acquire and wait-for-result paths
+- CacheManager.get_or_fetch coalescing concurrent misses
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from example_service.infra.cache.stampede import (
+    CacheEntry,
+    SingleFlight,
+    StampedeGuard,
+    should_refresh_early,
+    unwrap_entry,
+    wrap_entry,
+)
+from example_service.infra.cache.strategies import CacheConfig, CacheManager
+
+
+class TestEntries:
+    """Test XFetch envelope helpers."""
+
+    def test_wrap_and_unwrap_round_trip(self) -> None:
+        """Test wrapped values unwrap with their metadata."""
+        entry = unwrap_entry(wrap_entry({"a": 1}, delta=0.2, ttl=60))
+
+        assert entry.value == {"a": 1}
+        assert entry.delta == 0.2
+        assert entry.expiry is not None
+        assert entry.expiry > time.time()
+
+    def test_plain_values_pass_through(self) -> None:
+        """Test legacy plain values unwrap without metadata."""
+        entry = unwrap_entry({"a": 1})
+
+        assert entry == CacheEntry(value={"a": 1})
+
+    def test_no_envelope_without_ttl_or_value(self) -> None:
+        """Test None results and non-expiring values are stored as-is."""
+        assert wrap_entry(None, delta=1.0, ttl=60) is None
+        assert wrap_entry("x", delta=1.0, ttl=0) == "x"
+
+    def test_refresh_after_expiry(self) -> None:
+        """Test an expired entry always refreshes."""
+        entry = CacheEntry(value=1, delta=0.1, expiry=100.0)
+
+        assert should_refresh_early(entry, now=100.0) is True
+
+    def test_no_refresh_far_from_expiry(self) -> None:
+        """Test a fresh entry is not refreshed for a typical random draw."""
+        entry = CacheEntry(value=1, delta=0.1, expiry=1000.0)
+
+        with patch("example_service.infra.cache.stampede.random.random", return_value=0.5):
+            assert should_refresh_early(entry, now=100.0) is False
+
+    def test_expensive_values_refresh_earlier(self) -> None:
+        """Test larger recompute times widen the refresh window."""
+        cheap = CacheEntry(value=1, delta=0.1, expiry=110.0)
+        expensive = CacheEntry(value=1, delta=20.0, expiry=110.0)
+
+        with patch("example_service.infra.cache.stampede.random.random", return_value=0.5):
+            assert should_refresh_early(cheap, now=100.0) is False
+            assert should_refresh_early(expensive, now=100.0) is True
+
+    def test_plain_entries_never_refresh(self) -> None:
+        """Test entries without metadata never refresh early."""
+        assert should_refresh_early(CacheEntry(value=1), now=1e12) is False
+
+
+class TestSingleFlight:
+    """Test SingleFlight request coalescing."""
+
+    async def test_concurrent_calls_share_result(self) -> None:
+        """Test concurrent callers run the function once."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flights.do("k", compute) for _ in range(10)))
+
+        assert calls == 1
+        assert results == [42] * 10
+        assert not flights.in_flight("k")
+
+    async def test_exception_propagates_to_all_callers(self) -> None:
+        """Test every waiter sees the leader's exception."""
+        flights = SingleFlight()
+
+        async def compute() -> int:
+            await asyncio.sleep(0.01)
+            msg = "boom"
+            raise ValueError(msg)
+
+        results = await asyncio.gather(
+            *(flights.do("k", compute) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_sequential_calls_recompute(self) -> None:
+        """Test results are not cached once the call completes."""
+        flights = SingleFlight()
+        compute = AsyncMock(return_value=1)
+
+        await flights.do("k", compute)
+        await flights.do("k", compute)
+
+        assert compute.await_count == 2
+
+    async def test_follower_takes_over_cancelled_leader(self) -> None:
+        """Test a waiter recomputes when the leader is cancelled."""
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow() -> int:
+            started.set()
+            await asyncio.sleep(10)
+            return 1
+
+        async def fast() -> int:
+            return 2
+
+        leader = asyncio.create_task(flights.do("k", slow))
+        await started.wait()
+        follower = asyncio.create_task(flights.do("k", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 2
+
+    async def test_spawn_deduplicates_background_refreshes(self) -> None:
+        """Test only one background refresh runs per key."""
+        flights = SingleFlight()
+        compute = AsyncMock(return_value=1)
+
+        assert flights.spawn("k", compute) is True
+        assert flights.spawn("k", compute) is False
+        await asyncio.sleep(0.01)
+
+        compute.assert_awaited_once()
+
+
+class TestStampedeGuardLock:
+    """Test the cross-replica Redis lock paths."""
+
+    async def test_lock_holder_computes_and_releases(self) -> None:
+        """Test the lock winner computes and releases its lock."""
+        client = AsyncMock()
+        client.set = AsyncMock(return_value=True)
+        guard = StampedeGuard(lock_timeout=5.0, flights=SingleFlight())
+        compute = AsyncMock(return_value="fresh")
+
+        result = await guard.fetch(
+            "k", compute, client=client, reader=AsyncMock(return_value=None),
+        )
+
+        assert result == "fresh"
+        client.set.assert_awaited_once()
+        assert client.set.call_args.kwargs["nx"] is True
+        client.eval.assert_awaited_once()
+
+    async def test_waiter_returns_holders_result(self) -> None:
+        """Test a replica that loses the lock waits for the stored value."""
+        client = AsyncMock()
+        client.set = AsyncMock(return_value=False)
+        client.exists = AsyncMock(return_value=1)
+        reader = AsyncMock(side_effect=[None, wrap_entry("shared", 0.1, 60)])
+        guard = StampedeGuard(lock_timeout=5.0, poll_interval=0.001, flights=SingleFlight())
+        compute = AsyncMock(return_value="local")
+
+        result = await guard.fetch("k", compute, client=client, reader=reader)
+
+        assert result == "shared"
+        compute.assert_not_awaited()
+
+    async def test_waiter_computes_when_lock_released_without_value(self) -> None:
+        """Test waiters compute themselves if the holder stored nothing."""
+        client = AsyncMock()
+        client.set = AsyncMock(return_value=False)
+        client.exists = AsyncMock(return_value=0)
+        guard = StampedeGuard(lock_timeout=5.0, poll_interval=0.001, flights=SingleFlight())
+        compute = AsyncMock(return_value="local")
+
+        result = await guard.fetch(
+            "k", compute, client=client, reader=AsyncMock(return_value=None),
+        )
+
+        assert result == "local"
+
+    async def test_lock_errors_fall_back_to_local_compute(self) -> None:
+        """Test Redis lock failures never block the computation."""
+        client = AsyncMock()
+        client.set = AsyncMock(side_effect=ConnectionError("down"))
+        guard = StampedeGuard(lock_timeout=5.0, flights=SingleFlight())
+
+        result = await guard.fetch(
+            "k", AsyncMock(return_value=1), client=client, reader=AsyncMock(),
+        )
+
+        assert result == 1
+
+
+@pytest.fixture
+def patched_cache():
+    """Patch get_cache used by CacheManager with an in-memory mock."""
+    store: dict[str, str] = {}
+    cache_mock = AsyncMock()
+    cache_mock._client = None
+
+    async def get(key: str, codec: object = None):
+        return store.get(key)
+
+    async def set_(
+        key: str, value: str, ttl: int | None = None, codec: object = None,
+    ) -> bool:
+        store[key] = value
+        return True
+
+    cache_mock.get = AsyncMock(side_effect=get)
+    cache_mock.set = AsyncMock(side_effect=set_)
+
+    class _Context:
+        async def __aenter__(self):
+            return cache_mock
+
+        async def __aexit__(self, *exc: object) -> None:
+            return None
+
+    with patch(
+        "example_service.infra.cache.strategies.get_cache",
+        side_effect=_Context,
+    ):
+        yield cache_mock
+
+
+class TestCacheManagerStampede:
+    """Test CacheManager.get_or_fetch stampede protection."""
+
+    async def test_get_or_fetch_coalesces_misses(self, patched_cache: AsyncMock) -> None:
+        """Test concurrent misses call the fetch function once."""
+        manager = CacheManager()
+        calls = 0
+
+        async def fetch() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        results = await asyncio.gather(
+            *(manager.get_or_fetch("user:1", fetch) for _ in range(5)),
+        )
+
+        assert calls == 1
+        assert all(result == {"id": 1} for result in results)
+        patched_cache.set.assert_awaited_once()
+
+    async def test_get_or_fetch_awaits_lambda_coroutines(
+        self, patched_cache: AsyncMock,
+    ) -> None:
+        """Test lambdas returning coroutines are awaited."""
+        manager = CacheManager()
+
+        async def load() -> int:
+            return 7
+
+        assert await manager.get_or_fetch("n", lambda: load()) == 7  # noqa: PLW0108 - the lambda wrapper is under test
+
+    async def test_custom_serializer_receives_raw_value(
+        self, patched_cache: AsyncMock,
+    ) -> None:
+        """Test the XFetch envelope never reaches a custom serializer."""
+        manager = CacheManager(
+            CacheConfig(
+                serialize=lambda value: f"n={value}",
+                deserialize=lambda raw: int(raw.removeprefix("n=")),
+                early_refresh_beta=1.0,
+            ),
+        )
+
+        load = AsyncMock(return_value=7)
+
+        assert await manager.get_or_fetch("n", load) == 7
+        assert patched_cache.set.await_args.args[1] == "n=7"
+        assert await manager.get_or_fetch("n", load) == 7
+        load.assert_awaited_once()
@@ -0,0 +1 @@
+"""Email infrastructure tests."""
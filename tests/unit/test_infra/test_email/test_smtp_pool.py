@@ -0,0 +1,164 @@
+"""Unit tests for the SMTP connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from example_service.infra.email.providers.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """Connected SMTP client stand-in that records commands."""
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.sent = 0
+        self.noops = 0
+        self.closed = False
+        self.healthy = True
+
+    async def send_message(self, message: str) -> tuple[dict, str]:
+        await asyncio.sleep(0.01)
+        self.sent += 1
+        return {}, "250 OK"
+
+    async def noop(self) -> None:
+        self.noops += 1
+        if not self.healthy:
+            msg = "connection dropped"
+            raise ConnectionError(msg)
+
+    async def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeConnector:
+    """Opens FakeSMTP clients and keeps track of them."""
+
+    def __init__(self) -> None:
+        self.clients: list[FakeSMTP] = []
+
+    async def __call__(self) -> FakeSMTP:
+        client = FakeSMTP(len(self.clients))
+        self.clients.append(client)
+        return client
+
+
+async def send(pool: SMTPConnectionPool, message: str = "hello") -> int:
+    async with pool.connection() as smtp:
+        await smtp.send_message(message)
+        return smtp.number
+
+
+class TestSMTPConnectionPool:
+    """Test connection reuse, limits and health checks."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection_for_sequential_sends(self):
+        """Consecutive sends share one connection."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector)
+
+        for _ in range(5):
+            await send(pool)
+
+        assert len(connector.clients) == 1
+        assert connector.clients[0].sent == 5
+        assert pool.idle == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_stay_within_max_size(self):
+        """A burst opens at most ``max_size`` connections."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector, max_size=3)
+
+        await asyncio.gather(*(send(pool) for _ in range(20)))
+
+        assert len(connector.clients) == 3
+        assert sum(client.sent for client in connector.clients) == 20
+
+    @pytest.mark.asyncio
+    async def test_replaces_connection_after_max_messages(self):
+        """A connection is closed once it has sent ``max_messages``."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector, max_messages=2)
+
+        used = [await send(pool) for _ in range(5)]
+
+        assert used == [0, 0, 1, 1, 2]
+        assert connector.clients[0].closed
+        assert connector.clients[1].closed
+        assert not connector.clients[2].closed
+
+    @pytest.mark.asyncio
+    async def test_discards_connection_that_raised(self):
+        """A connection is not reused after an error during use."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector)
+
+        with pytest.raises(ConnectionError):
+            async with pool.connection():
+                msg = "server went away"
+                raise ConnectionError(msg)
+
+        assert connector.clients[0].closed
+        assert pool.size == 0
+        assert await send(pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_checks_idle_connection_before_reuse(self):
+        """A connection idle past ``health_check_after`` gets a NOOP first."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector, health_check_after=0.0)
+
+        await send(pool)
+        connector.clients[0].healthy = False
+        number = await send(pool)
+
+        assert connector.clients[0].noops == 1
+        assert connector.clients[0].closed
+        assert number == 1
+
+    @pytest.mark.asyncio
+    async def test_closes_connections_idle_past_timeout(self):
+        """Expired idle connections are closed instead of reused."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector, idle_timeout=0.01)
+
+        await send(pool)
+        await asyncio.sleep(0.02)
+        number = await send(pool)
+
+        assert connector.clients[0].closed
+        assert connector.clients[0].noops == 0
+        assert number == 1
+
+    @pytest.mark.asyncio
+    async def test_reaps_idle_connections_without_checkouts(self):
+        """Idle connections are closed on expiry even if the pool goes quiet."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector, idle_timeout=0.01)
+
+        await send(pool)
+        await asyncio.sleep(0.05)
+
+        assert connector.clients[0].closed
+        assert pool.idle == 0
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_idle_connections(self):
+        """Closing the pool quits idle connections and rejects new checkouts."""
+        connector = FakeConnector()
+        pool = SMTPConnectionPool(connector)
+        await asyncio.gather(send(pool), send(pool))
+
+        await pool.close()
+
+        assert all(client.closed for client in connector.clients)
+        with pytest.raises(RuntimeError, match="closed"):
+            await send(pool)
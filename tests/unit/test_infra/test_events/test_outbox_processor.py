@@ -0,0 +1,193 @@
+"""Tests for the batched outbox processor."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from pamqp.commands import Basic
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from example_service.infra.database import session as session_module
+from example_service.infra.events.outbox import repository as repository_module
+from example_service.infra.events.outbox.processor import OutboxProcessor
+from example_service.infra.events.outbox.repository import OutboxRepository
+
+
+def _event(aggregate_id: str | None = None, event_type: str = "thing.created"):
+    return SimpleNamespace(
+        id=uuid4(),
+        event_type=event_type,
+        event_version=1,
+        payload=json.dumps({"n": 1}),
+        correlation_id=None,
+        aggregate_type="Thing" if aggregate_id else None,
+        aggregate_id=aggregate_id,
+        retry_count=0,
+    )
+
+
+@pytest.fixture
+def repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the outbox repository and session with mocks."""
+    repo = MagicMock()
+    repo.mark_processed_many = AsyncMock()
+    repo.mark_failed_many = AsyncMock()
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    monkeypatch.setattr(repository_module, "OutboxRepository", lambda: repo)
+    monkeypatch.setattr(session_module, "get_async_session", fake_session)
+    return repo
+
+
+class TestOutboxProcessorBatch:
+    """Validate pipelined publishing and set-based status updates."""
+
+    async def test_batch_marks_successes_and_failures_in_one_call_each(self, repo: MagicMock):
+        events = [_event(), _event(), _event()]
+        repo.fetch_pending = AsyncMock(return_value=events)
+        processor = OutboxProcessor(partition=1, partition_count=2)
+        processor._broker = MagicMock()
+        processor._broker.publish = AsyncMock(
+            side_effect=[Basic.Ack(), ConnectionError("down"), Basic.Nack()],
+        )
+
+        assert await processor._process_batch() == 1
+
+        assert repo.fetch_pending.await_args.kwargs["partition"] == 1
+        repo.mark_processed_many.assert_awaited_once()
+        assert repo.mark_processed_many.await_args.args[1] == [events[0].id]
+        failures = repo.mark_failed_many.await_args.args[1]
+        assert set(failures) == {events[1].id, events[2].id}
+        assert failures[events[1].id] == "down"
+
+    async def test_publishes_concurrently_but_in_order_per_aggregate(self, repo: MagicMock):
+        events = [_event("a", "a.1"), _event("b", "b.1"), _event("a", "a.2"), _event()]
+        repo.fetch_pending = AsyncMock(return_value=events)
+        processor = OutboxProcessor(publish_concurrency=10)
+        in_flight = 0
+        peak = 0
+        order: list[str] = []
+
+        async def publish(message, **_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            order.append(message["event_type"])
+
+        processor._broker = MagicMock()
+        processor._broker.publish = publish
+
+        assert await processor._process_batch() == 4
+
+        assert peak == 3
+        assert order.index("a.1") < order.index("a.2")
+
+    async def test_failure_leaves_later_events_of_aggregate_pending(self, repo: MagicMock):
+        events = [_event("a", "a.1"), _event("a", "a.2"), _event("b", "b.1")]
+        repo.fetch_pending = AsyncMock(return_value=events)
+        processor = OutboxProcessor()
+        published: list[str] = []
+
+        async def publish(message, **_):
+            if message["event_type"] == "a.1":
+                msg = "down"
+                raise ConnectionError(msg)
+            published.append(message["event_type"])
+
+        processor._broker = MagicMock()
+        processor._broker.publish = publish
+
+        assert await processor._process_batch() == 1
+
+        assert published == ["b.1"]
+        assert repo.mark_processed_many.await_args.args[1] == [events[2].id]
+        assert set(repo.mark_failed_many.await_args.args[1]) == {events[0].id}
+
+    async def test_concurrency_is_bounded(self, repo: MagicMock):
+        repo.fetch_pending = AsyncMock(return_value=[_event() for _ in range(6)])
+        processor = OutboxProcessor(publish_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def publish(message, **_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        processor._broker = MagicMock()
+        processor._broker.publish = publish
+
+        assert await processor._process_batch() == 6
+        assert peak == 2
+
+
+class TestOutboxProcessorWakeup:
+    """Validate NOTIFY wakeups and argument checks."""
+
+    async def test_idle_wait_ends_on_wakeup(self):
+        processor = OutboxProcessor(poll_interval=30)
+        waiter = asyncio.create_task(processor._wait_for_events())
+        await asyncio.sleep(0)
+
+        processor._wakeup.set()
+
+        await asyncio.wait_for(waiter, timeout=1)
+
+    def test_invalid_partition_rejected(self):
+        with pytest.raises(ValueError, match="partition"):
+            OutboxProcessor(partition=2, partition_count=2)
+        with pytest.raises(ValueError, match="publish_concurrency"):
+            OutboxProcessor(publish_concurrency=0)
+
+
+class TestOutboxRepositoryBatchUpdates:
+    """Validate the set-based status updates."""
+
+    async def test_mark_failed_many_is_a_single_update(self):
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        await OutboxRepository().mark_failed_many(session, {uuid4(): "boom", uuid4(): "bang"})
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE event_outbox")
+        assert "FROM (VALUES" in sql
+        assert "power(" in sql
+
+    async def test_mark_processed_many_uses_any(self):
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        await OutboxRepository().mark_processed_many(session, [uuid4(), uuid4()])
+        await OutboxRepository().mark_processed_many(session, [])
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "= ANY (" in sql
+
+    async def test_fetch_pending_partition_masks_hash_sign_bit(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock())
+
+        await OutboxRepository().fetch_pending(session, partition=1, partition_count=4)
+
+        compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        assert "(hashtext(" in str(compiled)
+        assert "abs(" not in str(compiled)
+        assert 0x7FFFFFFF in compiled.params.values()
@@ -0,0 +1,121 @@
+"""Tests for HybridRateLimiter."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from example_service.infra.ratelimit import tracker as tracker_module
+from example_service.infra.ratelimit.hybrid import HybridRateLimiter
+from example_service.infra.ratelimit.tracker import RateLimitStateTracker
+
+
+@pytest.fixture
+def redis_limiter() -> MagicMock:
+    """RateLimiter stub whose batch call grants a fresh bucket of 5 per 10s."""
+    limiter = MagicMock()
+    limiter.default_limit = 5
+    limiter.default_window = 10
+    limiter.consume_batch = AsyncMock(
+        side_effect=lambda requests: [
+            (True, 5 - cost, 0.0, cost * 2000.0) for _, _, _, cost in requests
+        ],
+    )
+    return limiter
+
+
+@pytest.fixture
+def tracker(monkeypatch: pytest.MonkeyPatch) -> RateLimitStateTracker:
+    """Install a global tracker for the duration of the test."""
+    state_tracker = RateLimitStateTracker(failure_threshold=1)
+    monkeypatch.setattr(tracker_module, "_tracker", state_tracker)
+    return state_tracker
+
+
+class TestHybridRateLimiter:
+    """Validate local decisions and batched reconciliation."""
+
+    async def test_first_request_seeds_from_redis(self, redis_limiter: MagicMock):
+        limiter = HybridRateLimiter(redis_limiter, error_budget=1.0)
+
+        allowed, meta = await limiter.check_limit("ip:1")
+        await limiter.check_limit("ip:1")
+
+        assert allowed is True
+        assert meta["remaining"] == 4
+        redis_limiter.consume_batch.assert_awaited_once_with([("ip:1", 5, 10, 1)])
+        await limiter.close()
+
+    async def test_over_limit_rejected_locally(self, redis_limiter: MagicMock):
+        limiter = HybridRateLimiter(redis_limiter, error_budget=1.0)
+
+        results = [await limiter.check_limit("ip:1") for _ in range(6)]
+
+        assert [allowed for allowed, _ in results] == [True] * 5 + [False]
+        assert results[-1][1]["retry_after"] == 2
+        assert redis_limiter.consume_batch.await_count == 1
+        await limiter.close()
+
+    async def test_flush_batches_pending_counters(self, redis_limiter: MagicMock):
+        limiter = HybridRateLimiter(redis_limiter, error_budget=1.0)
+        for key in ("a", "b"):
+            await limiter.check_limit(key)
+            await limiter.check_limit(key)
+            await limiter.check_limit(key)
+        redis_limiter.consume_batch.reset_mock()
+
+        assert await limiter.flush() == 2
+
+        redis_limiter.consume_batch.assert_awaited_once_with([("a", 5, 10, 2), ("b", 5, 10, 2)])
+        assert await limiter.flush() == 0
+        await limiter.close()
+
+    async def test_sync_failure_keeps_pending_and_degrades(
+        self, redis_limiter: MagicMock, tracker: RateLimitStateTracker,
+    ):
+        limiter = HybridRateLimiter(redis_limiter, error_budget=1.0)
+        await limiter.check_limit("a")
+        await limiter.check_limit("a")
+        redis_limiter.consume_batch.side_effect = ConnectionError("down")
+
+        assert await limiter.flush() == 0
+
+        assert tracker.is_degraded
+        redis_limiter.consume_batch.side_effect = None
+        redis_limiter.consume_batch.return_value = [(True, 3, 0.0, 4000.0)]
+        assert await limiter.flush() == 1
+        redis_limiter.consume_batch.assert_awaited_with([("a", 5, 10, 1)])
+        assert not tracker.is_degraded
+        await limiter.close()
+
+    async def test_degraded_mode_enforces_locally(
+        self, redis_limiter: MagicMock, tracker: RateLimitStateTracker,
+    ):
+        tracker.record_failure("connection refused")
+        limiter = HybridRateLimiter(redis_limiter)
+
+        results = [(await limiter.check_limit("ip:9"))[0] for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        redis_limiter.consume_batch.assert_not_awaited()
+        limiter._sync_task.cancel()
+
+    async def test_redis_error_on_seed_falls_back_to_local(
+        self, redis_limiter: MagicMock, tracker: RateLimitStateTracker,
+    ):
+        redis_limiter.consume_batch.side_effect = ConnectionError("down")
+        limiter = HybridRateLimiter(redis_limiter)
+
+        allowed, meta = await limiter.check_limit("ip:1")
+
+        assert allowed is True
+        assert meta["remaining"] == 4
+        assert tracker.is_degraded
+        limiter._sync_task.cancel()
+
+    def test_invalid_arguments(self, redis_limiter: MagicMock):
+        with pytest.raises(ValueError, match="error_budget"):
+            HybridRateLimiter(redis_limiter, error_budget=2.0)
+        with pytest.raises(ValueError, match="sync_interval"):
+            HybridRateLimiter(redis_limiter, sync_interval=0)
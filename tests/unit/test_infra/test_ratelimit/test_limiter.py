@@ -0,0 +1,106 @@
+"""Tests for the Redis-backed RateLimiter."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from example_service.core.exceptions import RateLimitException
+from example_service.infra.ratelimit.limiter import (
+    _GCRA_SCRIPT,
+    _TOKEN_BUCKET_SCRIPT,
+    RateLimiter,
+    check_rate_limit,
+)
+
+
+def _make_limiter(result: list[int] | Exception, **kwargs) -> tuple[RateLimiter, MagicMock]:
+    """Create a limiter whose registered script returns a fixed result."""
+    script = AsyncMock(side_effect=result) if isinstance(result, Exception) else AsyncMock(
+        return_value=result,
+    )
+    redis = MagicMock()
+    redis.register_script = MagicMock(return_value=script)
+    return RateLimiter(redis, **kwargs), redis
+
+
+class TestRateLimiter:
+    """Validate script invocation and metadata calculation."""
+
+    async def test_allowed_request_metadata(self):
+        limiter, _ = _make_limiter([1, 4, 0, 2000])
+
+        allowed, meta = await limiter.check_limit("user:1", limit=5, window=10)
+
+        assert allowed is True
+        assert meta["limit"] == 5
+        assert meta["remaining"] == 4
+        assert meta["retry_after"] == 0
+
+    async def test_denied_request_uses_accurate_retry_after(self):
+        limiter, _ = _make_limiter([0, 0, 1500, 10000])
+
+        allowed, meta = await limiter.check_limit("user:1", limit=5, window=60)
+
+        assert allowed is False
+        # Time until the next token, not the whole window
+        assert meta["retry_after"] == 2
+        assert meta["remaining"] == 0
+
+    async def test_script_registered_once(self):
+        limiter, redis = _make_limiter([1, 4, 0, 2000])
+
+        await limiter.check_limit("a")
+        await limiter.check_limit("b")
+
+        redis.register_script.assert_called_once_with(_GCRA_SCRIPT)
+
+    async def test_gcra_arguments(self):
+        limiter, redis = _make_limiter([1, 99, 0, 600])
+
+        await limiter.check_limit("user:1", limit=100, window=60, cost=3)
+
+        script = redis.register_script.return_value
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["ratelimit:gcra:user:1"]
+        assert kwargs["args"] == [600.0, 100.0, 3]
+
+    async def test_token_bucket_arguments(self):
+        limiter, redis = _make_limiter([1, 9, 0, 100], algorithm="token_bucket")
+
+        await limiter.check_limit("user:1", limit=10, window=1)
+
+        redis.register_script.assert_called_once_with(_TOKEN_BUCKET_SCRIPT)
+        kwargs = redis.register_script.return_value.await_args.kwargs
+        assert kwargs["keys"] == ["ratelimit:token_bucket:user:1"]
+        assert kwargs["args"] == [10.0, 0.01, 1]
+
+    async def test_fail_open_when_redis_errors(self):
+        limiter, _ = _make_limiter(ConnectionError("redis down"))
+
+        allowed, meta = await limiter.check_limit("user:1", limit=5, window=10)
+
+        assert allowed is True
+        assert meta["remaining"] == 4
+
+    async def test_get_limit_info_does_not_consume(self):
+        limiter, redis = _make_limiter([1, 3, 0, 4000])
+
+        info = await limiter.get_limit_info("user:1", limit=5)
+
+        assert info["remaining"] == 3
+        assert info["current"] == 2
+        assert redis.register_script.return_value.await_args.kwargs["args"][2] == 0
+
+    def test_unknown_algorithm_rejected(self):
+        with pytest.raises(ValueError, match="algorithm"):
+            RateLimiter(MagicMock(), algorithm="leaky")  # type: ignore[arg-type]
+
+    async def test_check_rate_limit_raises_when_denied(self):
+        limiter, _ = _make_limiter([0, 0, 3000, 10000])
+
+        with pytest.raises(RateLimitException) as exc_info:
+            await check_rate_limit(limiter, "user:1", limit=5, window=10)
+
+        assert exc_info.value.extra["retry_after"] == 3
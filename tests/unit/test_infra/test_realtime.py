@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -53,6 +55,15 @@ class TestConnectionInfo:
 # ──────────────────────────────────────────────────────────────
 
 
+def stall_until(event: asyncio.Event):
+    """Build a send side effect that blocks until the event is set."""
+
+    async def send(_frame: str) -> None:
+        await event.wait()
+
+    return send
+
+
 class TestConnectionManager:
     """Tests for ConnectionManager."""
 
@@ -68,6 +79,9 @@ class TestConnectionManager:
                 max_connections=100,
                 heartbeat_interval=0,  # Disable heartbeat for tests
                 connection_timeout=0,
+                send_queue_size=100,
+                slow_consumer_policy="disconnect",
+                broadcast_batch_window_ms=0,
             )
             return ConnectionManager()
 
@@ -169,9 +183,25 @@ class TestConnectionManager:
             connection_id,
             {"type": "test", "data": "hello"},
         )
+        await manager.drain()
 
         assert result is True
-        mock_ws.send_json.assert_called_once_with({"type": "test", "data": "hello"})
+        mock_ws.send_text.assert_called_once_with(json.dumps({"type": "test", "data": "hello"}))
+        mock_ws.send_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_to_connection_keeps_order_with_broadcasts(self, manager):
+        """Direct messages share the outbound queue with broadcasts."""
+        mock_ws = AsyncMock()
+        connection_id = await manager.connect(mock_ws, channels=["news"])
+
+        await manager.broadcast("news", {"seq": 0})
+        await manager.send_to_connection(connection_id, {"seq": 1})
+        await manager.broadcast("news", {"seq": 2})
+        await manager.drain()
+
+        sent = [json.loads(c.args[0])["seq"] for c in mock_ws.send_text.call_args_list]
+        assert sent == [0, 1, 2]
 
     @pytest.mark.asyncio
     async def test_send_to_nonexistent_connection(self, manager):
@@ -199,12 +229,14 @@ class TestConnectionManager:
             "channel-x",
             {"type": "update", "data": "broadcast"},
         )
+        await manager.drain()
 
-        # Should send to 2 connections
+        # Should send to 2 connections, encoded once
         assert recipients == 2
-        mock_ws1.send_json.assert_called()
-        mock_ws2.send_json.assert_called()
-        mock_ws3.send_json.assert_not_called()
+        frame = json.dumps({"type": "update", "data": "broadcast"})
+        mock_ws1.send_text.assert_called_once_with(frame)
+        mock_ws2.send_text.assert_called_once_with(frame)
+        mock_ws3.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_broadcast_with_exclude(self, manager):
@@ -221,9 +253,79 @@ class TestConnectionManager:
             exclude={conn_id1},
         )
 
+        await manager.drain()
+
         assert recipients == 1
-        mock_ws1.send_json.assert_not_called()
-        mock_ws2.send_json.assert_called()
+        mock_ws1.send_text.assert_not_called()
+        mock_ws2.send_text.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_preserves_order_per_connection(self, manager):
+        """Queued broadcasts should reach each connection in order."""
+        mock_ws = AsyncMock()
+        await manager.connect(mock_ws, channels=["ordered"])
+
+        for i in range(5):
+            await manager.broadcast("ordered", {"seq": i})
+        await manager.drain()
+
+        sent = [json.loads(c.args[0])["seq"] for c in mock_ws.send_text.call_args_list]
+        assert sent == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_block_others(self, manager):
+        """A stalled client should not delay delivery to other subscribers."""
+        stalled = asyncio.Event()
+        slow_ws = AsyncMock()
+        slow_ws.send_text.side_effect = stall_until(stalled)
+        fast_ws = AsyncMock()
+
+        await manager.connect(slow_ws, channels=["news"])
+        await manager.connect(fast_ws, channels=["news"])
+
+        await manager.broadcast("news", {"type": "headline"})
+        await asyncio.sleep(0)
+
+        slow_ws.send_text.assert_called_once()
+        fast_ws.send_text.assert_called_once()
+        stalled.set()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_slow_consumer(self, manager):
+        """The disconnect policy should drop clients whose queue is full."""
+        manager._settings.send_queue_size = 2
+        slow_ws = AsyncMock()
+        slow_ws.send_text.side_effect = stall_until(asyncio.Event())
+
+        connection_id = await manager.connect(slow_ws, channels=["busy"])
+        recipients = [await manager.broadcast("busy", {"seq": i}) for i in range(4)]
+        await asyncio.sleep(0)  # Let the scheduled disconnect run
+
+        assert recipients == [1, 1, 0, 0]
+        assert manager.get_connection(connection_id) is None
+        slow_ws.close.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_messages_with_drop_policy(self, manager):
+        """The drop policy should keep the client but skip messages."""
+        manager._settings.send_queue_size = 1
+        manager._settings.slow_consumer_policy = "drop"
+        stalled = asyncio.Event()
+        slow_ws = AsyncMock()
+        slow_ws.send_text.side_effect = stall_until(stalled)
+
+        connection_id = await manager.connect(slow_ws, channels=["busy"])
+        await manager.broadcast("busy", {"seq": 0})
+        await asyncio.sleep(0)  # Writer takes the first frame and stalls
+        await manager.broadcast("busy", {"seq": 1})
+
+        assert await manager.broadcast("busy", {"seq": 2}) == 0
+        assert manager.get_connection(connection_id) is not None
+
+        stalled.set()
+        await manager.drain()
+        sent = [json.loads(c.args[0])["seq"] for c in slow_ws.send_text.call_args_list]
+        assert sent == [0, 1]
 
     @pytest.mark.asyncio
     async def test_send_to_user(self, manager):
@@ -241,10 +343,21 @@ class TestConnectionManager:
             {"type": "notification"},
         )
 
+        await manager.drain()
+
         assert recipients == 2
-        mock_ws1.send_json.assert_called()
-        mock_ws2.send_json.assert_called()
-        mock_ws3.send_json.assert_not_called()
+        mock_ws1.send_text.assert_called()
+        mock_ws2.send_text.assert_called()
+        mock_ws3.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_to_user_after_disconnect(self, manager):
+        """The user index should forget disconnected connections."""
+        conn_id = await manager.connect(AsyncMock(), user_id="user-A")
+        await manager.disconnect(conn_id)
+
+        assert await manager.send_to_user("user-A", {"type": "notification"}) == 0
+        assert "user-A" not in manager._user_connections
 
     @pytest.mark.asyncio
     async def test_connection_count(self, manager):
@@ -291,6 +404,9 @@ class TestConnectionManager:
                 max_connections=2,
                 heartbeat_interval=0,
                 connection_timeout=0,
+                send_queue_size=100,
+                slow_consumer_policy="disconnect",
+                broadcast_batch_window_ms=0,
             )
             limited_manager = ConnectionManager()
 
@@ -319,6 +435,157 @@ class TestConnectionManager:
         assert conn_id2 in conn_ids
 
 
+# ──────────────────────────────────────────────────────────────
+# Test Broadcast Batching
+# ──────────────────────────────────────────────────────────────
+
+
+class TestBroadcastBatcher:
+    """Tests for BroadcastBatcher and batched manager delivery."""
+
+    @pytest.fixture
+    def flushed(self):
+        """Collect batches handed to the flush callback."""
+        return []
+
+    @pytest.fixture
+    def batcher(self, flushed):
+        """Create a batcher with a long window so tests control flushing."""
+        from example_service.infra.realtime.batching import BroadcastBatcher
+
+        async def flush(batches):
+            flushed.append(batches)
+
+        return BroadcastBatcher(flush, window=60, max_messages=5)
+
+    @pytest.mark.asyncio
+    async def test_buffers_until_flush(self, batcher, flushed):
+        """Messages should be handed over together, in order, per channel."""
+        batcher.add("a", {"seq": 1})
+        batcher.add("b", {"seq": 2})
+        batcher.add("a", {"seq": 3})
+
+        assert flushed == []
+        await batcher.flush()
+
+        assert flushed == [{"a": [{"seq": 1}, {"seq": 3}], "b": [{"seq": 2}]}]
+        assert batcher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_value(self, batcher, flushed):
+        """Messages sharing a coalesce key should collapse to the latest."""
+        batcher.add("jobs", {"job": 1, "progress": 10}, coalesce_key="1")
+        batcher.add("jobs", {"job": 2, "progress": 50}, coalesce_key="2")
+        batcher.add("jobs", {"job": 1, "progress": 20}, coalesce_key="1")
+
+        await batcher.flush()
+
+        assert flushed == [
+            {"jobs": [{"job": 2, "progress": 50}, {"job": 1, "progress": 20}]},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_max_messages_triggers_flush(self, batcher, flushed):
+        """Reaching max_messages should flush without waiting for the window."""
+        for i in range(5):
+            batcher.add("burst", {"seq": i})
+        await asyncio.sleep(0)
+
+        assert len(flushed) == 1
+        assert len(flushed[0]["burst"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_manager_delivers_one_frame_per_batch(self):
+        """A burst should reach each client as a single batch frame."""
+        from example_service.infra.realtime.manager import ConnectionManager
+
+        with patch(
+            "example_service.infra.realtime.manager.get_websocket_settings",
+        ) as mock_settings:
+            mock_settings.return_value = MagicMock(
+                max_connections=100,
+                heartbeat_interval=0,
+                connection_timeout=0,
+                send_queue_size=100,
+                slow_consumer_policy="disconnect",
+                broadcast_batch_window_ms=60_000,
+                broadcast_batch_max_messages=100,
+            )
+            manager = ConnectionManager()
+
+        mock_ws = AsyncMock()
+        await manager.connect(mock_ws, channels=["events"])
+        for i in range(10):
+            assert await manager.broadcast("events", {"seq": i}) == 0
+
+        await manager._batcher.flush()
+        await manager.drain()
+
+        mock_ws.send_text.assert_called_once()
+        frame = json.loads(mock_ws.send_text.call_args.args[0])
+        assert frame["type"] == "batch"
+        assert frame["channel"] == "events"
+        assert [m["seq"] for m in frame["messages"]] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_excluding_broadcast_waits_for_pending_batch(self):
+        """A broadcast with exclusions is delivered after earlier buffered ones."""
+        from example_service.infra.realtime.manager import ConnectionManager
+
+        with patch(
+            "example_service.infra.realtime.manager.get_websocket_settings",
+        ) as mock_settings:
+            mock_settings.return_value = MagicMock(
+                max_connections=100,
+                heartbeat_interval=0,
+                connection_timeout=0,
+                send_queue_size=100,
+                slow_consumer_policy="disconnect",
+                broadcast_batch_window_ms=60_000,
+                broadcast_batch_max_messages=100,
+            )
+            manager = ConnectionManager()
+
+        mock_ws = AsyncMock()
+        await manager.connect(mock_ws, channels=["events"])
+        sender = await manager.connect(AsyncMock(), channels=["events"])
+
+        await manager.broadcast("events", {"seq": 0})
+        await manager.broadcast("events", {"seq": 1}, exclude={sender})
+        await manager.drain()
+
+        sent = [json.loads(c.args[0])["seq"] for c in mock_ws.send_text.call_args_list]
+        assert sent == [0, 1]
+        assert manager._batcher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_manager_publishes_batches_in_one_pipeline(self):
+        """With Redis, a flush should be one pipelined PUBLISH per channel."""
+        from example_service.infra.realtime.manager import ConnectionManager
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+
+        with patch(
+            "example_service.infra.realtime.manager.get_websocket_settings",
+        ) as mock_settings:
+            mock_settings.return_value = MagicMock(
+                broadcast_batch_window_ms=60_000,
+                broadcast_batch_max_messages=100,
+            )
+            manager = ConnectionManager(redis_client=redis)
+
+        for i in range(50):
+            await manager.broadcast("a" if i % 2 else "b", {"seq": i})
+        await manager._batcher.flush()
+
+        assert pipe.publish.call_count == 2
+        pipe.execute.assert_awaited_once()
+        redis.publish.assert_not_called()
+
+
 # ──────────────────────────────────────────────────────────────
 # Test WebSocket Schemas
 # ──────────────────────────────────────────────────────────────
@@ -0,0 +1,157 @@
+"""Unit tests for bulk S3 operations."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from example_service.infra.storage.backends.s3.bulk import (
+    DELETE_BATCH_SIZE,
+    delete_objects,
+    head_objects,
+    presign_get_urls,
+)
+from example_service.infra.storage.operations.batch import batch_delete
+
+
+class FakeClientError(Exception):
+    """Stand-in for botocore's ClientError."""
+
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeS3Client:
+    """Records bulk calls made against it."""
+
+    def __init__(self) -> None:
+        self.delete_requests: list[list[str]] = []
+        self.fail_keys: set[str] = set()
+        self.denied = False
+        self.existing: set[str] = set()
+        self.presign_calls = 0
+
+    async def delete_objects(self, Bucket: str, Delete: dict[str, Any]):  # noqa: N803
+        keys = [item["Key"] for item in Delete["Objects"]]
+        assert Delete["Quiet"] is True
+        self.delete_requests.append(keys)
+        if self.denied:
+            msg = "AccessDenied"
+            raise FakeClientError(msg)
+        return {
+            "Errors": [
+                {"Key": key, "Code": "InternalError", "Message": "Try again"}
+                for key in keys
+                if key in self.fail_keys
+            ],
+        }
+
+    async def head_object(self, Bucket: str, Key: str):  # noqa: N803
+        if Key not in self.existing:
+            msg = "404"
+            raise FakeClientError(msg)
+        return {"ContentLength": 3, "ETag": '"abc"'}
+
+    async def generate_presigned_url(self, method: str, Params: dict, ExpiresIn: int):  # noqa: N803
+        self.presign_calls += 1
+        return f"https://s3/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+
+class TestDeleteObjects:
+    """Test DeleteObjects batching."""
+
+    @pytest.mark.asyncio
+    async def test_keys_are_chunked_per_request(self):
+        """Keys are sent in requests of at most 1,000 keys."""
+        client = FakeS3Client()
+        keys = [f"thumbs/{i}.jpg" for i in range(2500)]
+
+        deleted, errors = await delete_objects(client, "bucket", keys)
+
+        assert [len(batch) for batch in client.delete_requests] == [1000, 1000, 500]
+        assert deleted == keys
+        assert errors == {}
+
+    @pytest.mark.asyncio
+    async def test_per_key_errors_are_reported(self):
+        """Keys listed in the response errors are reported as failed."""
+        client = FakeS3Client()
+        client.fail_keys = {"b"}
+
+        deleted, errors = await delete_objects(client, "bucket", ["a", "b", "c", "a"])
+
+        assert deleted == ["a", "c"]
+        assert errors == {"b": "InternalError: Try again"}
+        assert client.delete_requests == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_its_keys(self):
+        """A request that fails as a whole marks all its keys failed."""
+        client = FakeS3Client()
+        client.denied = True
+        keys = [str(i) for i in range(DELETE_BATCH_SIZE + 1)]
+
+        deleted, errors = await delete_objects(client, "bucket", keys)
+
+        assert deleted == []
+        assert set(errors) == set(keys)
+
+
+class TestHeadAndPresign:
+    """Test batched HEAD and presign helpers."""
+
+    @pytest.mark.asyncio
+    async def test_missing_objects_map_to_none(self):
+        """Missing objects are returned as None instead of raising."""
+        client = FakeS3Client()
+        client.existing = {"a"}
+
+        responses = await head_objects(client, "bucket", ["a", "b"])
+
+        assert responses["a"]["ContentLength"] == 3
+        assert responses["b"] is None
+
+    @pytest.mark.asyncio
+    async def test_presign_each_key_once(self):
+        """Duplicate keys are signed once."""
+        client = FakeS3Client()
+
+        urls = await presign_get_urls(client, "bucket", ["a", "b", "a"], 60)
+
+        assert urls == {
+            "a": "https://s3/bucket/a?expires=60",
+            "b": "https://s3/bucket/b?expires=60",
+        }
+        assert client.presign_calls == 2
+
+
+class FakeStorageService:
+    """Minimal StorageService stand-in for batch operations."""
+
+    async def delete_files(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, Any]:
+        return {
+            "deleted": [key for key in keys if key != "locked"],
+            "failed": [{"key": "locked", "error": "AccessDenied"}],
+            "total": len(keys),
+        }
+
+
+@pytest.mark.asyncio
+async def test_batch_delete_reports_per_key_results():
+    """batch_delete maps the bulk delete outcome onto per-key results."""
+    result = await batch_delete(FakeStorageService(), ["a", "locked", "b"])
+
+    assert result.successful == 2
+    assert result.failed == 1
+    assert result.results[1] == {
+        "key": "locked",
+        "success": False,
+        "error": "AccessDenied",
+    }
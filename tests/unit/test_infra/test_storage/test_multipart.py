@@ -0,0 +1,239 @@
+"""Unit tests for streaming multipart uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import hashlib
+from io import BytesIO
+import itertools
+from typing import Any
+
+import pytest
+
+from example_service.infra.storage.backends.s3.multipart import (
+    MIN_PART_SIZE,
+    MultipartUpload,
+    part_size_for,
+)
+
+PART = MIN_PART_SIZE
+
+
+def etag(body: bytes) -> str:
+    """Compute an S3-style ETag (MD5 hex digest) for a body."""
+    return hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+
+class FakeS3Client:
+    """In-memory S3 client implementing the multipart API."""
+
+    def __init__(self, fail_part: int | None = None, delay: float = 0) -> None:
+        self.fail_part = fail_part
+        self.delay = delay
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.part_calls: list[int] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._ids = itertools.count(1)
+
+    async def put_object(self, **kwargs: Any):
+        self.objects[kwargs["Key"]] = bytes(kwargs["Body"])
+        return {"ETag": f'"{etag(kwargs["Body"])}"'}
+
+    async def create_multipart_upload(self, **kwargs: Any):
+        upload_id = f"upload-{next(self._ids)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    async def upload_part(self, **kwargs: Any):
+        part_number, body = kwargs["PartNumber"], kwargs["Body"]
+        self.part_calls.append(part_number)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if part_number == self.fail_part:
+                msg = "connection reset"
+                raise ConnectionError(msg)
+            self.uploads[kwargs["UploadId"]][part_number] = bytes(body)
+        finally:
+            self.in_flight -= 1
+        return {"ETag": f'"{etag(body)}"'}
+
+    async def list_parts(self, **kwargs: Any):
+        return {
+            "Parts": [
+                {
+                    "PartNumber": number,
+                    "Size": len(body),
+                    "ETag": f'"{etag(body)}"',
+                }
+                for number, body in sorted(self.uploads[kwargs["UploadId"]].items())
+            ],
+            "IsTruncated": False,
+        }
+
+    async def complete_multipart_upload(self, **kwargs: Any):
+        parts = self.uploads.pop(kwargs["UploadId"])
+        numbers = [part["PartNumber"] for part in kwargs["MultipartUpload"]["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[kwargs["Key"]] = b"".join(parts[number] for number in numbers)
+        return {"ETag": f'"multipart-{len(numbers)}"', "VersionId": "v1"}
+
+    async def abort_multipart_upload(self, **kwargs: Any):
+        self.uploads.pop(kwargs["UploadId"], None)
+        self.aborted.append(kwargs["UploadId"])
+
+
+def payload(size: int) -> bytes:
+    return (bytes(range(251)) * (size // 251 + 1))[:size]
+
+
+async def stream(data: bytes, chunk: int = 64 * 1024, delay: float = 0):
+    for start in range(0, len(data), chunk):
+        await asyncio.sleep(delay)
+        yield data[start : start + chunk]
+
+
+class TestMultipartUpload:
+    """Test MultipartUpload against an in-memory S3 client."""
+
+    @pytest.mark.asyncio
+    async def test_small_object_uses_single_put(self):
+        """Objects smaller than one part skip the multipart API."""
+        client = FakeS3Client()
+        data = payload(1024)
+
+        result = await MultipartUpload(client, "b", "small", part_size=PART).upload(
+            BytesIO(data),
+        )
+
+        assert client.objects["small"] == data
+        assert client.part_calls == []
+        assert result.size_bytes == len(data)
+        assert result.checksum_sha256 == hashlib.sha256(data).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_stream_uploaded_in_parts_with_checksum(self):
+        """An async stream is split into parts and hashed incrementally."""
+        client = FakeS3Client()
+        data = payload(2 * PART + 1234)
+        progress: list[int] = []
+
+        upload = MultipartUpload(
+            client, "b", "big", part_size=PART, on_progress=progress.append,
+        )
+        result = await upload.upload(stream(data))
+
+        assert client.objects["big"] == data
+        assert sorted(client.part_calls) == [1, 2, 3]
+        assert result.size_bytes == len(data)
+        assert result.checksum_sha256 == hashlib.sha256(data).hexdigest()
+        assert result.version_id == "v1"
+        assert progress[-1] == len(data)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """No more than max_concurrency parts are in flight at once."""
+        client = FakeS3Client(delay=0.01)
+        data = payload(6 * PART)
+
+        await MultipartUpload(
+            client, "b", "big", part_size=PART, max_concurrency=2,
+        ).upload(BytesIO(data))
+
+        assert client.objects["big"] == data
+        assert client.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_aborts_upload(self):
+        """A failed part aborts the upload so no orphaned parts remain."""
+        client = FakeS3Client(fail_part=2)
+
+        upload = MultipartUpload(client, "b", "big", part_size=PART)
+        with pytest.raises(ConnectionError):
+            await upload.upload(BytesIO(payload(3 * PART)))
+
+        assert client.aborted == ["upload-1"]
+        assert client.uploads == {}
+        assert upload.upload_id is None
+
+    @pytest.mark.asyncio
+    async def test_part_failing_while_reading_is_retrieved(self):
+        """A part failing while the stream is read has its error retrieved."""
+        client = FakeS3Client(fail_part=1, delay=0.015)
+        unhandled: list[dict[str, Any]] = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda _loop, context: unhandled.append(context),
+        )
+
+        upload = MultipartUpload(client, "b", "big", part_size=PART)
+        with pytest.raises(ConnectionError):
+            await upload.upload(stream(payload(3 * PART), chunk=PART, delay=0.01))
+        gc.collect()
+
+        assert client.aborted == ["upload-1"]
+        assert unhandled == []
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_uploaded_parts(self):
+        """A resumed upload only sends the parts S3 does not hold yet."""
+        client = FakeS3Client(fail_part=3)
+        data = payload(3 * PART + 10)
+
+        upload = MultipartUpload(client, "b", "big", part_size=PART, max_concurrency=1)
+        with pytest.raises(ConnectionError):
+            await upload.upload(BytesIO(data), abort_on_error=False)
+        assert upload.upload_id == "upload-1"
+
+        client.fail_part = None
+        client.part_calls.clear()
+        resumed = MultipartUpload(
+            client, "b", "big", part_size=PART, upload_id=upload.upload_id,
+        )
+        result = await resumed.upload(BytesIO(data))
+
+        assert sorted(client.part_calls) == [3, 4]
+        assert client.objects["big"] == data
+        assert result.checksum_sha256 == hashlib.sha256(data).hexdigest()
+
+    def test_part_size_grows_for_huge_objects(self):
+        """Part size is raised so an object never needs more than 10,000 parts."""
+        assert part_size_for(None, PART) == PART
+        assert part_size_for(10 * PART, PART) == PART
+        assert part_size_for(20_000 * PART, PART) == 2 * PART
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_against_moto():
+    """Round-trip a multipart upload through a moto S3 server."""
+    aioboto3 = pytest.importorskip("aioboto3")
+    moto_server = pytest.importorskip("moto.server")
+
+    server = moto_server.ThreadedMotoServer(port=0)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        session = aioboto3.Session()
+        async with session.client(
+            "s3",
+            endpoint_url=f"http://{host}:{port}",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        ) as client:
+            await client.create_bucket(Bucket="uploads")
+            data = payload(2 * PART + 1)
+
+            result = await MultipartUpload(
+                client, "uploads", "big.bin", part_size=PART,
+            ).upload(BytesIO(data))
+
+            response = await client.get_object(Bucket="uploads", Key="big.bin")
+            assert await response["Body"].read() == data
+            assert result.size_bytes == len(data)
+    finally:
+        server.stop()
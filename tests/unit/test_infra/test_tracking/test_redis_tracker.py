@@ -15,33 +15,60 @@ class FakePipeline:
 
     def __init__(self, client: FakeRedis) -> None:
         self.client = client
+        self.results: list[Any] = []
 
     def hset(self, key: str, mapping: dict[str, Any]) -> FakePipeline:
-        self.client._hset_sync(key, mapping)
+        self.results.append(self.client._hset_sync(key, mapping))
+        return self
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> FakePipeline:
+        self.results.append(self.client._hincrby_sync(key, field, amount))
+        return self
+
+    def hgetall(self, key: str) -> FakePipeline:
+        self.results.append(dict(self.client.hashes.get(key, {})))
         return self
 
     def expire(self, key: str, ttl: int) -> FakePipeline:
-        self.client._expire_sync(key, ttl)
+        self.results.append(self.client._expire_sync(key, ttl))
         return self
 
     def set(self, key: str, value: str, ex: int | None = None) -> FakePipeline:
-        self.client._set_sync(key, value, ex)
+        self.results.append(self.client._set_sync(key, value, ex))
         return self
 
     def zadd(self, key: str, mapping: dict[str, float]) -> FakePipeline:
-        self.client._zadd_sync(key, mapping)
+        self.results.append(self.client._zadd_sync(key, mapping))
+        return self
+
+    def zcard(self, key: str) -> FakePipeline:
+        self.results.append(len(self.client.sorted_sets.get(key, {})))
+        return self
+
+    def lpush(self, key: str, value: Any) -> FakePipeline:
+        self.results.append(self.client._lpush_sync(key, value))
+        return self
+
+    def ltrim(self, key: str, start: int, stop: int) -> FakePipeline:
+        self.results.append(self.client._ltrim_sync(key, start, stop))
+        return self
+
+    def lrange(self, key: str, start: int, stop: int) -> FakePipeline:
+        items = self.client.lists.get(key, [])
+        self.results.append(list(items[start : None if stop == -1 else stop + 1]))
         return self
 
     def delete(self, key: str) -> FakePipeline:
-        self.client._delete_sync(key)
+        self.results.append(self.client._delete_sync(key))
         return self
 
     def zrem(self, key: str, member: str) -> FakePipeline:
-        self.client._zrem_sync(key, member)
+        self.results.append(self.client._zrem_sync(key, member))
         return self
 
     async def execute(self):
-        return []
+        results, self.results = self.results, []
+        return results
 
 
 class FakeRedis:
@@ -52,6 +79,7 @@ class FakeRedis:
         self.hashes: dict[str, dict[str, str]] = {}
         self.sorted_sets: dict[str, dict[str, float]] = {}
         self.strings: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = {}
         self.expirations: dict[str, int] = {}
         self.closed = False
 
@@ -61,6 +89,21 @@ class FakeRedis:
         for k, v in mapping.items():
             existing[k] = str(v)
 
+    def _hincrby_sync(self, key: str, field: str, amount: int) -> int:
+        existing = self.hashes.setdefault(key, {})
+        value = int(existing.get(field, "0")) + amount
+        existing[field] = str(value)
+        return value
+
+    def _lpush_sync(self, key: str, value: Any) -> int:
+        items = self.lists.setdefault(key, [])
+        items.insert(0, str(value))
+        return len(items)
+
+    def _ltrim_sync(self, key: str, start: int, stop: int) -> None:
+        if key in self.lists:
+            self.lists[key] = self.lists[key][start : None if stop == -1 else stop + 1]
+
     def _expire_sync(self, key: str, ttl: int) -> None:
         self.expirations[key] = ttl
 
@@ -119,6 +162,9 @@ class FakeRedis:
     async def hgetall(self, key: str):
         return dict(self.hashes.get(key, {}))
 
+    async def exists(self, *keys: str):
+        return sum(key in self.hashes for key in keys)
+
     async def hget(self, key: str, field: str):
         return self.hashes.get(key, {}).get(field)
 
@@ -128,7 +174,7 @@ class FakeRedis:
             if key.startswith(prefix):
                 yield key
 
-    def pipeline(self):
+    def pipeline(self, transaction: bool = True):
         return FakePipeline(self)
 
     async def disconnect(self):
@@ -335,3 +381,62 @@ async def test_returns_empty_when_not_connected():
         "by_task_name": {},
         "avg_duration_ms": None,
     }
+
+
+@pytest.mark.asyncio
+async def test_get_task_history_pages_through_index_for_secondary_filters(tracker, monkeypatch):
+    """Secondary filters keep scanning the index until the page is filled."""
+    monkeypatch.setattr(
+        "example_service.infra.tasks.tracking.redis_tracker.HISTORY_SCAN_BATCH_SIZE",
+        2,
+    )
+    tracker._client = FakeRedis()
+    for i, duration in enumerate([500, 10, 20, 30, 40]):
+        await tracker.on_task_start(f"task-{i}", "cleanup")
+        await asyncio.sleep(0.001)
+        await tracker.on_task_finish(f"task-{i}", "success", None, None, duration)
+
+    results = await tracker.get_task_history(limit=5, min_duration_ms=100)
+    total = await tracker.count_task_history(min_duration_ms=100)
+
+    assert [r["task_id"] for r in results] == ["task-0"]
+    assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_get_stats_rebuilds_missing_name_counters(tracker):
+    """get_stats should backfill per-name counters from the name indices."""
+    tracker._client = FakeRedis()
+    await tracker.on_task_start("task-1", "cleanup")
+    await tracker.on_task_start("task-2", "report")
+    tracker.client.hashes.pop(tracker._stats_by_name_key())
+
+    stats = await tracker.get_stats()
+
+    assert stats["by_task_name"] == {"cleanup": 1, "report": 1}
+    assert tracker.client.hashes[tracker._stats_by_name_key()] == {
+        "cleanup": "1",
+        "report": "1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_count_task_history_skips_expired_records(tracker, monkeypatch):
+    """Counts match the history page once execution hashes have expired."""
+    monkeypatch.setattr(
+        "example_service.infra.tasks.tracking.redis_tracker.HISTORY_SCAN_BATCH_SIZE",
+        2,
+    )
+    tracker._client = FakeRedis()
+    for i in range(5):
+        await tracker.on_task_start(f"task-{i}", "cleanup")
+        await tracker.on_task_finish(f"task-{i}", "success", None, None, 10)
+    # The execution hash expired; the index entries remain
+    tracker.client.hashes.pop(tracker._exec_key("task-2"))
+
+    results = await tracker.get_task_history(limit=10)
+
+    assert len(results) == 4
+    assert await tracker.count_task_history() == 4
+    assert await tracker.count_task_history(task_name="cleanup") == 4
+    assert await tracker.count_task_history(status="success") == 4